@@ -0,0 +1,72 @@
+"""Add stock_fundamentals table
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+AMOUNT_COLUMNS = [
+    'revenue',
+    'gross_profit',
+    'sga_expenses',
+    'operating_income',
+    'ordinary_income',
+    'net_income',
+    'total_assets',
+    'total_liabilities',
+    'shareholders_equity',
+    'current_assets',
+    'current_liabilities',
+    'cash_and_equivalents',
+    'operating_cash_flow',
+    'investing_cash_flow',
+    'financing_cash_flow',
+]
+
+
+def upgrade():
+    """Create the wide fundamentals table."""
+    op.create_table('stock_fundamentals',
+        sa.Column('ticker', sa.String(length=10), nullable=False),
+        sa.Column('fiscal_year', sa.Integer(), nullable=False),
+        sa.Column('fiscal_period', sa.String(length=10), nullable=False),
+        sa.Column('report_type', sa.String(length=20), nullable=False),
+        sa.Column('period_start', sa.Date(), nullable=True),
+        sa.Column('period_end', sa.Date(), nullable=True),
+        sa.Column('accounting_standard', sa.String(length=10), nullable=True),
+        sa.Column('is_consolidated', sa.Boolean(), nullable=True),
+        *[
+            sa.Column(name, postgresql.NUMERIC(precision=20, scale=2), nullable=True)
+            for name in AMOUNT_COLUMNS
+        ],
+        sa.Column('source', sa.String(length=20), nullable=False, server_default='EDINET'),
+        sa.Column('document_id', sa.String(length=20), nullable=True),
+        sa.Column('submitted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.CheckConstraint("fiscal_period IN ('Q1', 'Q2', 'Q3', 'Q4', 'FY')", name='check_fundamentals_fiscal_period'),
+        sa.CheckConstraint("report_type IN ('quarterly', 'annual')", name='check_fundamentals_report_type'),
+        sa.ForeignKeyConstraint(['ticker'], ['stocks.ticker'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('ticker', 'fiscal_year', 'fiscal_period')
+    )
+
+    # Latest periods per ticker and cross-sectional screens by period
+    op.create_index('idx_stock_fundamentals_ticker_period_end', 'stock_fundamentals', ['ticker', sa.text('period_end DESC')])
+    op.create_index('idx_stock_fundamentals_period', 'stock_fundamentals', ['fiscal_year', 'fiscal_period'])
+
+
+def downgrade():
+    """Drop the wide fundamentals table."""
+    op.drop_index('idx_stock_fundamentals_period', table_name='stock_fundamentals')
+    op.drop_index('idx_stock_fundamentals_ticker_period_end', table_name='stock_fundamentals')
+    op.drop_table('stock_fundamentals')
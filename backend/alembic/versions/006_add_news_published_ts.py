@@ -0,0 +1,85 @@
+"""Add typed publication timestamp to news articles
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def _parse(value):
+    """Parse an ISO 8601 or RFC 822 publication time (naive values are UTC)."""
+    if not value or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def upgrade():
+    """Add news_articles.published_ts, backfill it and index it."""
+    op.add_column('news_articles', sa.Column('published_ts', sa.DateTime(timezone=True), nullable=True))
+
+    # published_at holds both ISO and RFC 822 strings, so parse in Python;
+    # rows whose date cannot be parsed fall back to when they were stored
+    conn = op.get_bind()
+    articles = sa.table(
+        'news_articles',
+        sa.column('id'),
+        sa.column('published_at', sa.String()),
+        sa.column('published_ts', sa.DateTime(timezone=True)),
+        sa.column('created_at', sa.DateTime(timezone=True)),
+    )
+    while True:
+        rows = conn.execute(
+            sa.select(articles.c.id, articles.c.published_at, articles.c.created_at)
+            .where(articles.c.published_ts.is_(None))
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            articles.update()
+            .where(articles.c.id == sa.bindparam('article_id'))
+            .values(published_ts=sa.bindparam('ts')),
+            [
+                {'article_id': row.id, 'ts': _parse(row.published_at) or row.created_at}
+                for row in rows
+            ],
+        )
+
+    op.create_index('idx_news_published_ts', 'news_articles', [sa.text('published_ts DESC')])
+    op.create_index(
+        'idx_news_analyzed_published_ts',
+        'news_articles',
+        ['published_ts', 'sentiment_label', 'sentiment_score'],
+        postgresql_where=sa.text('sentiment_label IS NOT NULL'),
+    )
+
+
+def downgrade():
+    """Remove news_articles.published_ts."""
+    op.drop_index('idx_news_analyzed_published_ts', table_name='news_articles')
+    op.drop_index('idx_news_published_ts', table_name='news_articles')
+    op.drop_column('news_articles', 'published_ts')
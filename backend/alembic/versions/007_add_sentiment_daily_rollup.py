@@ -0,0 +1,63 @@
+"""Add sentiment_daily_rollup table
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+ROLLUP_AGGREGATES = """
+    (published_ts AT TIME ZONE 'UTC')::date AS day,
+    COUNT(*) FILTER (WHERE sentiment_label = 'positive'),
+    COUNT(*) FILTER (WHERE sentiment_label = 'negative'),
+    COUNT(*) FILTER (WHERE sentiment_label = 'neutral'),
+    COALESCE(SUM(sentiment_score), 0),
+    COUNT(sentiment_score)
+"""
+
+
+def upgrade():
+    """Create the daily rollup and fill it from already analyzed articles."""
+    op.create_table('sentiment_daily_rollup',
+        sa.Column('scope', sa.String(length=10), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('positive_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('negative_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('neutral_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('score_sum', postgresql.NUMERIC(precision=14, scale=4), nullable=False, server_default='0'),
+        sa.Column('score_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('scope', 'day')
+    )
+
+    columns = 'scope, day, positive_count, negative_count, neutral_count, score_sum, score_count'
+    op.execute(f"""
+        INSERT INTO sentiment_daily_rollup ({columns})
+        SELECT 'market', {ROLLUP_AGGREGATES}
+        FROM news_articles
+        WHERE sentiment_label IS NOT NULL AND published_ts IS NOT NULL
+        GROUP BY day
+    """)
+    op.execute(f"""
+        INSERT INTO sentiment_daily_rollup ({columns})
+        SELECT l.ticker, {ROLLUP_AGGREGATES}
+        FROM news_articles a
+        JOIN stock_news_link l ON l.article_id = a.id
+        WHERE sentiment_label IS NOT NULL AND published_ts IS NOT NULL
+        GROUP BY l.ticker, day
+    """)
+
+
+def downgrade():
+    """Drop the daily rollup."""
+    op.drop_table('sentiment_daily_rollup')
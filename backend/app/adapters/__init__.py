@@ -12,6 +12,7 @@ from .alpha_vantage_setup import (
 )
 from .base import (
     BaseDataSourceAdapter,
+    BulkQuoteResult,
     CostInfo,
     DataSourceError,
     DataSourceType,
@@ -26,6 +27,7 @@ from .base import (
     RateLimitInfo,
     StockPriceAdapter,
 )
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
 from .edinet_adapter import EDINETAdapter
 from .edinet_setup import (
     create_edinet_config,
@@ -36,6 +38,7 @@ from .edinet_setup import (
 )
 from .edinet_setup import setup_from_environment as setup_edinet_from_environment
 from .edinet_setup import test_edinet_connection, validate_edinet_config
+from .latency import LatencyTracker
 from .mock_adapter import MockFinancialDataAdapter, MockStockPriceAdapter
 from .registry import DataSourceRegistry, registry
 from .yahoo_finance_adapter import YahooFinanceJapanAdapter
@@ -64,6 +67,7 @@ __all__ = [
     "HealthStatus",
     "HealthCheck",
     "RateLimitInfo",
+    "BulkQuoteResult",
     "CostInfo",
     # Exceptions
     "DataSourceError",
@@ -73,6 +77,10 @@ __all__ = [
     # Registry
     "DataSourceRegistry",
     "registry",
+    "LatencyTracker",
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "CircuitState",
     # Mock adapters
     "MockStockPriceAdapter",
     "MockFinancialDataAdapter",
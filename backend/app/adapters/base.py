@@ -1,12 +1,17 @@
 """Base data source adapter interface."""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
+import pandas as pd
+
+from .price_frame import price_records_to_frame
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +65,30 @@ class CostInfo:
     current_monthly_usage: float = 0.0
 
 
+@dataclass
+class BulkQuoteResult:
+    """Result of a multi-symbol quote request.
+
+    Symbols that could be priced are in ``quotes``; symbols that failed are in
+    ``errors`` with the error message, so callers can use partial results.
+    """
+
+    quotes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every requested symbol was priced."""
+        return not self.errors
+
+    def merge(self, other: "BulkQuoteResult") -> None:
+        """Merge another result into this one in place."""
+        self.quotes.update(other.quotes)
+        self.errors.update(other.errors)
+        for symbol in other.quotes:
+            self.errors.pop(symbol, None)
+
+
 class DataSourceError(Exception):
     """Base exception for data source errors."""
 
@@ -226,6 +255,41 @@ class StockPriceAdapter(BaseDataSourceAdapter):
         """
         pass
 
+    async def get_current_prices(self, symbols: List[str]) -> BulkQuoteResult:
+        """
+        Get current prices for several stock symbols.
+
+        The default implementation calls ``get_current_price`` for each symbol
+        with bounded concurrency (``bulk_concurrency`` config, default 5).
+        Adapters whose provider offers a multi-symbol endpoint should override
+        this.
+
+        Args:
+            symbols: Stock symbols to price
+
+        Returns:
+            BulkQuoteResult with quotes and per-symbol errors
+        """
+        unique_symbols = list(dict.fromkeys(symbols))
+        result = BulkQuoteResult()
+        if not unique_symbols:
+            return result
+
+        semaphore = asyncio.Semaphore(max(1, self.config.get("bulk_concurrency", 5)))
+
+        async def fetch(symbol: str) -> None:
+            async with semaphore:
+                try:
+                    result.quotes[symbol] = await self.get_current_price(symbol)
+                except Exception as e:
+                    logger.warning(
+                        f"Adapter '{self.name}' failed to price {symbol}: {e}"
+                    )
+                    result.errors[symbol] = str(e)
+
+        await asyncio.gather(*(fetch(symbol) for symbol in unique_symbols))
+        return result
+
     @abstractmethod
     async def get_historical_prices(
         self,
@@ -248,6 +312,34 @@ class StockPriceAdapter(BaseDataSourceAdapter):
         """
         pass
 
+    async def get_historical_price_frame(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> pd.DataFrame:
+        """
+        Get historical price data as a columnar frame.
+
+        The default implementation converts ``get_historical_prices`` output;
+        adapters with array-shaped responses override it to skip per-row
+        dictionaries.
+
+        Args:
+            symbol: Stock symbol
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            interval: Data interval
+
+        Returns:
+            DataFrame with PRICE_FRAME_COLUMNS sorted by date
+        """
+        records = await self.get_historical_prices(
+            symbol, start_date, end_date, interval
+        )
+        return price_records_to_frame(records)
+
     @abstractmethod
     async def search_symbols(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,267 @@
+"""Circuit breaker for data source adapters."""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Circuit breaker thresholds."""
+
+    failure_rate_threshold: float = 0.5  # Share of failed calls that opens the circuit
+    slow_call_rate_threshold: float = 0.8  # Share of slow calls that opens the circuit
+    slow_call_duration_ms: float = 5000.0  # Calls slower than this count as slow
+    window_seconds: float = 300.0  # Rolling window for the rates
+    minimum_calls: int = 5  # Calls in the window before rates are evaluated
+    open_timeout_seconds: float = 300.0  # Time spent open before probing
+    half_open_max_probes: int = 3  # Probe calls admitted while half-open
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for one adapter.
+
+    While closed, call outcomes are kept in a rolling time window and the
+    circuit opens when the failure rate or slow-call rate crosses its
+    threshold. After ``open_timeout_seconds`` the circuit becomes half-open
+    and admits up to ``half_open_max_probes`` probe calls: if they all
+    succeed in time the circuit closes, and any failed or slow probe opens
+    it again. Outcomes of calls admitted before the circuit opened that
+    complete while it is open, or half-open without probes in flight, are
+    ignored, so they can neither extend the open period nor count as probes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: Optional[CircuitBreakerConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Name of the protected adapter (used in logs)
+            config: Thresholds; defaults to CircuitBreakerConfig()
+            clock: Monotonic clock in seconds, injectable for tests
+        """
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._calls: Deque[Tuple[float, bool, bool]] = deque()  # (time, failed, slow)
+        self._failed_calls = 0
+        self._slow_calls = 0
+        self._opened_at: Optional[float] = None
+        self._opened_at_wall: Optional[datetime] = None
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once the timeout expires."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.config.open_timeout_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def is_call_permitted(self) -> bool:
+        """
+        Check whether a call would currently be admitted, without reserving it.
+
+        Returns:
+            True if the circuit is closed or has a free half-open probe slot
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN:
+            return self._probe_slots_available() > 0
+        return False
+
+    def try_acquire(self) -> bool:
+        """
+        Reserve permission for a call.
+
+        Every successful acquire must be followed by exactly one of
+        ``record_success``, ``record_failure`` or ``release``.
+
+        Returns:
+            True if the call may proceed
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and self._probe_slots_available() > 0:
+            self._probes_in_flight += 1
+            return True
+        return False
+
+    def release(self) -> None:
+        """Give back a permission without recording an outcome (e.g. cancelled)."""
+        if self._state == CircuitState.HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def record_success(self, duration_ms: float = 0.0) -> None:
+        """
+        Record a successful call.
+
+        Args:
+            duration_ms: Call duration in milliseconds
+        """
+        if self._is_late_outcome():
+            return
+
+        slow = duration_ms >= self.config.slow_call_duration_ms
+        if self._state == CircuitState.HALF_OPEN:
+            self.release()
+            if slow:
+                self._open(f"slow probe ({duration_ms:.0f}ms)")
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.config.half_open_max_probes:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        self._record(failed=False, slow=slow)
+
+    def record_failure(self, duration_ms: float = 0.0) -> None:
+        """
+        Record a failed call.
+
+        Args:
+            duration_ms: Call duration in milliseconds
+        """
+        if self._is_late_outcome():
+            return
+
+        if self._state == CircuitState.HALF_OPEN:
+            self.release()
+            self._open("failed probe")
+            return
+
+        self._record(
+            failed=True, slow=duration_ms >= self.config.slow_call_duration_ms
+        )
+
+    def force_open(self) -> None:
+        """Open the circuit immediately."""
+        self._open("forced open")
+
+    def reset(self) -> None:
+        """Close the circuit and clear the rolling window."""
+        self._transition(CircuitState.CLOSED)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get a summary of the circuit breaker.
+
+        Returns:
+            Dictionary with state, rolling-window rates and reset time
+        """
+        state = self.state
+        self._prune()
+        calls = len(self._calls)
+        reset_time = None
+        if state == CircuitState.OPEN and self._opened_at_wall:
+            reset_time = self._opened_at_wall + timedelta(
+                seconds=self.config.open_timeout_seconds
+            )
+
+        return {
+            "state": state.value,
+            "open": state != CircuitState.CLOSED,
+            "calls_in_window": calls,
+            "failure_count": self._failed_calls,
+            "failure_rate": self._failed_calls / calls if calls else 0.0,
+            "slow_call_rate": self._slow_calls / calls if calls else 0.0,
+            "reset_time": reset_time.isoformat() if reset_time else None,
+            "probes_in_flight": self._probes_in_flight,
+            "probe_successes": self._probe_successes,
+        }
+
+    def _probe_slots_available(self) -> int:
+        """Number of half-open probes that may still be started."""
+        return (
+            self.config.half_open_max_probes
+            - self._probes_in_flight
+            - self._probe_successes
+        )
+
+    def _is_late_outcome(self) -> bool:
+        """Whether an outcome belongs to a call admitted before the circuit opened."""
+        if self._state == CircuitState.OPEN:
+            return True
+        return self._state == CircuitState.HALF_OPEN and self._probes_in_flight == 0
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        """Add an outcome to the rolling window and evaluate thresholds."""
+        self._calls.append((self._clock(), failed, slow))
+        self._failed_calls += failed
+        self._slow_calls += slow
+        self._prune()
+
+        calls = len(self._calls)
+        if calls < self.config.minimum_calls:
+            return
+
+        failure_rate = self._failed_calls / calls
+        slow_rate = self._slow_calls / calls
+        if failure_rate >= self.config.failure_rate_threshold:
+            self._open(f"failure rate {failure_rate:.0%} over {calls} calls")
+        elif slow_rate >= self.config.slow_call_rate_threshold:
+            self._open(f"slow call rate {slow_rate:.0%} over {calls} calls")
+
+    def _prune(self) -> None:
+        """Drop outcomes that fell out of the rolling window."""
+        cutoff = self._clock() - self.config.window_seconds
+        while self._calls and self._calls[0][0] < cutoff:
+            _, failed, slow = self._calls.popleft()
+            self._failed_calls -= failed
+            self._slow_calls -= slow
+
+    def _open(self, reason: str) -> None:
+        """Move to the open state, keeping the open time if already open."""
+        if self._state == CircuitState.OPEN:
+            return
+        self._transition(CircuitState.OPEN)
+        logger.warning(f"Circuit breaker opened for adapter '{self.name}': {reason}")
+
+    def _transition(self, state: CircuitState) -> None:
+        """Switch state and reset the bookkeeping of the new state."""
+        previous = self._state
+        self._state = state
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+            self._opened_at_wall = datetime.utcnow()
+        elif state == CircuitState.CLOSED:
+            self._calls.clear()
+            self._failed_calls = 0
+            self._slow_calls = 0
+            self._opened_at = None
+            self._opened_at_wall = None
+
+        if previous != state and state != CircuitState.OPEN:
+            logger.info(
+                f"Circuit breaker for adapter '{self.name}' "
+                f"{previous.value} -> {state.value}"
+            )
@@ -0,0 +1,282 @@
+"""Content-addressed on-disk store for downloaded EDINET documents."""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_DOC_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+class MappedFile:
+    """Read-only file object over a memory map, usable by ``zipfile``."""
+
+    def __init__(self, mapped: mmap.mmap):
+        self._mapped = mapped
+
+    def read(self, size: int = -1) -> bytes:
+        return self._mapped.read(size)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._mapped.seek(offset, whence)
+        return self._mapped.tell()
+
+    def tell(self) -> int:
+        return self._mapped.tell()
+
+    def seekable(self) -> bool:
+        return True
+
+
+@contextmanager
+def open_mapped(path: str) -> Iterator[MappedFile]:
+    """
+    Memory-map a file for reading.
+
+    Args:
+        path: File path
+
+    Yields:
+        MappedFile over the file contents
+    """
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield MappedFile(mapped)
+
+
+class DocumentStore:
+    """Size-bounded LRU store of immutable documents.
+
+    Blobs are stored under their SHA-256 digest, so identical downloads are
+    kept once, and each ``doc_id`` refers to a digest. Parsed results can be
+    stored next to a blob so every consumer of a document shares one parse.
+    When the total blob size exceeds ``max_bytes`` the least recently used
+    blobs are deleted along with their references and parsed results. Blobs
+    pinned by a reader (e.g. while a parse worker has them memory-mapped) are
+    skipped until unpinned.
+    """
+
+    def __init__(self, root: str, max_bytes: int = 2 * 1024**3):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding the store
+            max_bytes: Maximum total size of stored blobs
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._blob_dir = self.root / "blobs"
+        self._ref_dir = self.root / "refs"
+        self._blob_dir.mkdir(parents=True, exist_ok=True)
+        self._ref_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._blobs: "OrderedDict[str, int]" = OrderedDict()  # digest -> size
+        self._refs: Dict[str, str] = {}  # doc_id -> digest
+        self._pins: Dict[str, int] = {}  # digest -> readers holding it
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load()
+
+    def _load(self) -> None:
+        """Rebuild the in-memory index from disk, oldest access first."""
+        blobs = []
+        for path in self._blob_dir.glob("*/*.zip"):
+            stat = path.stat()
+            blobs.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, digest, size in sorted(blobs):
+            self._blobs[digest] = size
+            self._total_bytes += size
+
+        for path in self._ref_dir.iterdir():
+            digest = path.read_text().strip()
+            if digest in self._blobs:
+                self._refs[path.name] = digest
+            else:
+                path.unlink(missing_ok=True)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self._blob_dir / digest[:2] / f"{digest}.zip"
+
+    def _parsed_path(self, digest: str, version: str) -> Path:
+        return self._blob_dir / digest[:2] / f"{digest}.{version}.json"
+
+    @staticmethod
+    def _check_doc_id(doc_id: str) -> None:
+        if not _DOC_ID_PATTERN.match(doc_id):
+            raise ValueError(f"Invalid document id: {doc_id!r}")
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write a file so readers never see partial content."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(
+            f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def get_path(self, doc_id: str, pin: bool = False) -> Optional[str]:
+        """
+        Get the path of a stored document and mark it recently used.
+
+        Args:
+            doc_id: EDINET document ID
+            pin: Keep the blob from being evicted until ``unpin`` is called
+
+        Returns:
+            Blob path, or None if not stored
+        """
+        self._check_doc_id(doc_id)
+        with self._lock:
+            digest = self._refs.get(doc_id)
+            path = self._blob_path(digest) if digest else None
+            if path is None or not path.exists():
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._blobs.move_to_end(digest)
+            if pin:
+                self._pins[digest] = self._pins.get(digest, 0) + 1
+
+        # Access order survives restarts through the modification time
+        os.utime(path)
+        return str(path)
+
+    def put(self, doc_id: str, content: bytes, pin: bool = False) -> str:
+        """
+        Store a document.
+
+        Args:
+            doc_id: EDINET document ID
+            content: Document bytes
+            pin: Keep the blob from being evicted until ``unpin`` is called
+
+        Returns:
+            Blob path
+        """
+        self._check_doc_id(doc_id)
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+
+        if not path.exists():
+            self._write_atomic(path, content)
+        self._write_atomic(self._ref_dir / doc_id, digest.encode("ascii"))
+
+        with self._lock:
+            if digest not in self._blobs:
+                self._blobs[digest] = len(content)
+                self._total_bytes += len(content)
+            self._blobs.move_to_end(digest)
+            self._refs[doc_id] = digest
+            if pin:
+                self._pins[digest] = self._pins.get(digest, 0) + 1
+            self._evict()
+
+        return str(path)
+
+    def unpin(self, doc_id: str) -> None:
+        """
+        Release a pin taken by ``get_path`` or ``put``.
+
+        Args:
+            doc_id: EDINET document ID
+        """
+        with self._lock:
+            digest = self._refs.get(doc_id)
+            pins = self._pins.get(digest, 0)
+            if pins > 1:
+                self._pins[digest] = pins - 1
+            elif pins == 1:
+                del self._pins[digest]
+                # Evictions deferred while the blob was pinned
+                self._evict()
+
+    def get_parsed(self, doc_id: str, version: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a stored parse result for a document.
+
+        Args:
+            doc_id: EDINET document ID
+            version: Parser version the result must come from
+
+        Returns:
+            Parsed data, or None if not stored
+        """
+        digest = self._refs.get(doc_id)
+        if digest is None:
+            return None
+        try:
+            return json.loads(self._parsed_path(digest, version).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def put_parsed(self, doc_id: str, version: str, parsed: Dict[str, Any]) -> None:
+        """
+        Store a parse result for a stored document.
+
+        Args:
+            doc_id: EDINET document ID
+            version: Parser version that produced the result
+            parsed: Parsed data (JSON-serializable)
+        """
+        digest = self._refs.get(doc_id)
+        if digest is None:
+            return
+        self._write_atomic(
+            self._parsed_path(digest, version),
+            json.dumps(parsed, ensure_ascii=False).encode("utf-8"),
+        )
+
+    def _evict(self) -> None:
+        """Delete least recently used unpinned blobs until under the size limit."""
+        for digest in list(self._blobs):
+            if self._total_bytes <= self.max_bytes or len(self._blobs) <= 1:
+                break
+            if digest in self._pins:
+                continue
+
+            size = self._blobs.pop(digest)
+            self._total_bytes -= size
+            self._evictions += 1
+
+            blob_path = self._blob_path(digest)
+            for path in blob_path.parent.glob(f"{digest}.*"):
+                path.unlink(missing_ok=True)
+            for doc_id in [d for d, ref in self._refs.items() if ref == digest]:
+                del self._refs[doc_id]
+                (self._ref_dir / doc_id).unlink(missing_ok=True)
+
+            logger.debug(f"Evicted EDINET document blob {digest} ({size} bytes)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with sizes, counts and hit rate
+        """
+        lookups = self._hits + self._misses
+        return {
+            "documents": len(self._refs),
+            "blobs": len(self._blobs),
+            "total_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "pinned": len(self._pins),
+        }
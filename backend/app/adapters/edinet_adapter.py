@@ -1,13 +1,14 @@
 """EDINET financial data adapter for Japanese companies."""
 
 import asyncio
+import copy
 import json
 import logging
 import re
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlencode, urlparse
 
 import aiohttp
@@ -22,26 +23,26 @@ from .base import (
     InvalidDataError,
     RateLimitInfo,
 )
+from .document_store import DocumentStore
+from .edinet_index import EDINETDocument, EDINETDocumentIndex, edinet_today
+from .xbrl_parse_pool import XBRLParsePool
+from .xbrl_parser import (
+    PARSER_VERSION,
+    categorize_facts,
+    parse_context,
+    parse_xbrl_instance,
+    parse_xbrl_package,
+)
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class EDINETDocument:
-    """EDINET document metadata."""
+class IncompleteDocumentIndexError(DataSourceUnavailableError):
+    """Raised when daily document lists of a searched range are not indexed."""
 
-    doc_id: str
-    filer_name: str
-    fund_code: Optional[str]
-    sec_code: Optional[str]
-    jcn: Optional[str]
-    edinet_code: Optional[str]
-    doc_type_code: str
-    doc_description: str
-    submit_date: datetime
-    period_start: Optional[datetime]
-    period_end: Optional[datetime]
-    doc_url: str
+    def __init__(self, message: str, missing_days: List[date]):
+        super().__init__(message)
+        self.missing_days = missing_days
 
 
 class EDINETAdapter(FinancialDataAdapter):
@@ -86,6 +87,17 @@ class EDINETAdapter(FinancialDataAdapter):
                 - max_retries: Maximum retry attempts (default: 3)
                 - retry_delay: Delay between retries in seconds (default: 2)
                 - cache_ttl: Cache TTL for documents in seconds (default: 86400)
+                - xbrl_parse_workers: XBRL parser processes, 0 = inline (default: 2)
+                - xbrl_parse_queue: Documents allowed to wait for a parser (default: 16)
+                - document_cache_dir: On-disk document store directory (default: disabled)
+                - document_cache_max_bytes: Store size limit (default: 2 GiB)
+                - parsed_cache_size: Parsed documents kept in memory (default: 256)
+                - download_concurrency: Concurrent document downloads (default: 3)
+                - document_index_dir: Directory persisting daily document lists
+                  (default: in memory only)
+                - document_index_refresh: Seconds before today's list is fetched
+                  again (default: 900)
+                - index_sync_concurrency: Daily lists fetched at once (default: 4)
         """
         super().__init__(name, priority, config)
 
@@ -108,10 +120,40 @@ class EDINETAdapter(FinancialDataAdapter):
         # Session for connection pooling
         self._session: Optional[aiohttp.ClientSession] = None
 
+        # XBRL parsing is CPU-bound and runs in worker processes
+        self._parse_pool = XBRLParsePool(
+            max_workers=self.config.get("xbrl_parse_workers", 2),
+            max_queue=self.config.get("xbrl_parse_queue", 16),
+        )
+
         # Document cache
         self._document_cache: Dict[str, EDINETDocument] = {}
         self._cache_timestamps: Dict[str, datetime] = {}
 
+        # Filings are immutable, so downloads and parse results are cached by doc_id
+        document_cache_dir = self.config.get("document_cache_dir")
+        self._document_store: Optional[DocumentStore] = (
+            DocumentStore(
+                document_cache_dir,
+                max_bytes=self.config.get("document_cache_max_bytes", 2 * 1024**3),
+            )
+            if document_cache_dir
+            else None
+        )
+        self.parsed_cache_size = self.config.get("parsed_cache_size", 256)
+        self.download_concurrency = self.config.get("download_concurrency", 3)
+        self._parsed_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._inflight_parses: Dict[str, asyncio.Task] = {}
+        self._download_semaphore: Optional[asyncio.Semaphore] = None
+
+        # Daily document lists, so searches only fetch days not yet seen
+        self._document_index = EDINETDocumentIndex(
+            index_dir=self.config.get("document_index_dir"),
+            refresh_interval=self.config.get("document_index_refresh", 900),
+        )
+        self.index_sync_concurrency = self.config.get("index_sync_concurrency", 4)
+        self._index_sync_lock: Optional[asyncio.Lock] = None
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
         if self._session is None or self._session.closed:
@@ -128,10 +170,8 @@ class EDINETAdapter(FinancialDataAdapter):
         if self._session and not self._session.closed:
             await self._session.close()
 
-    def _update_request_counts(self):
-        """Update request counts for rate limiting."""
-        now = datetime.utcnow()
-
+    def _reset_rate_windows(self, now: datetime):
+        """Reset request counters whose rate limit window has passed."""
         # Reset minute counter if needed
         if (now - self._last_minute_reset).total_seconds() >= 60:
             self._request_count_minute = 0
@@ -142,6 +182,10 @@ class EDINETAdapter(FinancialDataAdapter):
             self._request_count_hour = 0
             self._last_hour_reset = now
 
+    def _update_request_counts(self):
+        """Update request counts for rate limiting."""
+        self._reset_rate_windows(datetime.utcnow())
+
         # Increment counters
         self._request_count_minute += 1
         self._request_count_hour += 1
@@ -149,6 +193,8 @@ class EDINETAdapter(FinancialDataAdapter):
 
     def _check_rate_limits(self):
         """Check if we're within rate limits."""
+        self._reset_rate_windows(datetime.utcnow())
+
         if self._request_count_minute >= self.requests_per_minute:
             raise DataSourceError(
                 f"EDINET minute rate limit exceeded ({self.requests_per_minute} requests/minute)"
@@ -159,6 +205,33 @@ class EDINETAdapter(FinancialDataAdapter):
                 f"EDINET hour rate limit exceeded ({self.requests_per_hour} requests/hour)"
             )
 
+    async def _wait_for_request_slots(self, wanted: int) -> int:
+        """
+        Wait until requests fit in the minute rate limit.
+
+        Args:
+            wanted: Number of requests the caller would like to make
+
+        Returns:
+            Number of requests (at most ``wanted``) that can be made now, or
+            0 if the hourly limit is used up
+        """
+        while True:
+            now = datetime.utcnow()
+            self._reset_rate_windows(now)
+
+            hour_left = self.requests_per_hour - self._request_count_hour
+            if hour_left <= 0:
+                return 0
+
+            minute_left = self.requests_per_minute - self._request_count_minute
+            if minute_left > 0:
+                return min(wanted, minute_left, hour_left)
+
+            wait = 60 - (now - self._last_minute_reset).total_seconds()
+            logger.debug(f"EDINET minute rate limit reached, waiting {wait:.1f}s")
+            await asyncio.sleep(max(wait, 0.1))
+
     async def _make_request(
         self, endpoint: str, params: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
@@ -283,82 +356,127 @@ class EDINETAdapter(FinancialDataAdapter):
         """
         Search for documents in EDINET.
 
+        The daily document lists of the range are synced into the local
+        index first; the search itself is answered from the index.
+
         Args:
             sec_code: Securities code (4-digit)
             edinet_code: EDINET code (5-digit)
             doc_type_code: Document type code
-            date_from: Start date for search
-            date_to: End date for search
+            date_from: Start date for search (default: date_to)
+            date_to: End date for search (default: today)
 
         Returns:
-            List of matching documents
+            List of matching documents, newest first
+
+        Raises:
+            IncompleteDocumentIndexError: If the range could not be fully
+                indexed; the missing days are fetched again by later searches
         """
-        params = {}
+        day_to = date_to.date() if date_to else edinet_today()
+        day_from = date_from.date() if date_from else day_to
 
-        if date_from:
-            params["date"] = date_from.strftime("%Y-%m-%d")
-        if date_to and date_from and date_to != date_from:
-            # EDINET API supports date range queries
-            params[
-                "date"
-            ] = f"{date_from.strftime('%Y-%m-%d')}-{date_to.strftime('%Y-%m-%d')}"
+        try:
+            await self.sync_document_index(day_from, day_to)
+        except Exception as e:
+            logger.error(f"Error searching EDINET documents: {e}")
+            raise
 
-        if doc_type_code:
-            params["type"] = doc_type_code
+        return self._document_index.query(
+            sec_code=sec_code,
+            edinet_code=edinet_code,
+            doc_type_code=doc_type_code,
+            date_from=day_from,
+            date_to=day_to,
+        )
 
-        try:
-            data = await self._make_request("documents.json", params)
+    async def sync_document_index(self, date_from: date, date_to: date) -> int:
+        """
+        Fetch the daily document lists of a range that are not yet indexed.
 
-            if "results" not in data:
-                return []
+        Business days are fetched newest first in chunks, paced to the minute
+        rate limit; concurrent syncs take turns chunk by chunk. If a fetch
+        fails or the hourly limit is used up, days already fetched stay
+        indexed and the days still missing are fetched by the next sync.
 
-            documents = []
-            for result in data["results"]:
-                # Filter by securities code if provided
-                if sec_code and result.get("secCode") != sec_code:
-                    continue
+        Args:
+            date_from: First submission day
+            date_to: Last submission day
 
-                # Filter by EDINET code if provided
-                if edinet_code and result.get("edinetCode") != edinet_code:
-                    continue
+        Returns:
+            Number of days fetched
 
-                # Parse dates
-                submit_date = datetime.strptime(
-                    result["submitDateTime"], "%Y-%m-%d %H:%M"
-                )
-                period_start = None
-                period_end = None
-
-                if result.get("periodStart"):
-                    period_start = datetime.strptime(result["periodStart"], "%Y-%m-%d")
-                if result.get("periodEnd"):
-                    period_end = datetime.strptime(result["periodEnd"], "%Y-%m-%d")
-
-                doc = EDINETDocument(
-                    doc_id=result["docID"],
-                    filer_name=result.get("filerName", ""),
-                    fund_code=result.get("fundCode"),
-                    sec_code=result.get("secCode"),
-                    jcn=result.get("JCN"),
-                    edinet_code=result.get("edinetCode"),
-                    doc_type_code=result["docTypeCode"],
-                    doc_description=result.get("docDescription", ""),
-                    submit_date=submit_date,
-                    period_start=period_start,
-                    period_end=period_end,
-                    doc_url=f"{self.DOCUMENT_URL}/{result['docID']}",
+        Raises:
+            IncompleteDocumentIndexError: If days of the range are still not
+                indexed after the sync
+        """
+        if self._index_sync_lock is None:
+            self._index_sync_lock = asyncio.Lock()
+
+        days = self._document_index.days_to_sync(date_from, date_to)
+        fetched = 0
+        error: Optional[Exception] = None
+
+        i = 0
+        while i < len(days) and error is None:
+            # The lock is held per chunk, not per sync: a long cold sync lets
+            # other searches take turns between chunks, and days another
+            # search fetched meanwhile are skipped instead of fetched twice
+            async with self._index_sync_lock:
+                slots = await self._wait_for_request_slots(
+                    max(1, self.index_sync_concurrency)
                 )
+                if not slots:
+                    error = DataSourceError(
+                        f"EDINET hour rate limit reached "
+                        f"({self.requests_per_hour} requests/hour)"
+                    )
+                    break
+
+                chunk = []
+                while i < len(days) and len(chunk) < slots:
+                    if self._document_index.needs_sync(days[i]):
+                        chunk.append(days[i])
+                    i += 1
+                if not chunk:
+                    continue
 
-                documents.append(doc)
+                responses = await asyncio.gather(
+                    *(
+                        self._make_request(
+                            "documents.json",
+                            {"date": day.isoformat(), "type": "2"},
+                        )
+                        for day in chunk
+                    ),
+                    return_exceptions=True,
+                )
 
-            # Sort by submit date (newest first)
-            documents.sort(key=lambda x: x.submit_date, reverse=True)
+                for day, response in zip(chunk, responses):
+                    if isinstance(response, Exception):
+                        error = error or response
+                        continue
+                    self._document_index.add_day(
+                        day, response.get("results") or [], self.DOCUMENT_URL
+                    )
+                    fetched += 1
 
-            return documents
+        if fetched:
+            logger.debug(
+                f"Synced {fetched} EDINET document lists for {date_from}..{date_to}"
+            )
 
-        except Exception as e:
-            logger.error(f"Error searching EDINET documents: {e}")
-            raise
+        missing = [day for day in days if not self._document_index.is_indexed(day)]
+        if missing:
+            raise IncompleteDocumentIndexError(
+                f"EDINET document index is missing {len(missing)} days of "
+                f"{date_from}..{date_to}: {error}",
+                missing_days=missing,
+            ) from error
+        if error is not None:
+            # Only refreshes of days already indexed failed
+            logger.warning(f"EDINET document index refresh failed: {error}")
+        return fetched
 
     async def _download_document(self, doc_id: str) -> bytes:
         """
@@ -388,43 +506,80 @@ class EDINETAdapter(FinancialDataAdapter):
         Parse XBRL/iXBRL financial data.
 
         Args:
-            xbrl_content: XBRL document content
+            xbrl_content: XBRL document content (ZIP package)
 
         Returns:
             Parsed financial data
         """
-        try:
-            # EDINET documents are typically ZIP files containing XBRL
-            import io
-            import zipfile
-
-            financial_data = {
-                "income_statement": {},
-                "balance_sheet": {},
-                "cash_flow": {},
-                "metadata": {},
-            }
+        # EDINET documents are ZIP files containing XBRL instances, which are
+        # streamed member by member
+        return parse_xbrl_package(xbrl_content)
 
-            # Extract ZIP file
-            with zipfile.ZipFile(io.BytesIO(xbrl_content)) as zip_file:
-                # Look for XBRL instance documents
-                xbrl_files = [f for f in zip_file.namelist() if f.endswith(".xbrl")]
-
-                for xbrl_file in xbrl_files:
-                    with zip_file.open(xbrl_file) as f:
-                        xbrl_data = f.read()
-                        parsed_data = self._parse_xbrl_instance(xbrl_data)
+    async def _get_parsed_document(self, doc_id: str) -> Dict[str, Any]:
+        """
+        Get parsed financial data for a document, downloading and parsing once.
 
-                        # Merge parsed data
-                        for section, data in parsed_data.items():
-                            if section in financial_data:
-                                financial_data[section].update(data)
+        Concurrent requests for the same document share one download and parse.
 
-            return financial_data
+        Args:
+            doc_id: Document ID
 
-        except Exception as e:
-            logger.error(f"Error parsing XBRL content: {e}")
-            raise InvalidDataError(f"Failed to parse XBRL data: {e}")
+        Returns:
+            Parsed financial data, a copy the caller may modify
+        """
+        parsed = self._parsed_cache.get(doc_id)
+        if parsed is not None:
+            self._parsed_cache.move_to_end(doc_id)
+            return copy.deepcopy(parsed)
+
+        task = self._inflight_parses.get(doc_id)
+        if task is None:
+            task = asyncio.create_task(self._load_parsed_document(doc_id))
+            self._inflight_parses[doc_id] = task
+            task.add_done_callback(lambda _: self._inflight_parses.pop(doc_id, None))
+
+        parsed = await asyncio.shield(task)
+
+        self._parsed_cache[doc_id] = parsed
+        self._parsed_cache.move_to_end(doc_id)
+        while len(self._parsed_cache) > self.parsed_cache_size:
+            self._parsed_cache.popitem(last=False)
+
+        return copy.deepcopy(parsed)
+
+    async def _load_parsed_document(self, doc_id: str) -> Dict[str, Any]:
+        """Load a parse result from the store, or download and parse the document."""
+        store = self._document_store
+        if store is not None:
+            parsed = await asyncio.to_thread(store.get_parsed, doc_id, PARSER_VERSION)
+            if parsed is not None:
+                return parsed
+
+            # Pinned so eviction cannot delete the file while it is parsed
+            path = await asyncio.to_thread(store.get_path, doc_id, True)
+            if path is None:
+                content = await self._download_with_limit(doc_id)
+                path = await asyncio.to_thread(store.put, doc_id, content, True)
+
+            # Workers memory-map the stored file instead of receiving the bytes
+            try:
+                parsed = await self._parse_pool.parse(path)
+            finally:
+                await asyncio.to_thread(store.unpin, doc_id)
+            await asyncio.to_thread(store.put_parsed, doc_id, PARSER_VERSION, parsed)
+            return parsed
+
+        content = await self._download_with_limit(doc_id)
+        return await self._parse_pool.parse(content)
+
+    async def _download_with_limit(self, doc_id: str) -> bytes:
+        """Download a document, bounding concurrent downloads."""
+        if self._download_semaphore is None:
+            self._download_semaphore = asyncio.Semaphore(
+                max(1, self.download_concurrency)
+            )
+        async with self._download_semaphore:
+            return await self._download_document(doc_id)
 
     def _parse_xbrl_instance(self, xbrl_data: bytes) -> Dict[str, Any]:
         """
@@ -437,195 +592,27 @@ class EDINETAdapter(FinancialDataAdapter):
             Parsed financial data
         """
         try:
-            # Parse XML
-            root = ET.fromstring(xbrl_data)
-
-            # Register namespaces
-            for prefix, uri in self.XBRL_NAMESPACES.items():
-                ET.register_namespace(prefix, uri)
-
-            financial_data = {
-                "income_statement": {},
-                "balance_sheet": {},
-                "cash_flow": {},
-                "metadata": {},
-            }
-
-            # Extract context information
-            contexts = self._extract_contexts(root)
-
-            # Extract financial facts
-            facts = self._extract_facts(root, contexts)
-
-            # Categorize facts into financial statements
-            financial_data = self._categorize_facts(facts)
-
-            return financial_data
-
-        except ET.ParseError as e:
-            logger.error(f"XML parsing error: {e}")
-            raise InvalidDataError(f"Invalid XBRL XML: {e}")
+            return parse_xbrl_instance(xbrl_data)
+        except InvalidDataError:
+            raise
         except Exception as e:
             logger.error(f"Error parsing XBRL instance: {e}")
             raise InvalidDataError(f"Failed to parse XBRL instance: {e}")
 
     def _extract_contexts(self, root: ET.Element) -> Dict[str, Dict[str, Any]]:
-        """Extract context information from XBRL."""
+        """Extract context information from a parsed XBRL tree."""
         contexts = {}
 
         for context in root.findall(".//xbrli:context", self.XBRL_NAMESPACES):
             context_id = context.get("id")
-            if not context_id:
-                continue
-
-            # Extract period information
-            period_elem = context.find(".//xbrli:period", self.XBRL_NAMESPACES)
-            period_info = {}
-
-            if period_elem is not None:
-                instant = period_elem.find("xbrli:instant", self.XBRL_NAMESPACES)
-                start_date = period_elem.find("xbrli:startDate", self.XBRL_NAMESPACES)
-                end_date = period_elem.find("xbrli:endDate", self.XBRL_NAMESPACES)
-
-                if instant is not None:
-                    period_info["type"] = "instant"
-                    period_info["date"] = instant.text
-                elif start_date is not None and end_date is not None:
-                    period_info["type"] = "duration"
-                    period_info["start_date"] = start_date.text
-                    period_info["end_date"] = end_date.text
-
-            contexts[context_id] = {
-                "period": period_info,
-                "entity": self._extract_entity_info(context),
-            }
+            if context_id:
+                contexts[context_id] = parse_context(context)
 
         return contexts
 
-    def _extract_entity_info(self, context: ET.Element) -> Dict[str, Any]:
-        """Extract entity information from context."""
-        entity_info = {}
-
-        entity = context.find(".//xbrli:entity", self.XBRL_NAMESPACES)
-        if entity is not None:
-            identifier = entity.find("xbrli:identifier", self.XBRL_NAMESPACES)
-            if identifier is not None:
-                entity_info["identifier"] = identifier.text
-                entity_info["scheme"] = identifier.get("scheme")
-
-        return entity_info
-
-    def _extract_facts(
-        self, root: ET.Element, contexts: Dict[str, Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Extract financial facts from XBRL."""
-        facts = []
-
-        # Find all elements that are not in the xbrli namespace (these are the facts)
-        for elem in root:
-            if elem.tag.startswith("{") and not elem.tag.startswith(
-                "{http://www.xbrl.org/2003/instance}"
-            ):
-                context_ref = elem.get("contextRef")
-                unit_ref = elem.get("unitRef")
-
-                if context_ref and context_ref in contexts:
-                    fact = {
-                        "name": elem.tag,
-                        "value": elem.text,
-                        "context": contexts[context_ref],
-                        "unit_ref": unit_ref,
-                        "decimals": elem.get("decimals"),
-                        "precision": elem.get("precision"),
-                    }
-                    facts.append(fact)
-
-        return facts
-
     def _categorize_facts(self, facts: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Categorize facts into financial statement sections."""
-        financial_data = {
-            "income_statement": {},
-            "balance_sheet": {},
-            "cash_flow": {},
-            "metadata": {},
-        }
-
-        # Mapping of XBRL element names to our standardized names
-        element_mapping = {
-            # Income Statement
-            "NetSales": "revenue",
-            "OperatingIncome": "operating_income",
-            "NetIncome": "net_income",
-            "GrossProfit": "gross_profit",
-            "SellingGeneralAndAdministrativeExpenses": "sga_expenses",
-            # Balance Sheet
-            "TotalAssets": "total_assets",
-            "TotalLiabilities": "total_liabilities",
-            "NetAssets": "shareholders_equity",
-            "CashAndCashEquivalents": "cash_and_equivalents",
-            "CurrentAssets": "current_assets",
-            "CurrentLiabilities": "current_liabilities",
-            # Cash Flow
-            "CashFlowsFromOperatingActivities": "operating_cash_flow",
-            "CashFlowsFromInvestingActivities": "investing_cash_flow",
-            "CashFlowsFromFinancingActivities": "financing_cash_flow",
-        }
-
-        for fact in facts:
-            # Extract element name from full tag
-            element_name = (
-                fact["name"].split("}")[-1] if "}" in fact["name"] else fact["name"]
-            )
-
-            # Convert value to float if possible
-            try:
-                value = float(fact["value"]) if fact["value"] else None
-            except (ValueError, TypeError):
-                value = fact["value"]
-
-            # Determine which statement this belongs to
-            if element_name in element_mapping:
-                standard_name = element_mapping[element_name]
-
-                # Categorize by element type
-                if element_name in [
-                    "NetSales",
-                    "OperatingIncome",
-                    "NetIncome",
-                    "GrossProfit",
-                    "SellingGeneralAndAdministrativeExpenses",
-                ]:
-                    financial_data["income_statement"][standard_name] = {
-                        "value": value,
-                        "period": fact["context"]["period"],
-                        "unit": fact["unit_ref"],
-                    }
-                elif element_name in [
-                    "TotalAssets",
-                    "TotalLiabilities",
-                    "NetAssets",
-                    "CashAndCashEquivalents",
-                    "CurrentAssets",
-                    "CurrentLiabilities",
-                ]:
-                    financial_data["balance_sheet"][standard_name] = {
-                        "value": value,
-                        "period": fact["context"]["period"],
-                        "unit": fact["unit_ref"],
-                    }
-                elif element_name in [
-                    "CashFlowsFromOperatingActivities",
-                    "CashFlowsFromInvestingActivities",
-                    "CashFlowsFromFinancingActivities",
-                ]:
-                    financial_data["cash_flow"][standard_name] = {
-                        "value": value,
-                        "period": fact["context"]["period"],
-                        "unit": fact["unit_ref"],
-                    }
-
-        return financial_data
+        return categorize_facts(facts)
 
     async def health_check(self) -> HealthCheck:
         """Check EDINET API health."""
@@ -646,6 +633,13 @@ class EDINETAdapter(FinancialDataAdapter):
                     "requests_today": self._total_requests,
                     "requests_this_hour": self._request_count_hour,
                     "requests_this_minute": self._request_count_minute,
+                    "xbrl_parser": self._parse_pool.get_metrics(),
+                    "document_store": (
+                        self._document_store.get_stats()
+                        if self._document_store
+                        else None
+                    ),
+                    "document_index": self._document_index.get_stats(),
                 },
             )
 
@@ -702,39 +696,11 @@ class EDINETAdapter(FinancialDataAdapter):
             List of financial statement data
         """
         try:
-            sec_code = self._normalize_symbol(symbol)
-
-            # Determine document type based on period
-            if period == "annual":
-                doc_type_code = "120"  # Annual Securities Report
-            elif period == "quarterly":
-                doc_type_code = "130"  # Quarterly Report
-            else:
-                raise InvalidDataError(f"Unsupported period type: {period}")
-
-            # Search for recent documents (last 2 years)
-            date_from = datetime.utcnow() - timedelta(days=730)
-            date_to = datetime.utcnow()
-
-            documents = await self._search_documents(
-                sec_code=sec_code,
-                doc_type_code=doc_type_code,
-                date_from=date_from,
-                date_to=date_to,
-            )
-
-            if not documents:
-                return []
+            filings = await self.get_parsed_filings(symbol, period)
 
             results = []
-
-            # Process up to 5 most recent documents
-            for doc in documents[:5]:
+            for doc, financial_data in filings:
                 try:
-                    # Download and parse document
-                    xbrl_content = await self._download_document(doc.doc_id)
-                    financial_data = self._parse_xbrl_financial_data(xbrl_content)
-
                     # Extract requested statement type
                     if statement_type in financial_data:
                         statement_data = {
@@ -772,6 +738,60 @@ class EDINETAdapter(FinancialDataAdapter):
             logger.error(f"Error getting financial statements for {symbol}: {e}")
             raise
 
+    async def get_parsed_filings(
+        self, symbol: str, period: str = "annual", limit: int = 5
+    ) -> List[Tuple[EDINETDocument, Dict[str, Any]]]:
+        """
+        Get a company's recent filings with their parsed financial data.
+
+        Documents are downloaded and parsed concurrently; documents that fail
+        are logged and left out.
+
+        Args:
+            symbol: Stock symbol (securities code)
+            period: Period type (annual, quarterly)
+            limit: Maximum number of most recent filings
+
+        Returns:
+            List of (document, parsed financial data), newest first
+        """
+        sec_code = self._normalize_symbol(symbol)
+
+        # Determine document type based on period
+        if period == "annual":
+            doc_type_code = "120"  # Annual Securities Report
+        elif period == "quarterly":
+            doc_type_code = "130"  # Quarterly Report
+        else:
+            raise InvalidDataError(f"Unsupported period type: {period}")
+
+        # Search for recent documents (last 2 years)
+        date_from = datetime.utcnow() - timedelta(days=730)
+        date_to = datetime.utcnow()
+
+        documents = await self._search_documents(
+            sec_code=sec_code,
+            doc_type_code=doc_type_code,
+            date_from=date_from,
+            date_to=date_to,
+        )
+
+        recent_documents = documents[:limit]
+        parsed_documents = await asyncio.gather(
+            *(self._get_parsed_document(doc.doc_id) for doc in recent_documents),
+            return_exceptions=True,
+        )
+
+        filings = []
+        for doc, financial_data in zip(recent_documents, parsed_documents):
+            if isinstance(financial_data, Exception):
+                logger.warning(
+                    f"Error processing document {doc.doc_id}: {financial_data}"
+                )
+                continue
+            filings.append((doc, financial_data))
+        return filings
+
     def _determine_fiscal_period(
         self, start_date: Optional[datetime], end_date: Optional[datetime]
     ) -> str:
@@ -842,8 +862,7 @@ class EDINETAdapter(FinancialDataAdapter):
 
             # Try to get additional financial metrics from latest report
             try:
-                xbrl_content = await self._download_document(latest_doc.doc_id)
-                financial_data = self._parse_xbrl_financial_data(xbrl_content)
+                financial_data = await self._get_parsed_document(latest_doc.doc_id)
 
                 # Add key financial metrics to overview
                 if "balance_sheet" in financial_data:
@@ -878,3 +897,4 @@ class EDINETAdapter(FinancialDataAdapter):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self._close_session()
+        self._parse_pool.shutdown()
@@ -0,0 +1,398 @@
+"""Local index of the EDINET daily document lists.
+
+EDINET only lists documents per submission day (``documents.json?date=``), so
+finding one company's filings means scanning every day in the range. The
+index keeps each day's list once, keyed by date, with lookups by securities
+code, EDINET code and document type, so per-company searches are answered
+locally and only days not yet indexed are fetched.
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from ..core.holidays import japanese_holidays
+
+logger = logging.getLogger(__name__)
+
+# EDINET days follow Japan time
+JST_OFFSET = timedelta(hours=9)
+
+
+@dataclass
+class EDINETDocument:
+    """EDINET document metadata."""
+
+    doc_id: str
+    filer_name: str
+    fund_code: Optional[str]
+    sec_code: Optional[str]
+    jcn: Optional[str]
+    edinet_code: Optional[str]
+    doc_type_code: str
+    doc_description: str
+    submit_date: datetime
+    period_start: Optional[datetime]
+    period_end: Optional[datetime]
+    doc_url: str
+
+    @classmethod
+    def from_result(cls, result: Dict[str, Any], document_url: str) -> "EDINETDocument":
+        """
+        Build document metadata from a ``documents.json`` result entry.
+
+        Args:
+            result: Result entry from the EDINET document list
+            document_url: Base URL of document downloads
+
+        Returns:
+            EDINETDocument
+        """
+        period_start = None
+        period_end = None
+        if result.get("periodStart"):
+            period_start = datetime.strptime(result["periodStart"], "%Y-%m-%d")
+        if result.get("periodEnd"):
+            period_end = datetime.strptime(result["periodEnd"], "%Y-%m-%d")
+
+        return cls(
+            doc_id=result["docID"],
+            filer_name=result.get("filerName") or "",
+            fund_code=result.get("fundCode"),
+            sec_code=result.get("secCode"),
+            jcn=result.get("JCN"),
+            edinet_code=result.get("edinetCode"),
+            doc_type_code=result.get("docTypeCode") or "",
+            doc_description=result.get("docDescription") or "",
+            submit_date=datetime.strptime(result["submitDateTime"], "%Y-%m-%d %H:%M"),
+            period_start=period_start,
+            period_end=period_end,
+            doc_url=f"{document_url}/{result['docID']}",
+        )
+
+
+def edinet_today() -> date:
+    """Get the current date in Japan time."""
+    return (datetime.utcnow() + JST_OFFSET).date()
+
+
+def is_edinet_business_day(day: date) -> bool:
+    """
+    Check whether EDINET accepts filings on a day.
+
+    Filings are only submitted on administrative business days, so weekends,
+    national holidays and the year-end closure (December 29 - January 3)
+    have empty document lists.
+
+    Args:
+        day: Submission day (Japan time)
+
+    Returns:
+        True if documents can be listed for the day
+    """
+    if day.weekday() >= 5:
+        return False
+    if (day.month == 12 and day.day >= 29) or (day.month == 1 and day.day <= 3):
+        return False
+    return day not in japanese_holidays(day.year)
+
+
+def sec_code_keys(sec_code: Optional[str]) -> List[str]:
+    """
+    Get the lookup keys of a securities code.
+
+    EDINET reports 5-digit codes (e.g. ``72030``) while tickers use the
+    4-digit form, so both are indexed.
+
+    Args:
+        sec_code: Securities code from a document or query
+
+    Returns:
+        List of keys
+    """
+    if not sec_code:
+        return []
+    if len(sec_code) == 5 and sec_code.endswith("0"):
+        return [sec_code, sec_code[:4]]
+    return [sec_code]
+
+
+class EDINETDocumentIndex:
+    """In-memory index of EDINET document lists, optionally kept on disk.
+
+    A day's list is final once it was fetched after that day ended (Japan
+    time); days fetched while still open are refreshed after
+    ``refresh_interval`` seconds. With ``index_dir`` set, each day is stored
+    as ``<index_dir>/<YYYY-MM-DD>.json`` and reloaded on start.
+    """
+
+    def __init__(self, index_dir: Optional[str] = None, refresh_interval: int = 900):
+        """
+        Initialize the index.
+
+        Args:
+            index_dir: Directory persisting daily lists (None keeps them in memory)
+            refresh_interval: Seconds before an open day is fetched again
+        """
+        self.index_dir = Path(index_dir) if index_dir else None
+        self.refresh_interval = refresh_interval
+
+        self._lock = threading.Lock()
+        self._days: Dict[date, List[str]] = {}
+        self._fetched_at: Dict[date, datetime] = {}
+        self._documents: Dict[str, EDINETDocument] = {}
+        self._document_days: Dict[str, date] = {}
+        self._by_sec_code: Dict[str, Set[str]] = {}
+        self._by_edinet_code: Dict[str, Set[str]] = {}
+        self._by_doc_type: Dict[str, Set[str]] = {}
+        self._days_fetched = 0
+        self._queries = 0
+
+        if self.index_dir is not None:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    def _load(self) -> None:
+        """Load persisted daily lists."""
+        for path in sorted(self.index_dir.glob("*.json")):
+            try:
+                day = date.fromisoformat(path.stem)
+                stored = json.loads(path.read_text())
+                self._index_day(
+                    day,
+                    stored["results"],
+                    datetime.fromisoformat(stored["fetched_at"]),
+                    stored["document_url"],
+                )
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable EDINET index file {path}: {e}")
+
+    def _day_path(self, day: date) -> Path:
+        return self.index_dir / f"{day.isoformat()}.json"
+
+    def _save_day(self, day: date, payload: Dict[str, Any]) -> None:
+        """Persist a daily list so readers never see partial content."""
+        path = self._day_path(day)
+        tmp_path = path.with_name(
+            f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False))
+        os.replace(tmp_path, path)
+
+    def needs_sync(self, day: date, now: Optional[datetime] = None) -> bool:
+        """
+        Check whether a day's list must be fetched.
+
+        Args:
+            day: Submission day (Japan time)
+            now: Current UTC time (default: now)
+
+        Returns:
+            True if the day is missing or may still change
+        """
+        fetched_at = self._fetched_at.get(day)
+        if fetched_at is None:
+            return True
+        if (fetched_at + JST_OFFSET).date() > day:
+            return False
+        now = now or datetime.utcnow()
+        return (now - fetched_at).total_seconds() >= self.refresh_interval
+
+    def days_to_sync(
+        self, date_from: date, date_to: date, now: Optional[datetime] = None
+    ) -> List[date]:
+        """
+        Get days in a range that must be fetched, newest first.
+
+        Days after today (Japan time) and days EDINET accepts no filings on
+        are never fetched.
+
+        Args:
+            date_from: First day
+            date_to: Last day
+            now: Current UTC time (default: now)
+
+        Returns:
+            List of days
+        """
+        now = now or datetime.utcnow()
+        day = min(date_to, (now + JST_OFFSET).date())
+        days = []
+        while day >= date_from:
+            if is_edinet_business_day(day) and self.needs_sync(day, now):
+                days.append(day)
+            day -= timedelta(days=1)
+        return days
+
+    def is_indexed(self, day: date) -> bool:
+        """Check whether a day's list is in the index."""
+        return day in self._fetched_at
+
+    def add_day(
+        self,
+        day: date,
+        results: List[Dict[str, Any]],
+        document_url: str,
+        fetched_at: Optional[datetime] = None,
+    ) -> int:
+        """
+        Replace a day's list in the index.
+
+        Args:
+            day: Submission day (Japan time)
+            results: ``results`` of the day's ``documents.json`` response
+            document_url: Base URL of document downloads
+            fetched_at: UTC time the list was fetched (default: now)
+
+        Returns:
+            Number of documents indexed for the day
+        """
+        fetched_at = fetched_at or datetime.utcnow()
+        indexed = self._index_day(day, results, fetched_at, document_url)
+        self._days_fetched += 1
+
+        if self.index_dir is not None:
+            self._save_day(
+                day,
+                {
+                    "fetched_at": fetched_at.isoformat(),
+                    "document_url": document_url,
+                    "results": results,
+                },
+            )
+        return indexed
+
+    def _index_day(
+        self,
+        day: date,
+        results: List[Dict[str, Any]],
+        fetched_at: datetime,
+        document_url: str,
+    ) -> int:
+        """Index a day's list, replacing any earlier version of it."""
+        documents = []
+        for result in results:
+            # Withdrawn filings are listed without a submission time
+            if not result.get("docID") or not result.get("submitDateTime"):
+                continue
+            try:
+                documents.append(EDINETDocument.from_result(result, document_url))
+            except ValueError as e:
+                logger.debug(f"Skipping EDINET result {result.get('docID')}: {e}")
+
+        with self._lock:
+            for doc_id in self._days.pop(day, []):
+                if self._document_days.get(doc_id) == day:
+                    self._unindex(doc_id)
+            for document in documents:
+                self._unindex(document.doc_id)
+                self._documents[document.doc_id] = document
+                self._document_days[document.doc_id] = day
+                for key in sec_code_keys(document.sec_code):
+                    self._by_sec_code.setdefault(key, set()).add(document.doc_id)
+                if document.edinet_code:
+                    self._by_edinet_code.setdefault(document.edinet_code, set()).add(
+                        document.doc_id
+                    )
+                self._by_doc_type.setdefault(document.doc_type_code, set()).add(
+                    document.doc_id
+                )
+            self._days[day] = [document.doc_id for document in documents]
+            self._fetched_at[day] = fetched_at
+
+        return len(documents)
+
+    def _unindex(self, doc_id: str) -> None:
+        """Remove a document from all lookups."""
+        document = self._documents.pop(doc_id, None)
+        if document is None:
+            return
+        del self._document_days[doc_id]
+        for lookup, key in (
+            *((self._by_sec_code, key) for key in sec_code_keys(document.sec_code)),
+            (self._by_edinet_code, document.edinet_code),
+            (self._by_doc_type, document.doc_type_code),
+        ):
+            doc_ids = lookup.get(key)
+            if doc_ids is not None:
+                doc_ids.discard(doc_id)
+                if not doc_ids:
+                    del lookup[key]
+
+    def _candidates(
+        self,
+        sec_code: Optional[str],
+        edinet_code: Optional[str],
+        doc_type_code: Optional[str],
+    ) -> Iterator[str]:
+        """Get document IDs matching all given codes."""
+        lookups = []
+        if sec_code:
+            lookups.append(self._by_sec_code.get(sec_code, set()))
+        if edinet_code:
+            lookups.append(self._by_edinet_code.get(edinet_code, set()))
+        if doc_type_code:
+            lookups.append(self._by_doc_type.get(doc_type_code, set()))
+
+        if not lookups:
+            return iter(list(self._documents))
+
+        lookups.sort(key=len)
+        return iter(lookups[0].intersection(*lookups[1:]))
+
+    def query(
+        self,
+        sec_code: Optional[str] = None,
+        edinet_code: Optional[str] = None,
+        doc_type_code: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> List[EDINETDocument]:
+        """
+        Find indexed documents.
+
+        Args:
+            sec_code: Securities code (4 or 5 digits)
+            edinet_code: EDINET code
+            doc_type_code: Document type code
+            date_from: First day the document was listed on
+            date_to: Last day the document was listed on
+
+        Returns:
+            Matching documents, newest first
+        """
+        with self._lock:
+            self._queries += 1
+            documents = []
+            for doc_id in self._candidates(sec_code, edinet_code, doc_type_code):
+                listed_day = self._document_days[doc_id]
+                if date_from and listed_day < date_from:
+                    continue
+                if date_to and listed_day > date_to:
+                    continue
+                documents.append(self._documents[doc_id])
+
+        documents.sort(key=lambda x: (x.submit_date, x.doc_id), reverse=True)
+        return documents
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with indexed days, documents and counters
+        """
+        return {
+            "days": len(self._days),
+            "documents": len(self._documents),
+            "first_day": min(self._days).isoformat() if self._days else None,
+            "last_day": max(self._days).isoformat() if self._days else None,
+            "days_fetched": self._days_fetched,
+            "queries": self._queries,
+            "persistent": self.index_dir is not None,
+        }
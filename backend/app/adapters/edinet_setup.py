@@ -18,6 +18,13 @@ def create_edinet_config(
     requests_per_minute: int = 60,
     requests_per_hour: int = 1000,
     cache_ttl: int = 86400,
+    xbrl_parse_workers: int = 2,
+    xbrl_parse_queue: int = 16,
+    document_cache_dir: Optional[str] = None,
+    document_cache_max_bytes: int = 2 * 1024**3,
+    download_concurrency: int = 3,
+    document_index_dir: Optional[str] = None,
+    index_sync_concurrency: int = 4,
 ) -> Dict[str, Any]:
     """
     Create EDINET adapter configuration.
@@ -29,6 +36,13 @@ def create_edinet_config(
         requests_per_minute: Rate limit per minute
         requests_per_hour: Rate limit per hour
         cache_ttl: Cache TTL for documents in seconds
+        xbrl_parse_workers: XBRL parser processes (0 = parse inline)
+        xbrl_parse_queue: Documents allowed to wait for a parser process
+        document_cache_dir: Directory for the on-disk document store (None disables it)
+        document_cache_max_bytes: Size limit of the document store
+        download_concurrency: Concurrent document downloads
+        document_index_dir: Directory persisting daily document lists (None keeps them in memory)
+        index_sync_concurrency: Daily document lists fetched at once
 
     Returns:
         Configuration dictionary
@@ -40,6 +54,13 @@ def create_edinet_config(
         "requests_per_minute": requests_per_minute,
         "requests_per_hour": requests_per_hour,
         "cache_ttl": cache_ttl,
+        "xbrl_parse_workers": xbrl_parse_workers,
+        "xbrl_parse_queue": xbrl_parse_queue,
+        "document_cache_dir": document_cache_dir,
+        "document_cache_max_bytes": document_cache_max_bytes,
+        "download_concurrency": download_concurrency,
+        "document_index_dir": document_index_dir,
+        "index_sync_concurrency": index_sync_concurrency,
     }
 
 
@@ -266,6 +287,7 @@ def setup_from_environment() -> Optional[EDINETAdapter]:
         Configured EDINET adapter or None if setup fails
     """
     import os
+    import tempfile
 
     try:
         # Get configuration from environment with defaults
@@ -276,6 +298,21 @@ def setup_from_environment() -> Optional[EDINETAdapter]:
             requests_per_minute=int(os.getenv("EDINET_REQUESTS_PER_MINUTE", "60")),
             requests_per_hour=int(os.getenv("EDINET_REQUESTS_PER_HOUR", "1000")),
             cache_ttl=int(os.getenv("EDINET_CACHE_TTL", "86400")),
+            xbrl_parse_workers=int(os.getenv("EDINET_XBRL_PARSE_WORKERS", "2")),
+            xbrl_parse_queue=int(os.getenv("EDINET_XBRL_PARSE_QUEUE", "16")),
+            document_cache_dir=os.getenv(
+                "EDINET_DOCUMENT_CACHE_DIR",
+                os.path.join(tempfile.gettempdir(), "edinet_documents"),
+            ),
+            document_cache_max_bytes=int(
+                os.getenv("EDINET_DOCUMENT_CACHE_MAX_BYTES", str(2 * 1024**3))
+            ),
+            download_concurrency=int(os.getenv("EDINET_DOWNLOAD_CONCURRENCY", "3")),
+            document_index_dir=os.getenv(
+                "EDINET_DOCUMENT_INDEX_DIR",
+                os.path.join(tempfile.gettempdir(), "edinet_index"),
+            ),
+            index_sync_concurrency=int(os.getenv("EDINET_INDEX_SYNC_CONCURRENCY", "4")),
         )
 
         # Determine priority from environment
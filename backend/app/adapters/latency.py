@@ -0,0 +1,153 @@
+"""Latency tracking for data source adapters."""
+
+import bisect
+from typing import Any, Dict, List, Optional, Sequence
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+DEFAULT_LATENCY_BUCKETS_MS: Sequence[float] = (
+    5,
+    10,
+    25,
+    50,
+    75,
+    100,
+    150,
+    250,
+    400,
+    600,
+    1000,
+    1500,
+    2500,
+    4000,
+    6000,
+    10000,
+    15000,
+    30000,
+)
+
+
+class LatencyTracker:
+    """Tracks response latency of one adapter with an EWMA and a histogram.
+
+    The EWMA reacts quickly to recent changes and is used as the expected
+    latency for routing. The histogram gives percentile estimates (e.g. p95
+    for hedging). Histogram counts are halved once they exceed
+    ``max_samples`` so old observations age out.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        buckets_ms: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS,
+        max_samples: int = 1000,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            alpha: EWMA smoothing factor (higher = more weight on recent samples)
+            buckets_ms: Sorted histogram bucket upper bounds in milliseconds
+            max_samples: Histogram size after which counts are halved
+        """
+        self.alpha = alpha
+        self.buckets_ms: List[float] = list(buckets_ms)
+        self.max_samples = max_samples
+        self._counts: List[int] = [0] * (len(self.buckets_ms) + 1)
+        self._total = 0
+        self._ewma_ms: Optional[float] = None
+        self._max_ms = 0.0
+        self._observations = 0
+
+    @property
+    def sample_count(self) -> int:
+        """Total number of observations recorded."""
+        return self._observations
+
+    @property
+    def ewma_ms(self) -> Optional[float]:
+        """Exponentially weighted moving average latency, if any samples."""
+        return self._ewma_ms
+
+    def record(self, latency_ms: float) -> None:
+        """
+        Record a latency observation.
+
+        Args:
+            latency_ms: Observed latency in milliseconds
+        """
+        latency_ms = max(0.0, latency_ms)
+
+        if self._ewma_ms is None:
+            self._ewma_ms = latency_ms
+        else:
+            self._ewma_ms += self.alpha * (latency_ms - self._ewma_ms)
+
+        self._counts[self.bucket_index(latency_ms)] += 1
+        self._total += 1
+        self._observations += 1
+        self._max_ms = max(self._max_ms, latency_ms)
+
+        if self._total > self.max_samples:
+            self._counts = [count // 2 for count in self._counts]
+            self._total = sum(self._counts)
+
+    def bucket_index(self, latency_ms: float) -> int:
+        """
+        Get the histogram bucket index for a latency.
+
+        Args:
+            latency_ms: Latency in milliseconds
+
+        Returns:
+            Index of the bucket containing the latency
+        """
+        return bisect.bisect_left(self.buckets_ms, latency_ms)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        Estimate a latency percentile from the histogram.
+
+        Values are linearly interpolated inside the matching bucket.
+
+        Args:
+            p: Percentile in the range 0-100
+
+        Returns:
+            Estimated latency in milliseconds, or None if no samples
+        """
+        if self._total == 0:
+            return None
+
+        target = self._total * min(max(p, 0.0), 100.0) / 100.0
+        cumulative = 0
+        for index, count in enumerate(self._counts):
+            if count == 0:
+                continue
+            if cumulative + count >= target:
+                lower = self.buckets_ms[index - 1] if index > 0 else 0.0
+                upper = (
+                    self.buckets_ms[index]
+                    if index < len(self.buckets_ms)
+                    else max(self._max_ms, lower)
+                )
+                fraction = (target - cumulative) / count
+                return lower + (upper - lower) * fraction
+            cumulative += count
+
+        return self._max_ms
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get a summary of tracked latency.
+
+        Returns:
+            Dictionary with sample count, EWMA and p50/p95/p99 estimates
+        """
+        return {
+            "samples": self._observations,
+            "ewma_ms": self._ewma_ms,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self._max_ms if self._observations else None,
+        }
@@ -6,9 +6,12 @@ import asyncio
 import hashlib
 import logging
 import re
+import time
 import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
 import aiohttp
@@ -16,10 +19,52 @@ from bs4 import BeautifulSoup
 
 from ..core.config import settings
 from .base import CostInfo, HealthCheck, HealthStatus, NewsAdapter, RateLimitInfo
+from .news_dedup import NewsDeduplicator, char_shingles, jaccard
 
 logger = logging.getLogger(__name__)
 
 
+def parse_published_at(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an article's publication time.
+
+    News API returns ISO 8601 timestamps and RSS feeds RFC 822 dates.
+
+    Args:
+        value: Publication time as provided by the source
+
+    Returns:
+        Timezone-aware datetime (naive values are taken as UTC), or None if
+        the value cannot be parsed
+    """
+    if not value or not value.strip():
+        return None
+
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@dataclass
+class _FeedState:
+    """Cache validators and parsed items of one RSS feed."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    fetched_at: Optional[float] = None  # time.monotonic() of the last response
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
 class NewsDataAdapter(NewsAdapter):
     """
     News data adapter that aggregates news from multiple sources including
@@ -73,9 +118,15 @@ class NewsDataAdapter(NewsAdapter):
             "requests_per_day": 1000,
         }
 
-        # Deduplication cache
-        self._seen_articles: Set[str] = set()
-        self._article_cache_ttl = 86400  # 24 hours
+        # Near-duplicate detection, remembering recent headlines across calls
+        self._deduplicator = NewsDeduplicator(
+            threshold=config.get("dedup_threshold", 0.8),
+            window_days=config.get("dedup_window_days", 2),
+        )
+
+        # Parsed RSS items shared by all queries until the feed is re-checked
+        self.rss_cache_ttl = config.get("rss_cache_ttl", 600)
+        self._feed_states: Dict[str, _FeedState] = {}
 
         # Session for HTTP requests
         self._session: Optional[aiohttp.ClientSession] = None
@@ -110,7 +161,8 @@ class NewsDataAdapter(NewsAdapter):
                 last_check=datetime.utcnow(),
                 metadata={
                     "sources_tested": len(self.rss_sources)
-                    + (1 if self.news_api_key else 0)
+                    + (1 if self.news_api_key else 0),
+                    "duplicates_dropped": self._deduplicator.duplicates_dropped,
                 },
             )
 
@@ -353,43 +405,88 @@ class NewsDataAdapter(NewsAdapter):
     ) -> List[Dict[str, Any]]:
         """Process a single RSS source."""
         try:
+            items = await self._get_feed_items(source)
+        except Exception as e:
+            logger.error(f"Error processing RSS source {source['name']}: {e}")
+            return []
+
+        # Copies, since callers annotate articles (e.g. relevance_score)
+        return [
+            dict(article)
+            for article in items
+            if self._filter_article(article, symbol, keywords, start_date, end_date)
+        ]
+
+    async def _get_feed_items(self, source: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Get the parsed items of an RSS feed.
+
+        Parsed items are shared for ``rss_cache_ttl`` seconds. After that the
+        feed is requested again with its ETag/Last-Modified validators, and a
+        304 response keeps the cached items. Concurrent callers wait for a
+        single fetch.
+
+        Args:
+            source: RSS source configuration
+
+        Returns:
+            Normalized articles of the feed (not to be modified)
+        """
+        state = self._feed_states.setdefault(source["url"], _FeedState())
+
+        async with state.lock:
+            if (
+                state.fetched_at is not None
+                and time.monotonic() - state.fetched_at < self.rss_cache_ttl
+            ):
+                return state.items
+
+            headers = {}
+            if state.etag:
+                headers["If-None-Match"] = state.etag
+            if state.last_modified:
+                headers["If-Modified-Since"] = state.last_modified
+
             session = await self._get_session()
+            async with session.get(source["url"], headers=headers) as response:
+                if response.status == 304:
+                    state.fetched_at = time.monotonic()
+                    return state.items
 
-            async with session.get(source["url"]) as response:
                 if response.status != 200:
                     logger.warning(
                         f"RSS source {source['name']} returned status {response.status}"
                     )
-                    return []
+                    return state.items
 
                 content = await response.text()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
 
-                # Parse RSS feed using XML parser
-                try:
-                    root = ET.fromstring(content)
-                    articles = []
-
-                    # Handle both RSS and Atom feeds
-                    items = root.findall(".//item") or root.findall(
-                        ".//{http://www.w3.org/2005/Atom}entry"
-                    )
-
-                    for item in items:
-                        article = self._normalize_rss_article_xml(item, source)
-                        if article and self._filter_article(
-                            article, symbol, keywords, start_date, end_date
-                        ):
-                            articles.append(article)
+            # Parse RSS feed using XML parser
+            try:
+                root = ET.fromstring(content)
+            except ET.ParseError as e:
+                logger.error(f"Error parsing RSS feed from {source['name']}: {e}")
+                return state.items
+
+            # Handle both RSS and Atom feeds
+            items = root.findall(".//item") or root.findall(
+                ".//{http://www.w3.org/2005/Atom}entry"
+            )
 
-                    return articles
+            articles = []
+            for item in items:
+                article = self._normalize_rss_article_xml(item, source)
+                if article:
+                    articles.append(article)
 
-                except ET.ParseError as e:
-                    logger.error(f"Error parsing RSS feed from {source['name']}: {e}")
-                    return []
+            state.items = articles
+            state.etag = etag
+            state.last_modified = last_modified
+            state.fetched_at = time.monotonic()
 
-        except Exception as e:
-            logger.error(f"Error processing RSS source {source['name']}: {e}")
-            return []
+            return articles
 
     def _normalize_news_api_article(
         self, article: Dict[str, Any]
@@ -560,49 +657,12 @@ class NewsDataAdapter(NewsAdapter):
     def _deduplicate_articles(
         self, articles: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Remove duplicate articles based on content similarity."""
-        seen_ids = set()
-        seen_headlines = set()
-        deduplicated = []
-
-        for article in articles:
-            article_id = article.get("id")
-            headline = article.get("headline", "").strip().lower()
-
-            # Skip if we've seen this exact ID or very similar headline
-            if article_id in seen_ids:
-                continue
-
-            # Check for similar headlines (simple approach)
-            is_duplicate = False
-            for seen_headline in seen_headlines:
-                if self._calculate_similarity(headline, seen_headline) > 0.8:
-                    is_duplicate = True
-                    break
-
-            if not is_duplicate:
-                seen_ids.add(article_id)
-                seen_headlines.add(headline)
-                deduplicated.append(article)
-
-        return deduplicated
+        """Remove duplicate articles by ID and near-duplicate headlines."""
+        return self._deduplicator.deduplicate(articles)
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate simple similarity between two texts."""
-        if not text1 or not text2:
-            return 0.0
-
-        # Simple word-based similarity
-        words1 = set(text1.split())
-        words2 = set(text2.split())
-
-        if not words1 or not words2:
-            return 0.0
-
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-
-        return len(intersection) / len(union) if union else 0.0
+        """Calculate character n-gram Jaccard similarity between two texts."""
+        return jaccard(char_shingles(text1), char_shingles(text2))
 
     def _score_relevance(
         self,
@@ -0,0 +1,333 @@
+"""Near-duplicate detection for news articles with MinHash and LSH.
+
+Headlines are normalized and split into character n-grams, which works for
+unsegmented Japanese text where whitespace tokenization does not. Each
+headline gets a MinHash signature; signatures are split into bands and
+hashed into LSH buckets so only articles sharing a bucket are compared. A
+batch is deduplicated in near-linear time, and a rolling index keeps the
+signatures of recent days so copies arriving in later batches are caught.
+"""
+
+import re
+import time
+import unicodedata
+import zlib
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Mersenne prime for universal hashing of 32-bit shingle hashes
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+_STRIP_PATTERN = re.compile(r"[\s\W_]+", re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for shingling.
+
+    Full-width characters are folded (NFKC), case is removed and
+    whitespace and punctuation are dropped.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Normalized text
+    """
+    return _STRIP_PATTERN.sub("", unicodedata.normalize("NFKC", text or "").lower())
+
+
+def char_shingles(text: str, n: int = 3) -> Set[str]:
+    """
+    Split text into character n-grams.
+
+    Args:
+        text: Input text
+        n: Shingle length
+
+    Returns:
+        Set of shingles; texts shorter than ``n`` give a single shingle
+    """
+    normalized = normalize_text(text)
+    if not normalized:
+        return set()
+    if len(normalized) <= n:
+        return {normalized}
+    return {normalized[i : i + n] for i in range(len(normalized) - n + 1)}
+
+
+def jaccard(shingles1: Set[str], shingles2: Set[str]) -> float:
+    """Exact Jaccard similarity of two shingle sets."""
+    if not shingles1 or not shingles2:
+        return 0.0
+    return len(shingles1 & shingles2) / len(shingles1 | shingles2)
+
+
+class MinHasher:
+    """Computes MinHash signatures of character shingle sets."""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        """
+        Initialize the hasher.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            shingle_size: Character n-gram length
+            seed: Seed of the permutation parameters
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        # Parameters below 2**32 keep a * x + b within uint64 for 32-bit x
+        self._a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            uint64 array of ``num_perm`` values, or None for empty text
+        """
+        shingles = char_shingles(text, self.shingle_size)
+        if not shingles:
+            return None
+
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        # (a * x + b) mod p for every permutation and shingle at once
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=0)
+
+
+def candidate_probability(similarity: float, bands: int, rows: int) -> float:
+    """
+    Probability that two signatures share at least one LSH band.
+
+    Args:
+        similarity: Jaccard similarity of the two texts
+        bands: Number of LSH bands
+        rows: Signature values per band
+
+    Returns:
+        ``1 - (1 - s**rows) ** bands``; the curve rises steepest near
+        ``(1 / bands) ** (1 / rows)``
+    """
+    return 1.0 - (1.0 - similarity**rows) ** bands
+
+
+def estimate_similarity(signature1: np.ndarray, signature2: np.ndarray) -> float:
+    """Estimate the Jaccard similarity of two MinHash signatures."""
+    return float(np.count_nonzero(signature1 == signature2)) / len(signature1)
+
+
+class NearDuplicateIndex:
+    """In-memory LSH index of MinHash signatures with a rolling time window.
+
+    Signatures are split into ``bands`` bands of equal width; two articles
+    become candidates when any band matches, and candidates are confirmed by
+    their estimated similarity. Entries older than ``window_seconds`` are
+    dropped as new ones arrive.
+
+    The default 16 bands of 4 rows put the knee of the candidate curve near
+    a similarity of 0.5, well below the 0.8 threshold, so a pair at the
+    threshold becomes a candidate with probability above 0.999 (8 bands of
+    8 rows would miss about one in four). The extra candidates are rejected
+    by the similarity check.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.8,
+        window_seconds: Optional[float] = 2 * 86400,
+        max_entries: int = 100000,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            num_perm: Signature length; must be divisible by ``bands``
+            bands: Number of LSH bands
+            threshold: Estimated similarity at which articles are duplicates
+            window_seconds: Age after which entries are dropped (None keeps all)
+            max_entries: Maximum number of entries kept
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._order: Deque[Tuple[float, str]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows : (band + 1) * self.rows].tobytes()
+
+    def find(
+        self, signature: np.ndarray, exclude: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Find an indexed near-duplicate of a signature.
+
+        Args:
+            signature: MinHash signature
+            exclude: Key that does not count as a duplicate (the article itself)
+
+        Returns:
+            Key of the most similar entry at or above the threshold, or None
+        """
+        best_key = None
+        best_similarity = self.threshold
+        checked: Set[str] = set()
+
+        for band, band_key in self._band_keys(signature):
+            for key in self._buckets[band].get(band_key, ()):
+                if key in checked or key == exclude:
+                    continue
+                checked.add(key)
+                similarity = estimate_similarity(signature, self._signatures[key])
+                if similarity >= best_similarity:
+                    best_key, best_similarity = key, similarity
+
+        return best_key
+
+    def add(
+        self, key: str, signature: np.ndarray, timestamp: Optional[float] = None
+    ) -> None:
+        """
+        Add a signature to the index.
+
+        Args:
+            key: Article key
+            signature: MinHash signature
+            timestamp: Time the article was seen (default: now)
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        self.expire(timestamp)
+        if key in self._signatures:
+            return
+
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, set()).add(key)
+        self._order.append((timestamp, key))
+
+        while len(self._order) > self.max_entries:
+            self._remove(self._order.popleft()[1])
+
+    def expire(self, now: Optional[float] = None) -> None:
+        """Drop entries older than the window."""
+        if self.window_seconds is None:
+            return
+        cutoff = (time.time() if now is None else now) - self.window_seconds
+        while self._order and self._order[0][0] < cutoff:
+            self._remove(self._order.popleft()[1])
+
+    def _remove(self, key: str) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+
+class NewsDeduplicator:
+    """Removes exact and near-duplicate articles within and across batches."""
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 3,
+        threshold: float = 0.8,
+        window_days: float = 2,
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            num_perm: MinHash signature length
+            bands: Number of LSH bands
+            shingle_size: Character n-gram length
+            threshold: Similarity at which headlines are duplicates
+            window_days: Days recent headlines are remembered across batches
+                (0 deduplicates within each batch only)
+        """
+        self.hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+        self._index_args = dict(num_perm=num_perm, bands=bands, threshold=threshold)
+        self.recent: Optional[NearDuplicateIndex] = (
+            NearDuplicateIndex(window_seconds=window_days * 86400, **self._index_args)
+            if window_days > 0
+            else None
+        )
+        self.duplicates_dropped = 0
+
+    def deduplicate(self, articles: List[Dict[str, object]]) -> List[Dict[str, object]]:
+        """
+        Remove duplicate articles, keeping the first occurrence.
+
+        An article is a duplicate if its ID was already kept in the batch or
+        its headline is a near-duplicate of a headline kept in the batch or
+        of a different article seen within the window.
+
+        Args:
+            articles: Normalized articles with ``id`` and ``headline``
+
+        Returns:
+            Deduplicated articles in their original order
+        """
+        batch = NearDuplicateIndex(window_seconds=None, **self._index_args)
+        seen_ids: Set[object] = set()
+        kept = []
+        now = time.time()
+
+        for article in articles:
+            article_id = article.get("id")
+            if article_id in seen_ids:
+                self.duplicates_dropped += 1
+                continue
+
+            signature = self.hasher.signature(str(article.get("headline") or ""))
+            if signature is not None:
+                key = str(article_id)
+                if batch.find(signature) is not None or (
+                    self.recent is not None
+                    and self.recent.find(signature, exclude=key) is not None
+                ):
+                    self.duplicates_dropped += 1
+                    continue
+                batch.add(key, signature, now)
+
+            seen_ids.add(article_id)
+            kept.append((article, signature))
+
+        if self.recent is not None:
+            for article, signature in kept:
+                if signature is not None:
+                    self.recent.add(str(article.get("id")), signature, now)
+
+        return [article for article, _ in kept]
@@ -0,0 +1,135 @@
+"""Columnar (DataFrame) representation of daily price bars."""
+
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Columns of a price frame, in order
+PRICE_FRAME_COLUMNS = (
+    "date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "adjusted_close",
+)
+
+
+def pad_column(values: Optional[Sequence[Any]], length: int) -> np.ndarray:
+    """
+    Convert a JSON array with nulls to a float array of a fixed length.
+
+    Nulls and missing trailing entries become NaN.
+
+    Args:
+        values: Sequence of numbers or None
+        length: Length of the result
+
+    Returns:
+        float64 array of ``length`` elements
+    """
+    column = np.full(length, np.nan)
+    if values:
+        converted = np.array(values[:length], dtype=np.float64)
+        column[: len(converted)] = converted
+    return column
+
+
+def build_price_frame(
+    dates: np.ndarray,
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    volumes: np.ndarray,
+    adjusted_closes: np.ndarray,
+) -> pd.DataFrame:
+    """
+    Build a clean price frame from column arrays.
+
+    Bars without a positive close (suspended days) are dropped, missing
+    open/high/low/adjusted close fall back to the close, missing volume
+    becomes 0, and duplicate dates keep the last bar.
+
+    Args:
+        dates: datetime64 array of bar dates
+        opens: Open prices (NaN for missing)
+        highs: High prices (NaN for missing)
+        lows: Low prices (NaN for missing)
+        closes: Close prices (NaN for missing)
+        volumes: Volumes (NaN for missing)
+        adjusted_closes: Adjusted closes (NaN for missing)
+
+    Returns:
+        DataFrame with ``PRICE_FRAME_COLUMNS`` sorted by date
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    valid = np.isfinite(closes) & (closes > 0)
+    close = closes[valid]
+
+    def fill(values: np.ndarray) -> np.ndarray:
+        selected = np.asarray(values, dtype=np.float64)[valid]
+        return np.where(np.isfinite(selected) & (selected > 0), selected, close)
+
+    frame = pd.DataFrame(
+        {
+            "date": np.asarray(dates, dtype="datetime64[D]")[valid].astype(
+                "datetime64[ns]"
+            ),
+            "open": fill(opens),
+            "high": fill(highs),
+            "low": fill(lows),
+            "close": close,
+            "volume": np.nan_to_num(
+                np.asarray(volumes, dtype=np.float64)[valid], nan=0.0
+            ).astype(np.int64),
+            "adjusted_close": fill(adjusted_closes),
+        },
+        columns=list(PRICE_FRAME_COLUMNS),
+    )
+
+    return (
+        frame.drop_duplicates("date", keep="last")
+        .sort_values("date", kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+def _record_date(value: Any) -> date:
+    """Get the calendar date of a record's date value."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def price_records_to_frame(records: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Convert per-row price dictionaries to a price frame.
+
+    Args:
+        records: Price dictionaries as returned by ``get_historical_prices``
+
+    Returns:
+        DataFrame with ``PRICE_FRAME_COLUMNS`` sorted by date
+    """
+    records = list(records)
+
+    def column(name: str) -> np.ndarray:
+        return pad_column([record.get(name) for record in records], len(records))
+
+    return build_price_frame(
+        np.array(
+            [_record_date(record["date"]) for record in records], dtype="datetime64[D]"
+        ),
+        column("open"),
+        column("high"),
+        column("low"),
+        column("close"),
+        column("volume"),
+        column("adjusted_close"),
+    )
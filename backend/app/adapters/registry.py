@@ -1,11 +1,13 @@
 """Data source registry with plugin-based architecture."""
 
 import asyncio
+import copy
 import json
 import logging
+import time
 from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type
 
 from .base import (
     BaseDataSourceAdapter,
@@ -16,6 +18,8 @@ from .base import (
     HealthStatus,
     RateLimitExceededError,
 )
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
+from .latency import LatencyTracker
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +36,28 @@ class DataSourceRegistry:
         self._health_check_interval = 300  # 5 minutes
         self._health_check_task: Optional[asyncio.Task] = None
         self._failover_enabled = True
-        self._circuit_breaker_threshold = 5  # Number of failures before circuit opens
-        self._circuit_breaker_timeout = 300  # 5 minutes
-        self._adapter_failures: Dict[str, List[datetime]] = defaultdict(list)
-        self._circuit_breaker_state: Dict[str, bool] = {}  # True = open (disabled)
-        self._circuit_breaker_reset_time: Dict[str, datetime] = {}
+        self._health_check_timeout = 10.0  # Seconds per adapter health check
+        self._circuit_breaker_config = CircuitBreakerConfig()
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+        # Latency tracking, latency-aware routing and hedged requests
+        self._latency_trackers: Dict[str, LatencyTracker] = defaultdict(
+            LatencyTracker
+        )
+        self._latency_routing_enabled = True
+        self._latency_min_samples = 20  # Samples needed before latency is trusted
+        self._hedging_enabled = False
+        self._hedge_percentile = 95.0
+        self._hedge_min_delay_ms = 50.0
+        self._hedging_stats: Dict[str, int] = {"hedged_requests": 0, "hedge_wins": 0}
+
+        # In-flight request coalescing
+        self._coalescing_default = True
+        self._coalescing_overrides: Dict[str, bool] = {}
+        self._inflight_requests: Dict[Tuple[Hashable, ...], asyncio.Task] = {}
+        self._coalescing_stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"requests": 0, "coalesced": 0}
+        )
 
     def register_adapter(self, adapter: BaseDataSourceAdapter) -> None:
         """
@@ -82,12 +103,10 @@ class DataSourceRegistry:
         del self._adapter_by_name[name]
 
         # Clean up failure tracking
-        if name in self._adapter_failures:
-            del self._adapter_failures[name]
-        if name in self._circuit_breaker_state:
-            del self._circuit_breaker_state[name]
-        if name in self._circuit_breaker_reset_time:
-            del self._circuit_breaker_reset_time[name]
+        if name in self._circuit_breakers:
+            del self._circuit_breakers[name]
+        if name in self._latency_trackers:
+            del self._latency_trackers[name]
 
         logger.info(f"Unregistered data source adapter: {name}")
 
@@ -127,7 +146,8 @@ class DataSourceRegistry:
             data_source_type: Type of data source
 
         Returns:
-            List of healthy adapters sorted by priority
+            List of healthy adapters sorted by priority, or by expected latency
+            when latency-aware routing is enabled
         """
         adapters = []
         for adapter in self._adapters[data_source_type]:
@@ -138,8 +158,119 @@ class DataSourceRegistry:
             ):
                 adapters.append(adapter)
 
+        if self._latency_routing_enabled and len(adapters) > 1:
+            adapters = self._order_by_expected_latency(adapters)
+
         return adapters
 
+    def _order_by_expected_latency(
+        self, adapters: List[BaseDataSourceAdapter]
+    ) -> List[BaseDataSourceAdapter]:
+        """
+        Order adapters by expected (EWMA) latency.
+
+        Latencies are compared by histogram bucket, so adapters with similar
+        latency keep their priority order. Adapters without enough samples are
+        assumed to be as fast as the fastest known adapter, which keeps them
+        in rotation until real measurements exist.
+
+        Args:
+            adapters: Adapters in priority order
+
+        Returns:
+            Adapters in routing order
+        """
+        expected: Dict[str, Optional[float]] = {}
+        for adapter in adapters:
+            tracker = self._latency_trackers.get(adapter.name)
+            if tracker and tracker.sample_count >= self._latency_min_samples:
+                expected[adapter.name] = tracker.ewma_ms
+            else:
+                expected[adapter.name] = None
+
+        known = [latency for latency in expected.values() if latency is not None]
+        if not known:
+            return adapters
+
+        optimistic = min(known)
+        reference = LatencyTracker()
+
+        def routing_key(adapter: BaseDataSourceAdapter) -> Tuple[int, int]:
+            latency = expected[adapter.name]
+            bucket = reference.bucket_index(
+                optimistic if latency is None else latency
+            )
+            return bucket, adapter.priority
+
+        return sorted(adapters, key=routing_key)
+
+    def get_latency_stats(self, adapter_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get latency statistics for an adapter.
+
+        Args:
+            adapter_name: Name of the adapter
+
+        Returns:
+            Latency summary or None if no latency has been recorded
+        """
+        tracker = self._latency_trackers.get(adapter_name)
+        return tracker.get_stats() if tracker else None
+
+    def enable_latency_routing(self) -> None:
+        """Route requests to the adapter with the lowest expected latency."""
+        self._latency_routing_enabled = True
+        logger.info("Latency-aware routing enabled")
+
+    def disable_latency_routing(self) -> None:
+        """Route requests by static adapter priority only."""
+        self._latency_routing_enabled = False
+        logger.info("Latency-aware routing disabled")
+
+    def enable_hedging(
+        self, percentile: float = 95.0, min_delay_ms: float = 50.0
+    ) -> None:
+        """
+        Enable hedged requests.
+
+        When the chosen adapter has not answered within its latency percentile,
+        the same operation is sent to the next adapter and the first success
+        wins; the slower request is cancelled.
+
+        Args:
+            percentile: Latency percentile of the primary that triggers a hedge
+            min_delay_ms: Lower bound for the hedge delay in milliseconds
+        """
+        self._hedging_enabled = True
+        self._hedge_percentile = percentile
+        self._hedge_min_delay_ms = min_delay_ms
+        logger.info(f"Hedged requests enabled (p{percentile:g})")
+
+    def disable_hedging(self) -> None:
+        """Disable hedged requests."""
+        self._hedging_enabled = False
+        logger.info("Hedged requests disabled")
+
+    def _get_hedge_delay(self, adapter: BaseDataSourceAdapter) -> Optional[float]:
+        """
+        Get how long to wait for an adapter before sending a hedged request.
+
+        Args:
+            adapter: Adapter handling the request
+
+        Returns:
+            Delay in seconds, or None if there is not enough latency data
+        """
+        tracker = self._latency_trackers.get(adapter.name)
+        if not tracker or tracker.sample_count < self._latency_min_samples:
+            return None
+
+        threshold_ms = tracker.percentile(self._hedge_percentile)
+        if threshold_ms is None:
+            return None
+
+        return max(threshold_ms, self._hedge_min_delay_ms) / 1000.0
+
     def get_primary_adapter(
         self, data_source_type: DataSourceType
     ) -> Optional[BaseDataSourceAdapter]:
@@ -155,19 +286,109 @@ class DataSourceRegistry:
         healthy_adapters = self.get_healthy_adapters(data_source_type)
         return healthy_adapters[0] if healthy_adapters else None
 
+    @staticmethod
+    def make_request_key(operation_name: str, *args: Any) -> Tuple[Hashable, ...]:
+        """
+        Build a coalescing key from an operation name and its arguments.
+
+        Strings are stripped, lists/sets become tuples and dicts become sorted
+        item tuples, so equivalent calls produce the same key.
+
+        Args:
+            operation_name: Name of the adapter operation (e.g. "get_current_price")
+            *args: Operation arguments
+
+        Returns:
+            Hashable request key
+        """
+
+        def normalize(value: Any) -> Hashable:
+            if isinstance(value, str):
+                return value.strip()
+            if isinstance(value, (list, tuple)):
+                return tuple(normalize(v) for v in value)
+            if isinstance(value, (set, frozenset)):
+                return tuple(sorted(normalize(v) for v in value))
+            if isinstance(value, dict):
+                return tuple(sorted((k, normalize(v)) for k, v in value.items()))
+            if isinstance(value, datetime):
+                return value.isoformat()
+            return value
+
+        return (operation_name,) + tuple(normalize(arg) for arg in args)
+
+    def set_request_coalescing(
+        self, enabled: bool, operation_name: Optional[str] = None
+    ) -> None:
+        """
+        Enable or disable in-flight request coalescing.
+
+        Args:
+            enabled: Whether identical concurrent calls share one upstream request
+            operation_name: Operation to configure; None changes the default
+        """
+        if operation_name is None:
+            self._coalescing_default = enabled
+        else:
+            self._coalescing_overrides[operation_name] = enabled
+
+        logger.info(
+            f"Request coalescing {'enabled' if enabled else 'disabled'} "
+            f"for {operation_name or 'all operations'}"
+        )
+
+    def is_request_coalescing_enabled(self, operation_name: str) -> bool:
+        """
+        Check whether request coalescing applies to an operation.
+
+        Args:
+            operation_name: Name of the adapter operation
+
+        Returns:
+            True if identical concurrent calls are coalesced
+        """
+        return self._coalescing_overrides.get(
+            operation_name, self._coalescing_default
+        )
+
+    def get_coalescing_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get request coalescing metrics per operation.
+
+        Returns:
+            Dictionary mapping operation name to request/coalesced counts and
+            the coalescing ratio (share of calls served by an in-flight request)
+        """
+        stats = {}
+        for operation_name, counts in self._coalescing_stats.items():
+            requests = counts["requests"]
+            stats[operation_name] = {
+                "requests": requests,
+                "coalesced": counts["coalesced"],
+                "coalescing_ratio": counts["coalesced"] / requests if requests else 0.0,
+            }
+        return stats
+
     async def execute_with_failover(
         self,
         data_source_type: DataSourceType,
         operation: Callable[[BaseDataSourceAdapter], Any],
         max_retries: int = 3,
+        request_key: Optional[Tuple[Hashable, ...]] = None,
     ) -> Any:
         """
         Execute an operation with automatic failover to backup adapters.
 
+        When ``request_key`` is given (see ``make_request_key``) and coalescing
+        is enabled for its operation, concurrent calls with the same key share
+        a single execution and each receive their own copy of its result, so
+        one caller modifying it cannot affect the others.
+
         Args:
             data_source_type: Type of data source needed
             operation: Async function that takes an adapter and returns result
             max_retries: Maximum number of adapters to try
+            request_key: Optional key identifying identical requests
 
         Returns:
             Result from the operation
@@ -175,6 +396,50 @@ class DataSourceRegistry:
         Raises:
             DataSourceUnavailableError: If all adapters fail
         """
+        if request_key is None or not self.is_request_coalescing_enabled(
+            request_key[0]
+        ):
+            return await self._execute_with_failover(
+                data_source_type, operation, max_retries
+            )
+
+        operation_name = request_key[0]
+        key = (data_source_type.value,) + tuple(request_key)
+        self._coalescing_stats[operation_name]["requests"] += 1
+
+        task = self._inflight_requests.get(key)
+        if task is not None:
+            self._coalescing_stats[operation_name]["coalesced"] += 1
+            logger.debug(f"Coalesced request onto in-flight call: {key}")
+        else:
+            task = asyncio.create_task(
+                self._execute_with_failover(data_source_type, operation, max_retries)
+            )
+            self._inflight_requests[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight_request(key, t))
+
+        # Shield so a cancelled caller does not cancel the shared request
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result)
+
+    def _finish_inflight_request(
+        self, key: Tuple[Hashable, ...], task: asyncio.Task
+    ) -> None:
+        """Remove a finished request from the in-flight table."""
+        if self._inflight_requests.get(key) is task:
+            del self._inflight_requests[key]
+
+        # Mark the exception as retrieved if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _execute_with_failover(
+        self,
+        data_source_type: DataSourceType,
+        operation: Callable[[BaseDataSourceAdapter], Any],
+        max_retries: int,
+    ) -> Any:
+        """Run an operation against healthy adapters in priority order."""
         if not self._failover_enabled:
             # If failover is disabled, only try primary adapter
             primary = self.get_primary_adapter(data_source_type)
@@ -195,15 +460,31 @@ class DataSourceRegistry:
 
         # Try adapters in order until one succeeds or we run out
         last_error = None
+        all_rate_limited = True
         adapters_tried = 0
+        candidates = healthy_adapters[:max_retries]
+
+        while adapters_tried < len(candidates):
+            adapter = candidates[adapters_tried]
+            backup = (
+                candidates[adapters_tried + 1]
+                if self._hedging_enabled and adapters_tried + 1 < len(candidates)
+                else None
+            )
+            hedge_delay = self._get_hedge_delay(adapter) if backup else None
+            failed: List[BaseDataSourceAdapter] = []
 
-        for adapter in healthy_adapters[:max_retries]:
             try:
-                result = await self._execute_with_adapter(adapter, operation)
-
-                # Reset failure count on success
-                if adapter.name in self._adapter_failures:
-                    self._adapter_failures[adapter.name].clear()
+                if hedge_delay is not None:
+                    result, adapter = await self._execute_hedged(
+                        adapter, backup, operation, hedge_delay, failed
+                    )
+                else:
+                    try:
+                        result = await self._execute_with_adapter(adapter, operation)
+                    except Exception:
+                        failed.append(adapter)
+                        raise
 
                 logger.info(
                     f"Successfully executed operation using adapter: {adapter.name}"
@@ -211,19 +492,25 @@ class DataSourceRegistry:
                 return result
 
             except Exception as e:
-                adapters_tried += 1
                 last_error = e
+                if not isinstance(e, RateLimitExceededError):
+                    all_rate_limited = False
 
-                # Record failure
-                self._record_adapter_failure(adapter.name)
+                for failed_adapter in failed:
+                    adapters_tried += 1
 
-                logger.warning(
-                    f"Adapter '{adapter.name}' failed (attempt {adapters_tried}): {e}"
-                )
+                    logger.warning(
+                        f"Adapter '{failed_adapter.name}' failed "
+                        f"(attempt {adapters_tried}): {e}"
+                    )
 
                 # Continue to next adapter
                 continue
 
+        # Rate limiting is not an outage; let callers surface it as such
+        if all_rate_limited and isinstance(last_error, RateLimitExceededError):
+            raise last_error
+
         # All adapters failed
         raise DataSourceUnavailableError(
             f"All {adapters_tried} adapters failed for {data_source_type.value}. "
@@ -248,86 +535,152 @@ class DataSourceRegistry:
         Raises:
             Various exceptions from the operation
         """
-        # Check circuit breaker
-        if self._is_circuit_breaker_open(adapter.name):
+        # Check circuit breaker (reserves a probe slot when half-open)
+        breaker = self._get_circuit_breaker(adapter.name)
+        if not breaker.try_acquire():
             raise DataSourceUnavailableError(
                 f"Circuit breaker open for adapter: {adapter.name}"
             )
 
         # Execute operation
+        start_time = time.perf_counter()
         try:
-            return await operation(adapter)
+            result = await operation(adapter)
+        except asyncio.CancelledError:
+            # A cancelled hedge loser took at least this long
+            self._latency_trackers[adapter.name].record(
+                (time.perf_counter() - start_time) * 1000
+            )
+            breaker.release()
+            raise
         except RateLimitExceededError:
             # Don't count rate limit errors as failures
+            breaker.release()
             raise
-        except Exception as e:
+        except Exception:
             # Record failure for circuit breaker
-            self._record_adapter_failure(adapter.name)
+            breaker.record_failure((time.perf_counter() - start_time) * 1000)
             raise
 
-    def _record_adapter_failure(self, adapter_name: str) -> None:
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self._latency_trackers[adapter.name].record(elapsed_ms)
+        breaker.record_success(elapsed_ms)
+        return result
+
+    async def _execute_hedged(
+        self,
+        primary: BaseDataSourceAdapter,
+        backup: BaseDataSourceAdapter,
+        operation: Callable[[BaseDataSourceAdapter], Any],
+        hedge_delay: float,
+        failed: List[BaseDataSourceAdapter],
+    ) -> Tuple[Any, BaseDataSourceAdapter]:
         """
-        Record a failure for an adapter and check circuit breaker.
+        Execute an operation on the primary, hedging to the backup if slow.
 
         Args:
-            adapter_name: Name of the adapter that failed
-        """
-        now = datetime.utcnow()
-
-        # Add failure timestamp
-        self._adapter_failures[adapter_name].append(now)
-
-        # Remove old failures (older than circuit breaker timeout)
-        cutoff_time = now - timedelta(seconds=self._circuit_breaker_timeout)
-        self._adapter_failures[adapter_name] = [
-            failure_time
-            for failure_time in self._adapter_failures[adapter_name]
-            if failure_time > cutoff_time
-        ]
-
-        # Check if we should open circuit breaker
-        failure_count = len(self._adapter_failures[adapter_name])
-        if failure_count >= self._circuit_breaker_threshold:
-            self._circuit_breaker_state[adapter_name] = True
-            self._circuit_breaker_reset_time[adapter_name] = now + timedelta(
-                seconds=self._circuit_breaker_timeout
-            )
+            primary: Adapter tried first
+            backup: Adapter used for the hedged request
+            operation: Operation to execute
+            hedge_delay: Seconds to wait for the primary before hedging
+            failed: List that receives every adapter that failed
 
-            logger.warning(
-                f"Circuit breaker opened for adapter '{adapter_name}' "
-                f"after {failure_count} failures"
-            )
+        Returns:
+            Tuple of the first successful result and the adapter that produced it
 
-    def _is_circuit_breaker_open(self, adapter_name: str) -> bool:
+        Raises:
+            The last error if every started request failed
         """
-        Check if circuit breaker is open for an adapter.
+        tasks: Dict[asyncio.Task, BaseDataSourceAdapter] = {}
+        primary_task = asyncio.create_task(
+            self._execute_with_adapter(primary, operation)
+        )
+        tasks[primary_task] = primary
+
+        last_error: Optional[BaseException] = None
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=hedge_delay)
+            if not done:
+                self._hedging_stats["hedged_requests"] += 1
+                logger.debug(
+                    f"Adapter '{primary.name}' exceeded {hedge_delay * 1000:.0f}ms, "
+                    f"hedging to '{backup.name}'"
+                )
+                backup_task = asyncio.create_task(
+                    self._execute_with_adapter(backup, operation)
+                )
+                tasks[backup_task] = backup
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    adapter = tasks[task]
+                    if task.exception() is None:
+                        if adapter is backup:
+                            self._hedging_stats["hedge_wins"] += 1
+                        return task.result(), adapter
+                    failed.append(adapter)
+                    last_error = task.exception()
+        finally:
+            # Cancel the loser (or everything, if we were cancelled ourselves,
+            # including during the hedge delay)
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        raise last_error
+
+    def _get_circuit_breaker(self, adapter_name: str) -> CircuitBreaker:
+        """
+        Get (or create) the circuit breaker for an adapter.
 
         Args:
             adapter_name: Name of the adapter
 
         Returns:
-            True if circuit breaker is open
+            Circuit breaker instance
         """
-        if adapter_name not in self._circuit_breaker_state:
-            return False
+        breaker = self._circuit_breakers.get(adapter_name)
+        if breaker is None:
+            breaker = CircuitBreaker(adapter_name, self._circuit_breaker_config)
+            self._circuit_breakers[adapter_name] = breaker
+        return breaker
 
-        if not self._circuit_breaker_state[adapter_name]:
-            return False
+    def configure_circuit_breakers(self, config: CircuitBreakerConfig) -> None:
+        """
+        Set circuit breaker thresholds for all adapters.
+
+        Existing breakers keep their state but use the new thresholds.
+
+        Args:
+            config: Circuit breaker thresholds
+        """
+        self._circuit_breaker_config = config
+        for breaker in self._circuit_breakers.values():
+            breaker.config = config
+
+    def _is_circuit_breaker_open(self, adapter_name: str) -> bool:
+        """
+        Check if circuit breaker is open for an adapter.
 
-        # Check if it's time to reset
-        now = datetime.utcnow()
-        reset_time = self._circuit_breaker_reset_time.get(adapter_name)
+        A half-open breaker counts as open once all its probe slots are taken.
 
-        if reset_time and now >= reset_time:
-            # Reset circuit breaker
-            self._circuit_breaker_state[adapter_name] = False
-            if adapter_name in self._circuit_breaker_reset_time:
-                del self._circuit_breaker_reset_time[adapter_name]
+        Args:
+            adapter_name: Name of the adapter
 
-            logger.info(f"Circuit breaker reset for adapter: {adapter_name}")
+        Returns:
+            True if circuit breaker is open
+        """
+        breaker = self._circuit_breakers.get(adapter_name)
+        if breaker is None:
             return False
 
-        return True
+        return not breaker.is_call_permitted()
 
     async def start_health_monitoring(self) -> None:
         """Start background health monitoring task."""
@@ -362,7 +715,7 @@ class DataSourceRegistry:
                 await asyncio.sleep(60)  # Wait 1 minute before retrying
 
     async def _check_all_adapters_health(self) -> None:
-        """Check health of all registered adapters."""
+        """Check health of all registered adapters concurrently."""
         tasks = []
 
         for adapter in self._adapter_by_name.values():
@@ -375,25 +728,43 @@ class DataSourceRegistry:
 
     async def _check_adapter_health(self, adapter: BaseDataSourceAdapter) -> None:
         """
-        Check health of a single adapter.
+        Check health of a single adapter and cache the result on it.
+
+        Checks that exceed ``_health_check_timeout`` are reported as unhealthy.
 
         Args:
             adapter: Adapter to check
         """
-        try:
-            health_check = await adapter.health_check()
-
-            if health_check.status == HealthStatus.UNHEALTHY:
-                logger.warning(
-                    f"Adapter '{adapter.name}' is unhealthy: {health_check.error_message}"
-                )
-            elif health_check.status == HealthStatus.DEGRADED:
-                logger.info(
-                    f"Adapter '{adapter.name}' is degraded: {health_check.error_message}"
-                )
+        start_time = datetime.utcnow()
 
+        try:
+            health_check = await asyncio.wait_for(
+                adapter.health_check(), timeout=self._health_check_timeout
+            )
+        except asyncio.TimeoutError:
+            health_check = HealthCheck(
+                status=HealthStatus.UNHEALTHY,
+                response_time_ms=(datetime.utcnow() - start_time).total_seconds()
+                * 1000,
+                last_check=datetime.utcnow(),
+                error_message=(
+                    f"Health check timed out after {self._health_check_timeout}s"
+                ),
+            )
         except Exception as e:
             logger.error(f"Health check failed for adapter '{adapter.name}': {e}")
+            return
+
+        adapter._last_health_check = health_check
+
+        if health_check.status == HealthStatus.UNHEALTHY:
+            logger.warning(
+                f"Adapter '{adapter.name}' is unhealthy: {health_check.error_message}"
+            )
+        elif health_check.status == HealthStatus.DEGRADED:
+            logger.info(
+                f"Adapter '{adapter.name}' is degraded: {health_check.error_message}"
+            )
 
     def enable_failover(self) -> None:
         """Enable automatic failover."""
@@ -436,17 +807,25 @@ class DataSourceRegistry:
                 if last_health
                 else None,
                 "error_message": last_health.error_message if last_health else None,
+                "latency": self.get_latency_stats(adapter_name),
             }
 
-        # Circuit breaker status
-        for adapter_name, is_open in self._circuit_breaker_state.items():
-            if is_open:
-                reset_time = self._circuit_breaker_reset_time.get(adapter_name)
-                status["circuit_breakers"][adapter_name] = {
-                    "open": True,
-                    "reset_time": reset_time.isoformat() if reset_time else None,
-                    "failure_count": len(self._adapter_failures.get(adapter_name, [])),
-                }
+        # Circuit breaker status (closed breakers are omitted)
+        for adapter_name, breaker in self._circuit_breakers.items():
+            if breaker.state != CircuitState.CLOSED:
+                status["circuit_breakers"][adapter_name] = breaker.get_status()
+
+        status["routing"] = {
+            "latency_routing_enabled": self._latency_routing_enabled,
+            "hedging_enabled": self._hedging_enabled,
+            "hedge_percentile": self._hedge_percentile,
+            **self._hedging_stats,
+        }
+
+        status["request_coalescing"] = {
+            "inflight_requests": len(self._inflight_requests),
+            "operations": self.get_coalescing_stats(),
+        }
 
         return status
 
@@ -460,17 +839,11 @@ class DataSourceRegistry:
         Returns:
             True if circuit breaker was reset, False if it wasn't open
         """
-        if (
-            adapter_name not in self._circuit_breaker_state
-            or not self._circuit_breaker_state[adapter_name]
-        ):
+        breaker = self._circuit_breakers.get(adapter_name)
+        if breaker is None or breaker.state == CircuitState.CLOSED:
             return False
 
-        self._circuit_breaker_state[adapter_name] = False
-        if adapter_name in self._circuit_breaker_reset_time:
-            del self._circuit_breaker_reset_time[adapter_name]
-        if adapter_name in self._adapter_failures:
-            self._adapter_failures[adapter_name].clear()
+        breaker.reset()
 
         logger.info(f"Manually reset circuit breaker for adapter: {adapter_name}")
         return True
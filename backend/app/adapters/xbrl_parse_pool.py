@@ -0,0 +1,178 @@
+"""Bounded process pool for CPU-bound XBRL parsing."""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .base import DataSourceUnavailableError
+from .xbrl_parser import parse_xbrl_package
+
+logger = logging.getLogger(__name__)
+
+
+def _timed_parse(content: Union[bytes, str]) -> Tuple[Dict[str, Any], float]:
+    """Parse a document package (bytes or path) and measure the parse time."""
+    started = time.perf_counter()
+    result = parse_xbrl_package(content)
+    return result, time.perf_counter() - started
+
+
+class XBRLParsePool:
+    """Runs XBRL parsing in a process pool so it does not block the event loop.
+
+    At most ``max_workers`` documents are parsed at once and at most
+    ``max_queue`` more may wait for a worker; further submissions are
+    rejected with DataSourceUnavailableError instead of growing the backlog.
+    With ``max_workers=0`` documents are parsed inline.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 16):
+        """
+        Initialize the parse pool.
+
+        Args:
+            max_workers: Worker processes (0 parses inline on the caller)
+            max_queue: Documents allowed to wait for a free worker
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        self._queued = 0
+        self._running = 0
+        self._started = 0
+        self._peak_queue_depth = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._parse_seconds_total = 0.0
+        self._parse_seconds_max = 0.0
+        self._wait_seconds_total = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get or create the process pool."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrently running parses."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(max(1, self.max_workers))
+        return self._slots
+
+    @property
+    def queue_depth(self) -> int:
+        """Documents waiting for or being parsed."""
+        return self._queued + self._running
+
+    async def parse(self, content: Union[bytes, str]) -> Dict[str, Any]:
+        """
+        Parse an EDINET document package.
+
+        Passing a file path avoids pickling the document to the worker, which
+        memory-maps it instead.
+
+        Args:
+            content: ZIP package content or path
+
+        Returns:
+            Parsed financial data
+
+        Raises:
+            DataSourceUnavailableError: If the queue is full
+            InvalidDataError: If the document cannot be parsed
+        """
+        if self.max_workers <= 0:
+            result, seconds = _timed_parse(content)
+            self._record_parse(seconds)
+            return result
+
+        if self._queued >= self.max_queue:
+            self._rejected += 1
+            raise DataSourceUnavailableError(
+                f"XBRL parse queue full ({self.max_queue} documents waiting)"
+            )
+
+        self._queued += 1
+        self._peak_queue_depth = max(self._peak_queue_depth, self.queue_depth)
+        queued_at = time.perf_counter()
+        try:
+            await self._get_slots().acquire()
+        finally:
+            self._queued -= 1
+
+        self._running += 1
+        self._started += 1
+        self._wait_seconds_total += time.perf_counter() - queued_at
+        try:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            try:
+                result, seconds = await loop.run_in_executor(
+                    executor, _timed_parse, content
+                )
+            except BrokenProcessPool:
+                # A crashed worker poisons the pool; shut it down so its
+                # remaining workers and management thread go away, and start
+                # a fresh one next time. Concurrent parses that failed on the
+                # same pool must not shut down its replacement.
+                if self._executor is executor:
+                    logger.warning("XBRL parse pool broken, recreating")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    self._executor = None
+                raise DataSourceUnavailableError("XBRL parse worker crashed")
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._running -= 1
+            self._get_slots().release()
+
+        self._record_parse(seconds)
+        return result
+
+    def _record_parse(self, seconds: float) -> None:
+        """Record a completed parse."""
+        self._completed += 1
+        self._parse_seconds_total += seconds
+        self._parse_seconds_max = max(self._parse_seconds_max, seconds)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get parse pool metrics.
+
+        Returns:
+            Dictionary with queue depth, counters and parse/wait times
+        """
+        completed = self._completed
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "queue_depth": self.queue_depth,
+            "queued": self._queued,
+            "running": self._running,
+            "peak_queue_depth": self._peak_queue_depth,
+            "completed": completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "avg_parse_ms": (
+                self._parse_seconds_total / completed * 1000 if completed else None
+            ),
+            "max_parse_ms": self._parse_seconds_max * 1000 if completed else None,
+            "avg_wait_ms": (
+                self._wait_seconds_total / self._started * 1000
+                if self._started
+                else None
+            ),
+        }
+
+    def shutdown(self) -> None:
+        """Shut down worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
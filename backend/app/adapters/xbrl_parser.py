@@ -0,0 +1,659 @@
+"""Streaming XBRL instance parser for EDINET documents.
+
+Instance documents are parsed incrementally with ``lxml.etree.iterparse``:
+each top-level element is handled when it closes and then cleared, so memory
+stays flat regardless of document size. Contexts are kept as small period
+dictionaries and only resolved for facts whose element is mapped.
+
+Elements are looked up in ``FACT_MAPPING``, a frozen table of the J-GAAP
+(``jppfs_cor``), IFRS (``jpigp_cor``), summary (``jpcrp_cor``) and document
+information (``jpdei_cor``) elements we use, keyed by qualified name so the taxonomy version in the namespace does
+not matter.
+"""
+
+import io
+import logging
+import os
+import re
+import zipfile
+from functools import lru_cache
+from types import MappingProxyType
+from typing import IO, Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from lxml import etree
+
+from .base import InvalidDataError
+from .document_store import open_mapped
+
+logger = logging.getLogger(__name__)
+
+XBRLI_NAMESPACE = "http://www.xbrl.org/2003/instance"
+XBRLI_NAMESPACES = {"xbrli": XBRLI_NAMESPACE}
+
+_CONTEXT_TAG = f"{{{XBRLI_NAMESPACE}}}context"
+_INSTANCE_PREFIX = f"{{{XBRLI_NAMESPACE}}}"
+
+# Bump when parse output changes so stored parse results are not reused
+PARSER_VERSION = "4"
+
+STATEMENT_SECTIONS = ("income_statement", "balance_sheet", "cash_flow", "metadata")
+FINANCIAL_STATEMENTS = ("income_statement", "balance_sheet", "cash_flow")
+
+# Standard EDINET taxonomies; company extension taxonomies are not mapped
+_TAXONOMY_PATTERN = re.compile(
+    r"^http://disclosure\.edinet-fsa\.go\.jp/taxonomy/(jppfs|jpigp|jpcrp|jpdei)/"
+    r"\d{4}-\d{2}-\d{2}(?:/\w+)?$"
+)
+
+_NON_CONSOLIDATED_MEMBER = "NonConsolidatedMember"
+_IFRS_PREFIX = "{http://disclosure.edinet-fsa.go.jp/taxonomy/jpigp/"
+
+# Period kinds of EDINET context IDs (the ID without its Current/Prior1
+# prefix and dimension suffix) in order of preference per statement. Flow
+# statements prefer the longest duration the report covers, so a quarterly
+# report yields year-to-date figures rather than the three-month quarter;
+# the balance sheet uses period-end instants.
+_DURATION_KINDS = ("YearDuration", "YTDDuration", "InterimDuration", "QuarterDuration")
+_CONTEXT_RANKS: Mapping[str, Mapping[str, int]] = MappingProxyType(
+    {
+        section: MappingProxyType({kind: rank for rank, kind in enumerate(kinds)})
+        for section, kinds in (
+            ("income_statement", _DURATION_KINDS),
+            ("cash_flow", _DURATION_KINDS),
+            ("balance_sheet", ("YearInstant", "InterimInstant", "QuarterInstant")),
+        )
+    }
+)
+
+# Summary of business results elements rank after any statement element
+_SUMMARY_PRIORITY = 100
+
+_STATEMENT_ELEMENTS: Tuple[Tuple[str, str, str, Tuple[str, ...]], ...] = (
+    # Japanese GAAP
+    (
+        "jppfs_cor",
+        "income_statement",
+        "revenue",
+        ("NetSales", "OperatingRevenue1", "Revenue"),
+    ),
+    ("jppfs_cor", "income_statement", "gross_profit", ("GrossProfit",)),
+    (
+        "jppfs_cor",
+        "income_statement",
+        "sga_expenses",
+        ("SellingGeneralAndAdministrativeExpenses",),
+    ),
+    ("jppfs_cor", "income_statement", "operating_income", ("OperatingIncome",)),
+    ("jppfs_cor", "income_statement", "ordinary_income", ("OrdinaryIncome",)),
+    (
+        "jppfs_cor",
+        "income_statement",
+        "net_income",
+        ("ProfitLossAttributableToOwnersOfParent", "NetIncome", "ProfitLoss"),
+    ),
+    ("jppfs_cor", "balance_sheet", "total_assets", ("Assets", "TotalAssets")),
+    (
+        "jppfs_cor",
+        "balance_sheet",
+        "total_liabilities",
+        ("Liabilities", "TotalLiabilities"),
+    ),
+    ("jppfs_cor", "balance_sheet", "shareholders_equity", ("NetAssets",)),
+    ("jppfs_cor", "balance_sheet", "current_assets", ("CurrentAssets",)),
+    ("jppfs_cor", "balance_sheet", "current_liabilities", ("CurrentLiabilities",)),
+    (
+        "jppfs_cor",
+        "balance_sheet",
+        "cash_and_equivalents",
+        ("CashAndCashEquivalents", "CashAndDeposits"),
+    ),
+    (
+        "jppfs_cor",
+        "cash_flow",
+        "operating_cash_flow",
+        (
+            "NetCashProvidedByUsedInOperatingActivities",
+            "CashFlowsFromOperatingActivities",
+        ),
+    ),
+    (
+        "jppfs_cor",
+        "cash_flow",
+        "investing_cash_flow",
+        (
+            "NetCashProvidedByUsedInInvestingActivities",
+            "CashFlowsFromInvestingActivities",
+        ),
+    ),
+    (
+        "jppfs_cor",
+        "cash_flow",
+        "financing_cash_flow",
+        (
+            "NetCashProvidedByUsedInFinancingActivities",
+            "CashFlowsFromFinancingActivities",
+        ),
+    ),
+    # IFRS
+    ("jpigp_cor", "income_statement", "revenue", ("RevenueIFRS", "NetSalesIFRS")),
+    ("jpigp_cor", "income_statement", "gross_profit", ("GrossProfitIFRS",)),
+    (
+        "jpigp_cor",
+        "income_statement",
+        "sga_expenses",
+        ("SellingGeneralAndAdministrativeExpensesIFRS",),
+    ),
+    ("jpigp_cor", "income_statement", "operating_income", ("OperatingProfitLossIFRS",)),
+    (
+        "jpigp_cor",
+        "income_statement",
+        "net_income",
+        ("ProfitLossAttributableToOwnersOfParentIFRS", "ProfitLossIFRS"),
+    ),
+    ("jpigp_cor", "balance_sheet", "total_assets", ("AssetsIFRS",)),
+    ("jpigp_cor", "balance_sheet", "total_liabilities", ("LiabilitiesIFRS",)),
+    (
+        "jpigp_cor",
+        "balance_sheet",
+        "shareholders_equity",
+        ("EquityAttributableToOwnersOfParentIFRS", "EquityIFRS"),
+    ),
+    ("jpigp_cor", "balance_sheet", "current_assets", ("CurrentAssetsIFRS",)),
+    ("jpigp_cor", "balance_sheet", "current_liabilities", ("CurrentLiabilitiesIFRS",)),
+    (
+        "jpigp_cor",
+        "balance_sheet",
+        "cash_and_equivalents",
+        ("CashAndCashEquivalentsIFRS",),
+    ),
+    (
+        "jpigp_cor",
+        "cash_flow",
+        "operating_cash_flow",
+        ("NetCashProvidedByUsedInOperatingActivitiesIFRS",),
+    ),
+    (
+        "jpigp_cor",
+        "cash_flow",
+        "investing_cash_flow",
+        ("NetCashProvidedByUsedInInvestingActivitiesIFRS",),
+    ),
+    (
+        "jpigp_cor",
+        "cash_flow",
+        "financing_cash_flow",
+        ("NetCashProvidedByUsedInFinancingActivitiesIFRS",),
+    ),
+)
+
+# Summary of business results, reported under either standard
+_SUMMARY_ELEMENTS: Tuple[Tuple[str, str, str, Tuple[str, ...]], ...] = (
+    (
+        "jpcrp_cor",
+        "income_statement",
+        "revenue",
+        (
+            "NetSalesSummaryOfBusinessResults",
+            "RevenueIFRSSummaryOfBusinessResults",
+            "OperatingRevenue1SummaryOfBusinessResults",
+        ),
+    ),
+    (
+        "jpcrp_cor",
+        "income_statement",
+        "ordinary_income",
+        ("OrdinaryIncomeLossSummaryOfBusinessResults",),
+    ),
+    (
+        "jpcrp_cor",
+        "income_statement",
+        "net_income",
+        (
+            "ProfitLossAttributableToOwnersOfParentSummaryOfBusinessResults",
+            "ProfitLossAttributableToOwnersOfParentIFRSSummaryOfBusinessResults",
+            "NetIncomeLossSummaryOfBusinessResults",
+        ),
+    ),
+    (
+        "jpcrp_cor",
+        "balance_sheet",
+        "total_assets",
+        (
+            "TotalAssetsSummaryOfBusinessResults",
+            "TotalAssetsIFRSSummaryOfBusinessResults",
+        ),
+    ),
+    (
+        "jpcrp_cor",
+        "balance_sheet",
+        "shareholders_equity",
+        (
+            "NetAssetsSummaryOfBusinessResults",
+            "EquityAttributableToOwnersOfParentIFRSSummaryOfBusinessResults",
+        ),
+    ),
+    (
+        "jpcrp_cor",
+        "cash_flow",
+        "operating_cash_flow",
+        (
+            "NetCashProvidedByUsedInOperatingActivitiesSummaryOfBusinessResults",
+            "CashFlowsFromUsedInOperatingActivitiesIFRSSummaryOfBusinessResults",
+        ),
+    ),
+)
+
+
+# Document and entity information, reported as text in any context
+_DEI_ELEMENTS: Tuple[Tuple[str, str, str, Tuple[str, ...]], ...] = (
+    ("jpdei_cor", "metadata", "period_type", ("TypeOfCurrentPeriodDEI",)),
+    ("jpdei_cor", "metadata", "fiscal_year_start", ("CurrentFiscalYearStartDateDEI",)),
+    ("jpdei_cor", "metadata", "fiscal_year_end", ("CurrentFiscalYearEndDateDEI",)),
+    ("jpdei_cor", "metadata", "period_end", ("CurrentPeriodEndDateDEI",)),
+)
+
+
+def _build_fact_mapping() -> Mapping[str, Tuple[str, str, int]]:
+    """Build the element lookup; earlier elements of a field take priority."""
+    mapping: Dict[str, Tuple[str, str, int]] = {
+        f"{taxonomy}:{elements[0]}": (section, field_name, 0)
+        for taxonomy, section, field_name, elements in _DEI_ELEMENTS
+    }
+    for base_priority, entries in (
+        (0, _STATEMENT_ELEMENTS),
+        (_SUMMARY_PRIORITY, _SUMMARY_ELEMENTS),
+    ):
+        for taxonomy, section, field_name, elements in entries:
+            for priority, element in enumerate(elements, start=base_priority):
+                mapping[f"{taxonomy}:{element}"] = (section, field_name, priority)
+    return MappingProxyType(mapping)
+
+
+# Qualified element name (e.g. ``jppfs_cor:NetSales``) ->
+# (statement section, standardized field name, priority; lower wins)
+FACT_MAPPING: Mapping[str, Tuple[str, str, int]] = _build_fact_mapping()
+
+XBRLSource = Union[bytes, IO[bytes]]
+PackageSource = Union[bytes, str, "os.PathLike[str]", IO[bytes]]
+
+
+def empty_financial_data() -> Dict[str, Dict[str, Any]]:
+    """Create an empty financial data structure."""
+    return {section: {} for section in STATEMENT_SECTIONS}
+
+
+def _local_name(tag: str) -> str:
+    """Strip the namespace from an element tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+@lru_cache(maxsize=8192)
+def resolve_element(tag: str) -> Optional[Tuple[str, str, int]]:
+    """
+    Look up the mapping of an element tag.
+
+    Args:
+        tag: Element tag in Clark notation (``{namespace}LocalName``)
+
+    Returns:
+        Tuple of (statement section, standardized field, priority), or None
+        if the element is not mapped
+    """
+    if not tag.startswith("{"):
+        return None
+    namespace, _, local_name = tag[1:].partition("}")
+    match = _TAXONOMY_PATTERN.match(namespace)
+    if match is None:
+        return None
+    return FACT_MAPPING.get(f"{match.group(1)}_cor:{local_name}")
+
+
+def parse_context(context: Any) -> Dict[str, Any]:
+    """
+    Parse an ``xbrli:context`` element.
+
+    Works with both ``xml.etree`` and ``lxml`` elements.
+
+    Args:
+        context: Context element
+
+    Returns:
+        Dictionary with ``period``, ``entity`` and ``dimensions`` information
+    """
+    period_info: Dict[str, Any] = {}
+    period = context.find("xbrli:period", XBRLI_NAMESPACES)
+    if period is not None:
+        instant = period.find("xbrli:instant", XBRLI_NAMESPACES)
+        start_date = period.find("xbrli:startDate", XBRLI_NAMESPACES)
+        end_date = period.find("xbrli:endDate", XBRLI_NAMESPACES)
+
+        if instant is not None:
+            period_info["type"] = "instant"
+            period_info["date"] = instant.text
+        elif start_date is not None and end_date is not None:
+            period_info["type"] = "duration"
+            period_info["start_date"] = start_date.text
+            period_info["end_date"] = end_date.text
+
+    entity_info: Dict[str, Any] = {}
+    identifier = context.find("xbrli:entity/xbrli:identifier", XBRLI_NAMESPACES)
+    if identifier is not None:
+        entity_info["identifier"] = identifier.text
+        entity_info["scheme"] = identifier.get("scheme")
+
+    # Explicit members of the context's segment or scenario
+    dimensions: Dict[str, str] = {}
+    for elem in context.iter():
+        if isinstance(elem.tag, str) and elem.tag.endswith("explicitMember"):
+            dimensions[elem.get("dimension", "")] = (elem.text or "").strip()
+
+    return {"period": period_info, "entity": entity_info, "dimensions": dimensions}
+
+
+def iter_instance(
+    source: XBRLSource, element_names: Optional[Iterable[str]] = None
+) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Stream an XBRL instance and collect contexts and mapped facts.
+
+    Args:
+        source: Instance document bytes or a binary stream
+        element_names: Local names of facts to keep (default: facts mapped in
+            FACT_MAPPING)
+
+    Returns:
+        Tuple of (contexts by id, facts in document order). Each fact holds
+        its ``context_ref``; contexts are resolved by the caller.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    wanted = frozenset(element_names) if element_names is not None else None
+
+    contexts: Dict[str, Dict[str, Any]] = {}
+    facts: List[Dict[str, Any]] = []
+    root = None
+
+    # Instances come from an external service, so libxml2's size and depth
+    # limits stay on (no huge_tree) and entities are not expanded
+    for event, elem in etree.iterparse(
+        source,
+        events=("start", "end"),
+        remove_comments=True,
+        resolve_entities=False,
+    ):
+        if event == "start":
+            if root is None:
+                root = elem
+            continue
+
+        if elem.getparent() is not root:
+            continue
+
+        tag = elem.tag
+        if tag == _CONTEXT_TAG:
+            context_id = elem.get("id")
+            if context_id:
+                contexts[context_id] = parse_context(elem)
+        elif (
+            isinstance(tag, str)
+            and tag.startswith("{")
+            and not tag.startswith(_INSTANCE_PREFIX)
+            and (
+                resolve_element(tag) is not None
+                if wanted is None
+                else _local_name(tag) in wanted
+            )
+            and elem.get("contextRef")
+        ):
+            facts.append(
+                {
+                    "name": tag,
+                    "value": elem.text,
+                    "context_ref": elem.get("contextRef"),
+                    "unit_ref": elem.get("unitRef"),
+                    "decimals": elem.get("decimals"),
+                    "precision": elem.get("precision"),
+                }
+            )
+
+        # Free the handled element and any siblings already processed
+        elem.clear()
+        while elem.getprevious() is not None:
+            del root[0]
+
+    return contexts, facts
+
+
+def _context_class(
+    context_ref: str, context: Dict[str, Any]
+) -> Optional[Tuple[bool, str]]:
+    """
+    Classify a fact's context.
+
+    EDINET names contexts after their period relative to the report
+    (``CurrentYearDuration``, ``Prior1YearInstant``, ...); the
+    non-consolidated figures carry only the NonConsolidatedMember dimension.
+
+    Returns:
+        Tuple of (consolidated, "current" or "prior"), or None for contexts
+        not used (segments, older periods)
+    """
+    if context_ref.startswith(("Current", "Interim")):
+        period = "current"
+    elif context_ref.startswith("Prior1"):
+        period = "prior"
+    else:
+        return None
+
+    dimensions = context.get("dimensions") or {}
+    if not dimensions:
+        return True, period
+    members = {member.rsplit(":", 1)[-1] for member in dimensions.values()}
+    if members == {_NON_CONSOLIDATED_MEMBER}:
+        return False, period
+    return None
+
+
+def _context_rank(section: str, context_ref: str) -> int:
+    """
+    Rank a fact's context for a statement section (lower is preferred).
+
+    Args:
+        section: Statement section the fact maps to
+        context_ref: EDINET context ID
+
+    Returns:
+        Position of the context's period kind in the section's preference
+        order; kinds not listed rank after every listed one
+    """
+    kind = context_ref.split("_", 1)[0]
+    for prefix in ("Current", "Prior1"):
+        if kind.startswith(prefix):
+            kind = kind[len(prefix) :]
+            break
+    ranks = _CONTEXT_RANKS[section]
+    return ranks.get(kind, len(ranks))
+
+
+def _fact_value(value: Optional[str]) -> Any:
+    """Convert a fact value to a float where possible."""
+    try:
+        return float(value) if value else None
+    except (ValueError, TypeError):
+        return value
+
+
+def categorize_facts(facts: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Categorize resolved facts into financial statement sections.
+
+    Facts are classified in a single pass by context (consolidated or
+    non-consolidated, current or prior period), then ranked by period kind
+    for the statement (year-to-date before quarter durations for flow
+    statements, instants for the balance sheet) and element priority.
+    Consolidated figures are used when the document has any, otherwise the
+    non-consolidated ones.
+
+    Args:
+        facts: Facts with ``name``, ``value``, ``context_ref``, ``context``
+            and ``unit_ref``
+
+    Returns:
+        Financial data keyed by statement section and standardized field.
+        Prior period figures are under ``prior_period``; ``metadata`` holds
+        the document's period information and which figures and accounting
+        standard were used.
+    """
+    # (consolidated, period) -> (section, field) -> ((rank, priority), fact)
+    selected: Dict[
+        Tuple[bool, str], Dict[Tuple[str, str], Tuple[Tuple[int, int], Dict[str, Any]]]
+    ] = {}
+    metadata: Dict[str, Any] = {}
+
+    for fact in facts:
+        mapping = resolve_element(fact["name"])
+        if mapping is None:
+            continue
+
+        section, field_name, priority = mapping
+        if section == "metadata":
+            if fact["value"]:
+                metadata.setdefault(field_name, fact["value"].strip())
+            continue
+
+        context_ref = fact.get("context_ref") or ""
+        context_class = _context_class(context_ref, fact["context"])
+        if context_class is None:
+            continue
+
+        # The preferred period wins over element priority, so all figures of a
+        # statement come from the same context where the document allows
+        rank = (_context_rank(section, context_ref), priority)
+        best = selected.setdefault(context_class, {})
+        current = best.get((section, field_name))
+        if current is None or rank < current[0]:
+            best[(section, field_name)] = (rank, fact)
+
+    financial_data = empty_financial_data()
+    financial_data["metadata"].update(metadata)
+    if not selected:
+        return financial_data
+
+    consolidated = (True, "current") in selected
+    prior_period: Dict[str, Dict[str, Any]] = {
+        section: {} for section in FINANCIAL_STATEMENTS
+    }
+    ifrs = False
+
+    for target, period in ((financial_data, "current"), (prior_period, "prior")):
+        for (section, field_name), (_, fact) in selected.get(
+            (consolidated, period), {}
+        ).items():
+            target[section][field_name] = {
+                "value": _fact_value(fact["value"]),
+                "period": fact["context"]["period"],
+                "unit": fact["unit_ref"],
+            }
+            ifrs = ifrs or fact["name"].startswith(_IFRS_PREFIX)
+
+    financial_data["prior_period"] = prior_period
+    financial_data["metadata"]["consolidated"] = consolidated
+    financial_data["metadata"]["accounting_standard"] = "ifrs" if ifrs else "jgaap"
+    return financial_data
+
+
+def parse_xbrl_instance(source: XBRLSource) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse an XBRL instance document into financial statement sections.
+
+    Args:
+        source: Instance document bytes or a binary stream
+
+    Returns:
+        Parsed financial data
+
+    Raises:
+        InvalidDataError: If the document is not well-formed XML
+    """
+    try:
+        contexts, facts = iter_instance(source)
+    except etree.XMLSyntaxError as e:
+        logger.error(f"XML parsing error: {e}")
+        raise InvalidDataError(f"Invalid XBRL XML: {e}")
+
+    resolved = []
+    for fact in facts:
+        context = contexts.get(fact["context_ref"])
+        if context is not None:
+            fact["context"] = context
+            resolved.append(fact)
+
+    return categorize_facts(resolved)
+
+
+def merge_financial_data(
+    target: Dict[str, Dict[str, Any]], parsed: Dict[str, Dict[str, Any]]
+) -> None:
+    """
+    Merge the financial data of one instance into another.
+
+    Args:
+        target: Financial data updated in place
+        parsed: Financial data of another instance
+    """
+    for section in FINANCIAL_STATEMENTS:
+        target[section].update(parsed.get(section, {}))
+
+    prior_period = parsed.get("prior_period")
+    if prior_period:
+        merged = target.setdefault(
+            "prior_period", {section: {} for section in FINANCIAL_STATEMENTS}
+        )
+        for section in FINANCIAL_STATEMENTS:
+            merged[section].update(prior_period.get(section, {}))
+
+    # Instances without mapped facts (e.g. audit reports) carry no metadata
+    if parsed.get("metadata"):
+        target["metadata"].update(parsed["metadata"])
+
+
+def parse_xbrl_package(source: PackageSource) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse all XBRL instances in an EDINET document ZIP.
+
+    Members are decompressed as streams and never read fully into memory.
+    Packages given as a path are memory-mapped rather than read.
+
+    Args:
+        source: ZIP content as bytes, a file path or a seekable binary stream
+
+    Returns:
+        Parsed financial data merged across instances
+
+    Raises:
+        InvalidDataError: If the package or an instance cannot be parsed
+    """
+    if isinstance(source, (str, os.PathLike)):
+        try:
+            with open_mapped(os.fspath(source)) as mapped:
+                return parse_xbrl_package(mapped)
+        except OSError as e:
+            raise InvalidDataError(f"Failed to read XBRL package: {e}")
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+
+    financial_data = empty_financial_data()
+    try:
+        with zipfile.ZipFile(source) as zip_file:
+            for member in zip_file.namelist():
+                if not member.endswith(".xbrl"):
+                    continue
+                with zip_file.open(member) as stream:
+                    parsed = parse_xbrl_instance(stream)
+                merge_financial_data(financial_data, parsed)
+    except Exception as e:
+        logger.error(f"Error parsing XBRL content: {e}")
+        raise InvalidDataError(f"Failed to parse XBRL data: {e}")
+
+    return financial_data
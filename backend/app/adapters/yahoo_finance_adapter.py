@@ -5,12 +5,15 @@ import json
 import logging
 import re
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote, urlencode
 
 import aiohttp
+import numpy as np
+import pandas as pd
 
 from .base import (
+    BulkQuoteResult,
     CostInfo,
     DataSourceError,
     DataSourceUnavailableError,
@@ -21,6 +24,7 @@ from .base import (
     RateLimitInfo,
     StockPriceAdapter,
 )
+from .price_frame import build_price_frame, pad_column
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +34,8 @@ class YahooFinanceJapanAdapter(StockPriceAdapter):
 
     BASE_URL = "https://query1.finance.yahoo.com/v8/finance/chart"
     SEARCH_URL = "https://query2.finance.yahoo.com/v1/finance/search"
+    QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+    JST_GMT_OFFSET = 9 * 3600  # Used when the chart meta has no gmtoffset
 
     def __init__(
         self,
@@ -49,6 +55,7 @@ class YahooFinanceJapanAdapter(StockPriceAdapter):
                 - retry_delay: Delay between retries in seconds (default: 1)
                 - delay_minutes: Delay for free tier data in minutes (default: 15)
                 - user_agent: User agent string for requests
+                - bulk_quote_chunk_size: Symbols per multi-quote request (default: 50)
         """
         super().__init__(name, priority, config)
 
@@ -69,6 +76,9 @@ class YahooFinanceJapanAdapter(StockPriceAdapter):
         self.requests_per_minute = self.config.get("requests_per_minute", 30)
         self.requests_per_hour = self.config.get("requests_per_hour", 1000)
 
+        # Multi-symbol quote endpoint batching
+        self.bulk_quote_chunk_size = self.config.get("bulk_quote_chunk_size", 50)
+
         # Request tracking
         self._request_count_minute = 0
         self._request_count_hour = 0
@@ -298,18 +308,76 @@ class YahooFinanceJapanAdapter(StockPriceAdapter):
             logger.error(f"Error parsing Yahoo Finance chart data: {e}")
             raise InvalidDataError(f"Invalid chart data format: {e}")
 
-    def _parse_historical_data(
-        self, data: Dict[str, Any], symbol: str
-    ) -> List[Dict[str, Any]]:
+    def _parse_quote_data(self, quote: Dict[str, Any], symbol: str) -> Dict[str, Any]:
         """
-        Parse historical data from Yahoo Finance response.
+        Parse a single entry of a multi-symbol quote response.
+
+        Args:
+            quote: Entry from ``quoteResponse.result``
+            symbol: Stock symbol as requested by the caller
+
+        Returns:
+            Normalized price data in the same shape as ``_parse_chart_data``
+        """
+        current_price = quote.get("regularMarketPrice")
+        if current_price is None:
+            raise InvalidDataError(f"No price in Yahoo Finance quote for {symbol}")
+
+        previous_close = quote.get("regularMarketPreviousClose")
+
+        change = quote.get("regularMarketChange")
+        change_percent = quote.get("regularMarketChangePercent")
+        if change is None and previous_close is not None:
+            change = current_price - previous_close
+            change_percent = (
+                (change / previous_close) * 100 if previous_close != 0 else 0
+            )
+
+        regular_market_time = quote.get("regularMarketTime")
+        if regular_market_time:
+            trading_day = datetime.fromtimestamp(regular_market_time).strftime(
+                "%Y-%m-%d"
+            )
+        else:
+            trading_day = datetime.utcnow().strftime("%Y-%m-%d")
+
+        return {
+            "symbol": symbol,
+            "price": current_price,
+            "open": quote.get("regularMarketOpen"),
+            "high": quote.get("regularMarketDayHigh"),
+            "low": quote.get("regularMarketDayLow"),
+            "volume": quote.get("regularMarketVolume", 0),
+            "previous_close": previous_close,
+            "change": change,
+            "change_percent": change_percent,
+            "trading_day": trading_day,
+            "timestamp": datetime.utcnow().isoformat(),
+            "currency": quote.get(
+                "currency", "JPY" if symbol.endswith(".T") else "USD"
+            ),
+            "market_status": "open"
+            if quote.get("marketState") == "REGULAR"
+            else "closed",
+            "data_delay_minutes": self.delay_minutes,
+        }
+
+    def _parse_chart_columns(
+        self,
+        data: Dict[str, Any],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray], int]:
+        """
+        Extract chart arrays from a Yahoo Finance response.
 
         Args:
             data: API response data
-            symbol: Stock symbol
+            start_date: Drop bars before this time
+            end_date: Drop bars after this time
 
         Returns:
-            List of historical price data
+            Tuple of (timestamps, columns with NaN for nulls, exchange GMT offset)
         """
         try:
             chart = data["chart"]
@@ -317,77 +385,138 @@ class YahooFinanceJapanAdapter(StockPriceAdapter):
                 raise InvalidDataError("No chart data found in Yahoo Finance response")
 
             result = chart["result"][0]
-            timestamps = result.get("timestamp", [])
             indicators = result.get("indicators", {})
 
             if "quote" not in indicators or not indicators["quote"]:
                 raise InvalidDataError("No quote data in indicators")
 
             quote = indicators["quote"][0]
+            timestamps = np.array(result.get("timestamp") or [], dtype=np.int64)
+            length = len(timestamps)
 
-            # Get OHLCV arrays
-            opens = quote.get("open", [])
-            highs = quote.get("high", [])
-            lows = quote.get("low", [])
-            closes = quote.get("close", [])
-            volumes = quote.get("volume", [])
-
-            # Get adjusted close if available
-            adjusted_closes = []
+            columns = {
+                name: pad_column(quote.get(name), length)
+                for name in ("open", "high", "low", "close", "volume")
+            }
+            adjusted_closes = None
             if "adjclose" in indicators and indicators["adjclose"]:
-                adjusted_closes = indicators["adjclose"][0].get("adjclose", [])
+                adjusted_closes = indicators["adjclose"][0].get("adjclose")
+            columns["adjclose"] = pad_column(adjusted_closes, length)
 
-            historical_data = []
+            gmt_offset = int(
+                result.get("meta", {}).get("gmtoffset", self.JST_GMT_OFFSET)
+            )
 
-            for i, timestamp in enumerate(timestamps):
-                try:
-                    # Convert timestamp to date
-                    date_obj = datetime.fromtimestamp(timestamp)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"Error parsing Yahoo Finance historical data: {e}")
+            raise InvalidDataError(f"Invalid historical data format: {e}")
 
-                    # Get values (handle None values)
-                    open_price = (
-                        opens[i] if i < len(opens) and opens[i] is not None else 0
-                    )
-                    high_price = (
-                        highs[i] if i < len(highs) and highs[i] is not None else 0
-                    )
-                    low_price = lows[i] if i < len(lows) and lows[i] is not None else 0
-                    close_price = (
-                        closes[i] if i < len(closes) and closes[i] is not None else 0
-                    )
-                    volume = (
-                        volumes[i] if i < len(volumes) and volumes[i] is not None else 0
-                    )
+        # Date range filter on epoch seconds (naive datetimes are local time,
+        # matching datetime.fromtimestamp)
+        mask = np.ones(length, dtype=bool)
+        if start_date is not None:
+            mask &= timestamps >= start_date.timestamp()
+        if end_date is not None:
+            mask &= timestamps <= end_date.timestamp()
+        if not mask.all():
+            timestamps = timestamps[mask]
+            columns = {name: column[mask] for name, column in columns.items()}
 
-                    adjusted_close = close_price
-                    if i < len(adjusted_closes) and adjusted_closes[i] is not None:
-                        adjusted_close = adjusted_closes[i]
+        return timestamps, columns, gmt_offset
 
-                    record = {
-                        "symbol": symbol,
-                        "date": date_obj.isoformat(),
-                        "open": float(open_price),
-                        "high": float(high_price),
-                        "low": float(low_price),
-                        "close": float(close_price),
-                        "volume": int(volume),
-                        "adjusted_close": float(adjusted_close),
-                    }
+    def _parse_historical_data(
+        self,
+        data: Dict[str, Any],
+        symbol: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse historical data from Yahoo Finance response.
 
-                    historical_data.append(record)
+        Args:
+            data: API response data
+            symbol: Stock symbol
+            start_date: Drop bars before this time
+            end_date: Drop bars after this time
 
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Error parsing historical data point {i}: {e}")
-                    continue
+        Returns:
+            List of historical price data (newest first)
+        """
+        timestamps, columns, _ = self._parse_chart_columns(data, start_date, end_date)
 
-            # Sort by date (newest first)
-            historical_data.sort(key=lambda x: x["date"], reverse=True)
+        # Nulls become 0; a missing adjusted close falls back to the close
+        closes = np.nan_to_num(columns["close"], nan=0.0)
+        adjusted_closes = np.where(
+            np.isnan(columns["adjclose"]), closes, columns["adjclose"]
+        )
+        order = np.argsort(-timestamps, kind="stable")
 
-            return historical_data
+        return [
+            {
+                "symbol": symbol,
+                "date": datetime.fromtimestamp(timestamp).isoformat(),
+                "open": open_price,
+                "high": high_price,
+                "low": low_price,
+                "close": close_price,
+                "volume": volume,
+                "adjusted_close": adjusted_close,
+            }
+            for (
+                timestamp,
+                open_price,
+                high_price,
+                low_price,
+                close_price,
+                volume,
+                adjusted_close,
+            ) in zip(
+                timestamps[order].tolist(),
+                np.nan_to_num(columns["open"][order], nan=0.0).tolist(),
+                np.nan_to_num(columns["high"][order], nan=0.0).tolist(),
+                np.nan_to_num(columns["low"][order], nan=0.0).tolist(),
+                closes[order].tolist(),
+                np.nan_to_num(columns["volume"][order], nan=0.0)
+                .astype(np.int64)
+                .tolist(),
+                adjusted_closes[order].tolist(),
+            )
+        ]
 
-        except (KeyError, TypeError) as e:
-            logger.error(f"Error parsing Yahoo Finance historical data: {e}")
-            raise InvalidDataError(f"Invalid historical data format: {e}")
+    def _parse_historical_frame(
+        self,
+        data: Dict[str, Any],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        Parse historical data from Yahoo Finance response into a price frame.
+
+        Bar dates are taken in the exchange's local time zone.
+
+        Args:
+            data: API response data
+            start_date: Drop bars before this time
+            end_date: Drop bars after this time
+
+        Returns:
+            DataFrame with PRICE_FRAME_COLUMNS sorted by date
+        """
+        timestamps, columns, gmt_offset = self._parse_chart_columns(
+            data, start_date, end_date
+        )
+        dates = ((timestamps + gmt_offset) // 86400).astype("datetime64[D]")
+
+        return build_price_frame(
+            dates,
+            columns["open"],
+            columns["high"],
+            columns["low"],
+            columns["close"],
+            columns["volume"],
+            columns["adjclose"],
+        )
 
     async def health_check(self) -> HealthCheck:
         """Check Yahoo Finance API health."""
@@ -486,6 +615,75 @@ class YahooFinanceJapanAdapter(StockPriceAdapter):
             logger.error(f"Error getting current price for {symbol}: {e}")
             raise
 
+    async def get_current_prices(self, symbols: List[str]) -> BulkQuoteResult:
+        """
+        Get current prices for several symbols via the multi-quote endpoint.
+
+        Symbols are sent in chunks of ``bulk_quote_chunk_size``. If the
+        multi-quote endpoint itself fails for a chunk (other than by rate
+        limiting), that chunk falls back to per-symbol chart requests.
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            BulkQuoteResult with quotes and per-symbol errors
+        """
+        unique_symbols = list(dict.fromkeys(symbols))
+        result = BulkQuoteResult()
+        chunk_size = max(1, self.bulk_quote_chunk_size)
+
+        for i in range(0, len(unique_symbols), chunk_size):
+            chunk = unique_symbols[i : i + chunk_size]
+            normalized = {self._normalize_symbol(symbol): symbol for symbol in chunk}
+            params = {"symbols": ",".join(normalized)}
+
+            try:
+                data = await self._make_request(self.QUOTE_URL, params)
+                quotes = (data.get("quoteResponse") or {}).get("result") or []
+            except RateLimitExceededError as e:
+                for symbol in chunk:
+                    result.errors[symbol] = str(e)
+                continue
+            except DataSourceError as e:
+                logger.warning(
+                    f"Yahoo Finance multi-quote request failed, "
+                    f"falling back to per-symbol requests: {e}"
+                )
+                result.merge(await super().get_current_prices(chunk))
+                continue
+
+            for quote in quotes:
+                symbol = normalized.get(quote.get("symbol", ""))
+                if symbol is None:
+                    continue
+                try:
+                    result.quotes[symbol] = self._parse_quote_data(quote, symbol)
+                except InvalidDataError as e:
+                    result.errors[symbol] = str(e)
+
+            for symbol in chunk:
+                if symbol not in result.quotes and symbol not in result.errors:
+                    result.errors[symbol] = "Symbol not found"
+
+        return result
+
+    async def _get_chart(
+        self, symbol: str, start_date: datetime, end_date: datetime, interval: str
+    ) -> Dict[str, Any]:
+        """Request chart data for a symbol and date range."""
+        if interval not in ("1d", "1wk", "1mo"):
+            raise InvalidDataError(f"Unsupported interval: {interval}")
+
+        url = f"{self.BASE_URL}/{self._normalize_symbol(symbol)}"
+        params = {
+            "interval": interval,
+            "period1": str(int(start_date.timestamp())),
+            "period2": str(int(end_date.timestamp())),
+            "events": "history",
+        }
+        return await self._make_request(url, params)
+
     async def get_historical_prices(
         self,
         symbol: str,
@@ -505,45 +703,36 @@ class YahooFinanceJapanAdapter(StockPriceAdapter):
         Returns:
             List of historical price data
         """
-        normalized_symbol = self._normalize_symbol(symbol)
+        try:
+            data = await self._get_chart(symbol, start_date, end_date, interval)
+            return self._parse_historical_data(data, symbol, start_date, end_date)
 
-        # Convert interval to Yahoo Finance format
-        yahoo_interval = interval
-        if interval == "1d":
-            yahoo_interval = "1d"
-        elif interval == "1wk":
-            yahoo_interval = "1wk"
-        elif interval == "1mo":
-            yahoo_interval = "1mo"
-        else:
-            raise InvalidDataError(f"Unsupported interval: {interval}")
+        except Exception as e:
+            logger.error(f"Error getting historical prices for {symbol}: {e}")
+            raise
 
-        # Convert dates to timestamps
-        start_timestamp = int(start_date.timestamp())
-        end_timestamp = int(end_date.timestamp())
+    async def get_historical_price_frame(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> pd.DataFrame:
+        """
+        Get historical price data as a columnar frame.
 
-        url = f"{self.BASE_URL}/{normalized_symbol}"
-        params = {
-            "interval": yahoo_interval,
-            "period1": str(start_timestamp),
-            "period2": str(end_timestamp),
-            "events": "history",
-        }
+        Args:
+            symbol: Stock symbol
+            start_date: Start date
+            end_date: End date
+            interval: Data interval (1d, 1wk, 1mo supported)
 
+        Returns:
+            DataFrame with PRICE_FRAME_COLUMNS sorted by date
+        """
         try:
-            data = await self._make_request(url, params)
-            historical_data = self._parse_historical_data(data, symbol)
-
-            # Filter by date range (additional safety check)
-            filtered_data = []
-            for record in historical_data:
-                record_date = datetime.fromisoformat(
-                    record["date"].replace("Z", "+00:00")
-                )
-                if start_date <= record_date <= end_date:
-                    filtered_data.append(record)
-
-            return filtered_data
+            data = await self._get_chart(symbol, start_date, end_date, interval)
+            return self._parse_historical_frame(data, start_date, end_date)
 
         except Exception as e:
             logger.error(f"Error getting historical prices for {symbol}: {e}")
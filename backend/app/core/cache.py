@@ -27,6 +27,7 @@ class CacheKeyType(Enum):
     USER_SESSION = "user_session"
     API_QUOTA = "api_quota"
     MARKET_DATA = "market_data"
+    SENTIMENT = "sentiment"
 
 
 class CacheTTLPolicy:
@@ -40,6 +41,7 @@ class CacheTTLPolicy:
         CacheKeyType.USER_SESSION: 1800,  # 30 minutes
         CacheKeyType.API_QUOTA: 86400,  # 24 hours
         CacheKeyType.MARKET_DATA: 300,  # 5 minutes
+        CacheKeyType.SENTIMENT: 2592000,  # 30 days
     }
 
     @classmethod
@@ -100,6 +102,13 @@ class CacheKeyBuilder:
         """Build cache key for market data."""
         return CacheKeyBuilder.build_key(CacheKeyType.MARKET_DATA, market, data_type)
 
+    @staticmethod
+    def build_sentiment_key(model_version: str, text_hash: str) -> str:
+        """Build cache key for a model's sentiment result for a text."""
+        return CacheKeyBuilder.build_key(
+            CacheKeyType.SENTIMENT, model_version, text_hash
+        )
+
 
 class RedisCache:
     """Redis caching layer with multi-layer support."""
@@ -221,6 +230,71 @@ class RedisCache:
             logger.error("Failed to get cache", key=key, error=str(e))
             return None
 
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several values from cache in one round trip.
+
+        Unlike ``get``, Redis errors are raised rather than reported as
+        misses, so callers can tell an outage from missing keys.
+        """
+        if not keys:
+            return []
+
+        await self._ensure_connected()
+
+        try:
+            values = await self._client.mget(keys)
+            logger.debug(
+                "Cache multi-get",
+                requested=len(keys),
+                hits=sum(value is not None for value in values),
+            )
+            return [
+                None if value is None else self._deserialize_data(value)
+                for value in values
+            ]
+
+        except Exception as e:
+            logger.error("Failed to get cache values", count=len(keys), error=str(e))
+            raise
+
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        key_type: Optional[CacheKeyType] = None,
+    ) -> bool:
+        """
+        Set several values in cache in one round trip.
+
+        Unlike ``set``, Redis errors are raised rather than reported as
+        False, so callers can tell an outage from a rejected write.
+        """
+        if not items:
+            return True
+
+        await self._ensure_connected()
+
+        try:
+            if ttl is None and key_type:
+                ttl = CacheTTLPolicy.get_ttl(key_type)
+
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    serialized_value = self._serialize_data(value)
+                    if ttl:
+                        await pipe.setex(key, ttl, serialized_value)
+                    else:
+                        await pipe.set(key, serialized_value)
+                results = await pipe.execute()
+
+            logger.debug("Cache multi-set", count=len(items), ttl=ttl)
+            return all(results)
+
+        except Exception as e:
+            logger.error("Failed to set cache values", count=len(items), error=str(e))
+            raise
+
     async def delete(self, key: str) -> bool:
         """Delete a key from cache."""
         await self._ensure_connected()
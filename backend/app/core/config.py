@@ -72,6 +72,11 @@ class Settings(BaseSettings):
     RATE_LIMIT_PER_MINUTE: int = 60
     RATE_LIMIT_PER_HOUR: int = 1000
 
+    # Sentiment analysis
+    SENTIMENT_BACKEND: str = "torch"  # "torch" or "onnx"
+    SENTIMENT_ONNX_MODEL_DIR: str = "models/sentiment-onnx"
+    SENTIMENT_ONNX_AUTO_EXPORT: bool = True
+
     # Alerting
     SLACK_WEBHOOK_URL: Optional[str] = None
     PAGERDUTY_INTEGRATION_KEY: Optional[str] = None
@@ -0,0 +1,99 @@
+"""
+Japanese national holidays.
+
+Computes the holidays from the statutory rules (including the 2019-2021
+one-off changes), so that business days can be enumerated without an external
+calendar service.
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import FrozenSet, Set
+
+# One-off holidays and moved holidays that the rules below do not produce
+_SPECIAL_HOLIDAYS = {
+    2019: {date(2019, 4, 30), date(2019, 5, 1), date(2019, 5, 2), date(2019, 10, 22)},
+    2020: {date(2020, 7, 23), date(2020, 7, 24), date(2020, 8, 10)},
+    2021: {date(2021, 7, 22), date(2021, 7, 23), date(2021, 8, 8)},
+}
+
+# Years in which the Olympics moved Marine Day, Sports Day and Mountain Day
+_OLYMPIC_YEARS = {2020, 2021}
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """Get the n-th given weekday (Mon=0) of a month."""
+    first = date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    return first + timedelta(days=offset + 7 * (n - 1))
+
+
+def _vernal_equinox(year: int) -> date:
+    """Vernal equinox day (valid 1980-2099)."""
+    day = int(20.8431 + 0.242194 * (year - 1980) - int((year - 1980) / 4))
+    return date(year, 3, day)
+
+
+def _autumnal_equinox(year: int) -> date:
+    """Autumnal equinox day (valid 1980-2099)."""
+    day = int(23.2488 + 0.242194 * (year - 1980) - int((year - 1980) / 4))
+    return date(year, 9, day)
+
+
+@lru_cache(maxsize=256)
+def japanese_holidays(year: int) -> FrozenSet[date]:
+    """
+    Get Japanese national holidays for a year.
+
+    Includes substitute holidays (振替休日) and citizens' holidays (国民の休日).
+
+    Args:
+        year: Calendar year (2000 or later)
+
+    Returns:
+        Set of holiday dates
+    """
+    holidays: Set[date] = {
+        date(year, 1, 1),
+        _nth_weekday(year, 1, 0, 2),  # Coming of Age Day
+        date(year, 2, 11),
+        _vernal_equinox(year),
+        date(year, 4, 29),
+        date(year, 5, 3),
+        date(year, 5, 4),
+        date(year, 5, 5),
+        _nth_weekday(year, 9, 0, 3),  # Respect for the Aged Day
+        _autumnal_equinox(year),
+        date(year, 11, 3),
+        date(year, 11, 23),
+    }
+
+    if year <= 2018:
+        holidays.add(date(year, 12, 23))
+    elif year >= 2020:
+        holidays.add(date(year, 2, 23))
+
+    if year not in _OLYMPIC_YEARS:
+        holidays.add(_nth_weekday(year, 7, 0, 3))  # Marine Day
+        holidays.add(_nth_weekday(year, 10, 0, 2))  # Sports Day
+        if year >= 2016:
+            holidays.add(date(year, 8, 11))  # Mountain Day
+
+    holidays |= _SPECIAL_HOLIDAYS.get(year, set())
+
+    # Citizens' holiday: a weekday sandwiched between two holidays
+    for holiday in sorted(holidays):
+        candidate = holiday + timedelta(days=2)
+        between = holiday + timedelta(days=1)
+        if candidate in holidays and between not in holidays and between.weekday() != 6:
+            holidays.add(between)
+
+    # Substitute holiday: a holiday on Sunday moves to the next non-holiday
+    for holiday in sorted(holidays):
+        if holiday.weekday() == 6:
+            substitute = holiday + timedelta(days=1)
+            while substitute in holidays:
+                substitute += timedelta(days=1)
+            holidays.add(substitute)
+
+    return frozenset(holidays)
@@ -2,9 +2,13 @@
 
 from app.models.analysis import AIAnalysisCache
 from app.models.base import Base
-from app.models.financial import FinancialReport, FinancialReportLineItem
+from app.models.financial import (
+    FinancialReport,
+    FinancialReportLineItem,
+    StockFundamentals,
+)
 from app.models.logs import APIUsageLog
-from app.models.news import NewsArticle, StockNewsLink
+from app.models.news import NewsArticle, SentimentDailyRollup, StockNewsLink
 from app.models.stock import Stock, StockDailyMetrics, StockPriceHistory
 from app.models.subscription import Plan, Subscription
 from app.models.user import User, UserOAuthIdentity, UserProfile
@@ -22,8 +26,10 @@ __all__ = [
     "StockPriceHistory",
     "FinancialReport",
     "FinancialReportLineItem",
+    "StockFundamentals",
     "NewsArticle",
     "StockNewsLink",
+    "SentimentDailyRollup",
     "AIAnalysisCache",
     "APIUsageLog",
     "UserWatchlist",
@@ -2,7 +2,16 @@
 Financial report models.
 """
 
-from sqlalchemy import CheckConstraint, Column, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+)
 from sqlalchemy.dialects.postgresql import NUMERIC, UUID
 from sqlalchemy.orm import relationship
 
@@ -63,3 +72,59 @@ class FinancialReportLineItem(Base):
 
     # Relationships
     report = relationship("FinancialReport", back_populates="line_items")
+
+
+class StockFundamentals(Base, TimestampMixin):
+    """Wide fundamentals table, one row per ticker and fiscal period."""
+
+    __tablename__ = "stock_fundamentals"
+
+    ticker = Column(
+        String(10), ForeignKey("stocks.ticker", ondelete="CASCADE"), primary_key=True
+    )
+    fiscal_year = Column(Integer, primary_key=True)
+    fiscal_period = Column(String(10), primary_key=True)
+    report_type = Column(String(20), nullable=False)
+    period_start = Column(Date, nullable=True)
+    period_end = Column(Date, nullable=True)
+    accounting_standard = Column(String(10), nullable=True)
+    is_consolidated = Column(Boolean, nullable=True)
+
+    # Income statement
+    revenue = Column(NUMERIC(20, 2), nullable=True)
+    gross_profit = Column(NUMERIC(20, 2), nullable=True)
+    sga_expenses = Column(NUMERIC(20, 2), nullable=True)
+    operating_income = Column(NUMERIC(20, 2), nullable=True)
+    ordinary_income = Column(NUMERIC(20, 2), nullable=True)
+    net_income = Column(NUMERIC(20, 2), nullable=True)
+
+    # Balance sheet
+    total_assets = Column(NUMERIC(20, 2), nullable=True)
+    total_liabilities = Column(NUMERIC(20, 2), nullable=True)
+    shareholders_equity = Column(NUMERIC(20, 2), nullable=True)
+    current_assets = Column(NUMERIC(20, 2), nullable=True)
+    current_liabilities = Column(NUMERIC(20, 2), nullable=True)
+    cash_and_equivalents = Column(NUMERIC(20, 2), nullable=True)
+
+    # Cash flow
+    operating_cash_flow = Column(NUMERIC(20, 2), nullable=True)
+    investing_cash_flow = Column(NUMERIC(20, 2), nullable=True)
+    financing_cash_flow = Column(NUMERIC(20, 2), nullable=True)
+
+    source = Column(String(20), nullable=False, default="EDINET")
+    document_id = Column(String(20), nullable=True)
+    submitted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        CheckConstraint(
+            "fiscal_period IN ('Q1', 'Q2', 'Q3', 'Q4', 'FY')",
+            name="check_fundamentals_fiscal_period",
+        ),
+        CheckConstraint(
+            "report_type IN ('quarterly', 'annual')",
+            name="check_fundamentals_report_type",
+        ),
+    )
+
+    # Relationships
+    stock = relationship("Stock", back_populates="fundamentals")
@@ -2,12 +2,23 @@
 News and sentiment models.
 """
 
-from sqlalchemy import CheckConstraint, Column, ForeignKey, String
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+)
 from sqlalchemy.dialects.postgresql import NUMERIC, UUID
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
 
+# Rollup scope aggregating every article regardless of stock
+MARKET_SENTIMENT_SCOPE = "market"
+
 
 class NewsArticle(Base, UUIDMixin, TimestampMixin):
     """News article model."""
@@ -20,6 +31,9 @@ class NewsArticle(Base, UUIDMixin, TimestampMixin):
     source = Column(String(100), nullable=True)
     author = Column(String(255), nullable=True)
     published_at = Column(String, nullable=False)  # ISO datetime string
+    published_ts = Column(
+        DateTime(timezone=True), nullable=True
+    )  # Parsed published_at for range filters and aggregation
     sentiment_label = Column(String(20), nullable=True)
     sentiment_score = Column(NUMERIC(5, 4), nullable=True)  # -1.0 to 1.0
     language = Column(String(10), nullable=False, default="ja")
@@ -52,3 +66,18 @@ class StockNewsLink(Base):
     # Relationships
     article = relationship("NewsArticle", back_populates="stock_links")
     stock = relationship("Stock", back_populates="news_links")
+
+
+class SentimentDailyRollup(Base, TimestampMixin):
+    """Daily sentiment counts per stock and for the whole market."""
+
+    __tablename__ = "sentiment_daily_rollup"
+
+    # Ticker, or MARKET_SENTIMENT_SCOPE for all articles
+    scope = Column(String(10), primary_key=True)
+    day = Column(Date, primary_key=True)  # UTC day of published_ts
+    positive_count = Column(Integer, nullable=False, default=0)
+    negative_count = Column(Integer, nullable=False, default=0)
+    neutral_count = Column(Integer, nullable=False, default=0)
+    score_sum = Column(NUMERIC(14, 4), nullable=False, default=0)
+    score_count = Column(Integer, nullable=False, default=0)
@@ -34,6 +34,9 @@ class Stock(Base, TimestampMixin):
     financial_reports = relationship(
         "FinancialReport", back_populates="stock", cascade="all, delete-orphan"
     )
+    fundamentals = relationship(
+        "StockFundamentals", back_populates="stock", cascade="all, delete-orphan"
+    )
     news_links = relationship(
         "StockNewsLink", back_populates="stock", cascade="all, delete-orphan"
     )
@@ -5,7 +5,10 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
+import pandas as pd
+
 from app.adapters import (
+    BulkQuoteResult,
     DataSourceError,
     DataSourceType,
     DataSourceUnavailableError,
@@ -43,7 +46,9 @@ class DataSourceService:
                 return await adapter.get_current_price(symbol)
 
             result = await self.registry.execute_with_failover(
-                DataSourceType.STOCK_PRICE, operation
+                DataSourceType.STOCK_PRICE,
+                operation,
+                request_key=self.registry.make_request_key("get_current_price", symbol),
             )
 
             logger.info(f"Retrieved stock price for {symbol}")
@@ -53,6 +58,55 @@ class DataSourceService:
             logger.error(f"Failed to get stock price for {symbol}: {e}")
             raise
 
+    async def get_stock_prices(self, symbols: List[str]) -> BulkQuoteResult:
+        """
+        Get current prices for several stocks in one batch.
+
+        The batch goes to a single adapter chosen by failover. An adapter that
+        prices none of the symbols is treated as failed so the next adapter is
+        tried; otherwise partial results are returned with per-symbol errors.
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            BulkQuoteResult with quotes and per-symbol errors
+
+        Raises:
+            DataSourceUnavailableError: If no data sources available
+        """
+        if not symbols:
+            return BulkQuoteResult()
+
+        try:
+
+            async def operation(adapter):
+                batch = await adapter.get_current_prices(symbols)
+                if not batch.quotes and batch.errors:
+                    raise DataSourceError(
+                        f"Adapter '{adapter.name}' could not price any of "
+                        f"{len(batch.errors)} symbols"
+                    )
+                return batch
+
+            result = await self.registry.execute_with_failover(
+                DataSourceType.STOCK_PRICE,
+                operation,
+                request_key=self.registry.make_request_key(
+                    "get_current_prices", sorted(set(symbols))
+                ),
+            )
+
+            logger.info(
+                f"Retrieved stock prices for {len(result.quotes)} symbols "
+                f"({len(result.errors)} errors)"
+            )
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to get stock prices for {len(symbols)} symbols: {e}")
+            raise
+
     async def get_historical_prices(
         self,
         symbol: str,
@@ -80,7 +134,11 @@ class DataSourceService:
                 )
 
             result = await self.registry.execute_with_failover(
-                DataSourceType.STOCK_PRICE, operation
+                DataSourceType.STOCK_PRICE,
+                operation,
+                request_key=self.registry.make_request_key(
+                    "get_historical_prices", symbol, start_date, end_date, interval
+                ),
             )
 
             logger.info(
@@ -92,6 +150,49 @@ class DataSourceService:
             logger.error(f"Failed to get historical prices for {symbol}: {e}")
             raise
 
+    async def get_historical_price_frame(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> pd.DataFrame:
+        """
+        Get historical stock prices as a columnar frame.
+
+        Args:
+            symbol: Stock symbol
+            start_date: Start date
+            end_date: End date
+            interval: Data interval
+
+        Returns:
+            DataFrame with PRICE_FRAME_COLUMNS sorted by date
+        """
+        try:
+
+            async def operation(adapter):
+                return await adapter.get_historical_price_frame(
+                    symbol, start_date, end_date, interval
+                )
+
+            result = await self.registry.execute_with_failover(
+                DataSourceType.STOCK_PRICE,
+                operation,
+                request_key=self.registry.make_request_key(
+                    "get_historical_price_frame", symbol, start_date, end_date, interval
+                ),
+            )
+
+            logger.info(
+                f"Retrieved {len(result)} price bars for {symbol} from {start_date} to {end_date}"
+            )
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to get historical prices for {symbol}: {e}")
+            raise
+
     async def search_stocks(self, query: str) -> List[Dict[str, Any]]:
         """
         Search for stock symbols.
@@ -108,7 +209,9 @@ class DataSourceService:
                 return await adapter.search_symbols(query)
 
             result = await self.registry.execute_with_failover(
-                DataSourceType.STOCK_PRICE, operation
+                DataSourceType.STOCK_PRICE,
+                operation,
+                request_key=self.registry.make_request_key("search_symbols", query),
             )
 
             logger.info(f"Searched stocks with query: {query}")
@@ -140,7 +243,11 @@ class DataSourceService:
                 )
 
             result = await self.registry.execute_with_failover(
-                DataSourceType.FINANCIAL_DATA, operation
+                DataSourceType.FINANCIAL_DATA,
+                operation,
+                request_key=self.registry.make_request_key(
+                    "get_financial_statements", symbol, statement_type, period
+                ),
             )
 
             logger.info(f"Retrieved {statement_type} statements for {symbol}")
@@ -166,7 +273,11 @@ class DataSourceService:
                 return await adapter.get_company_overview(symbol)
 
             result = await self.registry.execute_with_failover(
-                DataSourceType.FINANCIAL_DATA, operation
+                DataSourceType.FINANCIAL_DATA,
+                operation,
+                request_key=self.registry.make_request_key(
+                    "get_company_overview", symbol
+                ),
             )
 
             logger.info(f"Retrieved company overview for {symbol}")
@@ -205,7 +316,11 @@ class DataSourceService:
                 )
 
             result = await self.registry.execute_with_failover(
-                DataSourceType.NEWS, operation
+                DataSourceType.NEWS,
+                operation,
+                request_key=self.registry.make_request_key(
+                    "get_news", symbol, keywords, limit, start_date, end_date
+                ),
             )
 
             logger.info(f"Retrieved news articles (symbol: {symbol}, limit: {limit})")
@@ -228,7 +343,9 @@ class DataSourceService:
                 return await adapter.get_market_indices()
 
             result = await self.registry.execute_with_failover(
-                DataSourceType.MARKET_DATA, operation
+                DataSourceType.MARKET_DATA,
+                operation,
+                request_key=self.registry.make_request_key("get_market_indices"),
             )
 
             logger.info("Retrieved market indices")
@@ -257,7 +374,11 @@ class DataSourceService:
                 return await adapter.get_market_movers(market, category)
 
             result = await self.registry.execute_with_failover(
-                DataSourceType.MARKET_DATA, operation
+                DataSourceType.MARKET_DATA,
+                operation,
+                request_key=self.registry.make_request_key(
+                    "get_market_movers", market, category
+                ),
             )
 
             logger.info(f"Retrieved market movers ({market}, {category})")
@@ -12,7 +12,7 @@ import pandas as pd
 from sqlalchemy.orm import Session
 
 from app.models.financial import FinancialReport, FinancialReportLineItem
-from app.models.news import NewsArticle, StockNewsLink
+from app.models.news import NewsArticle, SentimentDailyRollup, StockNewsLink
 from app.models.stock import Stock, StockDailyMetrics, StockPriceHistory
 from app.services.news_service import NewsCollectionService
 from app.services.stock_service import StockService
@@ -424,17 +424,24 @@ class DataTransformer:
             end_date = date.today()
             start_date = end_date - timedelta(days=30)
 
-            news_data = await self._get_news_data(ticker, start_date, end_date)
+            # Sentiment comes from the daily rollup; only the top 5
+            # articles themselves are loaded for display
+            sentiment_rollup = await self._get_sentiment_rollup(
+                ticker, start_date, end_date
+            )
+            news_data = await self._get_news_data(ticker, start_date, end_date, limit=5)
 
-            if not news_data:
+            if not news_data and not sentiment_rollup:
                 return {"news_sentiment": "No recent news available"}
 
             # Analyze sentiment trends
-            sentiment_analysis = self._analyze_sentiment_trends(news_data)
+            sentiment_analysis = self._analyze_sentiment_trends(
+                news_data, sentiment_rollup
+            )
 
             return {
                 "news_sentiment": sentiment_analysis,
-                "recent_news": self._format_recent_news(news_data[:5]),  # Top 5 news
+                "recent_news": self._format_recent_news(news_data),
             }
 
         except Exception as e:
@@ -581,8 +588,50 @@ class DataTransformer:
             logger.error(f"Error getting daily metrics: {str(e)}")
             return {}
 
-    async def _get_news_data(
+    async def _get_sentiment_rollup(
         self, ticker: str, start_date: date, end_date: date
+    ) -> List[Dict[str, Any]]:
+        """Get daily sentiment rollup rows from database."""
+        if not self.db:
+            return []
+
+        try:
+            rollup_rows = (
+                self.db.query(SentimentDailyRollup)
+                .filter(
+                    SentimentDailyRollup.scope == ticker,
+                    SentimentDailyRollup.day >= start_date,
+                    SentimentDailyRollup.day <= end_date,
+                )
+                .order_by(SentimentDailyRollup.day)
+                .all()
+            )
+
+            return [
+                {
+                    "day": row.day.isoformat(),
+                    "positive_count": row.positive_count,
+                    "negative_count": row.negative_count,
+                    "neutral_count": row.neutral_count,
+                    "avg_sentiment_score": (
+                        float(row.score_sum) / row.score_count
+                        if row.score_count
+                        else 0.0
+                    ),
+                }
+                for row in rollup_rows
+            ]
+
+        except Exception as e:
+            logger.error(f"Error getting sentiment rollup: {str(e)}")
+            return []
+
+    async def _get_news_data(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Get news data from database."""
         if not self.db:
@@ -595,11 +644,13 @@ class DataTransformer:
                 .join(StockNewsLink, NewsArticle.id == StockNewsLink.article_id)
                 .filter(
                     StockNewsLink.ticker == ticker,
-                    NewsArticle.published_at >= start_date,
-                    NewsArticle.published_at <= end_date,
+                    NewsArticle.published_ts >= start_date,
+                    NewsArticle.published_ts < end_date + timedelta(days=1),
                 )
-                .order_by(NewsArticle.published_at.desc())
+                .order_by(NewsArticle.published_ts.desc())
             )
+            if limit:
+                news_query = news_query.limit(limit)
 
             news_records = news_query.all()
 
@@ -608,7 +659,7 @@ class DataTransformer:
                     "headline": record.headline,
                     "content_summary": record.content_summary,
                     "source": record.source,
-                    "published_at": record.published_at.isoformat(),
+                    "published_at": record.published_at,
                     "sentiment_label": record.sentiment_label,
                     "sentiment_score": float(record.sentiment_score)
                     if record.sentiment_score
@@ -686,18 +737,28 @@ class DataTransformer:
 
         return f"直近四半期: {quarterly_data[0]['fiscal_year']}年{quarterly_data[0]['fiscal_period']}"
 
-    def _analyze_sentiment_trends(self, news_data: List[Dict[str, Any]]) -> str:
-        """Analyze sentiment trends from news."""
-        if not news_data:
+    def _analyze_sentiment_trends(
+        self,
+        news_data: List[Dict[str, Any]],
+        sentiment_rollup: Optional[List[Dict[str, Any]]] = None,
+    ) -> str:
+        """Analyze sentiment trends from the daily rollup, or from news."""
+        if not news_data and not sentiment_rollup:
             return "ニュースデータなし"
 
         # Calculate sentiment distribution
-        sentiments = [news.get("sentiment_label", "neutral") for news in news_data]
-        positive_count = sentiments.count("positive")
-        negative_count = sentiments.count("negative")
-        neutral_count = sentiments.count("neutral")
+        if sentiment_rollup:
+            positive_count = sum(day["positive_count"] for day in sentiment_rollup)
+            negative_count = sum(day["negative_count"] for day in sentiment_rollup)
+            neutral_count = sum(day["neutral_count"] for day in sentiment_rollup)
+            total = positive_count + negative_count + neutral_count
+        else:
+            sentiments = [news.get("sentiment_label", "neutral") for news in news_data]
+            positive_count = sentiments.count("positive")
+            negative_count = sentiments.count("negative")
+            neutral_count = sentiments.count("neutral")
+            total = len(sentiments)
 
-        total = len(sentiments)
         if total == 0:
             return "センチメントデータなし"
 
@@ -0,0 +1,351 @@
+"""
+Fundamentals warehouse populated from EDINET filings.
+
+Parsed annual and quarterly reports are flattened into ``stock_fundamentals``,
+one typed row per ticker and fiscal period, and written with multi-row
+upserts. Growth and valuation queries read the pre-pivoted columns instead of
+the ``financial_report_line_items`` EAV table.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+from ..adapters.edinet_adapter import EDINETAdapter
+from ..adapters.edinet_index import EDINETDocument
+from ..models.financial import StockFundamentals
+from ..models.stock import Stock
+
+logger = logging.getLogger(__name__)
+
+# Statement section -> standardized fields stored as columns
+FUNDAMENTAL_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "income_statement": (
+        "revenue",
+        "gross_profit",
+        "sga_expenses",
+        "operating_income",
+        "ordinary_income",
+        "net_income",
+    ),
+    "balance_sheet": (
+        "total_assets",
+        "total_liabilities",
+        "shareholders_equity",
+        "current_assets",
+        "current_liabilities",
+        "cash_and_equivalents",
+    ),
+    "cash_flow": (
+        "operating_cash_flow",
+        "investing_cash_flow",
+        "financing_cash_flow",
+    ),
+}
+
+AMOUNT_COLUMNS: Tuple[str, ...] = tuple(
+    name for fields in FUNDAMENTAL_FIELDS.values() for name in fields
+)
+
+_KEY_COLUMNS = ("ticker", "fiscal_year", "fiscal_period")
+
+# TypeOfCurrentPeriodDEI -> fiscal_period
+_DEI_PERIODS = {"FY": "FY", "Q1": "Q1", "Q2": "Q2", "Q3": "Q3", "Q4": "Q4", "HY": "Q2"}
+
+# EDINET submission times are Japan time
+_JST = timezone(timedelta(hours=9))
+
+
+@dataclass
+class FundamentalsRefreshResult:
+    """Summary of a fundamentals refresh."""
+
+    tickers_processed: int = 0
+    rows_collected: int = 0
+    rows_written: int = 0
+    failed_tickers: Dict[str, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+def _to_date(value: Any) -> Optional[date]:
+    """Convert a datetime or ISO date string to a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str) and value:
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return None
+
+
+def fundamentals_row(
+    ticker: str,
+    document: EDINETDocument,
+    financial_data: Dict[str, Dict[str, Any]],
+    report_type: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    Flatten a parsed filing into a ``stock_fundamentals`` row.
+
+    The fiscal year and period come from the filing's document information
+    (DEI), falling back to the document's period end for annual reports.
+
+    Args:
+        ticker: Stock ticker
+        document: EDINET document metadata
+        financial_data: Parsed financial data (see ``parse_xbrl_package``)
+        report_type: "annual" or "quarterly"
+
+    Returns:
+        Row dictionary, or None if the period cannot be determined or the
+        filing has no mapped figures
+    """
+    metadata = financial_data.get("metadata") or {}
+
+    fiscal_period = _DEI_PERIODS.get(metadata.get("period_type"))
+    if fiscal_period is None:
+        if report_type != "annual":
+            return None
+        fiscal_period = "FY"
+
+    fiscal_year_end = _to_date(metadata.get("fiscal_year_end")) or _to_date(
+        document.period_end
+    )
+    if fiscal_year_end is None:
+        return None
+    period_end = _to_date(metadata.get("period_end")) or _to_date(document.period_end)
+
+    row: Dict[str, Any] = {
+        "ticker": ticker,
+        "fiscal_year": fiscal_year_end.year,
+        "fiscal_period": fiscal_period,
+        "report_type": report_type,
+        "period_start": _to_date(document.period_start),
+        "period_end": period_end,
+        "accounting_standard": metadata.get("accounting_standard"),
+        "is_consolidated": metadata.get("consolidated"),
+        "source": "EDINET",
+        "document_id": document.doc_id,
+        "submitted_at": document.submit_date.replace(tzinfo=_JST),
+    }
+
+    has_figures = False
+    for section, fields in FUNDAMENTAL_FIELDS.items():
+        statement = financial_data.get(section) or {}
+        for name in fields:
+            value = (statement.get(name) or {}).get("value")
+            if isinstance(value, (int, float)):
+                row[name] = value
+                has_figures = True
+            else:
+                row[name] = None
+
+    return row if has_figures else None
+
+
+class FundamentalsService:
+    """Service maintaining the ``stock_fundamentals`` warehouse table."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        edinet_adapter: EDINETAdapter,
+        max_concurrency: int = 4,
+        batch_size: int = 500,
+        filings_per_period: int = 5,
+    ):
+        """
+        Initialize the fundamentals service.
+
+        Args:
+            db: Async database session
+            edinet_adapter: EDINET adapter used to fetch and parse filings
+            max_concurrency: Tickers collected concurrently
+            batch_size: Rows per upsert statement
+            filings_per_period: Most recent filings read per report type
+        """
+        self.db = db
+        self.edinet_adapter = edinet_adapter
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.filings_per_period = filings_per_period
+        # AsyncSession is not safe for concurrent use
+        self._db_lock = asyncio.Lock()
+
+    async def collect_ticker(
+        self, ticker: str, report_types: Sequence[str] = ("annual", "quarterly")
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch and flatten a ticker's recent filings.
+
+        Args:
+            ticker: Stock ticker
+            report_types: Report types to read
+
+        Returns:
+            Rows for ``stock_fundamentals``
+        """
+        rows = []
+        for report_type in report_types:
+            filings = await self.edinet_adapter.get_parsed_filings(
+                ticker, report_type, limit=self.filings_per_period
+            )
+            for document, financial_data in filings:
+                row = fundamentals_row(ticker, document, financial_data, report_type)
+                if row is not None:
+                    rows.append(row)
+        return rows
+
+    async def upsert(self, rows: Sequence[Dict[str, Any]], commit: bool = True) -> int:
+        """
+        Upsert rows into ``stock_fundamentals``.
+
+        A period keeps the figures of its most recently submitted filing.
+
+        Args:
+            rows: Row dictionaries (see ``fundamentals_row``)
+            commit: Commit the session afterwards
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement
+        unique: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        for row in sorted(rows, key=lambda r: r["submitted_at"]):
+            unique[tuple(row[column] for column in _KEY_COLUMNS)] = row
+        values = list(unique.values())
+
+        conn = await self.db.connection()
+        insert = sqlite_insert if conn.dialect.name == "sqlite" else pg_insert
+
+        written = 0
+        for i in range(0, len(values), self.batch_size):
+            stmt = insert(StockFundamentals).values(values[i : i + self.batch_size])
+            set_ = {
+                column: stmt.excluded[column]
+                for column in values[0]
+                if column not in _KEY_COLUMNS
+            }
+            set_["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(_KEY_COLUMNS),
+                set_=set_,
+                where=or_(
+                    StockFundamentals.submitted_at.is_(None),
+                    StockFundamentals.submitted_at <= stmt.excluded.submitted_at,
+                ),
+            )
+            result = await self.db.execute(stmt)
+            written += max(result.rowcount or 0, 0)
+
+        if commit:
+            await self.db.commit()
+        return written
+
+    async def _get_universe(self, tickers: Optional[List[str]]) -> List[str]:
+        """Get active tickers to refresh."""
+        query = select(Stock.ticker).where(Stock.is_active == True)
+        if tickers:
+            query = query.where(Stock.ticker.in_(tickers))
+
+        async with self._db_lock:
+            return list((await self.db.execute(query)).scalars().all())
+
+    async def refresh(
+        self,
+        tickers: Optional[List[str]] = None,
+        report_types: Sequence[str] = ("annual", "quarterly"),
+    ) -> FundamentalsRefreshResult:
+        """
+        Refresh fundamentals for many tickers.
+
+        Filings are collected concurrently and written in batches of
+        ``batch_size`` rows, committed once at the end.
+
+        Args:
+            tickers: Tickers to refresh (default: all active stocks)
+            report_types: Report types to read
+
+        Returns:
+            FundamentalsRefreshResult summary
+        """
+        started = time.perf_counter()
+        result = FundamentalsRefreshResult()
+        universe = await self._get_universe(tickers)
+
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        pending: List[Dict[str, Any]] = []
+
+        async def flush(minimum: int) -> None:
+            async with self._db_lock:
+                if len(pending) < max(minimum, 1):
+                    return
+                batch = pending[:]
+                pending.clear()
+                result.rows_written += await self.upsert(batch, commit=False)
+
+        async def process(ticker: str) -> None:
+            async with semaphore:
+                try:
+                    rows = await self.collect_ticker(ticker, report_types)
+                except Exception as e:
+                    logger.warning(f"Fundamentals refresh failed for {ticker}: {e}")
+                    result.failed_tickers[ticker] = str(e)
+                    return
+
+            result.tickers_processed += 1
+            result.rows_collected += len(rows)
+            pending.extend(rows)
+            await flush(self.batch_size)
+
+        await asyncio.gather(*(process(ticker) for ticker in sorted(universe)))
+        await flush(1)
+        async with self._db_lock:
+            await self.db.commit()
+
+        result.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            f"Fundamentals refresh: {result.tickers_processed} tickers, "
+            f"{result.rows_written} rows, {len(result.failed_tickers)} failures "
+            f"in {result.elapsed_seconds:.1f}s"
+        )
+        return result
+
+    async def get_fundamentals(
+        self, ticker: str, report_type: Optional[str] = None, limit: int = 8
+    ) -> List[StockFundamentals]:
+        """
+        Get a ticker's most recent fundamentals rows.
+
+        Args:
+            ticker: Stock ticker
+            report_type: "annual" or "quarterly" (default: both)
+            limit: Maximum number of periods
+
+        Returns:
+            Rows ordered by period end, newest first
+        """
+        query = select(StockFundamentals).where(StockFundamentals.ticker == ticker)
+        if report_type:
+            query = query.where(StockFundamentals.report_type == report_type)
+        query = query.order_by(StockFundamentals.period_end.desc()).limit(limit)
+
+        async with self._db_lock:
+            return list((await self.db.execute(query)).scalars().all())
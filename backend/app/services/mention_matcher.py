@@ -0,0 +1,120 @@
+"""
+Multi-pattern substring matching with an Aho-Corasick automaton.
+
+The automaton is compiled once from a set of patterns and then reports every
+pattern occurring in a text in a single pass over its characters, regardless
+of how many patterns there are. Used to find stock mentions in news articles.
+"""
+
+from collections import deque
+from typing import Dict, Generic, Iterable, List, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class AhoCorasick(Generic[T]):
+    """
+    Aho-Corasick automaton mapping patterns to payloads.
+
+    Matching follows ``pattern in text`` semantics: a pattern is found
+    wherever it occurs as a substring, including overlapping occurrences.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, T]] = ()):
+        """
+        Build the automaton.
+
+        Args:
+            patterns: (pattern, payload) pairs; a pattern may carry several
+                payloads and empty patterns are ignored
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        self._payloads: List[List[T]] = []
+        self._pattern_ids: Dict[str, int] = {}
+
+        for pattern, payload in patterns:
+            self._add(pattern, payload)
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self._pattern_ids)
+
+    def _add(self, pattern: str, payload: T) -> None:
+        if not pattern:
+            return
+
+        pattern_id = self._pattern_ids.get(pattern)
+        if pattern_id is None:
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+
+            pattern_id = len(self._payloads)
+            self._pattern_ids[pattern] = pattern_id
+            self._payloads.append([])
+            self._out[state] = (pattern_id,)
+
+        self._payloads[pattern_id].append(payload)
+
+    def _build(self) -> None:
+        """Compute failure links breadth-first and merge their outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+
+                self._fail[next_state] = fail
+                if self._out[fail]:
+                    self._out[next_state] = self._out[next_state] + self._out[fail]
+                queue.append(next_state)
+
+    def find_patterns(self, text: str) -> Set[int]:
+        """
+        Find the patterns occurring in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            IDs of the patterns found
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[int] = set()
+        state = 0
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+
+        return found
+
+    def find(self, text: str) -> List[T]:
+        """
+        Find the payloads of all patterns occurring in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Payloads of every distinct pattern found (each pattern once)
+        """
+        payloads: List[T] = []
+        for pattern_id in self.find_patterns(text):
+            payloads.extend(self._payloads[pattern_id])
+        return payloads
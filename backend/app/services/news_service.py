@@ -4,19 +4,25 @@ News collection and management service.
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-
-from sqlalchemy import and_, desc, or_, select
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from ..adapters.news_adapter import NewsDataAdapter
+from ..adapters.news_adapter import NewsDataAdapter, parse_published_at
 from ..adapters.registry import registry
 from ..core.config import settings
-from ..core.database import get_db
+from ..core.database import get_db, get_db_session
 from ..models.news import NewsArticle, StockNewsLink
 from ..models.stock import Stock
+from ..models.watchlist import UserWatchlist
 from .news_stock_mapping_service import news_stock_mapping_service
 
 logger = logging.getLogger(__name__)
@@ -37,6 +43,24 @@ class NewsCollectionService:
         self.collection_interval = 3600  # 1 hour in seconds
         self.max_articles_per_collection = 100
         self.article_retention_days = 30
+        self.store_batch_size = 500  # Rows per multi-row insert
+
+        # Stock-specific collection: the most urgent stocks of each cycle are
+        # drained from a priority queue by a fixed pool of workers
+        self.stock_collection_workers = 5
+        self.stocks_per_cycle = 200
+        self.max_staleness_seconds = 7 * 86400
+        self.max_lookback_hours = 24
+        self._last_collected: Dict[str, datetime] = {}
+
+        # News API requests are spaced out to its per-minute limit, and each
+        # cycle is sized to what is left of its hourly and daily quotas
+        self.requests_per_minute: Optional[int] = None
+        self.requests_per_hour: Optional[int] = None
+        self.requests_per_day: Optional[int] = None
+        self._request_lock = asyncio.Lock()
+        self._next_request_at = 0.0
+        self._request_times: Deque[float] = deque()
 
         # Initialize adapter
         self._initialize_adapter()
@@ -49,6 +73,11 @@ class NewsCollectionService:
             self.news_adapter = NewsDataAdapter(
                 name="primary_news_adapter", priority=1, config=config
             )
+            if self.news_adapter.news_api_key:
+                rate_limit = self.news_adapter.news_api_rate_limit
+                self.requests_per_minute = rate_limit["requests_per_minute"]
+                self.requests_per_hour = rate_limit["requests_per_hour"]
+                self.requests_per_day = rate_limit["requests_per_day"]
 
             # Register with global registry
             registry.register_adapter(self.news_adapter)
@@ -130,6 +159,10 @@ class NewsCollectionService:
             start_date = datetime.utcnow() - timedelta(hours=2)
             end_date = datetime.utcnow()
 
+            if not await self._wait_for_request_slot():
+                logger.warning("News API quota used up, skipping general news")
+                return 0
+
             articles = await self.news_adapter.get_news(
                 keywords=keywords,
                 limit=self.max_articles_per_collection // 2,
@@ -149,7 +182,13 @@ class NewsCollectionService:
 
     async def collect_stock_specific_news(self) -> int:
         """
-        Collect news for specific stocks.
+        Collect news for the most urgent active stocks.
+
+        Every active stock is prioritized by how long ago its news was
+        collected and how many users watch it; the top ``stocks_per_cycle``,
+        fewer if the News API quota left for the cycle does not cover them,
+        are drained from a priority queue by ``stock_collection_workers``
+        workers, so the whole universe is covered over successive cycles.
 
         Returns:
             Number of new articles collected
@@ -159,38 +198,39 @@ class NewsCollectionService:
             return 0
 
         try:
-            # Get active stocks (you might want to limit this to popular stocks)
-            async with get_db() as db:
-                result = await db.execute(
-                    select(Stock)
-                    .where(Stock.is_active == True)
-                    .limit(50)  # Limit to avoid too many API calls
-                )
-                stocks = result.scalars().all()
-
-            total_new_articles = 0
+            budget = self._cycle_request_budget()
+            limit = (
+                self.stocks_per_cycle
+                if budget is None
+                else min(self.stocks_per_cycle, budget)
+            )
+            if limit <= 0:
+                logger.info("News API quota used up, skipping stock-specific news")
+                return 0
 
-            # Process stocks in batches to avoid overwhelming the API
-            batch_size = 10
-            for i in range(0, len(stocks), batch_size):
-                batch = stocks[i : i + batch_size]
+            queue = await self._build_collection_queue(limit)
+            if queue.empty():
+                return 0
 
-                # Process batch concurrently
-                tasks = []
-                for stock in batch:
-                    task = self._collect_stock_news(stock)
-                    tasks.append(task)
+            total_new_articles = 0
 
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+            async def worker() -> None:
+                nonlocal total_new_articles
+                while True:
+                    try:
+                        _, _, stock = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
 
-                for result in results:
-                    if isinstance(result, int):
-                        total_new_articles += result
-                    elif isinstance(result, Exception):
-                        logger.error(f"Error collecting stock news: {result}")
+                    if not await self._wait_for_request_slot():
+                        return
+                    try:
+                        total_new_articles += await self._collect_stock_news(stock)
+                    except Exception as e:
+                        logger.error(f"Error collecting stock news: {e}")
 
-                # Small delay between batches
-                await asyncio.sleep(1)
+            workers = min(self.stock_collection_workers, queue.qsize())
+            await asyncio.gather(*(worker() for _ in range(workers)))
 
             logger.info(f"Collected {total_new_articles} new stock-specific articles")
             return total_new_articles
@@ -199,16 +239,161 @@ class NewsCollectionService:
             logger.error(f"Error collecting stock-specific news: {e}")
             return 0
 
+    async def _build_collection_queue(
+        self, limit: Optional[int] = None
+    ) -> asyncio.PriorityQueue:
+        """
+        Build the priority queue of stocks to collect this cycle.
+
+        Stocks not collected by this process yet are dated by their most
+        recently stored linked article, so a restart does not make every
+        stock maximally stale.
+
+        Args:
+            limit: Maximum stocks queued (default: ``stocks_per_cycle``)
+
+        Returns:
+            Queue of (-priority, ticker, stock) entries, most urgent first
+        """
+        watchers = func.count(UserWatchlist.user_id)
+        last_linked = (
+            select(
+                StockNewsLink.ticker,
+                func.max(NewsArticle.created_at).label("linked_at"),
+            )
+            .join(NewsArticle, NewsArticle.id == StockNewsLink.article_id)
+            .group_by(StockNewsLink.ticker)
+            .subquery()
+        )
+        async with get_db_session() as db:
+            result = await db.execute(
+                select(Stock, watchers, func.max(last_linked.c.linked_at))
+                .outerjoin(UserWatchlist, UserWatchlist.ticker == Stock.ticker)
+                .outerjoin(last_linked, last_linked.c.ticker == Stock.ticker)
+                .where(Stock.is_active == True)
+                .group_by(Stock.ticker)
+            )
+            rows = result.all()
+
+        now = datetime.utcnow()
+        prioritized = sorted(
+            (
+                (
+                    self._collection_priority(
+                        stock.ticker, watcher_count, now, linked_at
+                    ),
+                    stock,
+                )
+                for stock, watcher_count, linked_at in rows
+            ),
+            key=lambda entry: (-entry[0], entry[1].ticker),
+        )
+
+        limit = self.stocks_per_cycle if limit is None else limit
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        for priority, stock in prioritized[:limit]:
+            queue.put_nowait((-priority, stock.ticker, stock))
+        return queue
+
+    def _collection_priority(
+        self,
+        ticker: str,
+        watchers: int,
+        now: datetime,
+        linked_at: Optional[datetime] = None,
+    ) -> float:
+        """
+        Priority of collecting a stock's news: staleness weighted by popularity.
+
+        Args:
+            ticker: Stock ticker
+            watchers: Number of users watching the stock
+            now: Current time (naive UTC)
+            linked_at: When the stock's latest linked article was stored
+
+        Returns:
+            Priority (higher is more urgent)
+        """
+        last_collected = self._last_collected.get(ticker)
+        if linked_at is not None:
+            if linked_at.tzinfo is not None:
+                linked_at = linked_at.astimezone(timezone.utc).replace(tzinfo=None)
+            last_collected = max(last_collected or linked_at, linked_at)
+        staleness = (
+            (now - last_collected).total_seconds()
+            if last_collected
+            else self.max_staleness_seconds
+        )
+        return min(staleness, self.max_staleness_seconds) * (1 + (watchers or 0))
+
+    def _remaining_quota(self, now: float) -> int:
+        """Requests left in the News API hourly and daily quotas."""
+        while self._request_times and self._request_times[0] <= now - 86400:
+            self._request_times.popleft()
+        hour_used = sum(1 for t in self._request_times if t > now - 3600)
+        return min(
+            self.requests_per_hour - hour_used,
+            self.requests_per_day - len(self._request_times),
+        )
+
+    def _cycle_request_budget(self) -> Optional[int]:
+        """
+        Number of News API requests the current cycle may still make.
+
+        The daily quota is spread evenly over the day's collection cycles, so
+        early cycles cannot use up the requests of later ones.
+
+        Returns:
+            Requests left for the cycle, or None if the API is not rate limited
+        """
+        if not self.requests_per_minute:
+            return None
+
+        now = time.monotonic()
+        cycles_per_day = max(1, 86400 // self.collection_interval)
+        per_cycle = -(-self.requests_per_day // cycles_per_day)
+        used = sum(1 for t in self._request_times if t > now - self.collection_interval)
+        return max(0, min(self._remaining_quota(now), per_cycle - used))
+
+    async def _wait_for_request_slot(self) -> bool:
+        """
+        Wait until another adapter request fits the News API rate limits.
+
+        Returns:
+            False without waiting if the hourly or daily quota is used up
+        """
+        if not self.requests_per_minute:
+            return True
+
+        interval = 60.0 / self.requests_per_minute
+        async with self._request_lock:
+            now = time.monotonic()
+            if self._remaining_quota(now) <= 0:
+                return False
+            start = max(now, self._next_request_at)
+            self._next_request_at = start + interval
+            self._request_times.append(start)
+
+        if start > now:
+            await asyncio.sleep(start - now)
+        return True
+
     async def _collect_stock_news(self, stock: Stock) -> int:
-        """Collect news for a specific stock."""
+        """Collect news for a specific stock since its last collection."""
         try:
             # Use both ticker and company name for search
             keywords = [stock.company_name_jp]
             if stock.company_name_en:
                 keywords.append(stock.company_name_en)
 
-            start_date = datetime.utcnow() - timedelta(hours=2)
             end_date = datetime.utcnow()
+            start_date = end_date - timedelta(hours=2)
+            last_collected = self._last_collected.get(stock.ticker)
+            if last_collected:
+                start_date = max(
+                    min(last_collected, start_date),
+                    end_date - timedelta(hours=self.max_lookback_hours),
+                )
 
             articles = await self.news_adapter.get_news(
                 symbol=stock.ticker,
@@ -220,6 +405,7 @@ class NewsCollectionService:
 
             # Store articles and create stock-news links
             new_articles_count = await self._store_articles(articles, stock.ticker)
+            self._last_collected[stock.ticker] = end_date
 
             return new_articles_count
 
@@ -233,6 +419,10 @@ class NewsCollectionService:
         """
         Store articles in database with deduplication.
 
+        New articles are inserted with ``ON CONFLICT (article_url) DO NOTHING``
+        and their stock links are computed in memory and written with one
+        multi-row upsert, all in a single transaction.
+
         Args:
             articles: List of article dictionaries
             ticker: Optional ticker to create stock-news link
@@ -243,95 +433,118 @@ class NewsCollectionService:
         if not articles:
             return 0
 
-        new_articles_count = 0
+        # Articles repeated within the batch would conflict with each other
+        rows = []
+        row_articles = []
+        seen_urls = set()
+        for article_data in articles:
+            article_url = article_data.get("article_url")
+            if article_url:
+                if article_url in seen_urls:
+                    continue
+                seen_urls.add(article_url)
+
+            published_at = article_data.get(
+                "published_at", datetime.utcnow().isoformat()
+            )
+            rows.append(
+                {
+                    "id": uuid4(),
+                    "article_url": article_url,
+                    "headline": article_data.get("headline", ""),
+                    "content_summary": article_data.get("content_summary"),
+                    "source": article_data.get("source"),
+                    "author": article_data.get("author"),
+                    "published_at": published_at,
+                    "published_ts": parse_published_at(published_at)
+                    or datetime.now(timezone.utc),
+                    "language": article_data.get("language", "ja"),
+                }
+            )
+            row_articles.append(article_data)
 
+        # Stock matching needs no database access, so do it before the transaction
         try:
-            async with get_db() as db:
-                for article_data in articles:
-                    # Check if article already exists
-                    article_url = article_data.get("article_url")
-                    if article_url:
-                        existing = await db.execute(
-                            select(NewsArticle).where(
-                                NewsArticle.article_url == article_url
-                            )
-                        )
-                        if existing.scalar_one_or_none():
-                            continue  # Skip duplicate
-
-                    # Create new article
-                    article = NewsArticle(
-                        article_url=article_data.get("article_url"),
-                        headline=article_data.get("headline", ""),
-                        content_summary=article_data.get("content_summary"),
-                        source=article_data.get("source"),
-                        author=article_data.get("author"),
-                        published_at=article_data.get(
-                            "published_at", datetime.utcnow().isoformat()
-                        ),
-                        language=article_data.get("language", "ja"),
-                    )
+            article_matches = await news_stock_mapping_service.match_articles(
+                [f"{row['headline']} {row['content_summary'] or ''}" for row in rows]
+            )
+        except Exception as e:
+            logger.error(f"Error matching articles to stocks: {e}")
+            article_matches = [[] for _ in rows]
 
-                    db.add(article)
-                    await db.flush()  # Get the article ID
+        new_articles_count = 0
 
-                    # Create stock-news links using mapping service
-                    article_text = f"{article.headline} {article.content_summary or ''}"
+        try:
+            async with get_db_session() as db:
+                try:
+                    conn = await db.connection()
+                    insert = (
+                        sqlite_insert if conn.dialect.name == "sqlite" else pg_insert
+                    )
 
-                    # Use mapping service for automatic stock-news linking
-                    try:
-                        await news_stock_mapping_service.create_stock_news_links(
-                            str(article.id), article_text
+                    inserted_ids = set()
+                    for i in range(0, len(rows), self.store_batch_size):
+                        stmt = (
+                            insert(NewsArticle)
+                            .values(rows[i : i + self.store_batch_size])
+                            .on_conflict_do_nothing(index_elements=["article_url"])
+                            .returning(NewsArticle.id)
                         )
-                    except Exception as e:
-                        logger.error(
-                            f"Error creating stock-news links for article {article.id}: {e}"
+                        result = await db.execute(stmt)
+                        inserted_ids.update(result.scalars().all())
+
+                    # Targeted articles are linked to the ticker with high relevance
+                    target_exists = False
+                    if ticker and inserted_ids:
+                        result = await db.execute(
+                            select(Stock.ticker).where(Stock.ticker == ticker)
                         )
+                        target_exists = result.scalar_one_or_none() is not None
+
+                    links: Dict[Tuple[Any, str], float] = {}
+                    for row, matches, article_data in zip(
+                        rows, article_matches, row_articles
+                    ):
+                        if row["id"] not in inserted_ids:
+                            continue
+                        for match_ticker, relevance_score in matches:
+                            links[(row["id"], match_ticker)] = relevance_score
+                        if target_exists:
+                            key = (row["id"], ticker)
+                            links[key] = max(
+                                links.get(key, 0.0),
+                                article_data.get("relevance_score", 0.8),
+                            )
 
-                    # If specific ticker provided, ensure it's linked with high relevance
-                    if ticker:
-                        # Check if stock exists
-                        stock_result = await db.execute(
-                            select(Stock).where(Stock.ticker == ticker)
+                    # Only articles inserted here are linked and none of them
+                    # is analyzed yet, so the sentiment rollups are unaffected
+                    link_rows = [
+                        {
+                            "article_id": article_id,
+                            "ticker": link_ticker,
+                            "relevance_score": relevance_score,
+                        }
+                        for (article_id, link_ticker), relevance_score in links.items()
+                    ]
+                    for i in range(0, len(link_rows), self.store_batch_size):
+                        stmt = insert(StockNewsLink).values(
+                            link_rows[i : i + self.store_batch_size]
                         )
-                        stock = stock_result.scalar_one_or_none()
-
-                        if stock:
-                            # Check if link already exists
-                            existing_link_result = await db.execute(
-                                select(StockNewsLink).where(
-                                    and_(
-                                        StockNewsLink.article_id == article.id,
-                                        StockNewsLink.ticker == ticker,
-                                    )
-                                )
-                            )
-                            existing_link = existing_link_result.scalar_one_or_none()
-
-                            if existing_link:
-                                # Update relevance score to ensure high relevance for targeted articles
-                                existing_link.relevance_score = max(
-                                    float(existing_link.relevance_score),
-                                    article_data.get("relevance_score", 0.8),
-                                )
-                            else:
-                                # Create new link with high relevance
-                                stock_link = StockNewsLink(
-                                    article_id=article.id,
-                                    ticker=ticker,
-                                    relevance_score=article_data.get(
-                                        "relevance_score", 0.8
-                                    ),
-                                )
-                                db.add(stock_link)
-
-                    new_articles_count += 1
+                        stmt = stmt.on_conflict_do_update(
+                            index_elements=["article_id", "ticker"],
+                            set_={"relevance_score": stmt.excluded.relevance_score},
+                        )
+                        await db.execute(stmt)
 
-                await db.commit()
+                    await db.commit()
+                    new_articles_count = len(inserted_ids)
+
+                except Exception:
+                    await db.rollback()
+                    raise
 
         except Exception as e:
             logger.error(f"Error storing articles: {e}")
-            await db.rollback()
 
         return new_articles_count
 
@@ -575,6 +788,8 @@ class NewsCollectionService:
             "recent_articles_24h": recent_articles,
             "max_articles_per_collection": self.max_articles_per_collection,
             "article_retention_days": self.article_retention_days,
+            "stocks_per_cycle": self.stocks_per_cycle,
+            "stocks_collected": len(self._last_collected),
             "mapping_statistics": mapping_stats,
         }
 
@@ -8,15 +8,17 @@ ticker symbols and company names, with relevance scoring.
 import logging
 import re
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from sqlalchemy import and_, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from ..core.database import get_db
+from ..core.database import get_db, get_db_session
 from ..models.news import NewsArticle, StockNewsLink
 from ..models.stock import Stock
+from .mention_matcher import AhoCorasick
+from .sentiment_rollup import set_article_stock_links
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +43,11 @@ class NewsStockMappingService:
         self._cache_last_updated: Optional[datetime] = None
         self._cache_ttl_seconds = 3600  # 1 hour
 
+        # Mention automaton compiled from the stock cache it was built for
+        self._matcher: Optional[AhoCorasick[Tuple[str, str]]] = None
+        self._matcher_stocks: Optional[Dict[str, Stock]] = None
+        self._ticker_order: Dict[str, int] = {}
+
         # Japanese text processing patterns
         self._japanese_company_suffixes = [
             "株式会社",
@@ -88,6 +95,7 @@ class NewsStockMappingService:
 
                 self._stock_cache = {stock.ticker: stock for stock in stocks}
                 self._cache_last_updated = datetime.utcnow()
+                self._build_matcher()
 
                 logger.info(
                     f"Refreshed stock cache with {len(self._stock_cache)} active stocks"
@@ -122,7 +130,7 @@ class NewsStockMappingService:
         await self._ensure_stock_cache()
 
         try:
-            async with get_db() as db:
+            async with get_db_session() as db:
                 # Check if links already exist
                 if not force_refresh:
                     existing_links = await db.execute(
@@ -135,31 +143,29 @@ class NewsStockMappingService:
                         return []
 
                 # Find potential stock matches
-                stock_matches = self._find_stock_matches(article_text)
-
-                created_links = []
-                for ticker, relevance_score in stock_matches:
-                    if relevance_score >= self.min_relevance_threshold:
-                        # Create stock-news link
-                        link = StockNewsLink(
-                            article_id=article_id,
-                            ticker=ticker,
-                            relevance_score=relevance_score,
-                        )
-
-                        db.add(link)
-                        created_links.append(
-                            {
-                                "ticker": ticker,
-                                "relevance_score": relevance_score,
-                                "company_name": self._stock_cache[
-                                    ticker
-                                ].company_name_jp,
-                            }
-                        )
+                scores = {
+                    ticker: relevance_score
+                    for ticker, relevance_score in self._find_stock_matches(
+                        article_text
+                    )
+                    if relevance_score >= self.min_relevance_threshold
+                }
 
+                # Moves already analyzed sentiment into the linked stocks' rollups
+                await set_article_stock_links(
+                    db, article_id, scores, replace=force_refresh
+                )
                 await db.commit()
 
+                created_links = [
+                    {
+                        "ticker": ticker,
+                        "relevance_score": relevance_score,
+                        "company_name": self._stock_cache[ticker].company_name_jp,
+                    }
+                    for ticker, relevance_score in scores.items()
+                ]
+
                 logger.info(
                     f"Created {len(created_links)} stock links for article {article_id}"
                 )
@@ -171,29 +177,132 @@ class NewsStockMappingService:
             )
             return []
 
+    async def match_articles(
+        self, article_texts: Sequence[str]
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Find linkable stocks for many articles without touching the database.
+
+        Args:
+            article_texts: Combined headline and content of each article
+
+        Returns:
+            For each article, (ticker, relevance_score) tuples at or above
+            the minimum relevance threshold
+        """
+        await self._ensure_stock_cache()
+
+        return [
+            [
+                (ticker, score)
+                for ticker, score in self._find_stock_matches(text)
+                if score >= self.min_relevance_threshold
+            ]
+            for text in article_texts
+        ]
+
+    def _build_matcher(self) -> None:
+        """
+        Compile the mention automaton from the stock cache.
+
+        Patterns cover tickers and their exchange formats, Japanese and
+        English company name variations, financial keywords and sector
+        keywords, each tagged with what a hit means for scoring.
+        """
+        patterns: List[Tuple[str, Tuple[str, str]]] = []
+
+        for ticker, stock in self._stock_cache.items():
+            ticker_lower = ticker.lower()
+            patterns.append((ticker_lower, ("ticker", ticker)))
+            for pattern in (
+                f"{ticker_lower}.t",
+                f"({ticker_lower})",
+                f"[{ticker_lower}]",
+                f"#{ticker_lower}",
+            ):
+                patterns.append((pattern, ("ticker_context", ticker)))
+
+            if stock.company_name_jp:
+                for variation in self._generate_company_name_variations(
+                    stock.company_name_jp
+                ):
+                    patterns.append((variation.lower(), ("name_jp", ticker)))
+
+            if stock.company_name_en:
+                for variation in self._generate_company_name_variations(
+                    stock.company_name_en
+                ):
+                    patterns.append((variation.lower(), ("name_en", ticker)))
+
+        for keyword in self._financial_keywords:
+            patterns.append((keyword.lower(), ("keyword", keyword)))
+
+        sectors = {stock.sector_jp for stock in self._stock_cache.values()}
+        for sector in sectors:
+            if sector:
+                for keyword in self._get_sector_keywords(sector):
+                    patterns.append((keyword.lower(), ("sector", sector)))
+
+        self._matcher = AhoCorasick(patterns)
+        self._matcher_stocks = self._stock_cache
+        self._ticker_order = {ticker: i for i, ticker in enumerate(self._stock_cache)}
+
+        logger.debug(
+            f"Built mention automaton with {len(self._matcher)} patterns "
+            f"for {len(self._stock_cache)} stocks"
+        )
+
     def _find_stock_matches(self, article_text: str) -> List[Tuple[str, float]]:
         """
         Find stock matches in article text with relevance scores.
 
+        All mentions are found in one pass of the mention automaton; scores
+        follow the same rules as ``_calculate_relevance_score``.
+
         Args:
             article_text: Text to analyze for stock mentions
 
         Returns:
             List of (ticker, relevance_score) tuples
         """
-        article_text_lower = article_text.lower()
+        if self._matcher is None or self._matcher_stocks is not self._stock_cache:
+            self._build_matcher()
+
+        mentions: Dict[str, Set[str]] = {}
+        keyword_count = 0
+        sectors_found: Set[str] = set()
+
+        for kind, key in self._matcher.find(article_text.lower()):
+            if kind == "keyword":
+                keyword_count += 1
+            elif kind == "sector":
+                sectors_found.add(key)
+            else:
+                mentions.setdefault(key, set()).add(kind)
+
         matches = []
+        for ticker, kinds in mentions.items():
+            score = 0.0
+            if "ticker" in kinds:
+                score += 0.4
+                if "ticker_context" in kinds:
+                    score += 0.1
+            if "name_jp" in kinds:
+                score += 0.3
+            if "name_en" in kinds:
+                score += 0.25
 
-        for ticker, stock in self._stock_cache.items():
-            relevance_score = self._calculate_relevance_score(
-                article_text_lower, ticker, stock
-            )
+            if score > 0:
+                score += min(keyword_count * 0.05, 0.2)
+
+                sector = self._stock_cache[ticker].sector_jp
+                if sector and sector in sectors_found:
+                    score += 0.1
 
-            if relevance_score > 0:
-                matches.append((ticker, relevance_score))
+                matches.append((ticker, min(score, 1.0)))
 
-        # Sort by relevance score descending
-        matches.sort(key=lambda x: x[1], reverse=True)
+        # Sort by relevance score descending, ties in stock cache order
+        matches.sort(key=lambda x: (-x[1], self._ticker_order[x[0]]))
 
         return matches
 
@@ -0,0 +1,428 @@
+"""
+Incremental historical price backfill service.
+
+Computes, per ticker, which TSE trading days are missing from
+``stock_price_history`` and fetches only those spans through the data source
+adapters, with bounded concurrency and rate-limit aware retries. Fetched bars
+are written through ``PriceIngestService``.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from datetime import time as dt_time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..adapters.base import RateLimitExceededError
+from ..models.stock import Stock, StockPriceHistory
+from .data_source_service import DataSourceService
+from .price_ingest_service import PriceBar, PriceIngestService, normalize_price_frame
+from .trading_calendar import last_completed_session, missing_trading_ranges
+
+logger = logging.getLogger(__name__)
+
+DateRange = Tuple[date, date]
+
+
+@dataclass
+class BackfillResult:
+    """Summary of a backfill run."""
+
+    tickers_processed: int = 0
+    tickers_skipped: int = 0
+    ranges_fetched: int = 0
+    rows_inserted: int = 0
+    failed_tickers: Dict[str, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+class BackfillCheckpoint:
+    """
+    JSON checkpoint for resumable backfills.
+
+    Records which tickers finished for a given job (date range) and which
+    trading-day ranges the provider returned no data for (suspensions,
+    pre-listing periods, calendar quirks), so those are not fetched again
+    until they expire after ``empty_range_ttl``.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        empty_range_ttl: timedelta = timedelta(days=30),
+    ):
+        self.path = Path(path) if path else None
+        self.empty_range_ttl = empty_range_ttl
+        self._jobs: Dict[str, List[str]] = {}
+        self._empty_ranges: Dict[str, List[List[str]]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Load checkpoint state from disk if present."""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+            self._jobs = data.get("jobs", {})
+            self._empty_ranges = data.get("empty_ranges", {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable backfill checkpoint {self.path}: {e}")
+
+    def save(self) -> None:
+        """Write checkpoint state atomically, dropping expired empty ranges."""
+        if not self.path:
+            return
+        now = datetime.utcnow()
+        for ticker in list(self._empty_ranges):
+            ranges = [
+                empty_range
+                for empty_range in self._empty_ranges[ticker]
+                if not self._is_expired(empty_range, now)
+            ]
+            if ranges:
+                self._empty_ranges[ticker] = ranges
+            else:
+                del self._empty_ranges[ticker]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"jobs": self._jobs, "empty_ranges": self._empty_ranges})
+        )
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def job_key(start: date, end: date) -> str:
+        """Key identifying a backfill job by its date range."""
+        return f"{start.isoformat()}:{end.isoformat()}"
+
+    def is_completed(self, job_key: str, ticker: str) -> bool:
+        """Whether a ticker already finished for a job."""
+        return ticker in self._jobs.get(job_key, ())
+
+    def mark_completed(self, job_key: str, ticker: str) -> None:
+        """Record that a ticker finished for a job."""
+        completed = self._jobs.setdefault(job_key, [])
+        if ticker not in completed:
+            completed.append(ticker)
+
+    def add_empty_range(
+        self, ticker: str, span: DateRange, recorded_at: Optional[datetime] = None
+    ) -> None:
+        """Record a range for which the provider had no data."""
+        recorded_at = recorded_at or datetime.utcnow()
+        self._empty_ranges.setdefault(ticker, []).append(
+            [span[0].isoformat(), span[1].isoformat(), recorded_at.isoformat()]
+        )
+
+    def _is_expired(self, empty_range: List[str], now: datetime) -> bool:
+        """Whether an empty range is due to be fetched again."""
+        # Ranges recorded without a timestamp predate expiry
+        if len(empty_range) < 3:
+            return True
+        recorded_at = datetime.fromisoformat(empty_range[2])
+        return now - recorded_at >= self.empty_range_ttl
+
+    def empty_dates(self, ticker: str, now: Optional[datetime] = None) -> Set[date]:
+        """All dates covered by unexpired empty ranges for a ticker."""
+        now = now or datetime.utcnow()
+        dates: Set[date] = set()
+        for empty_range in self._empty_ranges.get(ticker, []):
+            if self._is_expired(empty_range, now):
+                continue
+            day = date.fromisoformat(empty_range[0])
+            end = date.fromisoformat(empty_range[1])
+            while day <= end:
+                dates.add(day)
+                day += timedelta(days=1)
+        return dates
+
+
+class PriceBackfillService:
+    """
+    Service for filling gaps in historical daily prices.
+
+    Only trading days missing from the database (and not recently found to be
+    empty) are fetched. Spans are fetched through ``DataSourceService`` so
+    adapter failover and request coalescing apply.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        data_source_service: Optional[DataSourceService] = None,
+        max_concurrency: int = 4,
+        merge_gap_days: int = 5,
+        max_span_days: int = 730,
+        max_rate_limit_retries: int = 5,
+        checkpoint_path: Optional[str] = None,
+        empty_range_ttl_days: int = 30,
+        empty_range_min_age_days: int = 7,
+        checkpoint_every: int = 50,
+        checkpoint_interval_seconds: float = 30.0,
+    ):
+        """
+        Initialize the backfill service.
+
+        Args:
+            db: Async database session
+            data_source_service: Service used to fetch prices
+            max_concurrency: Maximum tickers fetched concurrently
+            merge_gap_days: Present trading days bridged when merging gaps
+            max_span_days: Longest calendar span fetched in one request
+            max_rate_limit_retries: Retries after rate-limit errors per span
+            checkpoint_path: JSON checkpoint file for resumable runs
+            empty_range_ttl_days: Days before a span without data is fetched
+                again
+            empty_range_min_age_days: Days after which a day without data is
+                remembered as empty; more recent days may not be published yet
+            checkpoint_every: Completed tickers after which the checkpoint is
+                written
+            checkpoint_interval_seconds: Seconds after which the checkpoint is
+                written even if fewer tickers completed
+        """
+        self.db = db
+        self.data_source_service = data_source_service or DataSourceService()
+        self.max_concurrency = max_concurrency
+        self.merge_gap_days = merge_gap_days
+        self.max_span_days = max_span_days
+        self.ingest_service = PriceIngestService(db)
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.empty_range_min_age_days = empty_range_min_age_days
+        self.checkpoint = BackfillCheckpoint(
+            checkpoint_path, empty_range_ttl=timedelta(days=empty_range_ttl_days)
+        )
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval_seconds = checkpoint_interval_seconds
+
+        # AsyncSession is not safe for concurrent use
+        self._db_lock = asyncio.Lock()
+
+    async def find_gaps(self, ticker: str, start: date, end: date) -> List[DateRange]:
+        """
+        Find missing trading-day ranges for a ticker.
+
+        Args:
+            ticker: Stock ticker
+            start: First date of the backfill window
+            end: Last date of the backfill window
+
+        Returns:
+            Missing ranges, split so none exceeds ``max_span_days``
+        """
+        async with self._db_lock:
+            result = await self.db.execute(
+                select(StockPriceHistory.date).where(
+                    StockPriceHistory.ticker == ticker,
+                    StockPriceHistory.date >= start,
+                    StockPriceHistory.date <= end,
+                )
+            )
+            existing = set(result.scalars().all())
+
+        existing |= self.checkpoint.empty_dates(ticker)
+        gaps = missing_trading_ranges(start, end, existing, self.merge_gap_days)
+
+        spans: List[DateRange] = []
+        for gap_start, gap_end in gaps:
+            while gap_start <= gap_end:
+                span_end = min(
+                    gap_end, gap_start + timedelta(days=self.max_span_days - 1)
+                )
+                spans.append((gap_start, span_end))
+                gap_start = span_end + timedelta(days=1)
+
+        return spans
+
+    async def _fetch_span(self, ticker: str, span: DateRange) -> pd.DataFrame:
+        """Fetch one span, waiting out rate limits."""
+        start_dt = datetime.combine(span[0], dt_time.min)
+        end_dt = datetime.combine(span[1], dt_time.max)
+
+        for attempt in range(self.max_rate_limit_retries + 1):
+            try:
+                return await self.data_source_service.get_historical_price_frame(
+                    ticker, start_dt, end_dt, "1d"
+                )
+            except RateLimitExceededError as e:
+                if attempt >= self.max_rate_limit_retries:
+                    raise
+                if e.retry_after:
+                    delay = (e.retry_after - datetime.utcnow()).total_seconds()
+                else:
+                    delay = 5 * 2**attempt
+                delay = min(max(delay, 1.0), 3600.0)
+                logger.info(
+                    f"Rate limited fetching {ticker} {span[0]}..{span[1]}, "
+                    f"retrying in {delay:.0f}s"
+                )
+                await asyncio.sleep(delay)
+
+        return pd.DataFrame()
+
+    def _record_empty_range(self, ticker: str, span: DateRange) -> None:
+        """Remember a span without data, leaving out recent days."""
+        cutoff = datetime.utcnow().date() - timedelta(
+            days=self.empty_range_min_age_days
+        )
+        if span[0] > cutoff:
+            return
+        self.checkpoint.add_empty_range(ticker, (span[0], min(span[1], cutoff)))
+
+    async def _ingest(self, bars: List[PriceBar]) -> int:
+        """Bulk upsert bars, serialized on the shared session."""
+        async with self._db_lock:
+            ingest_result = await self.ingest_service.ingest(bars)
+        return ingest_result.rows_written
+
+    async def backfill_ticker(
+        self,
+        ticker: str,
+        start: date,
+        end: date,
+        result: Optional[BackfillResult] = None,
+    ) -> int:
+        """
+        Backfill missing prices for one ticker.
+
+        Args:
+            ticker: Stock ticker
+            start: First date of the backfill window
+            end: Last date of the backfill window
+            result: Optional run summary to update
+
+        Returns:
+            Number of rows inserted
+        """
+        result = result if result is not None else BackfillResult()
+        inserted = 0
+
+        for span in await self.find_gaps(ticker, start, end):
+            frame = await self._fetch_span(ticker, span)
+            result.ranges_fetched += 1
+
+            bars = normalize_price_frame(ticker, frame)
+            if not bars:
+                self._record_empty_range(ticker, span)
+                continue
+
+            inserted += await self._ingest(bars)
+
+        result.rows_inserted += inserted
+        return inserted
+
+    async def _get_universe(
+        self, tickers: Optional[List[str]]
+    ) -> Dict[str, Optional[date]]:
+        """Get tickers to backfill with their listing dates."""
+        query = select(Stock.ticker, Stock.listing_date).where(Stock.is_active == True)
+        if tickers:
+            query = query.where(Stock.ticker.in_(tickers))
+
+        async with self._db_lock:
+            rows = (await self.db.execute(query)).all()
+
+        return {row.ticker: row.listing_date for row in rows}
+
+    async def backfill(
+        self,
+        tickers: Optional[List[str]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        years: int = 10,
+    ) -> BackfillResult:
+        """
+        Backfill missing daily prices for many tickers.
+
+        Args:
+            tickers: Tickers to backfill (default: all active stocks)
+            start: First date (default: ``years`` before ``end``)
+            end: Last date (default and upper bound: the last completed
+                trading session)
+            years: Window length used when ``start`` is not given
+
+        Returns:
+            BackfillResult summary
+        """
+        started = time.perf_counter()
+        # Sessions still trading have no final bar yet
+        latest = last_completed_session()
+        end = min(end, latest) if end else latest
+        # relativedelta moves Feb 29 to Feb 28 in non-leap years
+        start = start or end - relativedelta(years=years)
+        job_key = self.checkpoint.job_key(start, end)
+        result = BackfillResult()
+
+        universe = await self._get_universe(tickers)
+        for ticker in set(tickers or ()) - set(universe):
+            result.failed_tickers[ticker] = "Unknown or inactive ticker"
+
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        # Each save rewrites the whole file, so batch them
+        unsaved = 0
+        last_saved = time.monotonic()
+
+        def save_checkpoint(force: bool = False) -> None:
+            nonlocal unsaved, last_saved
+            if not force and (
+                unsaved < self.checkpoint_every
+                and time.monotonic() - last_saved < self.checkpoint_interval_seconds
+            ):
+                return
+            self.checkpoint.save()
+            unsaved = 0
+            last_saved = time.monotonic()
+
+        async def process(ticker: str, listing_date: Optional[date]) -> None:
+            nonlocal unsaved
+            if self.checkpoint.is_completed(job_key, ticker):
+                result.tickers_skipped += 1
+                return
+
+            ticker_start = max(start, listing_date) if listing_date else start
+            async with semaphore:
+                try:
+                    await self.backfill_ticker(ticker, ticker_start, end, result)
+                except Exception as e:
+                    async with self._db_lock:
+                        await self.db.rollback()
+                    logger.warning(f"Backfill failed for {ticker}: {e}")
+                    result.failed_tickers[ticker] = str(e)
+                    return
+
+            result.tickers_processed += 1
+            self.checkpoint.mark_completed(job_key, ticker)
+            unsaved += 1
+            save_checkpoint()
+
+        try:
+            await asyncio.gather(
+                *(
+                    process(ticker, listing)
+                    for ticker, listing in sorted(universe.items())
+                )
+            )
+        finally:
+            save_checkpoint(force=True)
+
+        result.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            f"Backfill {start}..{end}: {result.tickers_processed} tickers, "
+            f"{result.ranges_fetched} ranges, {result.rows_inserted} rows, "
+            f"{len(result.failed_tickers)} failures in {result.elapsed_seconds:.1f}s"
+        )
+        return result
@@ -0,0 +1,302 @@
+"""
+Bulk ingestion of daily price bars into ``stock_price_history``.
+
+On asyncpg connections bars are streamed into a temporary staging table with
+``COPY`` and merged with a single ``INSERT ... ON CONFLICT DO UPDATE``. Other
+dialects fall back to batched multi-row upserts.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.stock import StockPriceHistory
+
+logger = logging.getLogger(__name__)
+
+# Column order of ingested bars
+PRICE_COLUMNS: Tuple[str, ...] = (
+    "ticker",
+    "date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "adjusted_close",
+)
+
+PriceBar = Tuple[str, date, float, float, float, float, int, Optional[float]]
+
+_STAGING_TABLE = "stock_price_history_staging"
+
+_CREATE_STAGING_SQL = f"""
+CREATE TEMPORARY TABLE IF NOT EXISTS {_STAGING_TABLE} (
+    ticker VARCHAR(10) NOT NULL,
+    date DATE NOT NULL,
+    open DOUBLE PRECISION NOT NULL,
+    high DOUBLE PRECISION NOT NULL,
+    low DOUBLE PRECISION NOT NULL,
+    close DOUBLE PRECISION NOT NULL,
+    volume BIGINT NOT NULL,
+    adjusted_close DOUBLE PRECISION
+) ON COMMIT DROP
+"""
+
+# Later duplicates of a (ticker, date) win; unchanged rows are not rewritten
+_MERGE_SQL = f"""
+INSERT INTO stock_price_history ({", ".join(PRICE_COLUMNS)})
+SELECT DISTINCT ON (ticker, date) {", ".join(PRICE_COLUMNS)}
+FROM (
+    SELECT *, row_number() OVER () AS seq FROM {_STAGING_TABLE}
+) staged
+ORDER BY ticker, date, seq DESC
+ON CONFLICT (ticker, date) DO UPDATE SET
+    open = EXCLUDED.open,
+    high = EXCLUDED.high,
+    low = EXCLUDED.low,
+    close = EXCLUDED.close,
+    volume = EXCLUDED.volume,
+    adjusted_close = EXCLUDED.adjusted_close
+WHERE (
+    stock_price_history.open, stock_price_history.high, stock_price_history.low,
+    stock_price_history.close, stock_price_history.volume,
+    stock_price_history.adjusted_close
+) IS DISTINCT FROM (
+    EXCLUDED.open, EXCLUDED.high, EXCLUDED.low,
+    EXCLUDED.close, EXCLUDED.volume, EXCLUDED.adjusted_close
+)
+"""
+
+
+@dataclass
+class IngestResult:
+    """Outcome of a bulk ingest."""
+
+    rows_received: int = 0
+    rows_written: int = 0
+    elapsed_seconds: float = 0.0
+    method: str = "copy"
+
+    @property
+    def rows_per_second(self) -> float:
+        """Throughput over received rows."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.rows_received / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "rows_received": self.rows_received,
+            "rows_written": self.rows_written,
+            "elapsed_seconds": self.elapsed_seconds,
+            "rows_per_second": self.rows_per_second,
+            "method": self.method,
+        }
+
+
+def _to_date(value: Any) -> date:
+    """Convert an adapter date value to a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00")).date()
+
+
+def normalize_price_bars(
+    ticker: str, records: Iterable[Dict[str, Any]]
+) -> List[PriceBar]:
+    """
+    Convert adapter price records to bars ready for ingest.
+
+    Bars without a close price (suspended days) are dropped, missing
+    open/high/low fall back to the close, and duplicate dates keep the last
+    record.
+
+    Args:
+        ticker: Stock ticker
+        records: Price dictionaries as returned by ``get_historical_prices``
+
+    Returns:
+        List of tuples in ``PRICE_COLUMNS`` order, sorted by date
+    """
+    bars: Dict[date, PriceBar] = {}
+    for record in records:
+        close = record.get("close")
+        if not close:
+            continue
+        bar_date = _to_date(record["date"])
+        adjusted_close = record.get("adjusted_close")
+        bars[bar_date] = (
+            ticker,
+            bar_date,
+            float(record.get("open") or close),
+            float(record.get("high") or close),
+            float(record.get("low") or close),
+            float(close),
+            int(record.get("volume") or 0),
+            float(adjusted_close) if adjusted_close is not None else None,
+        )
+    return [bars[key] for key in sorted(bars)]
+
+
+def normalize_price_frame(ticker: str, frame: pd.DataFrame) -> List[PriceBar]:
+    """
+    Convert a price frame to bars ready for ingest without per-row dicts.
+
+    Args:
+        ticker: Stock ticker
+        frame: DataFrame with PRICE_FRAME_COLUMNS (see ``build_price_frame``)
+
+    Returns:
+        List of tuples in ``PRICE_COLUMNS`` order
+    """
+    if frame.empty:
+        return []
+
+    adjusted_closes = frame["adjusted_close"].astype(object)
+    adjusted_closes = adjusted_closes.where(frame["adjusted_close"].notna(), None)
+
+    return list(
+        zip(
+            repeat(ticker, len(frame)),
+            frame["date"].dt.date.tolist(),
+            frame["open"].tolist(),
+            frame["high"].tolist(),
+            frame["low"].tolist(),
+            frame["close"].tolist(),
+            frame["volume"].astype("int64").tolist(),
+            adjusted_closes.tolist(),
+        )
+    )
+
+
+class PriceIngestService:
+    """Service for bulk upserting daily price bars."""
+
+    def __init__(self, db: AsyncSession, batch_size: int = 1000):
+        """
+        Initialize the ingest service.
+
+        Args:
+            db: Async database session
+            batch_size: Rows per statement on the multi-row upsert fallback
+        """
+        self.db = db
+        self.batch_size = batch_size
+
+    async def ingest(
+        self, bars: Sequence[PriceBar], commit: bool = True
+    ) -> IngestResult:
+        """
+        Upsert price bars into ``stock_price_history``.
+
+        Args:
+            bars: Tuples in ``PRICE_COLUMNS`` order (see ``normalize_price_bars``)
+            commit: Commit the session after merging
+
+        Returns:
+            IngestResult with row counts and throughput
+        """
+        started = time.perf_counter()
+        result = IngestResult(rows_received=len(bars))
+        if not bars:
+            return result
+
+        conn = await self.db.connection()
+        if conn.dialect.driver == "asyncpg":
+            result.rows_written = await self._copy_and_merge(conn, bars)
+        else:
+            result.method = "upsert"
+            result.rows_written = await self._upsert(conn.dialect.name, bars)
+
+        if commit:
+            await self.db.commit()
+
+        result.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            f"Ingested {result.rows_received} price bars ({result.rows_written} written) "
+            f"via {result.method} at {result.rows_per_second:.0f} rows/s"
+        )
+        return result
+
+    async def ingest_records(
+        self, ticker: str, records: Iterable[Dict[str, Any]], commit: bool = True
+    ) -> IngestResult:
+        """
+        Normalize adapter records for one ticker and upsert them.
+
+        Args:
+            ticker: Stock ticker
+            records: Price dictionaries as returned by ``get_historical_prices``
+            commit: Commit the session after merging
+
+        Returns:
+            IngestResult with row counts and throughput
+        """
+        return await self.ingest(normalize_price_bars(ticker, records), commit=commit)
+
+    async def ingest_frame(
+        self, ticker: str, frame: pd.DataFrame, commit: bool = True
+    ) -> IngestResult:
+        """
+        Upsert a price frame for one ticker.
+
+        Args:
+            ticker: Stock ticker
+            frame: DataFrame with PRICE_FRAME_COLUMNS
+            commit: Commit the session after merging
+
+        Returns:
+            IngestResult with row counts and throughput
+        """
+        return await self.ingest(normalize_price_frame(ticker, frame), commit=commit)
+
+    async def _copy_and_merge(self, conn: Any, bars: Sequence[PriceBar]) -> int:
+        """Stream bars into the staging table with COPY and merge them."""
+        await conn.execute(text(_CREATE_STAGING_SQL))
+        await conn.execute(text(f"TRUNCATE {_STAGING_TABLE}"))
+
+        raw_connection = await conn.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            _STAGING_TABLE, records=bars, columns=PRICE_COLUMNS
+        )
+
+        merged = await conn.execute(text(_MERGE_SQL))
+        return max(merged.rowcount or 0, 0)
+
+    async def _upsert(self, dialect_name: str, bars: Sequence[PriceBar]) -> int:
+        """Upsert bars with multi-row INSERT ... ON CONFLICT statements."""
+        insert = sqlite_insert if dialect_name == "sqlite" else pg_insert
+
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement
+        unique: Dict[Tuple[str, date], PriceBar] = {}
+        for bar in bars:
+            unique[(bar[0], bar[1])] = bar
+        rows = [dict(zip(PRICE_COLUMNS, bar)) for bar in unique.values()]
+
+        written = 0
+        for i in range(0, len(rows), self.batch_size):
+            stmt = insert(StockPriceHistory).values(rows[i : i + self.batch_size])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["ticker", "date"],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in PRICE_COLUMNS
+                    if column not in ("ticker", "date")
+                },
+            )
+            result = await self.db.execute(stmt)
+            written += max(result.rowcount or 0, 0)
+        return written
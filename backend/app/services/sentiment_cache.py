@@ -0,0 +1,207 @@
+"""
+Two-tier cache for sentiment model results.
+
+A model's output for a given text never changes, so results are kept for a
+long time and shared between workers: an in-process LRU answers repeated
+texts without any I/O, and Redis, keyed by model version and text hash,
+survives restarts and is shared by every worker. Batch lookups fetch all
+in-process misses with a single MGET.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..core.cache import CacheKeyBuilder, CacheKeyType, CacheTTLPolicy, RedisCache
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize a text before it is analyzed or hashed."""
+    return text.strip()
+
+
+def hash_text(text: str) -> str:
+    """Hash a text for use in cache keys, after normalizing it."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class SentimentResultCache:
+    """
+    In-process LRU in front of Redis for sentiment results.
+
+    Values are JSON-serializable dicts. Redis errors never fail a lookup:
+    they count as misses and Redis is skipped for ``retry_interval`` seconds
+    so an outage does not add a connection timeout to every call.
+    """
+
+    def __init__(
+        self,
+        model_version: str,
+        max_entries: int = 50000,
+        ttl: Optional[int] = None,
+        redis_cache: Optional[RedisCache] = None,
+        retry_interval: float = 60.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            model_version: Identifies the model producing the results; part
+                of every Redis key so a model change never serves stale results
+            max_entries: Results kept in process
+            ttl: Seconds results live in Redis (default: the sentiment policy)
+            redis_cache: Redis cache client (None keeps results in process only)
+            retry_interval: Seconds Redis is skipped after an error
+        """
+        self.model_version = model_version
+        self.max_entries = max_entries
+        self.ttl = (
+            ttl if ttl is not None else CacheTTLPolicy.get_ttl(CacheKeyType.SENTIMENT)
+        )
+        self.redis_cache = redis_cache
+        self.retry_interval = retry_interval
+
+        self._local: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._redis_retry_at = 0.0
+
+        self._local_hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+        self._redis_errors = 0
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    def _redis_key(self, text_hash: str) -> str:
+        return CacheKeyBuilder.build_sentiment_key(self.model_version, text_hash)
+
+    def _redis_available(self) -> bool:
+        return self.redis_cache is not None and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, error: Exception) -> None:
+        self._redis_errors += 1
+        self._redis_retry_at = time.monotonic() + self.retry_interval
+        logger.warning(
+            f"Sentiment cache skipping Redis for {self.retry_interval}s: {error}"
+        )
+
+    def _get_local(self, text_hash: str) -> Optional[Dict[str, Any]]:
+        value = self._local.get(text_hash)
+        if value is not None:
+            self._local.move_to_end(text_hash)
+        return value
+
+    def _put_local(self, text_hash: str, value: Dict[str, Any]) -> None:
+        self._local[text_hash] = value
+        self._local.move_to_end(text_hash)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    async def get(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached result for a text.
+
+        Args:
+            text: Analyzed text
+
+        Returns:
+            Cached result or None
+        """
+        return (await self.get_many([text]))[0]
+
+    async def get_many(self, texts: Sequence[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get the cached results for several texts.
+
+        Args:
+            texts: Analyzed texts
+
+        Returns:
+            Cached result or None for each text, in order
+        """
+        hashes = [hash_text(text) for text in texts]
+        results: List[Optional[Dict[str, Any]]] = []
+        missing: Dict[str, List[int]] = {}
+
+        for index, text_hash in enumerate(hashes):
+            value = self._get_local(text_hash)
+            if value is not None:
+                self._local_hits += 1
+            else:
+                missing.setdefault(text_hash, []).append(index)
+            results.append(value)
+
+        if missing and self._redis_available():
+            missing_hashes = list(missing)
+            try:
+                values = await self.redis_cache.get_many(
+                    [self._redis_key(text_hash) for text_hash in missing_hashes]
+                )
+            except Exception as e:
+                self._redis_failed(e)
+                values = [None] * len(missing_hashes)
+
+            for text_hash, value in zip(missing_hashes, values):
+                if not isinstance(value, dict):
+                    continue
+                self._put_local(text_hash, value)
+                for index in missing.pop(text_hash):
+                    results[index] = value
+                    self._redis_hits += 1
+
+        self._misses += sum(len(indices) for indices in missing.values())
+        return results
+
+    async def set(self, text: str, value: Dict[str, Any]) -> None:
+        """
+        Cache the result for a text.
+
+        Args:
+            text: Analyzed text
+            value: JSON-serializable result
+        """
+        await self.set_many([(text, value)])
+
+    async def set_many(self, items: Sequence[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Cache the results for several texts.
+
+        Args:
+            items: (text, JSON-serializable result) pairs
+        """
+        redis_items = {}
+        for text, value in items:
+            text_hash = hash_text(text)
+            self._put_local(text_hash, value)
+            redis_items[self._redis_key(text_hash)] = value
+
+        if redis_items and self._redis_available():
+            try:
+                await self.redis_cache.set_many(redis_items, ttl=self.ttl)
+            except Exception as e:
+                self._redis_failed(e)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dictionary with size and hit counters per tier
+        """
+        lookups = self._local_hits + self._redis_hits + self._misses
+        return {
+            "model_version": self.model_version,
+            "local_entries": len(self._local),
+            "max_entries": self.max_entries,
+            "local_hits": self._local_hits,
+            "redis_hits": self._redis_hits,
+            "misses": self._misses,
+            "redis_errors": self._redis_errors,
+            "hit_rate": (
+                (self._local_hits + self._redis_hits) / lookups if lookups else None
+            ),
+        }
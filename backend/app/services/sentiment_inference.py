@@ -0,0 +1,470 @@
+"""
+Dedicated executor, micro-batching and token-budget packing for sentiment
+inference.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class SentimentInferenceError(Exception):
+    """Raised when sentiment inference cannot be served."""
+
+
+class InferenceQueueFullError(SentimentInferenceError):
+    """Raised when too many inference jobs are already waiting."""
+
+
+class InferenceTimeoutError(SentimentInferenceError):
+    """Raised when an inference job does not finish in time."""
+
+
+def _timed_call(fn: Callable[..., T], *args: Any) -> Tuple[T, float]:
+    """Run a function and measure its duration."""
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def plan_token_batches(
+    lengths: Sequence[int],
+    max_tokens: int,
+    max_batch_size: int,
+    bucket_width: int = 32,
+) -> List[List[int]]:
+    """
+    Group texts into forward passes by token length.
+
+    Texts are ordered by length and grouped into buckets of ``bucket_width``
+    tokens, so a batch never pads a text by a whole bucket or more. Each
+    bucket is packed into batches whose padded size (texts times the longest
+    text) stays within ``max_tokens``: many short headlines share one pass
+    while long articles run a few at a time. A text longer than the budget
+    runs alone.
+
+    Args:
+        lengths: Token count of each text
+        max_tokens: Padded tokens allowed per batch
+        max_batch_size: Texts allowed per batch
+        bucket_width: Tokens per length bucket
+
+    Returns:
+        Batches of indices into ``lengths``
+    """
+    batches: List[List[int]] = []
+    batch: List[int] = []
+    batch_bucket = None
+
+    for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+        length = max(1, lengths[index])
+        bucket = (length - 1) // bucket_width
+        # Lengths ascend, so the new text is the batch's longest
+        if batch and (
+            bucket != batch_bucket
+            or len(batch) >= max_batch_size
+            or (len(batch) + 1) * length > max_tokens
+        ):
+            batches.append(batch)
+            batch = []
+        batch.append(index)
+        batch_bucket = bucket
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def run_packed(
+    texts: Sequence[str],
+    count_tokens: Callable[[List[str]], List[int]],
+    predict: Callable[[List[str]], Sequence[R]],
+    max_tokens: int,
+    max_batch_size: int,
+    bucket_width: int = 32,
+) -> List[R]:
+    """
+    Run a model on texts in token-budget batches.
+
+    Args:
+        texts: Texts to run
+        count_tokens: Returns the token count of each text
+        predict: Runs one batch, returning one result per text in order
+        max_tokens: Padded tokens allowed per batch
+        max_batch_size: Texts allowed per batch
+        bucket_width: Tokens per length bucket
+
+    Returns:
+        Results in the order of ``texts``
+    """
+    texts = list(texts)
+    results: List[Optional[R]] = [None] * len(texts)
+
+    plan = plan_token_batches(
+        count_tokens(texts), max_tokens, max_batch_size, bucket_width
+    )
+    for batch in plan:
+        batch_results = predict([texts[index] for index in batch])
+        if len(batch_results) != len(batch):
+            raise SentimentInferenceError(
+                f"Batch returned {len(batch_results)} results for {len(batch)} texts"
+            )
+        for index, result in zip(batch, batch_results):
+            results[index] = result
+
+    return results  # type: ignore[return-value]
+
+
+class SentimentInferenceExecutor:
+    """Runs model loading and inference on a dedicated worker thread.
+
+    The model is only ever touched from the single worker thread, so the
+    event loop keeps serving requests while a forward pass runs (PyTorch
+    releases the GIL inside its kernels). At most ``max_queue`` jobs may be
+    pending; further submissions are rejected with InferenceQueueFullError.
+    Callers stop waiting after ``timeout`` seconds; a job that has not
+    started by then is dropped.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 64,
+        timeout: Optional[float] = 30.0,
+        initializer: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_queue: Jobs allowed to wait for or occupy the worker
+            timeout: Default seconds a caller waits for a job (None waits forever)
+            initializer: Called once on the worker thread (e.g. to set the
+                number of intra-op threads)
+        """
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.initializer = initializer
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._pending = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._run_seconds_total = 0.0
+        self._run_seconds_max = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the worker thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="sentiment-inference",
+                initializer=self.initializer,
+            )
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """Jobs waiting for or running on the worker."""
+        return self._pending
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+    ) -> T:
+        """
+        Run a function on the inference worker.
+
+        Args:
+            fn: Function to run (model loading or a forward pass)
+            *args: Positional arguments for ``fn``
+            timeout: Seconds to wait (default: the executor's timeout)
+
+        Returns:
+            Result of ``fn``
+
+        Raises:
+            InferenceQueueFullError: If ``max_queue`` jobs are pending
+            InferenceTimeoutError: If the job does not finish in time
+        """
+        timeout = self.timeout if timeout is None else timeout
+
+        if self._pending >= self.max_queue:
+            self._rejected += 1
+            raise InferenceQueueFullError(
+                f"Sentiment inference queue full ({self.max_queue} jobs pending)"
+            )
+
+        loop = asyncio.get_running_loop()
+        job = self._get_executor().submit(_timed_call, fn, *args)
+        self._pending += 1
+        self._peak_pending = max(self._peak_pending, self._pending)
+
+        def on_done(done: concurrent.futures.Future) -> None:
+            # The slot is freed when the job really ends, not when a caller gives up
+            try:
+                loop.call_soon_threadsafe(self._job_done, done)
+            except RuntimeError:
+                pass  # Event loop already closed
+
+        job.add_done_callback(on_done)
+
+        try:
+            result, _ = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(job)), timeout
+            )
+        except asyncio.TimeoutError:
+            job.cancel()
+            self._timed_out += 1
+            logger.warning(f"Sentiment inference timed out after {timeout}s")
+            raise InferenceTimeoutError(
+                f"Sentiment inference did not finish within {timeout}s"
+            )
+
+        return result
+
+    def _job_done(self, job: concurrent.futures.Future) -> None:
+        """Record a finished job on the event loop thread."""
+        self._pending -= 1
+        if job.cancelled():
+            return
+        if job.exception() is not None:
+            self._failed += 1
+            return
+
+        _, seconds = job.result()
+        self._completed += 1
+        self._run_seconds_total += seconds
+        self._run_seconds_max = max(self._run_seconds_max, seconds)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get executor metrics.
+
+        Returns:
+            Dictionary with queue depth, counters and run times
+        """
+        completed = self._completed
+        return {
+            "max_queue": self.max_queue,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self._peak_pending,
+            "completed": completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+            "avg_run_ms": self._run_seconds_total / completed * 1000
+            if completed
+            else None,
+            "max_run_ms": self._run_seconds_max * 1000 if completed else None,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker thread once its current job finishes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class MicroBatcher(Generic[R]):
+    """Coalesces texts from concurrent callers into model-sized batches.
+
+    Submitted texts wait at most ``max_wait`` seconds, or until
+    ``max_batch_size`` texts are pending, and are then run as one batch,
+    sorted by ``length_fn`` so similar lengths are padded together. Each
+    caller's future is resolved with the result for its own text. At most
+    ``max_in_flight`` batches are handed to ``run_batch`` at once and at most
+    ``max_pending`` texts may wait; beyond that submissions are rejected
+    with InferenceQueueFullError.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[List[str]], Awaitable[Sequence[R]]],
+        max_batch_size: int = 16,
+        max_wait: float = 0.005,
+        length_fn: Callable[[str], int] = len,
+        max_in_flight: int = 2,
+        max_pending: int = 10000,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            run_batch: Coroutine function running one batch of texts and
+                returning one result per text in the same order
+            max_batch_size: Texts per batch
+            max_wait: Seconds the first pending text waits for companions
+            length_fn: Length used to order texts within a batch
+            max_in_flight: Batches running or queued for the model at once
+            max_pending: Texts allowed to wait for a batch
+        """
+        self.run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.length_fn = length_fn
+        self.max_in_flight = max_in_flight
+        self.max_pending = max_pending
+
+        self._pending: List[Tuple[str, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._queued = 0
+
+        self._batches = 0
+        self._rejected = 0
+        self._items = 0
+        self._failed_batches = 0
+        self._batch_seconds_total = 0.0
+        self._latency_seconds_total = 0.0
+        self._latency_seconds_max = 0.0
+
+    async def submit(self, text: str) -> R:
+        """
+        Get the result for one text.
+
+        Args:
+            text: Text to run
+
+        Returns:
+            Result for the text
+        """
+        return (await self.submit_many([text]))[0]
+
+    async def submit_many(self, texts: Sequence[str]) -> List[R]:
+        """
+        Get the results for several texts, batched with other callers' texts.
+
+        Args:
+            texts: Texts to run
+
+        Returns:
+            Results in the order of ``texts``
+
+        Raises:
+            InferenceQueueFullError: If too many texts are already waiting
+        """
+        if not texts:
+            return []
+
+        if self._queued + len(texts) > self.max_pending:
+            self._rejected += 1
+            raise InferenceQueueFullError(
+                f"Sentiment batching queue full ({self._queued} texts waiting)"
+            )
+
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._pending.append((text, future, submitted))
+            self._queued += 1
+            futures.append(future)
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+
+        if self._pending and self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return list(await asyncio.gather(*futures))
+
+    def _flush(self) -> None:
+        """Start a batch with the oldest pending texts."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch = self._pending[: self.max_batch_size]
+        del self._pending[: len(batch)]
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future, float]]) -> None:
+        """Run one batch and resolve its callers' futures."""
+        batch.sort(key=lambda item: self.length_fn(item[0]))
+        if self._in_flight is None:
+            self._in_flight = asyncio.Semaphore(max(1, self.max_in_flight))
+
+        try:
+            async with self._in_flight:
+                self._queued -= len(batch)
+                started = time.perf_counter()
+                results = await self.run_batch([text for text, _, _ in batch])
+            if len(results) != len(batch):
+                raise SentimentInferenceError(
+                    f"Batch returned {len(results)} results for {len(batch)} texts"
+                )
+        except Exception as e:
+            self._failed_batches += 1
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        finished = time.perf_counter()
+        self._batches += 1
+        self._items += len(batch)
+        self._batch_seconds_total += finished - started
+
+        for (_, future, submitted), result in zip(batch, results):
+            latency = finished - submitted
+            self._latency_seconds_total += latency
+            self._latency_seconds_max = max(self._latency_seconds_max, latency)
+            if not future.done():
+                future.set_result(result)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get batching metrics.
+
+        Returns:
+            Dictionary with batch counts, sizes, throughput and latency
+        """
+        items = self._items
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "pending": self._queued,
+            "batches": self._batches,
+            "failed_batches": self._failed_batches,
+            "rejected": self._rejected,
+            "items": items,
+            "avg_batch_size": items / self._batches if self._batches else None,
+            "items_per_second": items / self._batch_seconds_total
+            if self._batch_seconds_total
+            else None,
+            "avg_latency_ms": self._latency_seconds_total / items * 1000
+            if items
+            else None,
+            "max_latency_ms": self._latency_seconds_max * 1000 if items else None,
+        }
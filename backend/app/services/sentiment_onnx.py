@@ -0,0 +1,346 @@
+"""
+ONNX Runtime backend for the Japanese sentiment model.
+
+The Hugging Face model is exported once to ONNX and its weights are
+quantized to int8 with dynamic (activation-range-at-runtime) quantization,
+which needs no calibration data and suits CPU-only inference. The exported
+directory holds the quantized graph together with the tokenizer and model
+config, so serving only needs ``onnxruntime`` and the tokenizer.
+
+Also provides the accuracy-parity and throughput helpers used to compare the
+ONNX backend against the PyTorch pipeline before switching over.
+"""
+
+import logging
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FP32_MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model.int8.onnx"
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    """Row-wise softmax that is stable for large logits."""
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+class ONNXSentimentPipeline:
+    """
+    Text classification with an ONNX Runtime session.
+
+    Called with a list of texts it returns one ``{"label", "score"}`` dict per
+    text, the same shape as the ``transformers`` sentiment-analysis pipeline,
+    so the analyzer can use either backend interchangeably.
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        tokenizer: Callable[..., Mapping[str, np.ndarray]],
+        id2label: Mapping[int, str],
+        max_length: int = 512,
+        batch_size: int = 16,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            session: ``onnxruntime.InferenceSession`` of the classifier
+            tokenizer: Hugging Face tokenizer for the model
+            id2label: Class index to label name, from the model config
+            max_length: Tokens kept per text
+            batch_size: Texts per forward pass
+        """
+        self.session = session
+        self.tokenizer = tokenizer
+        self.id2label = {int(k): v for k, v in id2label.items()}
+        self.max_length = max_length
+        self.batch_size = batch_size
+        self._input_names = [i.name for i in session.get_inputs()]
+
+    def predict_logits(
+        self, texts: Sequence[str], batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Get the classifier logits for texts.
+
+        Args:
+            texts: Texts to classify
+            batch_size: Texts per forward pass (default: the pipeline's)
+
+        Returns:
+            Array of shape (len(texts), num_labels)
+        """
+        batch_size = batch_size or self.batch_size
+        chunks = []
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                list(texts[start : start + batch_size]),
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np",
+            )
+            feeds = {
+                name: np.asarray(encoded[name], dtype=np.int64)
+                for name in self._input_names
+                if name in encoded
+            }
+            chunks.append(self.session.run(None, feeds)[0])
+
+        if not chunks:
+            return np.zeros((0, len(self.id2label)), dtype=np.float32)
+        return np.concatenate(chunks, axis=0)
+
+    def __call__(
+        self, texts: Sequence[str], batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify texts.
+
+        Args:
+            texts: Texts to classify
+            batch_size: Texts per forward pass (default: the pipeline's)
+
+        Returns:
+            Top label and its probability for each text
+        """
+        probabilities = softmax(self.predict_logits(texts, batch_size))
+        best = probabilities.argmax(axis=-1)
+        return [
+            {"label": self.id2label[int(index)], "score": float(row[index])}
+            for index, row in zip(best, probabilities)
+        ]
+
+
+def export_quantized_model(
+    model_name: str,
+    output_dir: str,
+    max_length: int = 512,
+    opset: int = 17,
+) -> Path:
+    """
+    Export a sequence classification model to ONNX and quantize it to int8.
+
+    Requires ``torch``, ``transformers``, ``onnx`` and ``onnxruntime``.
+
+    Args:
+        model_name: Hugging Face model name or local path
+        output_dir: Directory receiving the ONNX files, tokenizer and config
+        max_length: Sequence length of the dummy input used for tracing
+        opset: ONNX opset version
+
+    Returns:
+        Path of the quantized model
+    """
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    target = Path(output_dir)
+    target.mkdir(parents=True, exist_ok=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.eval()
+
+    dummy = tokenizer(
+        ["ダミー入力"],
+        padding="max_length",
+        truncation=True,
+        max_length=min(max_length, 32),
+        return_tensors="pt",
+    )
+    input_names = [
+        name
+        for name in ("input_ids", "attention_mask", "token_type_ids")
+        if name in dummy
+    ]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    fp32_path = target / FP32_MODEL_FILE
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(dummy[name] for name in input_names),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True,
+        )
+
+    quantized_path = target / QUANTIZED_MODEL_FILE
+    quantize_dynamic(
+        str(fp32_path),
+        str(quantized_path),
+        weight_type=QuantType.QInt8,
+        per_channel=True,
+    )
+
+    tokenizer.save_pretrained(str(target))
+    model.config.save_pretrained(str(target))
+
+    logger.info(
+        f"Exported {model_name} to ONNX: fp32 {fp32_path.stat().st_size / 1e6:.0f}MB, "
+        f"int8 {quantized_path.stat().st_size / 1e6:.0f}MB"
+    )
+    return quantized_path
+
+
+def load_onnx_pipeline(
+    model_dir: str,
+    max_length: int = 512,
+    batch_size: int = 16,
+    intra_op_threads: Optional[int] = None,
+    quantized: bool = True,
+) -> ONNXSentimentPipeline:
+    """
+    Load an exported model into an ONNX Runtime CPU session.
+
+    Args:
+        model_dir: Directory written by ``export_quantized_model``
+        max_length: Tokens kept per text
+        batch_size: Texts per forward pass
+        intra_op_threads: Threads used inside operators (default: ORT's choice)
+        quantized: Load the int8 model rather than the fp32 export
+
+    Returns:
+        Pipeline running on ONNX Runtime
+
+    Raises:
+        FileNotFoundError: If the model has not been exported
+    """
+    import onnxruntime as ort
+    from transformers import AutoConfig, AutoTokenizer
+
+    model_path = Path(model_dir) / (
+        QUANTIZED_MODEL_FILE if quantized else FP32_MODEL_FILE
+    )
+    if not model_path.exists():
+        raise FileNotFoundError(f"ONNX sentiment model not found at {model_path}")
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    if intra_op_threads:
+        options.intra_op_num_threads = intra_op_threads
+    options.inter_op_num_threads = 1
+
+    session = ort.InferenceSession(
+        str(model_path), sess_options=options, providers=["CPUExecutionProvider"]
+    )
+    config = AutoConfig.from_pretrained(model_dir)
+
+    return ONNXSentimentPipeline(
+        session,
+        AutoTokenizer.from_pretrained(model_dir),
+        config.id2label,
+        max_length=max_length,
+        batch_size=batch_size,
+    )
+
+
+def onnx_model_exists(model_dir: str) -> bool:
+    """Check whether a quantized export is present in a directory."""
+    return os.path.exists(os.path.join(model_dir, QUANTIZED_MODEL_FILE))
+
+
+def compare_predictions(
+    reference: Sequence[Mapping[str, Any]],
+    candidate: Sequence[Mapping[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Compare two backends' pipeline outputs on the same texts.
+
+    Args:
+        reference: Outputs of the reference (PyTorch) backend
+        candidate: Outputs of the candidate (ONNX) backend
+
+    Returns:
+        Label agreement rate, score differences on agreeing texts and the
+        indices of texts whose label changed
+
+    Raises:
+        ValueError: If the output lengths differ
+    """
+    if len(reference) != len(candidate):
+        raise ValueError(
+            f"Cannot compare {len(reference)} reference and {len(candidate)} candidate outputs"
+        )
+
+    mismatches = []
+    score_diffs = []
+    for index, (expected, actual) in enumerate(zip(reference, candidate)):
+        if expected["label"] != actual["label"]:
+            mismatches.append(index)
+        else:
+            score_diffs.append(abs(float(expected["score"]) - float(actual["score"])))
+
+    total = len(reference)
+    return {
+        "total": total,
+        "label_agreement": (total - len(mismatches)) / total if total else 1.0,
+        "mismatched_indices": mismatches,
+        "mean_score_diff": statistics.fmean(score_diffs) if score_diffs else 0.0,
+        "max_score_diff": max(score_diffs) if score_diffs else 0.0,
+    }
+
+
+def benchmark_predict(
+    predict: Callable[[List[str]], Any],
+    texts: Sequence[str],
+    batch_size: int = 16,
+    warmup_batches: int = 2,
+    repeats: int = 3,
+) -> Dict[str, Any]:
+    """
+    Measure the throughput and batch latency of a prediction function.
+
+    Args:
+        predict: Function classifying a list of texts
+        texts: Corpus to run
+        batch_size: Texts per call
+        warmup_batches: Untimed calls made first
+        repeats: Passes over the corpus
+
+    Returns:
+        Texts per second and batch latency percentiles in milliseconds
+    """
+    batches = [
+        list(texts[start : start + batch_size])
+        for start in range(0, len(texts), batch_size)
+    ]
+    for batch in batches[:warmup_batches]:
+        predict(batch)
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(repeats):
+        for batch in batches:
+            batch_started = time.perf_counter()
+            predict(batch)
+            latencies.append(time.perf_counter() - batch_started)
+    elapsed = time.perf_counter() - started
+
+    if not latencies:
+        return {"texts_per_second": None, "p50_batch_ms": None, "p95_batch_ms": None}
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "texts_per_second": len(texts) * repeats / elapsed if elapsed else None,
+        "p50_batch_ms": float(np.percentile(latencies_ms, 50)),
+        "p95_batch_ms": float(np.percentile(latencies_ms, 95)),
+        "batches": len(latencies),
+    }
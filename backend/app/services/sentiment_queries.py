@@ -0,0 +1,97 @@
+"""
+SQL aggregation queries over analyzed news sentiment.
+
+Counts and averages are computed by the database with ``COUNT(*) FILTER``
+and ``AVG`` over the typed ``published_ts`` column, so callers receive one
+row per time bucket rather than every matching article.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.sql import Select
+
+from ..models.news import NewsArticle, StockNewsLink
+
+TIMELINE_UNITS = {"hourly": "hour", "daily": "day"}
+
+
+def _sentiment_aggregates():
+    """Label counts, average score and total for a group of articles."""
+    label = NewsArticle.sentiment_label
+    return (
+        func.count().filter(label == "positive").label("positive_count"),
+        func.count().filter(label == "negative").label("negative_count"),
+        func.count().filter(label == "neutral").label("neutral_count"),
+        func.avg(NewsArticle.sentiment_score).label("avg_sentiment_score"),
+        func.coalesce(func.sum(NewsArticle.sentiment_score), 0).label("score_sum"),
+        func.count(NewsArticle.sentiment_score).label("score_count"),
+        func.count().label("total_articles"),
+    )
+
+
+def _analyzed_since(
+    query: Select,
+    start: datetime,
+    ticker: Optional[str],
+    end: Optional[datetime] = None,
+) -> Select:
+    """Restrict a query to analyzed articles published in a period."""
+    if ticker:
+        query = query.join(
+            StockNewsLink, StockNewsLink.article_id == NewsArticle.id
+        ).where(StockNewsLink.ticker == ticker)
+    if end is not None:
+        query = query.where(NewsArticle.published_ts < end)
+    return query.where(
+        NewsArticle.published_ts >= start,
+        NewsArticle.sentiment_label.isnot(None),
+    )
+
+
+def sentiment_timeline_query(
+    start: datetime, ticker: Optional[str] = None, granularity: str = "daily"
+) -> Select:
+    """
+    Build the per-period sentiment aggregation query.
+
+    Args:
+        start: Earliest publication time included
+        ticker: Stock ticker (None for general market sentiment)
+        granularity: 'daily' or 'hourly'
+
+    Returns:
+        Query yielding (bucket, positive_count, negative_count, neutral_count,
+        avg_sentiment_score, score_sum, score_count, total_articles) ordered
+        by bucket, with buckets as naive UTC datetimes
+    """
+    unit = TIMELINE_UNITS.get(granularity, "day")
+    bucket = func.date_trunc(unit, func.timezone("UTC", NewsArticle.published_ts))
+    bucket = bucket.label("bucket")
+
+    query = select(bucket, *_sentiment_aggregates())
+    # Group by the output column: repeating the expression would bind its
+    # parameters again, and Postgres would not match it to the select list
+    return _analyzed_since(query, start, ticker).group_by("bucket").order_by("bucket")
+
+
+def sentiment_summary_query(
+    start: datetime,
+    ticker: Optional[str] = None,
+    end: Optional[datetime] = None,
+) -> Select:
+    """
+    Build the sentiment aggregation query for a whole period.
+
+    Args:
+        start: Earliest publication time included
+        ticker: Stock ticker (None for general market sentiment)
+        end: Publication time the period stops before (None for no limit)
+
+    Returns:
+        Query yielding one row of (positive_count, negative_count,
+        neutral_count, avg_sentiment_score, score_sum, score_count,
+        total_articles)
+    """
+    return _analyzed_since(select(*_sentiment_aggregates()), start, ticker, end)
@@ -0,0 +1,365 @@
+"""
+Daily sentiment rollup maintenance and queries.
+
+``sentiment_daily_rollup`` holds one row per (ticker or market, UTC day) with
+label counts and the score sum and count of the analyzed articles published
+that day. Whenever article sentiment is written, the change is applied to the
+rollup as a delta in the same transaction: a re-analyzed article subtracts its
+previous label and score before adding the new ones, so rows stay exact
+without rescanning articles. The previous values are read under a row lock at
+write time, so overlapping analysis runs cannot subtract the same value
+twice. Stock links added to or removed from an already analyzed article move
+its sentiment into or out of that ticker's rows the same way. Timeline and
+summary reads then touch one row per day instead of every article.
+"""
+
+import logging
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from ..adapters.news_adapter import parse_published_at
+from ..models.news import (
+    MARKET_SENTIMENT_SCOPE,
+    NewsArticle,
+    SentimentDailyRollup,
+    StockNewsLink,
+)
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_COUNTERS = (
+    "positive_count",
+    "negative_count",
+    "neutral_count",
+    "score_sum",
+    "score_count",
+)
+SENTIMENT_LABELS = ("positive", "negative", "neutral")
+
+# (article with its new sentiment set, previous label, previous score)
+SentimentChange = Tuple[NewsArticle, Optional[str], Optional[Any]]
+
+
+def article_day(article: NewsArticle) -> date:
+    """
+    Get the UTC day an article is rolled up under.
+
+    Args:
+        article: News article
+
+    Returns:
+        Day of ``published_ts``, falling back to the parsed ``published_at``
+        and then to when the article was stored
+    """
+    published = (
+        article.published_ts
+        or parse_published_at(article.published_at)
+        or article.created_at
+        or datetime.now(timezone.utc)
+    )
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published.astimezone(timezone.utc).date()
+
+
+class RollupDeltas:
+    """Accumulates rollup changes from sentiment writes."""
+
+    def __init__(self):
+        self._deltas: Dict[Tuple[str, date], Dict[str, Any]] = {}
+
+    def record(
+        self,
+        day: date,
+        scopes: Iterable[str],
+        old_label: Optional[str],
+        old_score: Optional[Any],
+        new_label: Optional[str],
+        new_score: Optional[Any],
+    ) -> None:
+        """
+        Record one article's sentiment change.
+
+        Args:
+            day: Day the article is rolled up under
+            scopes: Rollup scopes the article counts towards
+            old_label: Label before the write (None if not analyzed)
+            old_score: Score before the write
+            new_label: Label written
+            new_score: Score written
+        """
+        for scope in scopes:
+            delta = self._deltas.get((scope, day))
+            if delta is None:
+                delta = {counter: 0 for counter in ROLLUP_COUNTERS}
+                delta["score_sum"] = Decimal(0)
+                self._deltas[(scope, day)] = delta
+            self._apply(delta, old_label, old_score, -1)
+            self._apply(delta, new_label, new_score, 1)
+
+    @staticmethod
+    def _apply(
+        delta: Dict[str, Any], label: Optional[str], score: Optional[Any], sign: int
+    ) -> None:
+        if label not in SENTIMENT_LABELS:
+            return
+        delta[f"{label}_count"] += sign
+        if score is not None:
+            delta["score_sum"] += sign * Decimal(str(score))
+            delta["score_count"] += sign
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """
+        Get the accumulated deltas as rollup rows.
+
+        Returns:
+            One row per (scope, day) whose counters changed
+        """
+        return [
+            {"scope": scope, "day": day, **delta}
+            for (scope, day), delta in sorted(self._deltas.items())
+            if any(delta[counter] for counter in ROLLUP_COUNTERS)
+        ]
+
+
+async def apply_rollup_deltas(
+    db: AsyncSession, deltas: RollupDeltas, batch_size: int = 500
+) -> int:
+    """
+    Add accumulated deltas to the rollup table.
+
+    Runs in the caller's transaction; the caller commits.
+
+    Args:
+        db: Database session
+        deltas: Changes to apply
+        batch_size: Rows per upsert statement
+
+    Returns:
+        Number of rollup rows changed
+    """
+    rows = deltas.rows()
+    if not rows:
+        return 0
+
+    conn = await db.connection()
+    insert = sqlite_insert if conn.dialect.name == "sqlite" else pg_insert
+
+    for i in range(0, len(rows), batch_size):
+        stmt = insert(SentimentDailyRollup).values(rows[i : i + batch_size])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["scope", "day"],
+            set_={
+                **{
+                    counter: getattr(SentimentDailyRollup, counter)
+                    + getattr(stmt.excluded, counter)
+                    for counter in ROLLUP_COUNTERS
+                },
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
+
+    return len(rows)
+
+
+async def update_sentiment_rollup(
+    db: AsyncSession, changes: Sequence[SentimentChange]
+) -> int:
+    """
+    Apply articles' sentiment writes to the market and per-stock rollups.
+
+    Args:
+        db: Database session the sentiment was written in
+        changes: Articles with their previous label and score
+
+    Returns:
+        Number of rollup rows changed
+    """
+    if not changes:
+        return 0
+
+    result = await db.execute(
+        select(StockNewsLink.article_id, StockNewsLink.ticker).where(
+            StockNewsLink.article_id.in_([article.id for article, _, _ in changes])
+        )
+    )
+    tickers: Dict[Any, List[str]] = {}
+    for article_id, ticker in result.all():
+        tickers.setdefault(article_id, []).append(ticker)
+
+    deltas = RollupDeltas()
+    for article, old_label, old_score in changes:
+        deltas.record(
+            article_day(article),
+            [MARKET_SENTIMENT_SCOPE, *tickers.get(article.id, [])],
+            old_label,
+            old_score,
+            article.sentiment_label,
+            article.sentiment_score,
+        )
+
+    return await apply_rollup_deltas(db, deltas)
+
+
+async def write_article_sentiment(
+    db: AsyncSession, sentiments: Mapping[Any, Tuple[str, float]]
+) -> List[NewsArticle]:
+    """
+    Write articles' sentiment together with the matching rollup deltas.
+
+    The articles are re-read with ``SELECT ... FOR UPDATE`` right before the
+    write, so the values subtracted from the rollup are the ones actually
+    being replaced, even if another run updated the articles after they were
+    loaded for inference; writers of the same article wait for each other.
+    Runs in the caller's transaction; the caller commits.
+
+    Args:
+        db: Database session
+        sentiments: Article ID to (label, score)
+
+    Returns:
+        Articles written
+    """
+    if not sentiments:
+        return []
+
+    # Lock in a fixed order so concurrent batches cannot deadlock
+    result = await db.execute(
+        select(NewsArticle)
+        .where(NewsArticle.id.in_(list(sentiments)))
+        .order_by(NewsArticle.id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    articles = result.scalars().all()
+
+    changes: List[SentimentChange] = []
+    for article in articles:
+        changes.append((article, article.sentiment_label, article.sentiment_score))
+        article.sentiment_label, article.sentiment_score = sentiments[article.id]
+
+    await update_sentiment_rollup(db, changes)
+    return list(articles)
+
+
+async def set_article_stock_links(
+    db: AsyncSession,
+    article_id: Any,
+    scores: Mapping[str, float],
+    replace: bool = False,
+) -> List[str]:
+    """
+    Link an article to stocks, keeping the per-stock rollups in step.
+
+    The article row is locked first, like sentiment writes do, so a link
+    change and a sentiment write of the same article cannot miss each other.
+    If the article is already analyzed, its sentiment is added to the rollup
+    of every newly linked ticker and subtracted from every unlinked one.
+    Runs in the caller's transaction; the caller commits.
+
+    Args:
+        db: Database session
+        article_id: Article ID
+        scores: Ticker to relevance score of the links to set
+        replace: Remove links to tickers not in ``scores`` and update the
+            scores of kept links (otherwise existing links are left as is)
+
+    Returns:
+        Tickers newly linked
+    """
+    result = await db.execute(
+        select(NewsArticle)
+        .where(NewsArticle.id == article_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    article = result.scalar_one_or_none()
+    if article is None:
+        return []
+
+    result = await db.execute(
+        select(StockNewsLink).where(StockNewsLink.article_id == article_id)
+    )
+    existing = {link.ticker: link for link in result.scalars().all()}
+
+    removed = [ticker for ticker in existing if ticker not in scores] if replace else []
+    for ticker in removed:
+        await db.delete(existing[ticker])
+
+    added = []
+    for ticker, relevance_score in scores.items():
+        link = existing.get(ticker)
+        if link is None:
+            db.add(
+                StockNewsLink(
+                    article_id=article_id,
+                    ticker=ticker,
+                    relevance_score=relevance_score,
+                )
+            )
+            added.append(ticker)
+        elif replace:
+            link.relevance_score = relevance_score
+
+    if article.sentiment_label is not None and (added or removed):
+        deltas = RollupDeltas()
+        day = article_day(article)
+        label, score = article.sentiment_label, article.sentiment_score
+        deltas.record(day, removed, label, score, None, None)
+        deltas.record(day, added, None, None, label, score)
+        await apply_rollup_deltas(db, deltas)
+
+    return added
+
+
+def rollup_timeline_query(start_day: date, ticker: Optional[str] = None) -> Select:
+    """
+    Build the daily rollup read for a timeline.
+
+    Args:
+        start_day: First day included
+        ticker: Stock ticker (None for general market sentiment)
+
+    Returns:
+        Query yielding SentimentDailyRollup rows ordered by day
+    """
+    return (
+        select(SentimentDailyRollup)
+        .where(
+            SentimentDailyRollup.scope == (ticker or MARKET_SENTIMENT_SCOPE),
+            SentimentDailyRollup.day >= start_day,
+        )
+        .order_by(SentimentDailyRollup.day)
+    )
+
+
+def rollup_summary_query(start_day: date, ticker: Optional[str] = None) -> Select:
+    """
+    Build the rollup totals read from a day onwards.
+
+    Args:
+        start_day: First day included
+        ticker: Stock ticker (None for general market sentiment)
+
+    Returns:
+        Query yielding one row with the summed counters
+    """
+    return select(
+        *[
+            func.coalesce(func.sum(getattr(SentimentDailyRollup, counter)), 0).label(
+                counter
+            )
+            for counter in ROLLUP_COUNTERS
+        ]
+    ).where(
+        SentimentDailyRollup.scope == (ticker or MARKET_SENTIMENT_SCOPE),
+        SentimentDailyRollup.day >= start_day,
+    )
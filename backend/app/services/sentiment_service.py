@@ -3,22 +3,41 @@ Japanese sentiment analysis service using nlp-waseda/roberta-base-japanese-senti
 """
 
 import asyncio
-import hashlib
 import json
 import logging
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime, time, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 import torch
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
 
+from ..core.cache import cache
 from ..core.config import settings
 from ..core.database import get_db
-from ..models.news import NewsArticle, StockNewsLink
+from ..models.news import NewsArticle
+from .sentiment_cache import SentimentResultCache, normalize_text
+from .sentiment_inference import (
+    MicroBatcher,
+    SentimentInferenceError,
+    SentimentInferenceExecutor,
+    run_packed,
+)
+from .sentiment_onnx import (
+    export_quantized_model,
+    load_onnx_pipeline,
+    onnx_model_exists,
+)
+from .sentiment_queries import sentiment_summary_query, sentiment_timeline_query
+from .sentiment_rollup import (
+    rollup_summary_query,
+    rollup_timeline_query,
+    write_article_sentiment,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -58,13 +77,43 @@ class JapaneseSentimentAnalyzer:
         self._is_initialized = False
         self._initialization_lock = asyncio.Lock()
 
-        # Batch processing settings
+        # Batch processing settings. Collected texts are tokenized, grouped
+        # into length buckets and packed into forward passes of at most
+        # max_batch_tokens padded tokens, so short headlines are not padded
+        # to the length of a long article in the same batch.
         self.batch_size = 16
+        self.max_batch_size = 64
+        self.max_batch_tokens = 4096
+        self.length_bucket_width = 32
         self.max_sequence_length = 512
 
-        # Cache for recent sentiment results
-        self._sentiment_cache = {}
-        self._cache_ttl = 3600  # 1 hour
+        # Inference backend: "torch" (transformers pipeline) or "onnx"
+        # (int8-quantized export served by ONNX Runtime)
+        self.backend = settings.SENTIMENT_BACKEND.lower()
+        if self.backend not in ("torch", "onnx"):
+            raise ValueError(f"Unknown sentiment backend: {settings.SENTIMENT_BACKEND}")
+        self.onnx_model_dir = settings.SENTIMENT_ONNX_MODEL_DIR
+
+        # Model loading and inference run on a dedicated worker thread
+        self.intra_op_threads = max(1, (os.cpu_count() or 2) // 2)
+        self.load_timeout = 600.0
+        self._executor = SentimentInferenceExecutor(
+            max_queue=64, timeout=30.0, initializer=self._configure_worker
+        )
+
+        # Texts from concurrent callers are collected into one worker job,
+        # which packs them by token length. The tokenizer belongs to the
+        # worker thread, so token counting happens there too.
+        self._batcher: MicroBatcher[Dict[str, Any]] = MicroBatcher(
+            self._run_batch, max_batch_size=self.max_batch_size, max_wait=0.005
+        )
+
+        # Results are deterministic per model and text: keep them in an
+        # in-process LRU backed by Redis shared across workers
+        self.model_version = f"{self.model_name}:{self.backend}"
+        self._result_cache = SentimentResultCache(
+            self.model_version, max_entries=50000, redis_cache=cache
+        )
 
         # Label mapping from model output to our standard format
         self.label_mapping = {
@@ -73,6 +122,10 @@ class JapaneseSentimentAnalyzer:
             "NEUTRAL": "neutral",
         }
 
+    def _configure_worker(self) -> None:
+        """Limit the intra-op threads PyTorch uses on the inference worker."""
+        torch.set_num_threads(self.intra_op_threads)
+
     async def initialize(self) -> None:
         """Initialize the sentiment analysis model."""
         if self._is_initialized:
@@ -83,24 +136,11 @@ class JapaneseSentimentAnalyzer:
                 return
 
             try:
-                logger.info("Initializing Japanese sentiment analysis model...")
-
-                # Load tokenizer and model
-                self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-                self.model = AutoModelForSequenceClassification.from_pretrained(
-                    self.model_name
+                logger.info(
+                    f"Initializing Japanese sentiment analysis model ({self.backend} backend)..."
                 )
 
-                # Create pipeline for easier inference
-                self.pipeline = pipeline(
-                    "sentiment-analysis",
-                    model=self.model,
-                    tokenizer=self.tokenizer,
-                    device=0 if torch.cuda.is_available() else -1,
-                    batch_size=self.batch_size,
-                    max_length=self.max_sequence_length,
-                    truncation=True,
-                )
+                await self._executor.run(self._load_model, timeout=self.load_timeout)
 
                 self._is_initialized = True
                 logger.info(
@@ -111,6 +151,83 @@ class JapaneseSentimentAnalyzer:
                 logger.error(f"Failed to initialize sentiment analysis model: {e}")
                 raise
 
+    def _load_model(self) -> None:
+        """Load the tokenizer, model and pipeline (runs on the worker)."""
+        if self.backend == "onnx":
+            self._load_onnx_model()
+            return
+
+        # Load tokenizer and model
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+
+        # Create pipeline for easier inference
+        self.pipeline = pipeline(
+            "sentiment-analysis",
+            model=self.model,
+            tokenizer=self.tokenizer,
+            device=0 if torch.cuda.is_available() else -1,
+            batch_size=self.batch_size,
+            max_length=self.max_sequence_length,
+            truncation=True,
+        )
+
+    def _load_onnx_model(self) -> None:
+        """Load the quantized ONNX model, exporting it first if needed."""
+        if not onnx_model_exists(self.onnx_model_dir):
+            if not settings.SENTIMENT_ONNX_AUTO_EXPORT:
+                raise FileNotFoundError(
+                    f"No ONNX sentiment model in {self.onnx_model_dir}; "
+                    "run scripts/benchmark_sentiment_backends.py --export"
+                )
+            logger.info(f"Exporting {self.model_name} to {self.onnx_model_dir}")
+            export_quantized_model(
+                self.model_name, self.onnx_model_dir, self.max_sequence_length
+            )
+
+        self.pipeline = load_onnx_pipeline(
+            self.onnx_model_dir,
+            max_length=self.max_sequence_length,
+            batch_size=self.batch_size,
+            intra_op_threads=self.intra_op_threads,
+        )
+        self.tokenizer = self.pipeline.tokenizer
+
+    def _count_tokens(self, texts: List[str]) -> List[int]:
+        """Count the tokens of each text after truncation (runs on the worker)."""
+        encoded = self.tokenizer(
+            texts, truncation=True, max_length=self.max_sequence_length
+        )
+        return [len(ids) for ids in encoded["input_ids"]]
+
+    def _predict_padded(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run texts of similar length as one forward pass (runs on the worker)."""
+        return self.pipeline(texts, batch_size=len(texts))
+
+    def _predict(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run the pipeline on token-budget batches of texts (runs on the worker)."""
+        return run_packed(
+            texts,
+            self._count_tokens,
+            self._predict_padded,
+            max_tokens=self.max_batch_tokens,
+            max_batch_size=self.max_batch_size,
+            bucket_width=self.length_bucket_width,
+        )
+
+    async def _run_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run one micro-batch on the inference worker."""
+        return await self._executor.run(self._predict, texts)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get micro-batching, inference executor and result cache metrics."""
+        return {
+            "backend": self.backend,
+            "batching": self._batcher.get_metrics(),
+            "executor": self._executor.get_metrics(),
+            "cache": self._result_cache.get_metrics(),
+        }
+
     async def analyze_text(self, text: str) -> SentimentResult:
         """
         Analyze sentiment of a single text.
@@ -120,30 +237,35 @@ class JapaneseSentimentAnalyzer:
 
         Returns:
             SentimentResult with label, score, and raw_score
+
+        Raises:
+            SentimentInferenceError: If the inference queue is full or times out
         """
-        if not text or not text.strip():
+        text = normalize_text(text or "")
+        if not text:
             return SentimentResult(label="neutral", score=0.5, raw_score=0.0)
 
         # Check cache first
-        cache_key = self._get_cache_key(text)
-        cached_result = self._get_cached_result(cache_key)
+        cached_result = await self._result_cache.get(text)
         if cached_result:
-            return cached_result
+            return SentimentResult(**cached_result)
 
         await self.initialize()
 
         try:
             # Run inference
-            result = self.pipeline(text)[0]
+            result = await self._batcher.submit(text)
 
             # Convert to our format
             sentiment_result = self._convert_pipeline_result(result)
 
             # Cache the result
-            self._cache_result(cache_key, sentiment_result)
+            await self._result_cache.set(text, asdict(sentiment_result))
 
             return sentiment_result
 
+        except SentimentInferenceError:
+            raise
         except Exception as e:
             logger.error(f"Error analyzing sentiment for text: {e}")
             return SentimentResult(label="neutral", score=0.5, raw_score=0.0)
@@ -157,89 +279,62 @@ class JapaneseSentimentAnalyzer:
 
         Returns:
             List of SentimentResult objects
+
+        Raises:
+            SentimentInferenceError: If the inference queue is full or times out
         """
         if not texts:
             return []
 
         await self.initialize()
 
-        results = []
+        # Empty texts stay neutral; every other slot is filled below
+        results = [
+            SentimentResult(label="neutral", score=0.5, raw_score=0.0) for _ in texts
+        ]
 
         try:
-            # Filter out empty texts and create mapping
-            valid_texts = []
-            text_indices = []
-
+            # Positions of each distinct non-empty text
+            positions: Dict[str, List[int]] = {}
             for i, text in enumerate(texts):
-                if text and text.strip():
-                    valid_texts.append(text.strip())
-                    text_indices.append(i)
-                else:
-                    # Add neutral result for empty texts
-                    results.append(
-                        SentimentResult(label="neutral", score=0.5, raw_score=0.0)
-                    )
+                text = normalize_text(text or "")
+                if text:
+                    positions.setdefault(text, []).append(i)
 
-            if not valid_texts:
+            if not positions:
                 return results
 
-            # Check cache for valid texts
-            cached_results = {}
+            # Check cache for valid texts (one Redis round trip for the batch)
+            valid_texts = list(positions)
             uncached_texts = []
-            uncached_indices = []
 
-            for i, text in enumerate(valid_texts):
-                cache_key = self._get_cache_key(text)
-                cached_result = self._get_cached_result(cache_key)
+            lookups = await self._result_cache.get_many(valid_texts)
+            for text, cached_result in zip(valid_texts, lookups):
                 if cached_result:
-                    cached_results[i] = cached_result
+                    sentiment_result = SentimentResult(**cached_result)
+                    for i in positions[text]:
+                        results[i] = sentiment_result
                 else:
                     uncached_texts.append(text)
-                    uncached_indices.append(i)
 
-            # Process uncached texts in batches
-            uncached_results = {}
+            # Process uncached texts in micro-batches shared with other callers
             if uncached_texts:
-                for batch_start in range(0, len(uncached_texts), self.batch_size):
-                    batch_end = min(batch_start + self.batch_size, len(uncached_texts))
-                    batch_texts = uncached_texts[batch_start:batch_end]
-                    batch_indices = uncached_indices[batch_start:batch_end]
-
-                    # Run batch inference
-                    batch_results = self.pipeline(batch_texts)
-
-                    # Process batch results
-                    for i, (text, result) in enumerate(zip(batch_texts, batch_results)):
-                        sentiment_result = self._convert_pipeline_result(result)
-                        original_index = batch_indices[i]
-                        uncached_results[original_index] = sentiment_result
-
-                        # Cache the result
-                        cache_key = self._get_cache_key(text)
-                        self._cache_result(cache_key, sentiment_result)
-
-            # Combine cached and uncached results
-            final_results = []
-            for i in range(len(valid_texts)):
-                if i in cached_results:
-                    final_results.append(cached_results[i])
-                else:
-                    final_results.append(uncached_results[i])
+                batch_results = await self._batcher.submit_many(uncached_texts)
 
-            # Insert results back into original positions
-            result_iter = iter(final_results)
-            final_output = []
+                new_entries = []
+                for text, result in zip(uncached_texts, batch_results):
+                    sentiment_result = self._convert_pipeline_result(result)
+                    for i in positions[text]:
+                        results[i] = sentiment_result
+                    new_entries.append((text, asdict(sentiment_result)))
 
-            for i in range(len(texts)):
-                if i in [text_indices[j] for j in range(len(text_indices))]:
-                    final_output.append(next(result_iter))
-                else:
-                    final_output.append(
-                        SentimentResult(label="neutral", score=0.5, raw_score=0.0)
-                    )
+                # Cache the results
+                await self._result_cache.set_many(new_entries)
 
-            return final_output
+            return results
 
+        except SentimentInferenceError:
+            raise
         except Exception as e:
             logger.error(f"Error in batch sentiment analysis: {e}")
             # Return neutral results for all texts
@@ -270,40 +365,6 @@ class JapaneseSentimentAnalyzer:
             label=mapped_label, score=confidence, raw_score=raw_score
         )
 
-    def _get_cache_key(self, text: str) -> str:
-        """Generate cache key for text."""
-        return hashlib.md5(text.encode("utf-8")).hexdigest()
-
-    def _get_cached_result(self, cache_key: str) -> Optional[SentimentResult]:
-        """Get cached sentiment result if still valid."""
-        if cache_key in self._sentiment_cache:
-            cached_data = self._sentiment_cache[cache_key]
-            if (
-                datetime.utcnow().timestamp() - cached_data["timestamp"]
-                < self._cache_ttl
-            ):
-                return cached_data["result"]
-            else:
-                # Remove expired cache entry
-                del self._sentiment_cache[cache_key]
-        return None
-
-    def _cache_result(self, cache_key: str, result: SentimentResult) -> None:
-        """Cache sentiment result."""
-        self._sentiment_cache[cache_key] = {
-            "result": result,
-            "timestamp": datetime.utcnow().timestamp(),
-        }
-
-        # Simple cache cleanup - remove oldest entries if cache gets too large
-        if len(self._sentiment_cache) > 1000:
-            # Remove oldest 100 entries
-            sorted_items = sorted(
-                self._sentiment_cache.items(), key=lambda x: x[1]["timestamp"]
-            )
-            for key, _ in sorted_items[:100]:
-                del self._sentiment_cache[key]
-
 
 class SentimentService:
     """
@@ -313,6 +374,44 @@ class SentimentService:
     def __init__(self):
         self.analyzer = JapaneseSentimentAnalyzer()
 
+    async def _analyze_and_store(
+        self, db: AsyncSession, articles: List[NewsArticle]
+    ) -> Dict[str, SentimentResult]:
+        """
+        Analyze articles and write their sentiment and rollup deltas.
+
+        Inference runs on the loaded articles; the write then re-reads them
+        under row locks, so the rollup subtracts the values actually replaced.
+
+        Args:
+            db: Database session the articles were loaded in
+            articles: Articles to analyze
+
+        Returns:
+            Dictionary mapping article_id to SentimentResult
+        """
+        texts = []
+        for article in articles:
+            # Combine headline and content for analysis
+            text_to_analyze = f"{article.headline}"
+            if article.content_summary:
+                text_to_analyze += f" {article.content_summary}"
+            texts.append(text_to_analyze)
+
+        sentiment_results = await self.analyzer.analyze_batch(texts)
+
+        sentiments = {
+            article.id: (sentiment_result.label, sentiment_result.raw_score)
+            for article, sentiment_result in zip(articles, sentiment_results)
+        }
+        await write_article_sentiment(db, sentiments)
+        await db.commit()
+
+        return {
+            str(article.id): sentiment_result
+            for article, sentiment_result in zip(articles, sentiment_results)
+        }
+
     async def analyze_article_sentiment(
         self, article_id: str
     ) -> Optional[SentimentResult]:
@@ -336,19 +435,8 @@ class SentimentService:
                     logger.warning(f"Article {article_id} not found")
                     return None
 
-                # Combine headline and content for analysis
-                text_to_analyze = f"{article.headline}"
-                if article.content_summary:
-                    text_to_analyze += f" {article.content_summary}"
-
-                # Analyze sentiment
-                sentiment_result = await self.analyzer.analyze_text(text_to_analyze)
-
-                # Update article with sentiment data
-                article.sentiment_label = sentiment_result.label
-                article.sentiment_score = sentiment_result.raw_score
-
-                await db.commit()
+                results = await self._analyze_and_store(db, [article])
+                sentiment_result = results[str(article.id)]
 
                 logger.info(
                     f"Updated sentiment for article {article_id}: {sentiment_result.label} ({sentiment_result.score:.3f})"
@@ -386,34 +474,7 @@ class SentimentService:
                 if not articles:
                     return {}
 
-                # Prepare texts for batch analysis
-                texts = []
-                article_map = {}
-
-                for article in articles:
-                    text_to_analyze = f"{article.headline}"
-                    if article.content_summary:
-                        text_to_analyze += f" {article.content_summary}"
-
-                    texts.append(text_to_analyze)
-                    article_map[len(texts) - 1] = article
-
-                # Perform batch sentiment analysis
-                sentiment_results = await self.analyzer.analyze_batch(texts)
-
-                # Update articles and prepare return data
-                results = {}
-
-                for i, sentiment_result in enumerate(sentiment_results):
-                    article = article_map[i]
-
-                    # Update article
-                    article.sentiment_label = sentiment_result.label
-                    article.sentiment_score = sentiment_result.raw_score
-
-                    results[str(article.id)] = sentiment_result
-
-                await db.commit()
+                results = await self._analyze_and_store(db, list(articles))
 
                 logger.info(f"Updated sentiment for {len(results)} articles")
 
@@ -427,6 +488,10 @@ class SentimentService:
         """
         Analyze sentiment for articles that haven't been processed yet.
 
+        Articles are claimed with ``FOR UPDATE SKIP LOCKED`` and analyzed in
+        the claiming transaction, so concurrent runs work on disjoint
+        articles.
+
         Args:
             limit: Maximum number of articles to process
 
@@ -435,23 +500,23 @@ class SentimentService:
         """
         try:
             async with get_db() as db:
-                # Find articles without sentiment analysis
+                # Claim articles without sentiment analysis
                 result = await db.execute(
                     select(NewsArticle)
                     .where(NewsArticle.sentiment_label.is_(None))
                     .limit(limit)
+                    .with_for_update(skip_locked=True)
                 )
                 articles = result.scalars().all()
 
                 if not articles:
                     return 0
 
-                article_ids = [str(article.id) for article in articles]
+                results = await self._analyze_and_store(db, list(articles))
 
-                # Process in batch
-                await self.analyze_articles_batch(article_ids)
+                logger.info(f"Updated sentiment for {len(results)} articles")
 
-                return len(articles)
+                return len(results)
 
         except Exception as e:
             logger.error(f"Error analyzing unprocessed articles: {e}")
@@ -472,113 +537,63 @@ class SentimentService:
             granularity: 'daily' or 'hourly'
 
         Returns:
-            List of SentimentTimelinePoint objects
+            List of SentimentTimelinePoint objects (daily points cover whole
+            UTC days from the day ``days_back`` days ago)
         """
         try:
-            start_date = datetime.utcnow() - timedelta(days=days_back)
-
-            async with get_db() as db:
-                # Build base query
-                if ticker:
-                    # Stock-specific sentiment
-                    query = (
-                        select(NewsArticle)
-                        .join(StockNewsLink)
-                        .where(
-                            and_(
-                                StockNewsLink.ticker == ticker,
-                                NewsArticle.published_at >= start_date.isoformat(),
-                                NewsArticle.sentiment_label.isnot(None),
-                            )
-                        )
-                    )
-                else:
-                    # General market sentiment
-                    query = select(NewsArticle).where(
-                        and_(
-                            NewsArticle.published_at >= start_date.isoformat(),
-                            NewsArticle.sentiment_label.isnot(None),
-                        )
-                    )
-
-                result = await db.execute(query)
-                articles = result.scalars().all()
+            start_date = datetime.now(timezone.utc) - timedelta(days=days_back)
 
-                if not articles:
-                    return []
-
-                # Group articles by time period
-                timeline_data = {}
-
-                for article in articles:
-                    try:
-                        # Parse published date
-                        pub_date = datetime.fromisoformat(
-                            article.published_at.replace("Z", "+00:00")
-                        )
-                        pub_date = pub_date.replace(
-                            tzinfo=None
-                        )  # Remove timezone for consistency
-
-                        # Determine time bucket based on granularity
-                        if granularity == "hourly":
-                            time_bucket = pub_date.replace(
-                                minute=0, second=0, microsecond=0
-                            )
-                        else:  # daily
-                            time_bucket = pub_date.replace(
-                                hour=0, minute=0, second=0, microsecond=0
-                            )
-
-                        if time_bucket not in timeline_data:
-                            timeline_data[time_bucket] = {
-                                "positive": 0,
-                                "negative": 0,
-                                "neutral": 0,
-                                "sentiment_scores": [],
-                            }
-
-                        # Count sentiment labels
-                        timeline_data[time_bucket][article.sentiment_label] += 1
-
-                        # Collect sentiment scores for average calculation
-                        if article.sentiment_score is not None:
-                            timeline_data[time_bucket]["sentiment_scores"].append(
-                                float(article.sentiment_score)
-                            )
-
-                    except (ValueError, TypeError) as e:
-                        logger.warning(
-                            f"Error parsing date for article {article.id}: {e}"
-                        )
-                        continue
-
-                # Convert to timeline points
-                timeline_points = []
-
-                for date, data in sorted(timeline_data.items()):
-                    avg_sentiment = 0.0
-                    if data["sentiment_scores"]:
-                        avg_sentiment = sum(data["sentiment_scores"]) / len(
-                            data["sentiment_scores"]
-                        )
-
-                    total_articles = (
-                        data["positive"] + data["negative"] + data["neutral"]
+            if granularity != "hourly":
+                # Daily points come straight from the rollup, one row per day
+                async with get_db() as db:
+                    result = await db.execute(
+                        rollup_timeline_query(start_date.date(), ticker)
                     )
-
-                    timeline_point = SentimentTimelinePoint(
-                        date=date,
-                        positive_count=data["positive"],
-                        negative_count=data["negative"],
-                        neutral_count=data["neutral"],
-                        avg_sentiment_score=avg_sentiment,
-                        total_articles=total_articles,
+                    rollups = result.scalars().all()
+
+                return [
+                    SentimentTimelinePoint(
+                        date=datetime.combine(rollup.day, time.min),
+                        positive_count=rollup.positive_count,
+                        negative_count=rollup.negative_count,
+                        neutral_count=rollup.neutral_count,
+                        avg_sentiment_score=(
+                            float(rollup.score_sum) / rollup.score_count
+                            if rollup.score_count
+                            else 0.0
+                        ),
+                        total_articles=rollup.positive_count
+                        + rollup.negative_count
+                        + rollup.neutral_count,
                     )
+                    for rollup in rollups
+                    if rollup.positive_count
+                    or rollup.negative_count
+                    or rollup.neutral_count
+                ]
 
-                    timeline_points.append(timeline_point)
+            async with get_db() as db:
+                # Aggregated in the database: one row per hour
+                result = await db.execute(
+                    sentiment_timeline_query(start_date, ticker, granularity)
+                )
+                rows = result.all()
 
-                return timeline_points
+            return [
+                SentimentTimelinePoint(
+                    date=row.bucket,
+                    positive_count=row.positive_count,
+                    negative_count=row.negative_count,
+                    neutral_count=row.neutral_count,
+                    avg_sentiment_score=(
+                        float(row.avg_sentiment_score)
+                        if row.avg_sentiment_score is not None
+                        else 0.0
+                    ),
+                    total_articles=row.total_articles,
+                )
+                for row in rows
+            ]
 
         except Exception as e:
             logger.error(f"Error generating sentiment timeline: {e}")
@@ -598,34 +613,30 @@ class SentimentService:
             Dictionary with sentiment summary statistics
         """
         try:
-            start_date = datetime.utcnow() - timedelta(hours=hours_back)
+            start_date = datetime.now(timezone.utc) - timedelta(hours=hours_back)
 
-            async with get_db() as db:
-                # Build query
-                if ticker:
-                    query = (
-                        select(NewsArticle)
-                        .join(StockNewsLink)
-                        .where(
-                            and_(
-                                StockNewsLink.ticker == ticker,
-                                NewsArticle.published_at >= start_date.isoformat(),
-                                NewsArticle.sentiment_label.isnot(None),
-                            )
-                        )
-                    )
-                else:
-                    query = select(NewsArticle).where(
-                        and_(
-                            NewsArticle.published_at >= start_date.isoformat(),
-                            NewsArticle.sentiment_label.isnot(None),
-                        )
-                    )
-
-                result = await db.execute(query)
-                articles = result.scalars().all()
+            # The partial first day is aggregated from its articles and the
+            # whole days after it are read from the rollup
+            next_day = datetime.combine(
+                start_date.date() + timedelta(days=1), time.min, tzinfo=timezone.utc
+            )
 
-                if not articles:
+            async with get_db() as db:
+                result = await db.execute(
+                    sentiment_summary_query(start_date, ticker, end=next_day)
+                )
+                partial = result.one()
+                result = await db.execute(rollup_summary_query(next_day.date(), ticker))
+                rolled = result.one()
+
+                positive_count = partial.positive_count + int(rolled.positive_count)
+                negative_count = partial.negative_count + int(rolled.negative_count)
+                neutral_count = partial.neutral_count + int(rolled.neutral_count)
+                score_sum = float(partial.score_sum) + float(rolled.score_sum)
+                score_count = partial.score_count + int(rolled.score_count)
+
+                total_articles = positive_count + negative_count + neutral_count
+                if not total_articles:
                     return {
                         "total_articles": 0,
                         "positive_count": 0,
@@ -638,34 +649,12 @@ class SentimentService:
                         "sentiment_trend": "neutral",
                     }
 
-                # Calculate statistics
-                positive_count = sum(
-                    1 for a in articles if a.sentiment_label == "positive"
-                )
-                negative_count = sum(
-                    1 for a in articles if a.sentiment_label == "negative"
-                )
-                neutral_count = sum(
-                    1 for a in articles if a.sentiment_label == "neutral"
-                )
-                total_articles = len(articles)
-
                 # Calculate percentages
                 positive_pct = (positive_count / total_articles) * 100
                 negative_pct = (negative_count / total_articles) * 100
                 neutral_pct = (neutral_count / total_articles) * 100
 
-                # Calculate average sentiment score
-                sentiment_scores = [
-                    float(a.sentiment_score)
-                    for a in articles
-                    if a.sentiment_score is not None
-                ]
-                avg_sentiment = (
-                    sum(sentiment_scores) / len(sentiment_scores)
-                    if sentiment_scores
-                    else 0.0
-                )
+                avg_sentiment = score_sum / score_count if score_count else 0.0
 
                 # Determine overall trend
                 if positive_count > negative_count and positive_pct > 40:
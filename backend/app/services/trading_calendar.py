@@ -0,0 +1,139 @@
+"""
+Tokyo Stock Exchange trading calendar.
+
+Trading days are enumerated from Japanese national holidays computed from
+the statutory rules, without an external calendar service.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterator, List, Optional, Set, Tuple
+
+from ..core.holidays import japanese_holidays
+
+JST = timezone(timedelta(hours=9))
+
+# End of the TSE closing auction (Japan time)
+TSE_CLOSE = time(15, 30)
+
+
+def is_trading_day(day: date) -> bool:
+    """
+    Check whether the TSE is open on a day.
+
+    The exchange is closed on weekends, national holidays and the year-end
+    break (December 31 - January 3).
+
+    Args:
+        day: Date to check
+
+    Returns:
+        True if it is a trading day
+    """
+    if day.weekday() >= 5:
+        return False
+    if (day.month == 12 and day.day == 31) or (day.month == 1 and day.day <= 3):
+        return False
+    return day not in japanese_holidays(day.year)
+
+
+def last_completed_session(now: Optional[datetime] = None) -> date:
+    """
+    Get the most recent trading day whose session has closed.
+
+    Args:
+        now: Current time (naive values are UTC; default: now)
+
+    Returns:
+        Today (Japan time) once the close has passed on a trading day,
+        otherwise the previous trading day
+    """
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    local = now.astimezone(JST)
+
+    day = local.date()
+    if is_trading_day(day) and local.time() >= TSE_CLOSE:
+        return day
+    day -= timedelta(days=1)
+    while not is_trading_day(day):
+        day -= timedelta(days=1)
+    return day
+
+
+def iter_trading_days(start: date, end: date) -> Iterator[date]:
+    """
+    Iterate over trading days in an inclusive date range.
+
+    Args:
+        start: First date
+        end: Last date
+
+    Yields:
+        Trading days in ascending order
+    """
+    day = start
+    while day <= end:
+        if is_trading_day(day):
+            yield day
+        day += timedelta(days=1)
+
+
+def trading_days(start: date, end: date) -> List[date]:
+    """
+    Get trading days in an inclusive date range.
+
+    Args:
+        start: First date
+        end: Last date
+
+    Returns:
+        Trading days in ascending order
+    """
+    return list(iter_trading_days(start, end))
+
+
+def missing_trading_ranges(
+    start: date,
+    end: date,
+    existing: Set[date],
+    merge_gap: int = 0,
+) -> List[Tuple[date, date]]:
+    """
+    Find the trading-day ranges in ``[start, end]`` that are not in ``existing``.
+
+    Consecutive missing trading days form one range. Ranges separated by at
+    most ``merge_gap`` present trading days are merged, trading a few
+    redundant rows for fewer upstream requests.
+
+    Args:
+        start: First date
+        end: Last date
+        existing: Dates that already have data
+        merge_gap: Maximum number of present trading days to bridge
+
+    Returns:
+        List of inclusive (start, end) ranges in ascending order
+    """
+    ranges: List[Tuple[date, date]] = []
+    range_start = None
+    range_end = None
+    present_run = 0
+
+    for day in iter_trading_days(start, end):
+        if day in existing:
+            present_run += 1
+            continue
+
+        if range_start is not None and present_run <= merge_gap:
+            range_end = day
+        else:
+            if range_start is not None:
+                ranges.append((range_start, range_end))
+            range_start = range_end = day
+        present_run = 0
+
+    if range_start is not None:
+        ranges.append((range_start, range_end))
+
+    return ranges
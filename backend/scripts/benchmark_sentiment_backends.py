@@ -0,0 +1,131 @@
+"""
+Compare the PyTorch and quantized ONNX Runtime sentiment backends.
+
+Exports the model if needed, runs both backends on the same headlines and
+reports label agreement, score drift and CPU throughput. Exits non-zero when
+the label agreement is below --min-agreement, so it can gate enabling
+SENTIMENT_BACKEND=onnx.
+
+Usage:
+    python scripts/benchmark_sentiment_backends.py --export
+    python scripts/benchmark_sentiment_backends.py --texts headlines.txt --threads 4
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.sentiment_onnx import (
+    benchmark_predict,
+    compare_predictions,
+    export_quantized_model,
+    load_onnx_pipeline,
+    onnx_model_exists,
+)
+
+MODEL_NAME = "nlp-waseda/roberta-base-japanese-sentiment"
+
+SAMPLE_TEXTS = [
+    "トヨタ自動車、通期業績予想を上方修正 純利益は過去最高に",
+    "ソニーグループ、半導体事業の減損で最終赤字に転落",
+    "日銀、金融政策の現状維持を決定",
+    "任天堂、新型ゲーム機の販売が好調 株価は年初来高値",
+    "三菱UFJ、システム障害でATMが一時停止",
+    "ソフトバンクグループ、保有株の売却で巨額の評価益",
+    "円相場、一時1ドル=150円台に下落 輸入物価の上昇懸念",
+    "キーエンス、四半期決算は市場予想をやや下回る",
+    "ファーストリテイリング、海外ユニクロ事業が増収増益",
+    "武田薬品、主力薬の特許切れで売上高が減少",
+    "日経平均株価、終値は前日比小幅に反落",
+    "東京エレクトロン、生成AI向け需要で受注残が拡大",
+]
+
+
+def load_texts(path: str, limit: int) -> list:
+    """Load one text per line, falling back to the built-in headlines."""
+    if not path:
+        texts = SAMPLE_TEXTS
+    else:
+        with open(path, encoding="utf-8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+    return texts[:limit] if limit else texts
+
+
+def load_torch_pipeline(batch_size: int, max_length: int, threads: int):
+    """Load the reference transformers pipeline on CPU."""
+    import torch
+    from transformers import pipeline
+
+    torch.set_num_threads(threads)
+    return pipeline(
+        "sentiment-analysis",
+        model=MODEL_NAME,
+        device=-1,
+        batch_size=batch_size,
+        max_length=max_length,
+        truncation=True,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model-dir", default="models/sentiment-onnx")
+    parser.add_argument("--texts", help="File with one text per line")
+    parser.add_argument("--limit", type=int, default=0)
+    parser.add_argument("--export", action="store_true", help="Re-export the model")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--max-length", type=int, default=512)
+    parser.add_argument(
+        "--threads", type=int, default=max(1, (os.cpu_count() or 2) // 2)
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--min-agreement", type=float, default=0.98)
+    args = parser.parse_args()
+
+    if args.export or not onnx_model_exists(args.model_dir):
+        export_quantized_model(MODEL_NAME, args.model_dir, args.max_length)
+
+    texts = load_texts(args.texts, args.limit)
+    torch_pipeline = load_torch_pipeline(args.batch_size, args.max_length, args.threads)
+    onnx_pipeline = load_onnx_pipeline(
+        args.model_dir,
+        max_length=args.max_length,
+        batch_size=args.batch_size,
+        intra_op_threads=args.threads,
+    )
+
+    parity = compare_predictions(torch_pipeline(texts), onnx_pipeline(texts))
+    report = {
+        "texts": len(texts),
+        "threads": args.threads,
+        "parity": parity,
+        "torch": benchmark_predict(
+            torch_pipeline, texts, args.batch_size, repeats=args.repeats
+        ),
+        "onnx_int8": benchmark_predict(
+            onnx_pipeline, texts, args.batch_size, repeats=args.repeats
+        ),
+    }
+    torch_tps = report["torch"]["texts_per_second"]
+    onnx_tps = report["onnx_int8"]["texts_per_second"]
+    if torch_tps and onnx_tps:
+        report["speedup"] = onnx_tps / torch_tps
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if parity["label_agreement"] < args.min_agreement:
+        print(
+            f"Label agreement {parity['label_agreement']:.3f} is below "
+            f"{args.min_agreement:.3f}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
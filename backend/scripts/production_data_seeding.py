@@ -36,6 +36,8 @@ from app.adapters.yahoo_finance_adapter import YahooFinanceJapanAdapter
 from app.adapters.edinet_adapter import EDINETAdapter
 from app.adapters.news_adapter import NewsDataAdapter
 from app.services.ai_analysis_service import AIAnalysisService
+from app.services.price_backfill_service import PriceBackfillService
+from app.services.trading_calendar import last_completed_session
 from app.services.news_service import NewsService
 from app.services.sentiment_service import SentimentService
 
@@ -200,7 +202,7 @@ class ProductionDataSeeder:
                 plans_created = await self._create_subscription_plans(db)
                 
                 # 3. Populate initial price data for priority stocks
-                price_records = await self._populate_initial_price_data(db)
+                price_records = await self._populate_initial_price_data()
                 
                 # 4. Create daily metrics for priority stocks
                 metrics_created = await self._create_daily_metrics(db)
@@ -332,66 +334,37 @@ class ProductionDataSeeder:
         db.commit()
         return len(plans)
     
-    async def _populate_initial_price_data(self, db: Session) -> int:
+    async def _populate_initial_price_data(self) -> int:
         """Populate initial price data for priority stocks."""
-        price_records = 0
-        
         # Only populate for priority 1 stocks to avoid excessive API calls
-        priority_stocks = [s for s in self.production_stocks if s.get("priority", 2) == 1]
-        
-        for stock_data in priority_stocks:
-            ticker = stock_data["ticker"]
-            
-            # Check if price data already exists
-            existing_data = db.query(StockPriceHistory).filter(
-                StockPriceHistory.ticker == ticker
-            ).first()
-            
-            if existing_data:
-                logger.info(f"Price data for {ticker} already exists, skipping...")
-                continue
-            
-            try:
-                # Try to get real price data from Yahoo Finance (free)
-                yahoo_adapter = YahooFinanceJapanAdapter(config={})
-                
-                # Get last 30 days of data
-                end_date = datetime.utcnow()
-                start_date = end_date - timedelta(days=30)
-                
-                historical_data = await yahoo_adapter.get_historical_prices(
-                    symbol=ticker,
-                    start_date=start_date,
-                    end_date=end_date,
-                    interval="1d"
-                )
-                
-                # Insert price data
-                for price_data in historical_data:
-                    price_record = StockPriceHistory(
-                        ticker=ticker,
-                        date=datetime.fromisoformat(price_data["date"].replace("Z", "+00:00")).date(),
-                        open=price_data["open"],
-                        high=price_data["high"],
-                        low=price_data["low"],
-                        close=price_data["close"],
-                        volume=price_data["volume"],
-                        adjusted_close=price_data["adjusted_close"]
-                    )
-                    db.add(price_record)
-                    price_records += 1
-                
-                logger.info(f"Added {len(historical_data)} price records for {ticker}")
-                
-                # Close adapter session
-                await yahoo_adapter._close_session()
-                
-            except Exception as e:
-                logger.warning(f"Failed to get price data for {ticker}: {e}")
-                continue
-        
-        db.commit()
-        return price_records
+        priority_tickers = [
+            s["ticker"] for s in self.production_stocks if s.get("priority", 2) == 1
+        ]
+
+        # Only trading days missing from the database are fetched, so re-runs
+        # fill gaps instead of skipping tickers that already have any rows
+        end_date = last_completed_session()
+        start_date = end_date - timedelta(days=30)
+
+        async with AsyncSessionLocal() as async_db:
+            backfill_service = PriceBackfillService(
+                async_db,
+                checkpoint_path=str(
+                    Path(__file__).parent / ".price_backfill_checkpoint.json"
+                ),
+            )
+            result = await backfill_service.backfill(
+                tickers=priority_tickers, start=start_date, end=end_date
+            )
+
+        for ticker, error in result.failed_tickers.items():
+            logger.warning(f"Failed to get price data for {ticker}: {error}")
+
+        logger.info(
+            f"Added {result.rows_inserted} price records for "
+            f"{result.tickers_processed} stocks ({result.ranges_fetched} ranges fetched)"
+        )
+        return result.rows_inserted
     
     async def _create_daily_metrics(self, db: Session) -> int:
         """Create daily metrics for priority stocks."""
@@ -70,6 +70,11 @@ class TestCacheKeyBuilder:
         key = CacheKeyBuilder.build_market_data_key("nikkei", "indices")
         assert key == "market_data:nikkei:indices"
 
+    def test_build_sentiment_key(self):
+        """Test sentiment result key building."""
+        key = CacheKeyBuilder.build_sentiment_key("model:torch", "abc123")
+        assert key == "sentiment:model:torch:abc123"
+
 
 class TestCacheTTLPolicy:
     """Test TTL policy functionality."""
@@ -103,6 +108,61 @@ class TestCacheTTLPolicy:
         assert ttl == 3600  # Default 1 hour
 
 
+class TestRedisCacheMultiKey:
+    """Test multi-key Redis cache operations."""
+
+    @staticmethod
+    def _connected_cache(client):
+        cache = RedisCache("redis://localhost:6379")
+        cache._client = client
+        cache._connected = True
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_get_many_uses_single_mget(self):
+        """Test several keys are fetched in one MGET."""
+        client = AsyncMock()
+        client.mget.return_value = [
+            json.dumps({"label": "positive"}).encode("utf-8"),
+            None,
+        ]
+        cache = self._connected_cache(client)
+
+        result = await cache.get_many(["a", "b"])
+
+        assert result == [{"label": "positive"}, None]
+        client.mget.assert_called_once_with(["a", "b"])
+        assert await cache.get_many([]) == []
+
+        client.mget.side_effect = ConnectionError("Redis connection lost")
+        with pytest.raises(ConnectionError):
+            await cache.get_many(["a", "b"])
+
+    @pytest.mark.asyncio
+    async def test_set_many_pipelines_writes(self):
+        """Test several keys are written in one pipeline with the policy TTL."""
+        client = MagicMock()
+        pipe = AsyncMock()
+        pipe.execute.return_value = [True, True]
+        pipe.__aenter__.return_value = pipe
+        client.pipeline.return_value = pipe
+        cache = self._connected_cache(client)
+
+        result = await cache.set_many(
+            {"a": {"label": "positive"}, "b": {"label": "negative"}},
+            key_type=CacheKeyType.SENTIMENT,
+        )
+
+        assert result is True
+        client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.setex.call_count == 2
+        assert pipe.setex.call_args[0][1] == 2592000
+
+        pipe.execute.side_effect = ConnectionError("Redis connection lost")
+        with pytest.raises(ConnectionError):
+            await cache.set_many({"a": {"label": "positive"}})
+
+
 @pytest.fixture
 async def mock_redis_client():
     """Create a mock Redis client."""
@@ -16,6 +16,12 @@ from app.adapters import (
     DataSourceUnavailableError,
     RateLimitExceededError
 )
+from app.adapters.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitState
+)
+from app.adapters.latency import LatencyTracker
 
 
 class TestDataSourceRegistry:
@@ -294,8 +300,7 @@ class TestDataSourceRegistry:
         registry.register_adapter(mock_stock_adapter)
         
         # Manually open circuit breaker
-        registry._circuit_breaker_state["test_stock"] = True
-        registry._circuit_breaker_reset_time["test_stock"] = datetime.utcnow() + timedelta(minutes=5)
+        registry._get_circuit_breaker("test_stock").force_open()
         
         assert registry._is_circuit_breaker_open("test_stock")
         
@@ -328,6 +333,289 @@ class TestDataSourceRegistry:
         # Circuit breaker should not be open
         assert not registry._is_circuit_breaker_open("test")
     
+    @pytest.mark.asyncio
+    async def test_execute_with_failover_coalesces_identical_requests(self, registry, mock_stock_adapter):
+        """Test concurrent identical requests share one upstream call."""
+        mock_stock_adapter._last_health_check = HealthCheck(
+            status=HealthStatus.HEALTHY,
+            response_time_ms=100,
+            last_check=datetime.utcnow()
+        )
+        mock_stock_adapter.set_response_delay(0.05)
+        registry.register_adapter(mock_stock_adapter)
+        
+        async def operation(adapter):
+            return await adapter.get_current_price("7203")
+        
+        key = registry.make_request_key("get_current_price", " 7203 ")
+        results = await asyncio.gather(*[
+            registry.execute_with_failover(
+                DataSourceType.STOCK_PRICE, operation, request_key=key
+            )
+            for _ in range(10)
+        ])
+        
+        assert mock_stock_adapter._request_count == 1
+        assert all(result == results[0] for result in results)
+        
+        stats = registry.get_coalescing_stats()["get_current_price"]
+        assert stats["requests"] == 10
+        assert stats["coalesced"] == 9
+        assert stats["coalescing_ratio"] == 0.9
+        assert registry.get_registry_status()["request_coalescing"]["inflight_requests"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_execute_with_failover_coalesced_results_are_independent(self, registry, mock_stock_adapter):
+        """Test a caller modifying its result does not affect coalesced callers."""
+        mock_stock_adapter._last_health_check = HealthCheck(
+            status=HealthStatus.HEALTHY,
+            response_time_ms=100,
+            last_check=datetime.utcnow()
+        )
+        mock_stock_adapter.set_response_delay(0.05)
+        registry.register_adapter(mock_stock_adapter)
+        
+        async def operation(adapter):
+            return await adapter.get_current_price("7203")
+        
+        key = registry.make_request_key("get_current_price", "7203")
+        
+        async def mutating_caller():
+            result = await registry.execute_with_failover(
+                DataSourceType.STOCK_PRICE, operation, request_key=key
+            )
+            result["price"] = -1
+            return result
+        
+        first, second = await asyncio.gather(
+            mutating_caller(),
+            registry.execute_with_failover(
+                DataSourceType.STOCK_PRICE, operation, request_key=key
+            ),
+        )
+        
+        assert mock_stock_adapter._request_count == 1
+        assert first["price"] == -1
+        assert second["price"] != -1
+    
+    @pytest.mark.asyncio
+    async def test_execute_with_failover_coalescing_disabled_per_operation(self, registry, mock_stock_adapter):
+        """Test coalescing can be turned off for a single operation."""
+        mock_stock_adapter._last_health_check = HealthCheck(
+            status=HealthStatus.HEALTHY,
+            response_time_ms=100,
+            last_check=datetime.utcnow()
+        )
+        mock_stock_adapter.set_response_delay(0.01)
+        registry.register_adapter(mock_stock_adapter)
+        registry.set_request_coalescing(False, "get_current_price")
+        
+        async def operation(adapter):
+            return await adapter.get_current_price("7203")
+        
+        key = registry.make_request_key("get_current_price", "7203")
+        await asyncio.gather(*[
+            registry.execute_with_failover(
+                DataSourceType.STOCK_PRICE, operation, request_key=key
+            )
+            for _ in range(3)
+        ])
+        
+        assert mock_stock_adapter._request_count == 3
+        assert registry.is_request_coalescing_enabled("search_symbols")
+    
+    @pytest.mark.asyncio
+    async def test_execute_with_failover_coalesced_error_propagates(self, registry, mock_stock_adapter):
+        """Test all coalesced callers receive the shared failure."""
+        mock_stock_adapter._last_health_check = HealthCheck(
+            status=HealthStatus.HEALTHY,
+            response_time_ms=100,
+            last_check=datetime.utcnow()
+        )
+        mock_stock_adapter.set_response_delay(0.01)
+        mock_stock_adapter.force_failure(True)
+        registry.register_adapter(mock_stock_adapter)
+        
+        async def operation(adapter):
+            return await adapter.get_current_price("7203")
+        
+        key = registry.make_request_key("get_current_price", "7203")
+        results = await asyncio.gather(*[
+            registry.execute_with_failover(
+                DataSourceType.STOCK_PRICE, operation, request_key=key
+            )
+            for _ in range(3)
+        ], return_exceptions=True)
+        
+        assert all(isinstance(r, DataSourceUnavailableError) for r in results)
+        assert mock_stock_adapter._request_count == 1
+    
+    def test_get_healthy_adapters_latency_routing(self, registry):
+        """Test adapters are ordered by expected latency once measured."""
+        fast = MockStockPriceAdapter("fast", priority=20)
+        slow = MockStockPriceAdapter("slow", priority=10)
+        for adapter in [fast, slow]:
+            adapter._last_health_check = HealthCheck(
+                status=HealthStatus.HEALTHY,
+                response_time_ms=100,
+                last_check=datetime.utcnow()
+            )
+            registry.register_adapter(adapter)
+        
+        # Without samples, static priority decides
+        assert registry.get_primary_adapter(DataSourceType.STOCK_PRICE) == slow
+        
+        for _ in range(30):
+            registry._latency_trackers["slow"].record(800)
+            registry._latency_trackers["fast"].record(40)
+        
+        assert registry.get_primary_adapter(DataSourceType.STOCK_PRICE) == fast
+        
+        registry.disable_latency_routing()
+        assert registry.get_primary_adapter(DataSourceType.STOCK_PRICE) == slow
+    
+    @pytest.mark.asyncio
+    async def test_execute_with_failover_hedged_request(self, registry):
+        """Test a slow primary is hedged to the next adapter and cancelled."""
+        primary = MockStockPriceAdapter("primary", priority=10)
+        backup = MockStockPriceAdapter("backup", priority=20)
+        for adapter in [primary, backup]:
+            adapter._last_health_check = HealthCheck(
+                status=HealthStatus.HEALTHY,
+                response_time_ms=100,
+                last_check=datetime.utcnow()
+            )
+            registry.register_adapter(adapter)
+        
+        # Primary normally answers in ~10ms, backup has no history
+        for _ in range(30):
+            registry._latency_trackers["primary"].record(10)
+        registry.disable_latency_routing()
+        registry.enable_hedging(min_delay_ms=10)
+        primary.set_response_delay(1.0)
+        
+        async def operation(adapter):
+            result = await adapter.get_current_price("7203")
+            result["source"] = adapter.name
+            return result
+        
+        start_time = datetime.utcnow()
+        result = await registry.execute_with_failover(
+            DataSourceType.STOCK_PRICE, operation
+        )
+        elapsed = (datetime.utcnow() - start_time).total_seconds()
+        
+        assert result["source"] == "backup"
+        assert elapsed < 0.5
+        routing = registry.get_registry_status()["routing"]
+        assert routing["hedged_requests"] == 1
+        assert routing["hedge_wins"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_hedged_request_cancelled_during_hedge_delay(self, registry):
+        """Test cancelling the caller before the hedge also cancels the primary."""
+        primary = MockStockPriceAdapter("primary", priority=10)
+        backup = MockStockPriceAdapter("backup", priority=20)
+        for adapter in [primary, backup]:
+            registry.register_adapter(adapter)
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+        
+        async def operation(adapter):
+            started.set()
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        
+        caller = asyncio.create_task(
+            registry._execute_hedged(primary, backup, operation, 1.0, [])
+        )
+        await started.wait()
+        caller.cancel()
+        
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert cancelled.is_set()
+    
+    @pytest.mark.asyncio
+    async def test_execute_with_failover_no_hedge_when_fast(self, registry):
+        """Test no hedge is sent when the primary answers within its p95."""
+        primary = MockStockPriceAdapter("primary", priority=10)
+        backup = MockStockPriceAdapter("backup", priority=20)
+        for adapter in [primary, backup]:
+            adapter._last_health_check = HealthCheck(
+                status=HealthStatus.HEALTHY,
+                response_time_ms=100,
+                last_check=datetime.utcnow()
+            )
+            registry.register_adapter(adapter)
+        
+        for _ in range(30):
+            registry._latency_trackers["primary"].record(500)
+        registry.enable_hedging()
+        
+        async def operation(adapter):
+            return await adapter.get_current_price("7203")
+        
+        await registry.execute_with_failover(DataSourceType.STOCK_PRICE, operation)
+        
+        assert primary._request_count == 1
+        assert backup._request_count == 0
+        assert registry.get_registry_status()["routing"]["hedged_requests"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_half_open_probe(self, registry, mock_stock_adapter):
+        """Test an open breaker admits a probe after its timeout and closes on success."""
+        mock_stock_adapter._last_health_check = HealthCheck(
+            status=HealthStatus.HEALTHY,
+            response_time_ms=100,
+            last_check=datetime.utcnow()
+        )
+        registry.register_adapter(mock_stock_adapter)
+        registry.configure_circuit_breakers(
+            CircuitBreakerConfig(open_timeout_seconds=0.05, half_open_max_probes=1)
+        )
+        breaker = registry._get_circuit_breaker("test_stock")
+        breaker.force_open()
+        
+        assert registry.get_healthy_adapters(DataSourceType.STOCK_PRICE) == []
+        
+        await asyncio.sleep(0.06)
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert registry.get_healthy_adapters(DataSourceType.STOCK_PRICE) == [mock_stock_adapter]
+        
+        async def operation(adapter):
+            return await adapter.get_current_price("TEST")
+        
+        await registry.execute_with_failover(DataSourceType.STOCK_PRICE, operation)
+        
+        assert breaker.state == CircuitState.CLOSED
+    
+    @pytest.mark.asyncio
+    async def test_check_all_adapters_health_timeout(self, registry):
+        """Test health checks run concurrently and time out individually."""
+        slow = MockStockPriceAdapter("slow", priority=10)
+        fast = MockStockPriceAdapter("fast", priority=20)
+        registry.register_adapter(slow)
+        registry.register_adapter(fast)
+        registry._health_check_timeout = 0.05
+        
+        async def hanging_health_check():
+            await asyncio.sleep(1)
+        
+        slow.health_check = hanging_health_check
+        
+        start_time = datetime.utcnow()
+        await registry._check_all_adapters_health()
+        elapsed = (datetime.utcnow() - start_time).total_seconds()
+        
+        assert elapsed < 0.5
+        assert slow._last_health_check.status == HealthStatus.UNHEALTHY
+        assert "timed out" in slow._last_health_check.error_message
+        assert fast._last_health_check.status == HealthStatus.HEALTHY
+    
     def test_enable_disable_failover(self, registry):
         """Test enabling and disabling failover."""
         assert registry._failover_enabled is True
@@ -371,6 +659,188 @@ class TestDataSourceRegistry:
         assert adapter_status["response_time_ms"] == 150
 
 
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+    
+    @pytest.fixture
+    def clock(self):
+        """Controllable monotonic clock."""
+        class Clock:
+            now = 1000.0
+            
+            def __call__(self):
+                return self.now
+        
+        return Clock()
+    
+    @pytest.fixture
+    def breaker(self, clock):
+        """Create a circuit breaker with a fake clock."""
+        config = CircuitBreakerConfig(
+            failure_rate_threshold=0.5,
+            slow_call_rate_threshold=0.5,
+            slow_call_duration_ms=1000,
+            window_seconds=60,
+            minimum_calls=4,
+            open_timeout_seconds=30,
+            half_open_max_probes=2
+        )
+        return CircuitBreaker("test", config, clock=clock)
+    
+    def test_opens_on_failure_rate(self, breaker):
+        """Test breaker opens once the failure rate crosses the threshold."""
+        breaker.record_success(10)
+        breaker.record_success(10)
+        breaker.record_failure(10)
+        assert breaker.state == CircuitState.CLOSED  # Below minimum calls
+        
+        breaker.record_failure(10)
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.try_acquire()
+    
+    def test_stays_closed_below_threshold(self, breaker):
+        """Test occasional failures do not open the breaker."""
+        for _ in range(9):
+            breaker.record_success(10)
+        breaker.record_failure(10)
+        
+        assert breaker.state == CircuitState.CLOSED
+    
+    def test_opens_on_slow_call_rate(self, breaker):
+        """Test breaker opens when too many calls are slow."""
+        for _ in range(2):
+            breaker.record_success(10)
+        for _ in range(2):
+            breaker.record_success(5000)
+        
+        assert breaker.state == CircuitState.OPEN
+    
+    def test_rolling_window_expires_old_calls(self, breaker, clock):
+        """Test outcomes older than the window are forgotten."""
+        for _ in range(3):
+            breaker.record_failure(10)
+        clock.now += 120
+        breaker.record_failure(10)
+        
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.get_status()["calls_in_window"] == 1
+    
+    def test_half_open_limits_probes_and_closes(self, breaker, clock):
+        """Test half-open admits a limited number of probes."""
+        breaker.force_open()
+        assert breaker.state == CircuitState.OPEN
+        
+        clock.now += 31
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.try_acquire()
+        assert breaker.try_acquire()
+        assert not breaker.try_acquire()  # Probe slots exhausted
+        assert not breaker.is_call_permitted()
+        
+        breaker.record_success(10)
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.record_success(10)
+        assert breaker.state == CircuitState.CLOSED
+    
+    def test_half_open_failed_probe_reopens(self, breaker, clock):
+        """Test a failed probe sends the breaker back to open."""
+        breaker.force_open()
+        clock.now += 31
+        
+        assert breaker.try_acquire()
+        breaker.record_failure(10)
+        
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.get_status()["reset_time"] is not None
+    
+    def test_half_open_released_probe_frees_slot(self, breaker, clock):
+        """Test a cancelled probe returns its slot."""
+        breaker.force_open()
+        clock.now += 31
+        
+        assert breaker.try_acquire()
+        assert breaker.try_acquire()
+        breaker.release()
+        
+        assert breaker.try_acquire()
+
+    
+    def test_late_outcomes_while_open_are_ignored(self, breaker, clock):
+        """Test calls finishing after the breaker opened do not re-arm it."""
+        for _ in range(4):
+            breaker.record_failure(10)
+        assert breaker.state == CircuitState.OPEN
+        reset_time = breaker.get_status()["reset_time"]
+        
+        clock.now += 20
+        breaker.record_failure(10)
+        breaker.record_success(10)
+        assert breaker.get_status()["reset_time"] == reset_time
+        
+        clock.now += 11
+        assert breaker.state == CircuitState.HALF_OPEN
+    
+    def test_late_outcome_is_not_a_probe(self, breaker, clock):
+        """Test a late outcome while half-open does not count as a probe."""
+        breaker.force_open()
+        clock.now += 31
+        assert breaker.state == CircuitState.HALF_OPEN
+        
+        breaker.record_failure(10)
+        assert breaker.state == CircuitState.HALF_OPEN
+        
+        assert breaker.try_acquire()
+        breaker.record_success(10)
+        assert breaker.get_status()["probe_successes"] == 1
+
+
+class TestLatencyTracker:
+    """Test cases for LatencyTracker."""
+    
+    def test_empty_tracker(self):
+        """Test tracker without samples."""
+        tracker = LatencyTracker()
+        
+        assert tracker.sample_count == 0
+        assert tracker.ewma_ms is None
+        assert tracker.percentile(95) is None
+    
+    def test_ewma(self):
+        """Test EWMA moves towards recent samples."""
+        tracker = LatencyTracker(alpha=0.5)
+        tracker.record(100)
+        tracker.record(200)
+        
+        assert tracker.ewma_ms == 150
+    
+    def test_percentiles(self):
+        """Test percentile estimates from the histogram."""
+        tracker = LatencyTracker()
+        for _ in range(95):
+            tracker.record(20)
+        for _ in range(5):
+            tracker.record(2000)
+        
+        assert 10 <= tracker.percentile(50) <= 25
+        assert tracker.percentile(95) <= 25
+        assert 1500 <= tracker.percentile(99) <= 2500
+        
+        stats = tracker.get_stats()
+        assert stats["samples"] == 100
+        assert stats["max_ms"] == 2000
+    
+    def test_histogram_aging(self):
+        """Test old observations are halved away."""
+        tracker = LatencyTracker(max_samples=100)
+        for _ in range(100):
+            tracker.record(20)
+        for _ in range(100):
+            tracker.record(3000)
+        
+        assert tracker.percentile(50) > 1000
+        assert tracker.sample_count == 200
+
+
 class TestMockStockPriceAdapter:
     """Test cases for MockStockPriceAdapter."""
     
@@ -508,6 +978,33 @@ class TestMockStockPriceAdapter:
         
         with pytest.raises(DataSourceError):
             await adapter.get_current_price("TEST")
+    
+    @pytest.mark.asyncio
+    async def test_get_current_prices(self, adapter):
+        """Test bulk price lookup via the default per-symbol implementation."""
+        result = await adapter.get_current_prices(["7203.T", "6758.T", "7203.T"])
+        
+        assert set(result.quotes) == {"7203.T", "6758.T"}
+        assert result.is_complete
+        assert adapter._request_count == 2  # Duplicates fetched once
+    
+    @pytest.mark.asyncio
+    async def test_get_current_prices_partial_failure(self, adapter):
+        """Test bulk price lookup reports per-symbol errors."""
+        original = adapter.get_current_price
+        
+        async def flaky_get_current_price(symbol):
+            if symbol == "BAD":
+                raise DataSourceError("Symbol not found")
+            return await original(symbol)
+        
+        adapter.get_current_price = flaky_get_current_price
+        
+        result = await adapter.get_current_prices(["7203.T", "BAD"])
+        
+        assert set(result.quotes) == {"7203.T"}
+        assert result.errors == {"BAD": "Symbol not found"}
+        assert not result.is_complete
 
 
 class TestMockFinancialDataAdapter:
@@ -0,0 +1,127 @@
+"""Tests for the EDINET document store."""
+
+import io
+import zipfile
+
+import pytest
+
+from app.adapters.document_store import DocumentStore, open_mapped
+
+
+def _zip(payload: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr("XBRL/PublicDoc/doc.xbrl", payload)
+    return buffer.getvalue()
+
+
+class TestDocumentStore:
+    """Test cases for DocumentStore."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test stored documents can be found by doc_id."""
+        store = DocumentStore(str(tmp_path))
+        content = _zip("a")
+
+        path = store.put("S100AAAA", content)
+
+        assert store.get_path("S100AAAA") == path
+        assert store.get_path("S100BBBB") is None
+        with open(path, "rb") as f:
+            assert f.read() == content
+        stats = store.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_content_addressed_deduplication(self, tmp_path):
+        """Test identical content is stored once."""
+        store = DocumentStore(str(tmp_path))
+        content = _zip("same")
+
+        first = store.put("S100AAAA", content)
+        second = store.put("S100BBBB", content)
+
+        assert first == second
+        assert store.get_stats()["blobs"] == 1
+        assert store.get_stats()["documents"] == 2
+        assert store.get_stats()["total_bytes"] == len(content)
+
+    def test_lru_eviction(self, tmp_path):
+        """Test least recently used documents are evicted over the size limit."""
+        documents = {f"S100000{i}": _zip(f"document {i}") for i in range(3)}
+        size = len(documents["S1000000"])
+        store = DocumentStore(str(tmp_path), max_bytes=size * 2)
+
+        store.put("S1000000", documents["S1000000"])
+        store.put("S1000001", documents["S1000001"])
+        store.get_path("S1000000")  # Most recently used now
+        store.put("S1000002", documents["S1000002"])
+
+        assert store.get_path("S1000001") is None
+        assert store.get_path("S1000000") is not None
+        assert store.get_path("S1000002") is not None
+        assert store.get_stats()["evictions"] == 1
+
+    def test_pinned_documents_are_not_evicted(self, tmp_path):
+        """Test a pinned document survives eviction until it is unpinned."""
+        documents = {f"S100000{i}": _zip(f"document {i}") for i in range(3)}
+        size = len(documents["S1000000"])
+        store = DocumentStore(str(tmp_path), max_bytes=size * 2)
+
+        pinned_path = store.put("S1000000", documents["S1000000"], pin=True)
+        store.put("S1000001", documents["S1000001"])
+        store.put("S1000002", documents["S1000002"])
+
+        assert store.get_path("S1000000") == pinned_path
+        assert store.get_path("S1000001") is None
+        assert store.get_stats()["pinned"] == 1
+
+        store.get_path("S1000002")
+        store.put("S1000003", _zip("document 3"))
+        assert store.get_stats()["evictions"] == 2
+        assert store.get_stats()["pinned"] == 1
+
+        store.unpin("S1000000")
+        store.put("S1000004", _zip("document 4"))
+        assert store.get_path("S1000000") is None
+        assert store.get_stats()["pinned"] == 0
+
+    def test_index_survives_restart(self, tmp_path):
+        """Test a new store instance finds existing documents."""
+        DocumentStore(str(tmp_path)).put("S100AAAA", _zip("a"))
+
+        reopened = DocumentStore(str(tmp_path))
+
+        assert reopened.get_path("S100AAAA") is not None
+        assert reopened.get_stats()["documents"] == 1
+
+    def test_parsed_results(self, tmp_path):
+        """Test parse results are stored per parser version."""
+        store = DocumentStore(str(tmp_path))
+        store.put("S100AAAA", _zip("a"))
+
+        store.put_parsed(
+            "S100AAAA", "1", {"income_statement": {"revenue": {"value": 1.0}}}
+        )
+
+        assert (
+            store.get_parsed("S100AAAA", "1")["income_statement"]["revenue"]["value"]
+            == 1.0
+        )
+        assert store.get_parsed("S100AAAA", "2") is None
+        assert store.get_parsed("S100BBBB", "1") is None
+
+    def test_rejects_unsafe_doc_ids(self, tmp_path):
+        """Test doc IDs cannot escape the store directory."""
+        store = DocumentStore(str(tmp_path))
+
+        with pytest.raises(ValueError):
+            store.put("../etc", b"x")
+
+    def test_open_mapped_reads_zip(self, tmp_path):
+        """Test memory-mapped files can be read by zipfile."""
+        path = DocumentStore(str(tmp_path)).put("S100AAAA", _zip("payload"))
+
+        with open_mapped(path) as mapped:
+            with zipfile.ZipFile(mapped) as zip_file:
+                assert zip_file.read("XBRL/PublicDoc/doc.xbrl") == b"payload"
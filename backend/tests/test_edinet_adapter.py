@@ -321,6 +321,84 @@ class TestEDINETAdapter:
         
         assert data["revenue"]["value"] == 37154136000000.0
     
+    @pytest.mark.asyncio
+    async def test_documents_parsed_once_across_statement_types(
+        self, adapter, sample_edinet_response, sample_xbrl_content
+    ):
+        """Test every statement type reuses one download and parse per document."""
+
+        def mock_make_request(endpoint, params=None):
+            if "documents.json" in endpoint:
+                return sample_edinet_response
+            return {"binary_data": sample_xbrl_content}
+
+        with patch.object(
+            adapter, "_make_request", side_effect=mock_make_request
+        ) as mock_request:
+            income = await adapter.get_financial_statements(
+                "7203", "income_statement", "annual"
+            )
+            balance = await adapter.get_financial_statements(
+                "7203", "balance_sheet", "annual"
+            )
+
+        downloads = [
+            c for c in mock_request.call_args_list if "documents.json" not in c[0][0]
+        ]
+        assert len(downloads) == 1
+        assert income[0]["data"]["revenue"]["value"] == 37154136000000.0
+        assert balance[0]["data"]["total_assets"]["value"] == 71381000000000.0
+
+    @pytest.mark.asyncio
+    async def test_parsed_documents_are_copied(self, adapter, sample_xbrl_content):
+        """Test callers modifying a parse result do not change the cached one."""
+        with patch.object(
+            adapter, "_download_document", AsyncMock(return_value=sample_xbrl_content)
+        ) as download:
+            first = await adapter._get_parsed_document("S100TEST")
+            first["income_statement"].clear()
+            second = await adapter._get_parsed_document("S100TEST")
+
+        assert second["income_statement"]["revenue"]["value"] == 37154136000000.0
+        assert download.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_document_store_cache(
+        self, sample_edinet_response, sample_xbrl_content, tmp_path
+    ):
+        """Test documents and parse results are reused from the on-disk store."""
+
+        def mock_make_request(endpoint, params=None):
+            if "documents.json" in endpoint:
+                return sample_edinet_response
+            return {"binary_data": sample_xbrl_content}
+
+        config = {"document_cache_dir": str(tmp_path), "xbrl_parse_workers": 1}
+        first = EDINETAdapter(config=config)
+        try:
+            with patch.object(first, "_make_request", side_effect=mock_make_request):
+                await first.get_financial_statements(
+                    "7203", "income_statement", "annual"
+                )
+        finally:
+            first._parse_pool.shutdown()
+
+        second = EDINETAdapter(config=config)
+        with (
+            patch.object(
+                second, "_make_request", side_effect=mock_make_request
+            ) as mock_request,
+            patch.object(second._parse_pool, "parse", AsyncMock()) as mock_parse,
+        ):
+            statements = await second.get_financial_statements(
+                "7203", "income_statement", "annual"
+            )
+
+        assert statements[0]["data"]["revenue"]["value"] == 37154136000000.0
+        assert all("documents.json" in c[0][0] for c in mock_request.call_args_list)
+        mock_parse.assert_not_called()
+        assert second._document_store.get_stats()["documents"] == 1
+
     @pytest.mark.asyncio
     async def test_get_financial_statements_no_documents(self, adapter):
         """Test financial statements retrieval when no documents found."""
@@ -0,0 +1,272 @@
+"""Tests for the EDINET document list index."""
+
+import asyncio
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.adapters.base import DataSourceError
+from app.adapters.edinet_adapter import EDINETAdapter, IncompleteDocumentIndexError
+from app.adapters.edinet_index import EDINETDocumentIndex, is_edinet_business_day
+
+DOCUMENT_URL = "https://disclosure.edinet-fsa.go.jp/api/v1/documents"
+
+
+def _result(doc_id, sec_code="72030", doc_type_code="120", day="2024-06-25", **extra):
+    result = {
+        "docID": doc_id,
+        "edinetCode": f"E{(sec_code or '')[:4]}0",
+        "secCode": sec_code,
+        "filerName": f"Filer {sec_code}",
+        "docTypeCode": doc_type_code,
+        "submitDateTime": f"{day} 15:30",
+        "periodStart": "2023-04-01",
+        "periodEnd": "2024-03-31",
+    }
+    result.update(extra)
+    return result
+
+
+class TestEDINETDocumentIndex:
+    """Test cases for EDINETDocumentIndex."""
+
+    def test_query_by_codes(self):
+        """Test lookups by securities code, EDINET code and document type."""
+        index = EDINETDocumentIndex()
+        index.add_day(
+            date(2024, 6, 25),
+            [
+                _result("S1", "72030", "120"),
+                _result("S2", "72030", "130"),
+                _result("S3", "67580", "120"),
+                _result("S4", None, "120", edinetCode="E99999"),
+            ],
+            DOCUMENT_URL,
+        )
+
+        assert [d.doc_id for d in index.query(sec_code="7203")] == ["S2", "S1"]
+        assert [
+            d.doc_id for d in index.query(sec_code="72030", doc_type_code="120")
+        ] == ["S1"]
+        assert [d.doc_id for d in index.query(edinet_code="E67580")] == ["S3"]
+        assert {d.doc_id for d in index.query(doc_type_code="120")} == {
+            "S1",
+            "S3",
+            "S4",
+        }
+        assert index.query(sec_code="9999") == []
+        assert index.query(sec_code="7203")[0].doc_url == f"{DOCUMENT_URL}/S2"
+
+    def test_query_date_range(self):
+        """Test results are limited to the days they were listed on."""
+        index = EDINETDocumentIndex()
+        index.add_day(
+            date(2024, 6, 24), [_result("S1", day="2024-06-24")], DOCUMENT_URL
+        )
+        index.add_day(
+            date(2024, 6, 25), [_result("S2", day="2024-06-25")], DOCUMENT_URL
+        )
+
+        documents = index.query(sec_code="7203", date_from=date(2024, 6, 25))
+        assert [d.doc_id for d in documents] == ["S2"]
+        documents = index.query(sec_code="7203", date_to=date(2024, 6, 25))
+        assert [d.doc_id for d in documents] == ["S2", "S1"]
+
+    def test_add_day_replaces_previous_list(self):
+        """Test re-fetching a day drops documents no longer listed."""
+        index = EDINETDocumentIndex()
+        day = date(2024, 6, 25)
+        index.add_day(day, [_result("S1"), _result("S2")], DOCUMENT_URL)
+        index.add_day(
+            day, [_result("S2"), _result("S3", submitDateTime=None)], DOCUMENT_URL
+        )
+
+        assert [d.doc_id for d in index.query(sec_code="7203")] == ["S2"]
+        assert index.get_stats()["documents"] == 1
+
+    def test_open_days_are_refreshed(self):
+        """Test days fetched before they ended are fetched again later."""
+        index = EDINETDocumentIndex(refresh_interval=600)
+        # 2024-06-25 10:00 JST
+        fetched_at = datetime(2024, 6, 25, 1, 0)
+        index.add_day(date(2024, 6, 24), [], DOCUMENT_URL, fetched_at=fetched_at)
+        index.add_day(date(2024, 6, 25), [], DOCUMENT_URL, fetched_at=fetched_at)
+
+        soon = fetched_at + timedelta(minutes=5)
+        later = fetched_at + timedelta(minutes=15)
+        # 2024-06-22/23 is a weekend and never fetched
+        assert index.days_to_sync(date(2024, 6, 21), date(2024, 6, 30), soon) == [
+            date(2024, 6, 21)
+        ]
+        assert index.days_to_sync(date(2024, 6, 21), date(2024, 6, 30), later) == [
+            date(2024, 6, 25),
+            date(2024, 6, 21),
+        ]
+
+    def test_persistence(self, tmp_path):
+        """Test daily lists are reloaded from disk."""
+        index = EDINETDocumentIndex(str(tmp_path))
+        index.add_day(
+            date(2024, 6, 25),
+            [_result("S1")],
+            DOCUMENT_URL,
+            fetched_at=datetime(2024, 6, 26, 1, 0),
+        )
+
+        reloaded = EDINETDocumentIndex(str(tmp_path))
+
+        assert [d.doc_id for d in reloaded.query(sec_code="7203")] == ["S1"]
+        assert not reloaded.needs_sync(date(2024, 6, 25))
+
+
+class TestEDINETAdapterIndexSync:
+    """Test cases for incremental document list syncing."""
+
+    @pytest.fixture
+    def adapter(self):
+        return EDINETAdapter(config={"xbrl_parse_workers": 0})
+
+    @pytest.mark.asyncio
+    async def test_search_fetches_only_new_days(self, adapter):
+        """Test repeated searches reuse indexed days and skip non-business days."""
+
+        async def documents_for_day(endpoint, params=None):
+            return {"results": [_result(f"S{params['date']}", day=params["date"])]}
+
+        adapter._make_request = AsyncMock(side_effect=documents_for_day)
+
+        # 2024-06-22/23 is a weekend
+        documents = await adapter._search_documents(
+            sec_code="7203",
+            date_from=datetime(2024, 6, 20),
+            date_to=datetime(2024, 6, 25),
+        )
+        assert len(documents) == 4
+        assert adapter._make_request.call_count == 4
+        assert adapter._make_request.call_args.args[1]["type"] == "2"
+
+        documents = await adapter._search_documents(
+            sec_code="7203",
+            date_from=datetime(2024, 6, 18),
+            date_to=datetime(2024, 6, 25),
+        )
+        assert len(documents) == 6
+        assert documents[0].doc_id == "S2024-06-25"
+        assert adapter._make_request.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_partial_sync_is_reported_and_resumed(self, adapter):
+        """Test a failed day raises, keeps fetched days and is retried later."""
+        failing = {"2024-06-20", "2024-06-21"}
+
+        async def documents_for_day(endpoint, params=None):
+            if params["date"] in failing:
+                raise DataSourceError("EDINET server error: 503")
+            return {"results": [_result(f"S{params['date']}", day=params["date"])]}
+
+        adapter.index_sync_concurrency = 1
+        adapter._make_request = AsyncMock(side_effect=documents_for_day)
+
+        with pytest.raises(IncompleteDocumentIndexError) as excinfo:
+            await adapter._search_documents(
+                sec_code="7203",
+                date_from=datetime(2024, 6, 20),
+                date_to=datetime(2024, 6, 25),
+            )
+        assert excinfo.value.missing_days == [date(2024, 6, 21), date(2024, 6, 20)]
+
+        failing.clear()
+        adapter._make_request.reset_mock()
+        documents = await adapter._search_documents(
+            sec_code="7203",
+            date_from=datetime(2024, 6, 20),
+            date_to=datetime(2024, 6, 25),
+        )
+
+        assert len(documents) == 4
+        assert [
+            call.args[1]["date"] for call in adapter._make_request.call_args_list
+        ] == [
+            "2024-06-21",
+            "2024-06-20",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sync_is_paced_to_minute_limit(self, adapter):
+        """Test a long sync waits for the minute window instead of failing."""
+
+        async def documents_for_day(endpoint, params=None):
+            adapter._check_rate_limits()
+            adapter._update_request_counts()
+            return {"results": []}
+
+        async def advance_clock(seconds):
+            adapter._last_minute_reset -= timedelta(seconds=seconds)
+
+        adapter.requests_per_minute = 3
+        adapter._make_request = AsyncMock(side_effect=documents_for_day)
+
+        with patch(
+            "app.adapters.edinet_adapter.asyncio.sleep",
+            AsyncMock(side_effect=advance_clock),
+        ) as sleep:
+            fetched = await adapter.sync_document_index(
+                date(2024, 6, 3), date(2024, 6, 14)
+            )
+
+        assert fetched == 10
+        assert sleep.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_hour_limit_reports_incomplete_range(self, adapter):
+        """Test a used-up hourly limit stops the sync and reports the rest."""
+
+        async def documents_for_day(endpoint, params=None):
+            adapter._update_request_counts()
+            return {"results": []}
+
+        adapter.requests_per_hour = 2
+        adapter._make_request = AsyncMock(side_effect=documents_for_day)
+
+        with pytest.raises(IncompleteDocumentIndexError) as excinfo:
+            await adapter.sync_document_index(date(2024, 6, 24), date(2024, 6, 28))
+
+        assert adapter._make_request.call_count == 2
+        assert len(excinfo.value.missing_days) == 3
+
+    @pytest.mark.asyncio
+    async def test_long_sync_does_not_block_other_searches(self, adapter):
+        """Test a short sync finishes while a long one is still running."""
+
+        async def documents_for_day(endpoint, params=None):
+            await asyncio.sleep(0.01)
+            return {"results": [_result(f"S{params['date']}", day=params["date"])]}
+
+        adapter.index_sync_concurrency = 1
+        adapter._make_request = AsyncMock(side_effect=documents_for_day)
+
+        cold = asyncio.create_task(
+            adapter.sync_document_index(date(2024, 4, 1), date(2024, 5, 31))
+        )
+        await asyncio.sleep(0.02)
+        # One day inside the long range and one outside it
+        fetched = await adapter.sync_document_index(date(2024, 6, 3), date(2024, 6, 3))
+        await adapter.sync_document_index(date(2024, 5, 31), date(2024, 5, 31))
+
+        assert fetched == 1
+        assert not cold.done()
+        await cold
+        fetched_days = [
+            call.args[1]["date"] for call in adapter._make_request.call_args_list
+        ]
+        assert len(fetched_days) == len(set(fetched_days))
+
+
+def test_is_edinet_business_day():
+    """Test weekends, holidays and the year-end closure are skipped."""
+    assert is_edinet_business_day(date(2024, 6, 25))
+    assert not is_edinet_business_day(date(2024, 6, 22))
+    assert not is_edinet_business_day(date(2024, 7, 15))  # Marine Day
+    assert not is_edinet_business_day(date(2024, 12, 30))
+    assert not is_edinet_business_day(date(2025, 1, 2))
@@ -0,0 +1,173 @@
+"""Tests for the fundamentals warehouse service."""
+
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.adapters.edinet_index import EDINETDocument
+from app.services.fundamentals_service import (
+    AMOUNT_COLUMNS,
+    FundamentalsService,
+    fundamentals_row,
+)
+
+
+def _document(doc_id="S100ABC1", submitted="2024-06-25 15:30", period_end="2024-03-31"):
+    return EDINETDocument(
+        doc_id=doc_id,
+        filer_name="トヨタ自動車株式会社",
+        fund_code=None,
+        sec_code="72030",
+        jcn=None,
+        edinet_code="E02144",
+        doc_type_code="120",
+        doc_description="有価証券報告書",
+        submit_date=datetime.strptime(submitted, "%Y-%m-%d %H:%M"),
+        period_start=datetime(2023, 4, 1),
+        period_end=datetime.strptime(period_end, "%Y-%m-%d"),
+        doc_url=f"https://example.com/{doc_id}",
+    )
+
+
+def _financial_data(revenue=100.0, **metadata):
+    return {
+        "income_statement": {"revenue": {"value": revenue, "unit": "JPY"}},
+        "balance_sheet": {"total_assets": {"value": 500.0, "unit": "JPY"}},
+        "cash_flow": {},
+        "metadata": {"consolidated": True, "accounting_standard": "jgaap", **metadata},
+    }
+
+
+class TestFundamentalsRow:
+    """Test cases for fundamentals_row."""
+
+    def test_flattens_statements(self):
+        """Test statement fields become typed columns."""
+        row = fundamentals_row(
+            "7203",
+            _document(),
+            _financial_data(period_type="FY", fiscal_year_end="2024-03-31"),
+            "annual",
+        )
+
+        assert row["fiscal_year"] == 2024
+        assert row["fiscal_period"] == "FY"
+        assert row["period_start"] == date(2023, 4, 1)
+        assert row["period_end"] == date(2024, 3, 31)
+        assert row["revenue"] == 100.0
+        assert row["total_assets"] == 500.0
+        assert row["operating_cash_flow"] is None
+        assert row["is_consolidated"] is True
+        assert row["submitted_at"].utcoffset().total_seconds() == 9 * 3600
+        assert set(AMOUNT_COLUMNS) <= set(row)
+
+    def test_quarter_from_document_information(self):
+        """Test quarterly reports use the DEI period type and fiscal year."""
+        row = fundamentals_row(
+            "7203",
+            _document(period_end="2023-12-31"),
+            _financial_data(period_type="Q3", fiscal_year_end="2024-03-31"),
+            "quarterly",
+        )
+
+        assert (row["fiscal_year"], row["fiscal_period"]) == (2024, "Q3")
+
+    def test_unknown_quarter_or_no_figures(self):
+        """Test filings without a known period or figures are skipped."""
+        assert (
+            fundamentals_row("7203", _document(), _financial_data(), "quarterly")
+            is None
+        )
+        assert (
+            fundamentals_row("7203", _document(), _financial_data(), "annual")[
+                "fiscal_period"
+            ]
+            == "FY"
+        )
+
+        empty = _financial_data(revenue="n/a")
+        empty["balance_sheet"] = {}
+        assert fundamentals_row("7203", _document(), empty, "annual") is None
+
+
+class TestFundamentalsService:
+    """Test cases for FundamentalsService."""
+
+    def _session(self, rowcount=1):
+        conn = MagicMock()
+        conn.dialect.name = "postgresql"
+        db = AsyncMock()
+        db.connection = AsyncMock(return_value=conn)
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=rowcount))
+        return db
+
+    @pytest.mark.asyncio
+    async def test_upsert_keeps_latest_filing_per_period(self):
+        """Test duplicate periods collapse to the latest filing in one statement."""
+        db = self._session(rowcount=1)
+        older = fundamentals_row(
+            "7203", _document("S1", "2024-06-25 15:30"), _financial_data(1.0), "annual"
+        )
+        newer = fundamentals_row(
+            "7203", _document("S2", "2024-07-01 09:00"), _financial_data(2.0), "annual"
+        )
+
+        written = await FundamentalsService(db, MagicMock()).upsert([newer, older])
+
+        assert written == 1
+        stmt = db.execute.call_args[0][0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert "ON CONFLICT (ticker, fiscal_year, fiscal_period) DO UPDATE" in str(
+            compiled
+        )
+        assert "stock_fundamentals.submitted_at <= excluded.submitted_at" in str(
+            compiled
+        )
+        assert compiled.params["document_id_m0"] == "S2"
+        assert "document_id_m1" not in compiled.params
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_batches_rows(self):
+        """Test refresh collects tickers concurrently and upserts in batches."""
+        db = self._session(rowcount=2)
+        db.execute = AsyncMock(
+            side_effect=[
+                MagicMock(
+                    scalars=MagicMock(
+                        return_value=MagicMock(all=lambda: ["6758", "7203", "9984"])
+                    )
+                ),
+                MagicMock(rowcount=2),
+                MagicMock(rowcount=2),
+            ]
+        )
+
+        async def get_parsed_filings(ticker, period, limit=5):
+            if ticker == "9984":
+                raise ValueError("no filings")
+            return [
+                (
+                    _document(f"S{ticker}a"),
+                    _financial_data(period_type="FY", fiscal_year_end="2024-03-31"),
+                ),
+                (
+                    _document(f"S{ticker}b", period_end="2023-03-31"),
+                    _financial_data(period_type="FY", fiscal_year_end="2023-03-31"),
+                ),
+            ]
+
+        adapter = MagicMock()
+        adapter.get_parsed_filings = AsyncMock(side_effect=get_parsed_filings)
+        service = FundamentalsService(db, adapter, batch_size=2)
+
+        result = await service.refresh(report_types=("annual",))
+
+        assert result.tickers_processed == 2
+        assert result.rows_collected == 4
+        assert result.rows_written == 4
+        assert set(result.failed_tickers) == {"9984"}
+        assert db.execute.await_count == 3
+        db.commit.assert_awaited_once()
@@ -0,0 +1,46 @@
+"""Tests for the Aho-Corasick mention matcher."""
+
+from app.services.mention_matcher import AhoCorasick
+
+
+class TestAhoCorasick:
+    """Test cases for AhoCorasick."""
+
+    def test_finds_overlapping_patterns(self):
+        """Test every pattern occurring as a substring is found."""
+        automaton = AhoCorasick(
+            [("he", 1), ("she", 2), ("his", 3), ("hers", 4), ("", 5)]
+        )
+
+        assert len(automaton) == 4
+        assert sorted(automaton.find("ushers")) == [1, 2, 4]
+        assert automaton.find("hi") == []
+
+    def test_shared_patterns_and_japanese_text(self):
+        """Test payloads of a shared pattern are all returned."""
+        automaton = AhoCorasick(
+            [
+                ("トヨタ", "7203"),
+                ("トヨタ", "7203-name"),
+                ("トヨタ自動車", "7203-full"),
+                ("ソニー", "6758"),
+            ]
+        )
+
+        assert sorted(automaton.find("トヨタ自動車とソニーの決算")) == [
+            "6758",
+            "7203",
+            "7203-full",
+            "7203-name",
+        ]
+        assert automaton.find("トヨ") == []
+
+    def test_matches_substring_semantics(self):
+        """Test results agree with the ``in`` operator."""
+        patterns = ["ab", "abc", "bca", "c", "cab", "aaa"]
+        automaton = AhoCorasick((p, p) for p in patterns)
+
+        for text in ["abcab", "aaaa", "bcbcb", "xyz", "cabca"]:
+            assert sorted(automaton.find(text)) == sorted(
+                p for p in patterns if p in text
+            )
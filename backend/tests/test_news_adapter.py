@@ -3,11 +3,12 @@ Tests for news data adapter.
 """
 
 import pytest
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch
 import aiohttp
 
-from app.adapters.news_adapter import NewsDataAdapter
+from app.adapters.news_adapter import NewsDataAdapter, parse_published_at
 from app.adapters.base import HealthStatus
 
 
@@ -151,6 +152,72 @@ class TestNewsDataAdapter:
             assert articles[0]["headline"] == "Test RSS Article"
             assert articles[0]["source_type"] == "rss"
     
+    def _feed_session(self, responses):
+        """Mock session returning (status, headers, body) responses in order."""
+        session = Mock()
+        session.requests = []
+
+        def get(url, headers=None):
+            session.requests.append((url, dict(headers or {})))
+            status, response_headers, body = responses[len(session.requests) - 1]
+            response = Mock(status=status, headers=response_headers)
+            response.text = AsyncMock(return_value=body)
+            context = Mock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=False)
+            return context
+
+        session.get = Mock(side_effect=get)
+        return session
+
+    @pytest.mark.asyncio
+    async def test_rss_feed_shared_between_queries(self, adapter):
+        """Test per-stock queries filter one parsed copy of each feed."""
+        feed = """<rss version="2.0"><channel>
+            <item><title>トヨタ 7203 決算</title><link>https://example.com/a</link></item>
+            <item><title>ソニー 6758 新製品</title><link>https://example.com/b</link></item>
+        </channel></rss>"""
+        adapter.rss_sources = adapter.rss_sources[:1]
+        session = self._feed_session([(200, {"ETag": '"v1"'}, feed)])
+
+        with patch.object(adapter, '_get_session', AsyncMock(return_value=session)):
+            results = await asyncio.gather(
+                adapter._get_rss_articles("7203", None, 10, None, None),
+                adapter._get_rss_articles("6758", None, 10, None, None),
+            )
+
+        assert [[a["headline"] for a in r] for r in results] == [["トヨタ 7203 決算"], ["ソニー 6758 新製品"]]
+        assert len(session.requests) == 1
+
+        results[0][0]["relevance_score"] = 1.0
+        cached = adapter._feed_states[adapter.rss_sources[0]["url"]].items
+        assert all("relevance_score" not in item for item in cached)
+
+    @pytest.mark.asyncio
+    async def test_rss_feed_conditional_request(self, adapter):
+        """Test stale feeds are revalidated and 304 keeps the parsed items."""
+        feed = """<rss version="2.0"><channel>
+            <item><title>日経平均が続伸</title><link>https://example.com/a</link></item>
+        </channel></rss>"""
+        adapter.rss_cache_ttl = 0
+        source = adapter.rss_sources[0]
+        session = self._feed_session([
+            (200, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 12:00:00 GMT"}, feed),
+            (304, {}, ""),
+        ])
+
+        with patch.object(adapter, '_get_session', AsyncMock(return_value=session)):
+            first = await adapter._process_rss_source(source, None, None, None, None)
+            second = await adapter._process_rss_source(source, None, None, None, None)
+
+        assert session.requests[0][1] == {}
+        assert session.requests[1][1] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT",
+        }
+        assert first == second
+        assert second[0]["headline"] == "日経平均が続伸"
+
     def test_normalize_news_api_article(self, adapter):
         """Test News API article normalization."""
         raw_article = {
@@ -463,4 +530,19 @@ class TestNewsDataAdapter:
         # Test without API key
         adapter.news_api_key = None
         cost_info_free = await adapter.get_cost_info()
-        assert cost_info_free.cost_per_request == 0.0
\ No newline at end of file
+        assert cost_info_free.cost_per_request == 0.0
+
+
+class TestParsePublishedAt:
+    """Test cases for parse_published_at."""
+
+    def test_source_formats(self):
+        """Test ISO 8601 and RFC 822 dates parse to aware datetimes."""
+        iso = parse_published_at("2024-03-19T06:30:00Z")
+        rfc = parse_published_at("Tue, 19 Mar 2024 15:30:00 +0900")
+
+        assert iso == rfc
+        assert iso.utcoffset() is not None
+        assert parse_published_at("2024-03-19T06:30:00").tzinfo is not None
+        assert parse_published_at("") is None
+        assert parse_published_at("not a date") is None
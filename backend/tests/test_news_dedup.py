@@ -0,0 +1,137 @@
+"""Tests for MinHash/LSH news deduplication."""
+
+import random
+
+import numpy as np
+
+from app.adapters.news_dedup import (
+    MinHasher,
+    NearDuplicateIndex,
+    NewsDeduplicator,
+    candidate_probability,
+    char_shingles,
+    estimate_similarity,
+)
+
+
+def _article(article_id, headline):
+    return {"id": article_id, "headline": headline}
+
+
+class TestShingling:
+    """Test cases for text normalization and shingling."""
+
+    def test_japanese_shingles(self):
+        """Test unsegmented Japanese text is split into character n-grams."""
+        assert char_shingles("トヨタ決算") == {"トヨタ", "ヨタ決", "タ決算"}
+
+    def test_normalization(self):
+        """Test full-width characters, case and punctuation are folded."""
+        assert char_shingles("ＴＯＹＯＴＡ、増益！") == char_shingles("toyota 増益")
+        assert char_shingles("ab") == {"ab"}
+        assert char_shingles("  ") == set()
+
+
+class TestMinHash:
+    """Test cases for MinHash signatures and the LSH index."""
+
+    def test_signature_similarity(self):
+        """Test signature agreement tracks headline similarity."""
+        hasher = MinHasher(num_perm=128)
+        base = hasher.signature(
+            "トヨタ自動車、通期業績予想を上方修正 純利益は過去最高に"
+        )
+        near = hasher.signature(
+            "トヨタ自動車、通期業績予想を上方修正　純利益は過去最高"
+        )
+        other = hasher.signature("ソニーグループ、半導体事業の分社化を検討")
+
+        assert estimate_similarity(base, near) > 0.8
+        assert estimate_similarity(base, other) < 0.2
+        assert hasher.signature("") is None
+
+    def test_index_window(self):
+        """Test entries expire after the window."""
+        hasher = MinHasher()
+        index = NearDuplicateIndex(window_seconds=60)
+        signature = hasher.signature("日銀、金融政策の現状維持を決定")
+
+        index.add("a1", signature, timestamp=1000.0)
+        assert index.find(signature) == "a1"
+        assert index.find(signature, exclude="a1") is None
+
+        index.add("a2", hasher.signature("別の記事"), timestamp=1100.0)
+        assert index.find(signature) is None
+        assert len(index) == 1
+
+    def test_index_max_entries(self):
+        """Test the oldest entries are evicted beyond the size limit."""
+        index = NearDuplicateIndex(
+            num_perm=8, bands=2, window_seconds=None, max_entries=2
+        )
+        for i in range(3):
+            index.add(f"a{i}", np.full(8, i, dtype=np.uint64), timestamp=float(i))
+
+        assert len(index) == 2
+        assert index.find(np.full(8, 0, dtype=np.uint64)) is None
+
+    def test_default_banding_recall(self):
+        """Test pairs at the threshold almost always become candidates."""
+        index = NearDuplicateIndex()
+
+        assert (index.bands, index.rows) == (16, 4)
+        assert candidate_probability(index.threshold, index.bands, index.rows) > 0.999
+        assert candidate_probability(0.3, index.bands, index.rows) < 0.15
+
+    def test_near_duplicates_are_found(self):
+        """Test every pair estimated at or above the threshold is found."""
+        rng = random.Random(7)
+        alphabet = [chr(code) for code in range(0x4E00, 0x4E00 + 500)]
+        hasher = MinHasher()
+        found = total = 0
+
+        for _ in range(300):
+            headline = "".join(rng.choice(alphabet) for _ in range(30))
+            pos = rng.randrange(3, 27)
+            edited = headline[:pos] + rng.choice(alphabet) + headline[pos + 1 :]
+            original, copy = hasher.signature(headline), hasher.signature(edited)
+            if estimate_similarity(original, copy) < 0.8:
+                continue
+
+            index = NearDuplicateIndex(window_seconds=None)
+            index.add("a", original, timestamp=0.0)
+            total += 1
+            found += index.find(copy) == "a"
+
+        assert total > 100
+        assert found == total
+
+
+class TestNewsDeduplicator:
+    """Test cases for NewsDeduplicator."""
+
+    def test_batch_deduplication(self):
+        """Test ID and near-duplicate headlines are dropped within a batch."""
+        deduplicator = NewsDeduplicator(window_days=0)
+        articles = [
+            _article("1", "トヨタ、通期業績予想を上方修正 純利益は過去最高"),
+            _article("2", "【速報】トヨタ、通期業績予想を上方修正 純利益は過去最高"),
+            _article("1", "別の見出し"),
+            _article("3", "ソニー、新型ゲーム機を発表"),
+        ]
+
+        result = deduplicator.deduplicate(articles)
+
+        assert [a["id"] for a in result] == ["1", "3"]
+        assert deduplicator.duplicates_dropped == 2
+
+    def test_cross_batch_deduplication(self):
+        """Test copies of recently seen articles are dropped in later batches."""
+        deduplicator = NewsDeduplicator()
+        first = _article("nikkei-1", "日銀、マイナス金利を解除 17年ぶり利上げ")
+
+        assert deduplicator.deduplicate([first]) == [first]
+
+        copy = _article("yahoo-9", "日銀、マイナス金利を解除　17年ぶり利上げ")
+        unrelated = _article("yahoo-10", "円相場、一時1ドル=150円台に下落")
+        assert deduplicator.deduplicate([copy, unrelated, first]) == [unrelated, first]
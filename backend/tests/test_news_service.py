@@ -4,8 +4,10 @@ Tests for news collection service.
 
 import pytest
 import asyncio
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, AsyncMock, patch
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.news_service import NewsCollectionService, news_service
@@ -143,10 +145,10 @@ class TestNewsCollectionService:
     async def test_collect_stock_specific_news(self, service, sample_stocks, sample_articles):
         """Test stock-specific news collection."""
         # Mock database query for stocks
-        with patch('app.services.news_service.get_db') as mock_get_db:
+        with patch('app.services.news_service.get_db_session') as mock_get_db:
             mock_db = Mock()
             mock_result = Mock()
-            mock_result.scalars.return_value.all.return_value = sample_stocks
+            mock_result.all.return_value = [(stock, 0, None) for stock in sample_stocks]
             mock_db.execute = AsyncMock(return_value=mock_result)
             mock_get_db.return_value.__aenter__.return_value = mock_db
             
@@ -159,6 +161,98 @@ class TestNewsCollectionService:
                 assert result == 4  # 2 stocks * 2 articles each
                 assert mock_collect.call_count == len(sample_stocks)
     
+    @pytest.mark.asyncio
+    async def test_collect_stock_specific_news_priority(self, service, sample_stocks):
+        """Test stale and watched stocks are collected first, up to the cycle limit."""
+        quiet = Stock(ticker="9984", company_name_jp="ソフトバンクグループ", is_active=True)
+        now = datetime.utcnow()
+        service._last_collected = {
+            "7203": now - timedelta(hours=1),
+            "6758": now - timedelta(hours=2),
+            "9984": now - timedelta(hours=3),
+        }
+        service.stocks_per_cycle = 2
+        service.stock_collection_workers = 1
+        
+        with patch('app.services.news_service.get_db_session') as mock_get_db:
+            mock_db = Mock()
+            mock_result = Mock()
+            # 7203 has 5 watchers, 6758 has 1 and 9984 none
+            mock_result.all.return_value = [
+                (sample_stocks[0], 5, None), (sample_stocks[1], 1, None), (quiet, 0, None)
+            ]
+            mock_db.execute = AsyncMock(return_value=mock_result)
+            mock_get_db.return_value.__aenter__.return_value = mock_db
+            
+            with patch.object(service, '_collect_stock_news') as mock_collect:
+                mock_collect.return_value = 1
+                
+                result = await service.collect_stock_specific_news()
+        
+        assert result == 2
+        # 7203: 1h x 6 = 6h, 6758: 2h x 2 = 4h, 9984: 3h x 1 = 3h
+        assert [c.args[0].ticker for c in mock_collect.call_args_list] == ["7203", "6758"]
+    
+    def test_priority_uses_latest_linked_article(self, service):
+        """Test stocks are dated by stored articles after a restart."""
+        now = datetime.utcnow()
+        linked_at = (now - timedelta(hours=2)).replace(tzinfo=timezone.utc)
+        
+        assert service._collection_priority("7203", 0, now, linked_at) == pytest.approx(7200, abs=1)
+        assert service._collection_priority("6758", 0, now) == service.max_staleness_seconds
+    
+    @pytest.mark.asyncio
+    async def test_cycle_sized_to_remaining_quota(self, service, sample_stocks):
+        """Test a cycle collects no more stocks than the quota left allows."""
+        service.requests_per_minute = 600
+        service.requests_per_hour = 100
+        service.requests_per_day = 1000
+        # 1000/day over 24 hourly cycles allows 42 requests; 40 are used
+        service._request_times.extend([time.monotonic() - 60] * 40)
+        
+        queue = asyncio.PriorityQueue()
+        for stock in sample_stocks:
+            queue.put_nowait((0, stock.ticker, stock))
+        
+        with patch.object(service, '_build_collection_queue', AsyncMock(return_value=queue)) as build_queue, \
+             patch.object(service, '_collect_stock_news', AsyncMock(return_value=1)) as collect:
+            result = await service.collect_stock_specific_news()
+        
+        build_queue.assert_awaited_once_with(2)
+        assert result == 2
+        assert collect.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_request_slot_respects_hourly_and_daily_quota(self, service):
+        """Test requests are refused once the hourly or daily quota is used."""
+        service.requests_per_minute = 600
+        service.requests_per_hour = 3
+        service.requests_per_day = 1000
+        
+        with patch('app.services.news_service.asyncio.sleep', AsyncMock()):
+            granted = [await service._wait_for_request_slot() for _ in range(4)]
+        assert granted == [True, True, True, False]
+        
+        service.requests_per_hour = 100
+        service.requests_per_day = 3
+        assert await service._wait_for_request_slot() is False
+        assert service._cycle_request_budget() == 0
+    
+    @pytest.mark.asyncio
+    async def test_collect_stock_news_records_last_collected(self, service, sample_stocks):
+        """Test collection time is recorded and bounds the next search window."""
+        stock = sample_stocks[0]
+        service.news_adapter.get_news = AsyncMock(return_value=[])
+        service._last_collected[stock.ticker] = datetime.utcnow() - timedelta(hours=10)
+        
+        with patch.object(service, '_store_articles', AsyncMock(return_value=0)):
+            await service._collect_stock_news(stock)
+        
+        start_date = service.news_adapter.get_news.call_args.kwargs["start_date"]
+        end_date = service.news_adapter.get_news.call_args.kwargs["end_date"]
+        assert timedelta(hours=9) < end_date - start_date < timedelta(hours=11)
+        assert service._last_collected[stock.ticker] == end_date
+    
     @pytest.mark.asyncio
     async def test_collect_stock_news(self, service, sample_stocks, sample_articles):
         """Test collecting news for a specific stock."""
@@ -180,102 +274,123 @@ class TestNewsCollectionService:
             call_args = mock_store.call_args
             assert call_args[0][1] == stock.ticker  # Second argument should be ticker
     
+    def _store_session(self, existing_urls=(), stock_exists=True):
+        """Mock session whose article insert skips the given existing URLs."""
+        conn = Mock()
+        conn.dialect.name = "postgresql"
+        db = Mock()
+        db.connection = AsyncMock(return_value=conn)
+        db.commit = AsyncMock()
+        db.rollback = AsyncMock()
+        db.statements = []
+
+        async def execute(stmt):
+            db.statements.append(stmt)
+            result = Mock()
+            table = getattr(stmt, "table", None)
+            if table is not None and table.name == "news_articles":
+                params = stmt.compile(dialect=postgresql.dialect()).params
+                inserted = [
+                    value
+                    for key, value in params.items()
+                    if key.startswith("id_m")
+                    and params[f"article_url_m{key[4:]}"] not in existing_urls
+                ]
+                result.scalars.return_value.all.return_value = inserted
+            else:
+                result.scalar_one_or_none.return_value = "7203" if stock_exists else None
+            return result
+
+        db.execute = AsyncMock(side_effect=execute)
+        return db
+
+    def _link_rows(self, db):
+        """Rows written to stock_news_link."""
+        rows = []
+        for stmt in db.statements:
+            table = getattr(stmt, "table", None)
+            if table is not None and table.name == "stock_news_link":
+                params = stmt.compile(dialect=postgresql.dialect()).params
+                i = 0
+                while f"ticker_m{i}" in params:
+                    rows.append((params[f"ticker_m{i}"], float(params[f"relevance_score_m{i}"])))
+                    i += 1
+        return rows
+
     @pytest.mark.asyncio
     async def test_store_articles_new_articles(self, service, sample_articles):
-        """Test storing new articles."""
-        with patch('app.services.news_service.get_db') as mock_get_db:
-            mock_db = Mock()
-            
-            # Mock no existing articles (all are new)
-            mock_existing_result = Mock()
-            mock_existing_result.scalar_one_or_none.return_value = None
-            mock_db.execute = AsyncMock(return_value=mock_existing_result)
-            
-            mock_db.add = Mock()
-            mock_db.flush = AsyncMock()
-            mock_db.commit = AsyncMock()
-            
-            mock_get_db.return_value.__aenter__.return_value = mock_db
-            
+        """Test new articles are stored with one multi-row insert."""
+        db = self._store_session()
+
+        with patch('app.services.news_service.get_db_session') as mock_get_db, \
+             patch('app.services.news_service.news_stock_mapping_service') as mock_mapping_service:
+            mock_get_db.return_value.__aenter__.return_value = db
+            mock_mapping_service.match_articles = AsyncMock(
+                return_value=[[("7203", 0.9)], [("6758", 0.5), ("7203", 0.2)]]
+            )
+
             result = await service._store_articles(sample_articles)
-            
-            assert result == len(sample_articles)
-            assert mock_db.add.call_count == len(sample_articles)
-            mock_db.commit.assert_called_once()
-    
+
+        assert result == len(sample_articles)
+        compiled = str(db.statements[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (article_url) DO NOTHING RETURNING news_articles.id" in compiled
+        assert sorted(self._link_rows(db)) == [("6758", 0.5), ("7203", 0.2), ("7203", 0.9)]
+        assert len(db.statements) == 2
+        db.commit.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_store_articles_with_ticker(self, service, sample_articles):
-        """Test storing articles with stock ticker link."""
-        ticker = "7203"
-        
-        with patch('app.services.news_service.get_db') as mock_get_db, \
+        """Test targeted articles are linked to the ticker with high relevance."""
+        db = self._store_session()
+
+        with patch('app.services.news_service.get_db_session') as mock_get_db, \
              patch('app.services.news_service.news_stock_mapping_service') as mock_mapping_service:
-            
-            mock_db = Mock()
-            
-            # Mock no existing articles
-            mock_existing_result = Mock()
-            mock_existing_result.scalar_one_or_none.return_value = None
-            
-            # Mock stock exists
-            mock_stock_result = Mock()
-            mock_stock = Mock()
-            mock_stock_result.scalar_one_or_none.return_value = mock_stock
-            
-            # Mock no existing stock links
-            mock_link_result = Mock()
-            mock_link_result.scalar_one_or_none.return_value = None
-            
-            # Return different results for different queries
-            mock_db.execute = AsyncMock(side_effect=[
-                mock_existing_result,  # First article check
-                mock_stock_result,     # Stock check
-                mock_link_result,      # Stock link check
-                mock_existing_result,  # Second article check
-                mock_stock_result,     # Stock check
-                mock_link_result       # Stock link check
-            ])
-            
-            mock_db.add = Mock()
-            mock_db.flush = AsyncMock()
-            mock_db.commit = AsyncMock()
-            
-            mock_get_db.return_value.__aenter__.return_value = mock_db
-            
-            # Mock mapping service
-            mock_mapping_service.create_stock_news_links = AsyncMock(return_value=[])
-            
-            result = await service._store_articles(sample_articles, ticker)
-            
-            assert result == len(sample_articles)
-            # Should call mapping service for each article
-            assert mock_mapping_service.create_stock_news_links.call_count == len(sample_articles)
-            # Should add articles + targeted stock links
-            expected_calls = len(sample_articles) * 2  # articles + targeted links
-            assert mock_db.add.call_count == expected_calls
-    
+            mock_get_db.return_value.__aenter__.return_value = db
+            mock_mapping_service.match_articles = AsyncMock(
+                return_value=[[("7203", 0.9)], [("6758", 0.5)]]
+            )
+
+            result = await service._store_articles(sample_articles, "7203")
+
+        assert result == len(sample_articles)
+        mock_mapping_service.match_articles.assert_awaited_once()
+        # Article insert, stock check and one link upsert
+        assert len(db.statements) == 3
+        assert sorted(self._link_rows(db)) == [("6758", 0.5), ("7203", 0.7), ("7203", 0.9)]
+        db.commit.assert_called_once()
+
     @pytest.mark.asyncio
-    async def test_store_articles_duplicate_handling(self, service, sample_articles):
-        """Test handling of duplicate articles."""
-        with patch('app.services.news_service.get_db') as mock_get_db:
-            mock_db = Mock()
-            
-            # Mock existing article found (duplicate)
-            mock_existing_result = Mock()
-            mock_existing_article = Mock()
-            mock_existing_result.scalar_one_or_none.return_value = mock_existing_article
-            mock_db.execute = AsyncMock(return_value=mock_existing_result)
-            
-            mock_db.add = Mock()
-            mock_db.commit = AsyncMock()
-            
-            mock_get_db.return_value.__aenter__.return_value = mock_db
-            
+    async def test_store_articles_opens_session_context(self, service, sample_articles):
+        """Test the real session context manager is used and closed."""
+        db = self._store_session()
+        db.close = AsyncMock()
+
+        with patch('app.core.database.get_session_factory', return_value=lambda: db), \
+             patch('app.services.news_service.news_stock_mapping_service') as mock_mapping_service:
+            mock_mapping_service.match_articles = AsyncMock(return_value=[[], []])
+
             result = await service._store_articles(sample_articles)
-            
-            # No new articles should be stored (all duplicates)
-            assert result == 0
-            mock_db.add.assert_not_called()
+
+        assert result == len(sample_articles)
+        db.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_store_articles_duplicate_handling(self, service, sample_articles):
+        """Test articles already stored are neither counted nor linked."""
+        existing = {sample_articles[0]["article_url"]}
+        db = self._store_session(existing_urls=existing)
+
+        with patch('app.services.news_service.get_db_session') as mock_get_db, \
+             patch('app.services.news_service.news_stock_mapping_service') as mock_mapping_service:
+            mock_get_db.return_value.__aenter__.return_value = db
+            mock_mapping_service.match_articles = AsyncMock(
+                return_value=[[("7203", 0.9)], [("6758", 0.5)]]
+            )
+
+            result = await service._store_articles(sample_articles + sample_articles[:1])
+
+        assert result == len(sample_articles) - 1
+        assert self._link_rows(db) == [("6758", 0.5)]
     
     @pytest.mark.asyncio
     async def test_cleanup_old_articles(self, service):
@@ -553,7 +668,7 @@ class TestNewsCollectionService:
     @pytest.mark.asyncio
     async def test_store_articles_error_handling(self, service, sample_articles):
         """Test error handling in store_articles."""
-        with patch('app.services.news_service.get_db') as mock_get_db:
+        with patch('app.services.news_service.get_db_session') as mock_get_db:
             mock_db = Mock()
             mock_db.execute = AsyncMock(side_effect=Exception("Database error"))
             mock_db.rollback = AsyncMock()
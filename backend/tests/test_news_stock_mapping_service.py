@@ -246,6 +246,35 @@ class TestNewsStockMappingService:
         # Should be sorted by relevance score
         assert matches[0][1] >= matches[1][1]
     
+    def test_find_stock_matches_matches_per_stock_scoring(self, service, sample_stocks):
+        """Test automaton matching scores like the per-stock relevance rules."""
+        service._stock_cache = {stock.ticker: stock for stock in sample_stocks}
+        texts = [
+            "トヨタ自動車(7203)が決算発表、売上高と利益が過去最高 #7203",
+            "Sony Group and SoftBank Group Corp report earnings; 9984.T shares fell",
+            "ソフトバンクの通信事業、配当を維持 [9984]",
+            "日本株式市場全体が上昇、自動車セクターが牽引",
+            "",
+        ]
+
+        for text in texts:
+            expected = [
+                (ticker, score)
+                for ticker, stock in service._stock_cache.items()
+                if (score := service._calculate_relevance_score(text.lower(), ticker, stock)) > 0
+            ]
+            expected.sort(key=lambda x: x[1], reverse=True)
+
+            assert service._find_stock_matches(text) == expected
+
+    def test_find_stock_matches_rebuilds_for_new_cache(self, service, sample_stocks):
+        """Test the automaton follows a replaced stock cache."""
+        service._stock_cache = {"7203": sample_stocks[0]}
+        assert [m[0] for m in service._find_stock_matches("ソニーとトヨタ")] == ["7203"]
+
+        service._stock_cache = {stock.ticker: stock for stock in sample_stocks}
+        assert {m[0] for m in service._find_stock_matches("ソニーとトヨタ")} == {"7203", "6758"}
+
     @pytest.mark.asyncio
     async def test_create_stock_news_links_success(self, service, sample_stocks):
         """Test successful creation of stock-news links."""
@@ -254,15 +283,14 @@ class TestNewsStockMappingService:
         article_id = "test-article-id"
         article_text = "トヨタ自動車(7203)の決算発表"
         
-        with patch('app.services.news_stock_mapping_service.get_db') as mock_get_db:
+        with patch('app.services.news_stock_mapping_service.get_db_session') as mock_get_db, \
+             patch('app.services.news_stock_mapping_service.set_article_stock_links', AsyncMock()) as mock_set_links:
             mock_db = Mock()
             
             # Mock no existing links
             mock_existing_result = Mock()
             mock_existing_result.scalars.return_value.first.return_value = None
             mock_db.execute = AsyncMock(return_value=mock_existing_result)
-            
-            mock_db.add = Mock()
             mock_db.commit = AsyncMock()
             
             mock_get_db.return_value.__aenter__.return_value = mock_db
@@ -271,7 +299,10 @@ class TestNewsStockMappingService:
             
             assert len(links) > 0
             assert any(link["ticker"] == "7203" for link in links)
-            mock_db.add.assert_called()
+            db, linked_id, scores = mock_set_links.call_args[0]
+            assert (db, linked_id) == (mock_db, article_id)
+            assert "7203" in scores
+            assert mock_set_links.call_args[1] == {"replace": False}
             mock_db.commit.assert_called_once()
     
     @pytest.mark.asyncio
@@ -282,7 +313,8 @@ class TestNewsStockMappingService:
         article_id = "test-article-id"
         article_text = "トヨタ自動車(7203)の決算発表"
         
-        with patch('app.services.news_stock_mapping_service.get_db') as mock_get_db:
+        with patch('app.services.news_stock_mapping_service.get_db_session') as mock_get_db, \
+             patch('app.services.news_stock_mapping_service.set_article_stock_links', AsyncMock()) as mock_set_links:
             mock_db = Mock()
             
             # Mock existing links found
@@ -297,19 +329,20 @@ class TestNewsStockMappingService:
             
             # Should return empty list when links already exist
             assert links == []
+            mock_set_links.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_create_stock_news_links_force_refresh(self, service, sample_stocks):
-        """Test force refresh of existing stock-news links."""
+        """Test force refresh replaces existing stock-news links."""
         service._stock_cache = {stock.ticker: stock for stock in sample_stocks}
         
         article_id = "test-article-id"
         article_text = "トヨタ自動車(7203)の決算発表"
         
-        with patch('app.services.news_stock_mapping_service.get_db') as mock_get_db:
+        with patch('app.services.news_stock_mapping_service.get_db_session') as mock_get_db, \
+             patch('app.services.news_stock_mapping_service.set_article_stock_links', AsyncMock()) as mock_set_links:
             mock_db = Mock()
             mock_db.execute = AsyncMock()
-            mock_db.add = Mock()
             mock_db.commit = AsyncMock()
             mock_get_db.return_value.__aenter__.return_value = mock_db
             
@@ -319,7 +352,8 @@ class TestNewsStockMappingService:
             
             # Should create links even if they exist
             assert len(links) > 0
-            mock_db.add.assert_called()
+            mock_db.execute.assert_not_called()
+            assert mock_set_links.call_args[1] == {"replace": True}
     
     @pytest.mark.asyncio
     async def test_batch_create_links_for_articles(self, service, sample_stocks):
@@ -0,0 +1,388 @@
+"""Tests for the trading calendar and price backfill service."""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from app.adapters.base import RateLimitExceededError
+from app.adapters.price_frame import price_records_to_frame
+from app.core.holidays import japanese_holidays
+from app.services.price_backfill_service import (
+    BackfillCheckpoint,
+    PriceBackfillService,
+)
+from app.services.trading_calendar import (
+    is_trading_day,
+    last_completed_session,
+    missing_trading_ranges,
+    trading_days,
+)
+
+
+class TestTradingCalendar:
+    """Test cases for the TSE trading calendar."""
+
+    def test_holidays_2024(self):
+        """Test holidays including substitute holidays."""
+        holidays = japanese_holidays(2024)
+
+        assert date(2024, 2, 12) in holidays  # Substitute for Feb 11
+        assert date(2024, 3, 20) in holidays  # Vernal equinox
+        assert date(2024, 8, 12) in holidays  # Substitute for Mountain Day
+        assert date(2024, 9, 23) in holidays  # Substitute for autumnal equinox
+        assert date(2024, 11, 4) in holidays  # Substitute for Culture Day
+
+    def test_citizens_holiday(self):
+        """Test a weekday between two holidays becomes a holiday."""
+        assert date(2015, 9, 22) in japanese_holidays(2015)
+
+    def test_special_holidays(self):
+        """Test one-off holidays around the 2019 enthronement."""
+        holidays = japanese_holidays(2019)
+
+        assert date(2019, 4, 30) in holidays
+        assert date(2019, 5, 1) in holidays
+        assert date(2019, 10, 22) in holidays
+
+    def test_is_trading_day(self):
+        """Test weekends, holidays and the year-end break are closed."""
+        assert is_trading_day(date(2024, 1, 4))
+        assert not is_trading_day(date(2024, 1, 3))
+        assert not is_trading_day(date(2023, 12, 31))
+        assert not is_trading_day(date(2024, 1, 6))
+        assert not is_trading_day(date(2024, 1, 8))
+
+    def test_last_completed_session(self):
+        """Test sessions count once the close has passed in Japan time."""
+        # Tuesday 2024-03-19 14:00 JST and 16:00 JST
+        assert last_completed_session(datetime(2024, 3, 19, 5, 0)) == date(2024, 3, 18)
+        assert last_completed_session(datetime(2024, 3, 19, 7, 0)) == date(2024, 3, 19)
+        # Monday 2024-03-25 08:00 JST falls back over the weekend
+        assert last_completed_session(datetime(2024, 3, 24, 23, 0)) == date(2024, 3, 22)
+
+    def test_trading_days_per_year(self):
+        """Test the number of trading days in 2024."""
+        assert len(trading_days(date(2024, 1, 1), date(2024, 12, 31))) == 245
+
+    def test_missing_ranges(self):
+        """Test gaps are grouped into contiguous ranges."""
+        days = trading_days(date(2024, 3, 1), date(2024, 3, 29))
+        existing = set(days[:5]) | set(days[8:])
+
+        ranges = missing_trading_ranges(date(2024, 3, 1), date(2024, 3, 29), existing)
+
+        assert ranges == [(days[5], days[7])]
+
+    def test_missing_ranges_merge_gap(self):
+        """Test nearby gaps are merged."""
+        days = trading_days(date(2024, 3, 1), date(2024, 3, 29))
+        existing = set(days) - {days[2], days[5]}
+
+        assert len(missing_trading_ranges(days[0], days[-1], existing)) == 2
+        assert missing_trading_ranges(days[0], days[-1], existing, merge_gap=2) == [
+            (days[2], days[5])
+        ]
+
+    def test_no_missing_ranges(self):
+        """Test a complete range has no gaps."""
+        days = trading_days(date(2024, 3, 1), date(2024, 3, 29))
+
+        assert missing_trading_ranges(days[0], days[-1], set(days)) == []
+
+
+class TestPriceBackfillService:
+    """Test cases for PriceBackfillService."""
+
+    @pytest.fixture
+    def db(self):
+        """Create a mock async session."""
+        session = AsyncMock()
+        session.add = MagicMock()
+        return session
+
+    @pytest.fixture
+    def data_source_service(self):
+        """Create a mock data source service."""
+        service = MagicMock()
+        service.get_historical_price_frame = AsyncMock(return_value=pd.DataFrame())
+        return service
+
+    def _existing_dates_result(self, dates):
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = list(dates)
+        return result
+
+    def _price_records(self, days):
+        return [
+            {
+                "date": datetime.combine(day, datetime.min.time()).isoformat(),
+                "open": 100.0,
+                "high": 110.0,
+                "low": 90.0,
+                "close": 105.0,
+                "volume": 1000,
+                "adjusted_close": 105.0,
+            }
+            for day in days
+        ]
+
+    @pytest.mark.asyncio
+    async def test_find_gaps_excludes_existing_dates(self, db, data_source_service):
+        """Test only missing trading days are returned."""
+        days = trading_days(date(2024, 3, 1), date(2024, 3, 29))
+        db.execute.return_value = self._existing_dates_result(days[:10])
+        service = PriceBackfillService(db, data_source_service, merge_gap_days=0)
+
+        gaps = await service.find_gaps("7203", days[0], days[-1])
+
+        assert gaps == [(days[10], days[-1])]
+
+    @pytest.mark.asyncio
+    async def test_find_gaps_splits_long_spans(self, db, data_source_service):
+        """Test long gaps are split into bounded spans."""
+        db.execute.return_value = self._existing_dates_result([])
+        service = PriceBackfillService(db, data_source_service, max_span_days=365)
+
+        gaps = await service.find_gaps("7203", date(2015, 1, 5), date(2024, 12, 30))
+
+        assert len(gaps) == 10
+        assert all((end - start).days < 365 for start, end in gaps)
+        assert gaps[0][0] == date(2015, 1, 5)
+        assert gaps[-1][1] == date(2024, 12, 30)
+
+    @pytest.mark.asyncio
+    async def test_backfill_ticker_fetches_only_gaps(self, db, data_source_service):
+        """Test a ticker with a partial history only fetches the missing span."""
+        days = trading_days(date(2024, 3, 1), date(2024, 3, 29))
+        db.execute.return_value = self._existing_dates_result(days[:10])
+        data_source_service.get_historical_price_frame.return_value = (
+            price_records_to_frame(self._price_records(days[10:]))
+        )
+        service = PriceBackfillService(db, data_source_service)
+
+        with patch.object(service, "_ingest", AsyncMock(return_value=9)) as ingest:
+            inserted = await service.backfill_ticker("7203", days[0], days[-1])
+
+        assert inserted == 9
+        call_args = data_source_service.get_historical_price_frame.call_args[0]
+        assert call_args[0] == "7203"
+        assert call_args[1].date() == days[10]
+        assert call_args[2].date() == days[-1]
+
+        bars = ingest.call_args[0][0]
+        assert [bar[1] for bar in bars] == days[10:]
+        assert bars[0][0] == "7203"
+
+    @pytest.mark.asyncio
+    async def test_empty_span_recorded_in_checkpoint(
+        self, db, data_source_service, tmp_path
+    ):
+        """Test spans without data are not fetched again."""
+        days = trading_days(date(2024, 3, 1), date(2024, 3, 29))
+        db.execute.return_value = self._existing_dates_result(days[:10])
+        checkpoint_path = str(tmp_path / "checkpoint.json")
+        service = PriceBackfillService(
+            db, data_source_service, checkpoint_path=checkpoint_path
+        )
+
+        await service.backfill_ticker("7203", days[0], days[-1])
+        service.checkpoint.save()
+
+        resumed = PriceBackfillService(
+            db, data_source_service, checkpoint_path=checkpoint_path
+        )
+        assert await resumed.find_gaps("7203", days[0], days[-1]) == []
+
+    @pytest.mark.asyncio
+    async def test_recent_empty_days_are_not_recorded(self, db, data_source_service):
+        """Test days the provider may not have published yet are fetched again."""
+        today = datetime.utcnow().date()
+        db.execute.return_value = self._existing_dates_result([])
+        service = PriceBackfillService(
+            db, data_source_service, empty_range_min_age_days=7
+        )
+
+        service._record_empty_range("7203", (today - timedelta(days=3), today))
+        service._record_empty_range("7203", (today - timedelta(days=20), today))
+
+        empty = service.checkpoint.empty_dates("7203")
+        assert min(empty) == today - timedelta(days=20)
+        assert max(empty) == today - timedelta(days=7)
+
+    def test_empty_ranges_expire(self, tmp_path):
+        """Test empty ranges are fetched again once they expire."""
+        checkpoint_path = str(tmp_path / "checkpoint.json")
+        checkpoint = BackfillCheckpoint(
+            checkpoint_path, empty_range_ttl=timedelta(days=30)
+        )
+        span = (date(2024, 3, 4), date(2024, 3, 8))
+        checkpoint.add_empty_range("7203", span, recorded_at=datetime.utcnow())
+        checkpoint.add_empty_range(
+            "6758", span, recorded_at=datetime.utcnow() - timedelta(days=31)
+        )
+        checkpoint.save()
+
+        reloaded = BackfillCheckpoint(
+            checkpoint_path, empty_range_ttl=timedelta(days=30)
+        )
+        assert len(reloaded.empty_dates("7203")) == 5
+        assert reloaded.empty_dates("6758") == set()
+        assert (
+            reloaded.empty_dates("7203", now=datetime.utcnow() + timedelta(days=31))
+            == set()
+        )
+
+    @pytest.mark.asyncio
+    async def test_backfill_end_capped_at_last_session(self, db, data_source_service):
+        """Test a backfill never asks for sessions that have not closed."""
+        service = PriceBackfillService(db, data_source_service)
+        latest = last_completed_session()
+
+        with (
+            patch.object(
+                service, "_get_universe", AsyncMock(return_value={"7203": None})
+            ),
+            patch.object(
+                service, "backfill_ticker", AsyncMock(return_value=0)
+            ) as backfill_ticker,
+        ):
+            await service.backfill(end=latest + timedelta(days=10))
+
+        assert backfill_ticker.call_args[0][2] == latest
+
+    @pytest.mark.asyncio
+    async def test_backfill_window_from_leap_day(self, db, data_source_service):
+        """Test the default window start is valid when it ends on Feb 29."""
+        service = PriceBackfillService(db, data_source_service)
+
+        with (
+            patch(
+                "app.services.price_backfill_service.last_completed_session",
+                return_value=date(2024, 2, 29),
+            ),
+            patch.object(
+                service, "_get_universe", AsyncMock(return_value={"7203": None})
+            ),
+            patch.object(
+                service, "backfill_ticker", AsyncMock(return_value=0)
+            ) as backfill_ticker,
+        ):
+            await service.backfill(years=10)
+
+        assert backfill_ticker.call_args[0][1:3] == (
+            date(2014, 2, 28),
+            date(2024, 2, 29),
+        )
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_saves_are_batched(self, db, data_source_service):
+        """Test the checkpoint is written every few tickers and at the end."""
+        service = PriceBackfillService(
+            db,
+            data_source_service,
+            checkpoint_every=2,
+            checkpoint_interval_seconds=3600,
+        )
+        universe = {ticker: None for ticker in ("1301", "6758", "7203", "8306", "9984")}
+
+        with (
+            patch.object(service, "_get_universe", AsyncMock(return_value=universe)),
+            patch.object(service, "backfill_ticker", AsyncMock(return_value=0)),
+            patch.object(service.checkpoint, "save") as save,
+        ):
+            result = await service.backfill(
+                start=date(2024, 3, 1), end=date(2024, 3, 29)
+            )
+
+        assert result.tickers_processed == 5
+        assert save.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_retried(self, db, data_source_service):
+        """Test rate-limited fetches wait and retry."""
+        data_source_service.get_historical_price_frame.side_effect = [
+            RateLimitExceededError("limited", retry_after=datetime.utcnow()),
+            pd.DataFrame(),
+        ]
+        service = PriceBackfillService(db, data_source_service)
+
+        with patch(
+            "app.services.price_backfill_service.asyncio.sleep", AsyncMock()
+        ) as sleep:
+            frame = await service._fetch_span(
+                "7203", (date(2024, 3, 1), date(2024, 3, 29))
+            )
+
+        assert frame.empty
+        assert data_source_service.get_historical_price_frame.call_count == 2
+        sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retries_exhausted(self, db, data_source_service):
+        """Test rate-limit errors propagate after the retry budget."""
+        data_source_service.get_historical_price_frame.side_effect = (
+            RateLimitExceededError("limited")
+        )
+        service = PriceBackfillService(
+            db, data_source_service, max_rate_limit_retries=2
+        )
+
+        with patch("app.services.price_backfill_service.asyncio.sleep", AsyncMock()):
+            with pytest.raises(RateLimitExceededError):
+                await service._fetch_span("7203", (date(2024, 3, 1), date(2024, 3, 29)))
+
+        assert data_source_service.get_historical_price_frame.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_backfill_resumes_from_checkpoint(
+        self, db, data_source_service, tmp_path
+    ):
+        """Test completed tickers are skipped and failures are reported."""
+        checkpoint_path = str(tmp_path / "checkpoint.json")
+        start, end = date(2024, 3, 1), date(2024, 3, 29)
+        checkpoint = BackfillCheckpoint(checkpoint_path)
+        checkpoint.mark_completed(BackfillCheckpoint.job_key(start, end), "7203")
+        checkpoint.save()
+
+        service = PriceBackfillService(
+            db, data_source_service, checkpoint_path=checkpoint_path
+        )
+        universe = {"7203": date(2000, 1, 1), "6758": date(2000, 1, 1)}
+
+        with (
+            patch.object(service, "_get_universe", AsyncMock(return_value=universe)),
+            patch.object(
+                service, "backfill_ticker", AsyncMock(return_value=0)
+            ) as backfill_ticker,
+        ):
+            result = await service.backfill(
+                tickers=["7203", "6758", "9999"], start=start, end=end
+            )
+
+        assert result.tickers_skipped == 1
+        assert result.tickers_processed == 1
+        assert backfill_ticker.call_args[0][0] == "6758"
+        assert "9999" in result.failed_tickers
+        assert BackfillCheckpoint(checkpoint_path).is_completed(
+            BackfillCheckpoint.job_key(start, end), "6758"
+        )
+
+    @pytest.mark.asyncio
+    async def test_backfill_clamps_to_listing_date(self, db, data_source_service):
+        """Test tickers are not backfilled before their listing date."""
+        service = PriceBackfillService(db, data_source_service)
+        listing = date(2024, 3, 15)
+
+        with (
+            patch.object(
+                service, "_get_universe", AsyncMock(return_value={"7203": listing})
+            ),
+            patch.object(
+                service, "backfill_ticker", AsyncMock(return_value=0)
+            ) as backfill_ticker,
+        ):
+            await service.backfill(start=date(2024, 1, 4), end=date(2024, 3, 29))
+
+        assert backfill_ticker.call_args[0][1] == listing
@@ -0,0 +1,169 @@
+"""Tests for the bulk price ingest service."""
+
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.adapters.price_frame import price_records_to_frame
+from app.services.price_ingest_service import (
+    PRICE_COLUMNS,
+    IngestResult,
+    PriceIngestService,
+    normalize_price_bars,
+    normalize_price_frame,
+)
+
+
+def _record(day, close=105.0, **overrides):
+    record = {
+        "date": datetime.combine(day, datetime.min.time()).isoformat(),
+        "open": 100.0,
+        "high": 110.0,
+        "low": 90.0,
+        "close": close,
+        "volume": 1000,
+        "adjusted_close": close,
+    }
+    record.update(overrides)
+    return record
+
+
+class TestNormalizePriceBars:
+    """Test cases for normalize_price_bars."""
+
+    def test_converts_records_to_tuples(self):
+        """Test records become tuples in column order."""
+        bars = normalize_price_bars("7203", [_record(date(2024, 3, 1))])
+
+        assert bars == [
+            ("7203", date(2024, 3, 1), 100.0, 110.0, 90.0, 105.0, 1000, 105.0)
+        ]
+        assert len(bars[0]) == len(PRICE_COLUMNS)
+
+    def test_drops_bars_without_close(self):
+        """Test suspended days are dropped."""
+        bars = normalize_price_bars(
+            "7203", [_record(date(2024, 3, 1)), _record(date(2024, 3, 4), close=0)]
+        )
+
+        assert [bar[1] for bar in bars] == [date(2024, 3, 1)]
+
+    def test_deduplicates_and_sorts_by_date(self):
+        """Test duplicate dates keep the last record and output is sorted."""
+        bars = normalize_price_bars(
+            "7203",
+            [
+                _record(date(2024, 3, 4)),
+                _record(date(2024, 3, 1)),
+                _record(date(2024, 3, 4), close=120.0),
+            ],
+        )
+
+        assert [bar[1] for bar in bars] == [date(2024, 3, 1), date(2024, 3, 4)]
+        assert bars[1][5] == 120.0
+
+    def test_accepts_date_objects_and_missing_fields(self):
+        """Test date objects and missing OHLC values."""
+        bars = normalize_price_bars(
+            "7203",
+            [{"date": date(2024, 3, 1), "close": 105.0, "open": None, "volume": None}],
+        )
+
+        assert bars == [("7203", date(2024, 3, 1), 105.0, 105.0, 105.0, 105.0, 0, None)]
+
+
+class TestPriceIngestService:
+    """Test cases for PriceIngestService."""
+
+    def _session(self, driver, dialect_name="postgresql", rowcount=2):
+        conn = MagicMock()
+        conn.dialect.driver = driver
+        conn.dialect.name = dialect_name
+        conn.execute = AsyncMock(return_value=MagicMock(rowcount=rowcount))
+        raw_connection = MagicMock()
+        raw_connection.driver_connection.copy_records_to_table = AsyncMock()
+        conn.get_raw_connection = AsyncMock(return_value=raw_connection)
+
+        db = AsyncMock()
+        db.connection = AsyncMock(return_value=conn)
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=rowcount))
+        return db, conn, raw_connection.driver_connection
+
+    @pytest.mark.asyncio
+    async def test_copy_path_on_asyncpg(self):
+        """Test asyncpg connections COPY into staging and merge once."""
+        db, conn, driver_connection = self._session("asyncpg")
+        bars = normalize_price_bars(
+            "7203", [_record(date(2024, 3, 1)), _record(date(2024, 3, 4))]
+        )
+
+        result = await PriceIngestService(db).ingest(bars)
+
+        copy_call = driver_connection.copy_records_to_table.call_args
+        assert copy_call.kwargs["records"] == bars
+        assert copy_call.kwargs["columns"] == PRICE_COLUMNS
+        merge_sql = str(conn.execute.call_args_list[-1][0][0])
+        assert "ON CONFLICT (ticker, date) DO UPDATE" in merge_sql
+        assert result.method == "copy"
+        assert result.rows_received == 2
+        assert result.rows_written == 2
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_upsert_fallback(self):
+        """Test other drivers use batched multi-row upserts."""
+        db, conn, driver_connection = self._session("psycopg2", rowcount=2)
+        bars = normalize_price_bars(
+            "7203", [_record(date(2024, 3, day)) for day in (1, 4, 5, 6, 7)]
+        )
+
+        result = await PriceIngestService(db, batch_size=2).ingest(bars, commit=False)
+
+        driver_connection.copy_records_to_table.assert_not_called()
+        assert db.execute.await_count == 3
+        assert result.method == "upsert"
+        assert result.rows_written == 6
+        db.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self):
+        """Test empty input does not touch the database."""
+        db, conn, _ = self._session("asyncpg")
+
+        result = await PriceIngestService(db).ingest([])
+
+        assert result.rows_received == 0
+        db.connection.assert_not_awaited()
+
+    def test_rows_per_second(self):
+        """Test throughput calculation."""
+        assert (
+            IngestResult(rows_received=1000, elapsed_seconds=0.5).rows_per_second
+            == 2000
+        )
+        assert IngestResult(rows_received=10).rows_per_second == 0.0
+
+
+class TestNormalizePriceFrame:
+    """Test cases for normalize_price_frame."""
+
+    def test_frame_to_bars(self):
+        """Test frames convert to the same bars as records."""
+        records = [
+            _record(date(2024, 3, 4)),
+            _record(date(2024, 3, 1), adjusted_close=None),
+        ]
+
+        bars = normalize_price_frame("7203", price_records_to_frame(records))
+
+        assert bars == [
+            ("7203", date(2024, 3, 1), 100.0, 110.0, 90.0, 105.0, 1000, 105.0),
+            ("7203", date(2024, 3, 4), 100.0, 110.0, 90.0, 105.0, 1000, 105.0),
+        ]
+        assert all(type(value) is float for value in bars[0][2:6])
+        assert type(bars[0][6]) is int
+
+    def test_empty_frame(self):
+        """Test an empty frame gives no bars."""
+        assert normalize_price_frame("7203", price_records_to_frame([])) == []
@@ -0,0 +1,133 @@
+"""Tests for the two-tier sentiment result cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.cache import RedisCache
+from app.services.sentiment_cache import SentimentResultCache
+
+
+class _DictRedisCache:
+    """In-memory stand-in for RedisCache's multi-key methods."""
+
+    def __init__(self, fail=False):
+        self.data = {}
+        self.fail = fail
+        self.get_calls = []
+        self.ttls = []
+
+    async def get_many(self, keys):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.get_calls.append(list(keys))
+        return [self.data.get(key) for key in keys]
+
+    async def set_many(self, items, ttl=None, key_type=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.ttls.append(ttl)
+        self.data.update(items)
+        return True
+
+
+def _result(label):
+    return {"label": label, "score": 0.9, "raw_score": 0.9}
+
+
+class TestSentimentResultCache:
+    """Test cases for SentimentResultCache."""
+
+    @pytest.mark.asyncio
+    async def test_local_lru_eviction(self):
+        """Test the least recently used result is evicted first."""
+        cache = SentimentResultCache("model:v1", max_entries=2)
+
+        await cache.set("a", _result("positive"))
+        await cache.set("b", _result("negative"))
+        assert await cache.get("a") == _result("positive")
+        await cache.set("c", _result("neutral"))
+
+        assert len(cache) == 2
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert cache.get_metrics()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_single_and_batch_keys_match(self):
+        """Test surrounding whitespace does not split one text across entries."""
+        cache = SentimentResultCache("model:v1")
+
+        await cache.set(" トヨタが増益 \n", _result("positive"))
+        await cache.set_many([("ソニーが減益", _result("negative"))])
+
+        assert await cache.get("トヨタが増益") == _result("positive")
+        assert await cache.get_many(["トヨタが増益", " ソニーが減益 "]) == [
+            _result("positive"),
+            _result("negative"),
+        ]
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_redis_tier(self):
+        """Test a fresh process is served from Redis with a single MGET."""
+        redis = _DictRedisCache()
+        writer = SentimentResultCache("model:v1", redis_cache=redis, ttl=600)
+        await writer.set_many([("a", _result("positive")), ("b", _result("negative"))])
+
+        reader = SentimentResultCache("model:v1", redis_cache=redis)
+        results = await reader.get_many(["a", "b", "a", "missing"])
+
+        assert results == [
+            _result("positive"),
+            _result("negative"),
+            _result("positive"),
+            None,
+        ]
+        assert len(redis.get_calls) == 1
+        assert len(redis.get_calls[0]) == 3  # Repeated texts are fetched once
+        assert redis.ttls == [600]
+
+        # Promoted to the local tier: no further Redis round trips
+        await reader.get_many(["a", "b"])
+        assert len(redis.get_calls) == 1
+        metrics = reader.get_metrics()
+        assert metrics["redis_hits"] == 3
+        assert metrics["local_hits"] == 2
+
+        other_model = SentimentResultCache("model:v2", redis_cache=redis)
+        assert await other_model.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_backs_off_real_redis_cache(self):
+        """Test errors from a connected RedisCache trigger the back-off."""
+        client = MagicMock()
+        client.mget = AsyncMock(side_effect=ConnectionError("Redis connection lost"))
+        redis = RedisCache("redis://localhost:6379")
+        redis._client = client
+        redis._connected = True
+        cache = SentimentResultCache("model:v1", redis_cache=redis, retry_interval=60)
+
+        assert await cache.get_many(["a", "b"]) == [None, None]
+        assert await cache.get("c") is None
+        await cache.set("d", _result("positive"))
+
+        client.mget.assert_awaited_once()
+        client.pipeline.assert_not_called()
+        assert cache.get_metrics()["redis_errors"] == 1
+        assert cache.get_metrics()["misses"] == 3
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_misses(self):
+        """Test Redis failures fall back to the local tier and back off."""
+        redis = _DictRedisCache(fail=True)
+        cache = SentimentResultCache("model:v1", redis_cache=redis, retry_interval=60)
+
+        await cache.set("a", _result("positive"))
+        assert await cache.get("a") == _result("positive")
+        assert await cache.get("b") is None
+
+        redis.fail = False
+        assert await cache.get("c") is None
+        assert redis.get_calls == []  # Still backing off
+        assert cache.get_metrics()["redis_errors"] == 1
@@ -0,0 +1,162 @@
+"""Tests for the sentiment inference executor."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.services.sentiment_inference import (
+    InferenceQueueFullError,
+    InferenceTimeoutError,
+    MicroBatcher,
+    SentimentInferenceExecutor,
+    plan_token_batches,
+    run_packed,
+)
+
+
+class TestSentimentInferenceExecutor:
+    """Test cases for SentimentInferenceExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_runs_on_worker_thread(self):
+        """Test jobs run on the initialized worker thread, not the event loop."""
+        configured = []
+        executor = SentimentInferenceExecutor(
+            initializer=lambda: configured.append(threading.current_thread().name)
+        )
+
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+        await executor.run(len, [1, 2])
+
+        assert thread_name.startswith("sentiment-inference")
+        assert configured == [thread_name]
+        await asyncio.sleep(0.01)
+        metrics = executor.get_metrics()
+        assert metrics["completed"] == 2
+        assert metrics["queue_depth"] == 0
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_queue_limit_and_timeout(self):
+        """Test full queues reject jobs and slow jobs time out."""
+        release = threading.Event()
+        executor = SentimentInferenceExecutor(max_queue=1)
+
+        with pytest.raises(InferenceTimeoutError):
+            await executor.run(release.wait, timeout=0.05)
+
+        # The timed-out job still occupies the worker until it ends
+        with pytest.raises(InferenceQueueFullError):
+            await executor.run(len, [])
+
+        release.set()
+        for _ in range(100):
+            if executor.queue_depth == 0:
+                break
+            await asyncio.sleep(0.01)
+
+        assert await executor.run(len, [1]) == 1
+        metrics = executor.get_metrics()
+        assert metrics["timed_out"] == 1
+        assert metrics["rejected"] == 1
+        executor.shutdown()
+
+
+class TestMicroBatcher:
+    """Test cases for MicroBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_callers(self):
+        """Test single-text callers share one length-sorted batch."""
+        batches = []
+
+        async def run_batch(texts):
+            batches.append(list(texts))
+            return [text.upper() for text in texts]
+
+        batcher = MicroBatcher(run_batch, max_batch_size=16, max_wait=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit("ccc"), batcher.submit("a"), batcher.submit_many(["bb", "dddd"])
+        )
+
+        assert results == ["CCC", "A", ["BB", "DDDD"]]
+        assert batches == [["a", "bb", "ccc", "dddd"]]
+        metrics = batcher.get_metrics()
+        assert metrics["batches"] == 1
+        assert metrics["avg_batch_size"] == 4
+        assert metrics["avg_latency_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_splits_at_batch_size(self):
+        """Test full batches run immediately and results keep input order."""
+        sizes = []
+
+        async def run_batch(texts):
+            sizes.append(len(texts))
+            return [int(text) * 2 for text in texts]
+
+        batcher = MicroBatcher(run_batch, max_batch_size=16, max_wait=10)
+        texts = [str(i) for i in range(32)]
+
+        results = await asyncio.wait_for(batcher.submit_many(texts), timeout=1)
+
+        assert results == [i * 2 for i in range(32)]
+        assert sizes == [16, 16]
+
+    @pytest.mark.asyncio
+    async def test_failures_and_admission_limit(self):
+        """Test batch errors reach every caller and overfull queues reject."""
+
+        async def run_batch(texts):
+            raise InferenceTimeoutError("slow")
+
+        batcher = MicroBatcher(run_batch, max_batch_size=4, max_wait=0.001, max_pending=3)
+
+        with pytest.raises(InferenceTimeoutError):
+            await batcher.submit_many(["a", "b"])
+        with pytest.raises(InferenceQueueFullError):
+            await batcher.submit_many(["a", "b", "c", "d"])
+
+        metrics = batcher.get_metrics()
+        assert metrics["failed_batches"] == 1
+        assert metrics["rejected"] == 1
+        assert metrics["pending"] == 0
+
+
+class TestTokenBudgetPacking:
+    """Test cases for token-budget batch planning."""
+
+    def test_plan_token_batches(self):
+        """Test batches stay within one length bucket and the token budget."""
+        lengths = [300, 12, 20, 40, 15, 600, 35, 18]
+
+        plan = plan_token_batches(lengths, max_tokens=512, max_batch_size=3)
+
+        assert plan == [[1, 4, 7], [2], [6, 3], [0], [5]]
+        for batch in plan:
+            longest = max(lengths[i] for i in batch)
+            assert len(batch) == 1 or len(batch) * longest <= 512
+        assert sorted(i for batch in plan for i in batch) == list(range(len(lengths)))
+
+    def test_run_packed_restores_order(self):
+        """Test results map back to the input order across packed batches."""
+        texts = ["x" * n for n in (50, 3, 7, 64, 2, 33)]
+        calls = []
+
+        def predict(batch):
+            calls.append(batch)
+            return [len(text) for text in batch]
+
+        results = run_packed(
+            texts,
+            lambda batch: [len(text) for text in batch],
+            predict,
+            max_tokens=128,
+            max_batch_size=8,
+        )
+
+        assert results == [50, 3, 7, 64, 2, 33]
+        assert calls[0] == ["xx", "xxx", "xxxxxxx"]
+        assert all(len(batch) * max(map(len, batch)) <= 128 for batch in calls)
@@ -0,0 +1,108 @@
+"""Tests for the ONNX Runtime sentiment backend helpers."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.services.sentiment_onnx import (
+    ONNXSentimentPipeline,
+    benchmark_predict,
+    compare_predictions,
+)
+
+
+class _LengthTokenizer:
+    """Tokenizer encoding each text as one token per character."""
+
+    def __call__(self, texts, padding, truncation, max_length, return_tensors):
+        width = min(max(len(t) for t in texts), max_length)
+        ids = np.zeros((len(texts), width), dtype=np.int32)
+        mask = np.zeros((len(texts), width), dtype=np.int32)
+        for row, text in enumerate(texts):
+            length = min(len(text), max_length)
+            ids[row, :length] = 1
+            mask[row, :length] = 1
+        return {"input_ids": ids, "attention_mask": mask, "token_type_ids": ids * 0}
+
+
+class _LengthSession:
+    """Session scoring texts longer than three tokens as positive."""
+
+    def __init__(self):
+        self.feeds = []
+
+    def get_inputs(self):
+        return [
+            SimpleNamespace(name="input_ids"),
+            SimpleNamespace(name="attention_mask"),
+        ]
+
+    def run(self, output_names, feeds):
+        self.feeds.append(feeds)
+        lengths = feeds["attention_mask"].sum(axis=1)
+        positive = np.where(lengths > 3, 2.0, -2.0)
+        return [np.stack([-positive, positive], axis=1).astype(np.float32)]
+
+
+class TestONNXSentimentPipeline:
+    """Test cases for ONNXSentimentPipeline."""
+
+    def test_pipeline_output_format(self):
+        """Test outputs match the transformers pipeline shape and batching."""
+        session = _LengthSession()
+        pipeline = ONNXSentimentPipeline(
+            session,
+            _LengthTokenizer(),
+            {"0": "NEGATIVE", "1": "POSITIVE"},
+            max_length=8,
+            batch_size=2,
+        )
+
+        results = pipeline(["好調", "業績予想を上方修正", "赤字"])
+
+        assert [r["label"] for r in results] == ["NEGATIVE", "POSITIVE", "NEGATIVE"]
+        assert results[0]["score"] == pytest.approx(1 / (1 + np.exp(-4)))
+        assert len(session.feeds) == 2
+        # Only the inputs the graph declares are fed, as int64
+        assert set(session.feeds[0]) == {"input_ids", "attention_mask"}
+        assert session.feeds[0]["input_ids"].dtype == np.int64
+        assert pipeline([]) == []
+
+
+class TestBackendComparison:
+    """Test cases for the parity and benchmark helpers."""
+
+    def test_compare_predictions(self):
+        """Test label agreement and score drift are reported."""
+        reference = [
+            {"label": "POSITIVE", "score": 0.9},
+            {"label": "NEGATIVE", "score": 0.8},
+            {"label": "POSITIVE", "score": 0.55},
+        ]
+        candidate = [
+            {"label": "POSITIVE", "score": 0.88},
+            {"label": "NEGATIVE", "score": 0.83},
+            {"label": "NEGATIVE", "score": 0.51},
+        ]
+
+        parity = compare_predictions(reference, candidate)
+
+        assert parity["label_agreement"] == pytest.approx(2 / 3)
+        assert parity["mismatched_indices"] == [2]
+        assert parity["max_score_diff"] == pytest.approx(0.03)
+        with pytest.raises(ValueError):
+            compare_predictions(reference, candidate[:2])
+
+    def test_benchmark_predict(self):
+        """Test every batch is timed on each pass after the warmup."""
+        calls = []
+
+        report = benchmark_predict(
+            calls.append, [str(i) for i in range(10)], batch_size=4, repeats=2
+        )
+
+        assert len(calls) == 2 + 3 * 2
+        assert report["batches"] == 6
+        assert report["texts_per_second"] > 0
+        assert report["p95_batch_ms"] >= report["p50_batch_ms"]
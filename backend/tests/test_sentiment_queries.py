@@ -0,0 +1,177 @@
+"""Tests for the SQL sentiment aggregation queries."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects import postgresql
+
+from app.services.sentiment_queries import (
+    sentiment_summary_query,
+    sentiment_timeline_query,
+)
+
+
+def _sql(query):
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# (id, published_ts, sentiment_label, sentiment_score, linked tickers)
+ARTICLES = [
+    (1, "2023-12-31 23:59:59.000000", "positive", 0.9, ["7203"]),
+    (2, "2024-01-01 00:00:00.000000", "positive", 0.8, ["7203"]),
+    (3, "2024-01-01 00:59:59.000000", "negative", -0.6, ["7203", "6758"]),
+    (4, "2024-01-01 01:00:00.000000", "neutral", 0.1, ["6758"]),
+    (5, "2024-01-01 23:59:59.999999", "negative", -0.4, []),
+    (6, "2024-01-02 00:00:00.000000", "positive", 0.5, ["7203"]),
+    (7, "2024-01-02 12:00:00.000000", None, None, ["7203"]),
+]
+
+
+def _date_trunc(unit, value):
+    """SQLite version of Postgres date_trunc for 'hour' and 'day'."""
+    return value[:13] + ":00:00" if unit == "hour" else value[:10] + " 00:00:00"
+
+
+def _timezone(zone, value):
+    """SQLite version of Postgres timezone() for timestamps stored in UTC."""
+    assert zone == "UTC"
+    return value
+
+
+@pytest.fixture
+def news_db():
+    """SQLite engine seeded with the columns the aggregation queries read."""
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def register_functions(dbapi_connection, connection_record):
+        dbapi_connection.create_function("date_trunc", 2, _date_trunc)
+        dbapi_connection.create_function("timezone", 2, _timezone)
+
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE news_articles (id INTEGER PRIMARY KEY, "
+                "published_ts DATETIME, sentiment_label TEXT, sentiment_score REAL)"
+            )
+        )
+        conn.execute(
+            text("CREATE TABLE stock_news_link (article_id INTEGER, ticker TEXT)")
+        )
+        for article_id, published_ts, label, score, tickers in ARTICLES:
+            conn.execute(
+                text("INSERT INTO news_articles VALUES (:id, :ts, :label, :score)"),
+                {"id": article_id, "ts": published_ts, "label": label, "score": score},
+            )
+            for ticker in tickers:
+                conn.execute(
+                    text("INSERT INTO stock_news_link VALUES (:id, :ticker)"),
+                    {"id": article_id, "ticker": ticker},
+                )
+
+    yield engine
+    engine.dispose()
+
+
+def _rows(engine, query):
+    with engine.connect() as conn:
+        return [row._asdict() for row in conn.execute(query)]
+
+
+class TestSentimentQueries:
+    """Test cases for the sentiment aggregation queries."""
+
+    def test_timeline_aggregates_in_database(self):
+        """Test the timeline groups by truncated timestamp with filtered counts."""
+        sql = _sql(sentiment_timeline_query(START, granularity="hourly"))
+
+        assert (
+            "date_trunc(%(date_trunc_1)s, "
+            "timezone(%(timezone_1)s, news_articles.published_ts))" in sql
+        )
+        assert (
+            "count(*) FILTER "
+            "(WHERE news_articles.sentiment_label = %(sentiment_label_1)s)" in sql
+        )
+        assert "avg(news_articles.sentiment_score)" in sql
+        assert "news_articles.published_ts >= %(published_ts_1)s" in sql
+        assert "GROUP BY bucket ORDER BY bucket" in sql
+        assert "stock_news_link" not in sql
+
+        params = (
+            sentiment_timeline_query(START).compile(dialect=postgresql.dialect()).params
+        )
+        assert params["date_trunc_1"] == "day"
+        assert params["published_ts_1"] == START
+
+    def test_ticker_filter(self):
+        """Test ticker queries join the stock links and return one summary row."""
+        timeline = _sql(sentiment_timeline_query(START, ticker="7203"))
+        summary = _sql(sentiment_summary_query(START, ticker="7203"))
+
+        for sql in (timeline, summary):
+            assert (
+                "JOIN stock_news_link ON stock_news_link.article_id = news_articles.id"
+                in sql
+            )
+            assert "stock_news_link.ticker = %(ticker_1)s" in sql
+        assert "GROUP BY" not in summary
+
+
+class TestSentimentQueryResults:
+    """Test the aggregation queries against seeded rows."""
+
+    def test_daily_buckets(self, news_db):
+        """Test day boundaries, label counts and averages per bucket."""
+        rows = _rows(news_db, sentiment_timeline_query(START))
+
+        assert [row["bucket"] for row in rows] == [
+            "2024-01-01 00:00:00",
+            "2024-01-02 00:00:00",
+        ]
+        first, second = rows
+        assert (
+            first["positive_count"],
+            first["negative_count"],
+            first["neutral_count"],
+            first["total_articles"],
+            first["score_count"],
+        ) == (1, 2, 1, 4, 4)
+        assert first["avg_sentiment_score"] == pytest.approx(-0.025)
+        assert float(first["score_sum"]) == pytest.approx(-0.1)
+        # The unanalyzed article on the second day is not counted
+        assert (second["positive_count"], second["total_articles"]) == (1, 1)
+        assert second["avg_sentiment_score"] == pytest.approx(0.5)
+
+    def test_hourly_buckets_for_ticker(self, news_db):
+        """Test hour boundaries and the ticker join on linked articles only."""
+        query = sentiment_timeline_query(START, ticker="7203", granularity="hourly")
+        rows = _rows(news_db, query)
+
+        assert [
+            (row["bucket"], row["positive_count"], row["negative_count"])
+            for row in rows
+        ] == [
+            ("2024-01-01 00:00:00", 1, 1),
+            ("2024-01-02 00:00:00", 1, 0),
+        ]
+        assert rows[0]["avg_sentiment_score"] == pytest.approx(0.1)
+
+    def test_summary_period(self, news_db):
+        """Test the summary includes its start and excludes its end."""
+        end = START + timedelta(days=1)
+
+        (market,) = _rows(news_db, sentiment_summary_query(START, end=end))
+        (sony,) = _rows(news_db, sentiment_summary_query(START, ticker="6758"))
+        (empty,) = _rows(news_db, sentiment_summary_query(end, ticker="6758"))
+
+        assert (market["total_articles"], market["negative_count"]) == (4, 2)
+        assert market["avg_sentiment_score"] == pytest.approx(-0.025)
+        assert (sony["negative_count"], sony["neutral_count"]) == (1, 1)
+        assert sony["avg_sentiment_score"] == pytest.approx(-0.25)
+        assert empty["total_articles"] == 0
+        assert empty["avg_sentiment_score"] is None
+        assert empty["score_sum"] == 0
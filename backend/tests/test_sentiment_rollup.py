@@ -0,0 +1,250 @@
+"""Tests for the daily sentiment rollup."""
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.news import MARKET_SENTIMENT_SCOPE
+from app.services.sentiment_rollup import (
+    RollupDeltas,
+    article_day,
+    set_article_stock_links,
+    update_sentiment_rollup,
+    write_article_sentiment,
+)
+
+DAY = date(2024, 3, 19)
+
+
+def _article(article_id, label, score, published_ts=None, published_at=""):
+    return SimpleNamespace(
+        id=article_id,
+        sentiment_label=label,
+        sentiment_score=score,
+        published_ts=published_ts,
+        published_at=published_at,
+        created_at=None,
+    )
+
+
+def _rollup_session(links, articles=()):
+    """Mock session returning the given (article_id, ticker) links and articles."""
+    conn = Mock()
+    conn.dialect.name = "postgresql"
+    db = Mock()
+    db.connection = AsyncMock(return_value=conn)
+    db.statements = []
+
+    async def execute(stmt):
+        db.statements.append(stmt)
+        result = Mock()
+        result.all.return_value = links
+        result.scalars.return_value.all.return_value = list(articles)
+        return result
+
+    db.execute = AsyncMock(side_effect=execute)
+    return db
+
+
+class TestRollupDeltas:
+    """Test cases for RollupDeltas."""
+
+    def test_new_and_changed_sentiment(self):
+        """Test re-analyzed articles move between labels without double counting."""
+        deltas = RollupDeltas()
+        deltas.record(DAY, ["market", "7203"], None, None, "positive", 0.9)
+        deltas.record(DAY, ["market"], "negative", Decimal("-0.8"), "neutral", 0.0)
+        deltas.record(DAY, ["market"], "neutral", 0.0, "neutral", 0.0)
+
+        rows = {row["scope"]: row for row in deltas.rows()}
+
+        assert rows["market"]["positive_count"] == 1
+        assert rows["market"]["negative_count"] == -1
+        assert rows["market"]["neutral_count"] == 1
+        assert rows["market"]["score_sum"] == Decimal("1.7")
+        assert rows["market"]["score_count"] == 1
+        assert rows["7203"]["score_sum"] == Decimal("0.9")
+
+    def test_unchanged_rows_are_skipped(self):
+        """Test writes that leave a day unchanged produce no rows."""
+        deltas = RollupDeltas()
+        deltas.record(DAY, ["market"], "positive", 0.9, "positive", 0.9)
+
+        assert deltas.rows() == []
+
+    def test_article_day(self):
+        """Test articles are rolled up under the UTC day of publication."""
+        jst_morning = _article(
+            "a", "positive", 0.5, published_at="Wed, 20 Mar 2024 08:00:00 +0900"
+        )
+        typed = _article(
+            "b",
+            "positive",
+            0.5,
+            published_ts=datetime(2024, 3, 19, 23, 0, tzinfo=timezone.utc),
+        )
+
+        assert article_day(jst_morning) == DAY
+        assert article_day(typed) == DAY
+
+
+class TestUpdateSentimentRollup:
+    """Test cases for update_sentiment_rollup."""
+
+    @pytest.mark.asyncio
+    async def test_upserts_market_and_ticker_rows(self):
+        """Test one upsert adds the deltas to the market and linked stocks."""
+        published = datetime(2024, 3, 19, 6, 0, tzinfo=timezone.utc)
+        first = _article("a1", "positive", 0.9, published_ts=published)
+        second = _article("a2", "negative", -0.6, published_ts=published)
+        db = _rollup_session([("a1", "7203"), ("a2", "7203"), ("a2", "6758")])
+
+        changed = await update_sentiment_rollup(
+            db, [(first, None, None), (second, "positive", 0.4)]
+        )
+
+        assert changed == 3
+        upsert = db.statements[-1]
+        sql = str(upsert.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (scope, day) DO UPDATE" in sql
+        assert (
+            "positive_count = (sentiment_daily_rollup.positive_count + excluded.positive_count)"
+            in sql
+        )
+
+        params = upsert.compile(dialect=postgresql.dialect()).params
+        rows = {
+            params[f"scope_m{i}"]: (
+                params[f"positive_count_m{i}"],
+                params[f"negative_count_m{i}"],
+            )
+            for i in range(changed)
+        }
+        # a1 is new; a2 was positive before, so it moves to negative
+        assert rows[MARKET_SENTIMENT_SCOPE] == (0, 1)
+        assert rows["7203"] == (0, 1)
+        assert rows["6758"] == (-1, 1)
+
+    @pytest.mark.asyncio
+    async def test_no_changes(self):
+        """Test nothing is queried without changes."""
+        db = _rollup_session([])
+
+        assert await update_sentiment_rollup(db, []) == 0
+        db.execute.assert_not_called()
+
+
+class TestWriteArticleSentiment:
+    """Test cases for write_article_sentiment."""
+
+    @pytest.mark.asyncio
+    async def test_deltas_use_values_read_under_lock(self):
+        """Test the rollup subtracts the value current at write time."""
+        published = datetime(2024, 3, 19, 6, 0, tzinfo=timezone.utc)
+        # Loaded unanalyzed, but another run wrote "positive" before the lock
+        article = _article("a1", "positive", 0.7, published_ts=published)
+        db = _rollup_session([], articles=[article])
+
+        written = await write_article_sentiment(db, {"a1": ("negative", -0.6)})
+
+        assert written == [article]
+        assert (article.sentiment_label, article.sentiment_score) == ("negative", -0.6)
+
+        locking = db.statements[0]
+        assert "FOR UPDATE" in str(locking.compile(dialect=postgresql.dialect()))
+        assert locking.get_execution_options()["populate_existing"] is True
+
+        params = db.statements[-1].compile(dialect=postgresql.dialect()).params
+        assert params["positive_count_m0"] == -1
+        assert params["negative_count_m0"] == 1
+        assert params["score_count_m0"] == 0
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_write(self):
+        """Test no statement is run without sentiments."""
+        db = _rollup_session([])
+
+        assert await write_article_sentiment(db, {}) == []
+        db.execute.assert_not_called()
+
+
+class TestSetArticleStockLinks:
+    """Test cases for set_article_stock_links."""
+
+    def _link_session(self, article, links):
+        db = _rollup_session([])
+        db.add = Mock()
+        db.delete = AsyncMock()
+        locked = Mock()
+        locked.scalar_one_or_none.return_value = article
+        existing = Mock()
+        existing.scalars.return_value.all.return_value = links
+        results = iter([locked, existing])
+
+        async def execute(stmt):
+            db.statements.append(stmt)
+            return next(results, Mock())
+
+        db.execute = AsyncMock(side_effect=execute)
+        return db
+
+    @pytest.mark.asyncio
+    async def test_links_to_analyzed_article_update_rollup(self):
+        """Test new links add and removed links subtract analyzed sentiment."""
+        published = datetime(2024, 3, 19, 6, 0, tzinfo=timezone.utc)
+        article = _article("a1", "positive", 0.5, published_ts=published)
+        kept = SimpleNamespace(ticker="7203", relevance_score=0.9)
+        dropped = SimpleNamespace(ticker="9984", relevance_score=0.4)
+        db = self._link_session(article, [kept, dropped])
+
+        added = await set_article_stock_links(
+            db, "a1", {"7203": 0.7, "6758": 0.8}, replace=True
+        )
+
+        assert added == ["6758"]
+        assert kept.relevance_score == 0.7
+        db.delete.assert_awaited_once_with(dropped)
+        assert db.add.call_args[0][0].ticker == "6758"
+
+        locking = db.statements[0]
+        assert "FOR UPDATE" in str(locking.compile(dialect=postgresql.dialect()))
+
+        params = db.statements[-1].compile(dialect=postgresql.dialect()).params
+        rows = {
+            params[f"scope_m{i}"]: (
+                params[f"positive_count_m{i}"],
+                params[f"score_count_m{i}"],
+            )
+            for i in range(2)
+        }
+        assert rows == {"6758": (1, 1), "9984": (-1, -1)}
+
+    @pytest.mark.asyncio
+    async def test_links_to_unanalyzed_article(self):
+        """Test links are added without rollup changes before analysis."""
+        article = _article("a1", None, None)
+        db = self._link_session(article, [])
+
+        added = await set_article_stock_links(db, "a1", {"7203": 0.9})
+
+        assert added == ["7203"]
+        assert len(db.statements) == 2
+        db.connection.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_existing_links_kept_without_replace(self):
+        """Test existing links are left alone unless replacing."""
+        article = _article("a1", "negative", -0.5)
+        link = SimpleNamespace(ticker="9984", relevance_score=0.4)
+        db = self._link_session(article, [link])
+
+        added = await set_article_stock_links(db, "a1", {"9984": 0.9})
+
+        assert added == []
+        assert link.relevance_score == 0.4
+        db.delete.assert_not_called()
+        db.add.assert_not_called()
@@ -0,0 +1,393 @@
+"""Tests for the streaming XBRL parser."""
+
+import asyncio
+import io
+import zipfile
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import Mock
+
+import pytest
+
+from app.adapters.base import DataSourceUnavailableError, InvalidDataError
+from app.adapters.xbrl_parse_pool import XBRLParsePool
+from app.adapters.xbrl_parser import (
+    FACT_MAPPING,
+    iter_instance,
+    parse_xbrl_instance,
+    parse_xbrl_package,
+)
+
+INSTANCE_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance"
+      xmlns:xbrldi="http://xbrl.org/2006/xbrldi"
+      xmlns:jppfs_cor="http://disclosure.edinet-fsa.go.jp/taxonomy/jppfs/2023-11-01/jppfs_cor"
+      xmlns:jpigp_cor="http://disclosure.edinet-fsa.go.jp/taxonomy/jpigp/2023-11-01/jpigp_cor"
+      xmlns:jpcrp_cor="http://disclosure.edinet-fsa.go.jp/taxonomy/jpcrp/2023-11-01/jpcrp_cor"
+      xmlns:jpdei_cor="http://disclosure.edinet-fsa.go.jp/taxonomy/jpdei/2013-08-31/jpdei_cor"
+      xmlns:ext="http://disclosure.edinet-fsa.go.jp/jpcrp030000/asr/001/E12345-000/2024-03-31/01/2024-06-25">
+    {body}
+</xbrli:xbrl>"""
+
+DURATION_CONTEXT = """
+    <xbrli:context id="CurrentYearDuration">
+        <xbrli:entity>
+            <xbrli:identifier scheme="http://disclosure.edinet-fsa.go.jp">E12345</xbrli:identifier>
+        </xbrli:entity>
+        <xbrli:period>
+            <xbrli:startDate>2023-04-01</xbrli:startDate>
+            <xbrli:endDate>2024-03-31</xbrli:endDate>
+        </xbrli:period>
+    </xbrli:context>"""
+
+
+def _context(context_id: str, end_date: str, member: str = "") -> str:
+    scenario = (
+        f'<xbrli:scenario><xbrldi:explicitMember dimension="jppfs_cor:ConsolidatedOrNonConsolidatedAxis">'
+        f"{member}</xbrldi:explicitMember></xbrli:scenario>"
+        if member
+        else ""
+    )
+    return f"""
+    <xbrli:context id="{context_id}">
+        <xbrli:entity>
+            <xbrli:identifier scheme="http://disclosure.edinet-fsa.go.jp">E12345</xbrli:identifier>
+        </xbrli:entity>
+        <xbrli:period>
+            <xbrli:startDate>{int(end_date[:4]) - 1}-04-01</xbrli:startDate>
+            <xbrli:endDate>{end_date}</xbrli:endDate>
+        </xbrli:period>{scenario}
+    </xbrli:context>"""
+
+
+def _instance(body: str) -> bytes:
+    return INSTANCE_TEMPLATE.format(body=body).encode("utf-8")
+
+
+def _package(body: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr("XBRL/PublicDoc/doc.xbrl", _instance(body))
+    return buffer.getvalue()
+
+
+class TestStreamingXBRLParser:
+    """Test cases for the streaming XBRL parser."""
+
+    def test_keeps_only_mapped_facts(self):
+        """Test unmapped facts are dropped while streaming."""
+        contexts, facts = iter_instance(_instance(DURATION_CONTEXT + """
+                <jppfs_cor:NetSales contextRef="CurrentYearDuration" unitRef="JPY">100</jppfs_cor:NetSales>
+                <jppfs_cor:SomethingElse contextRef="CurrentYearDuration" unitRef="JPY">1</jppfs_cor:SomethingElse>
+                """))
+
+        assert list(contexts) == ["CurrentYearDuration"]
+        assert contexts["CurrentYearDuration"]["entity"]["identifier"] == "E12345"
+        assert [fact["context_ref"] for fact in facts] == ["CurrentYearDuration"]
+        assert facts[0]["name"].endswith("NetSales")
+
+    def test_contexts_resolved_after_facts(self):
+        """Test facts referencing contexts declared later are resolved."""
+        data = parse_xbrl_instance(_instance("""
+                <jppfs_cor:NetSales contextRef="CurrentYearDuration" unitRef="JPY">100</jppfs_cor:NetSales>
+                <jppfs_cor:NetIncome contextRef="Missing" unitRef="JPY">5</jppfs_cor:NetIncome>
+                """ + DURATION_CONTEXT))
+
+        assert data["income_statement"]["revenue"]["value"] == 100.0
+        assert data["income_statement"]["revenue"]["period"]["end_date"] == "2024-03-31"
+        assert "net_income" not in data["income_statement"]
+
+    def test_parse_from_stream(self):
+        """Test instances can be parsed from a binary stream."""
+        data = parse_xbrl_instance(
+            io.BytesIO(
+                _instance(
+                    DURATION_CONTEXT
+                    + '<jppfs_cor:NetSales contextRef="CurrentYearDuration" unitRef="JPY">7</jppfs_cor:NetSales>'
+                )
+            )
+        )
+
+        assert data["income_statement"]["revenue"]["value"] == 7.0
+
+    def test_large_instance(self):
+        """Test a document with many unmapped facts parses correctly."""
+        filler = "".join(
+            f'<jppfs_cor:Other{i} contextRef="CurrentYearDuration" unitRef="JPY">{i}</jppfs_cor:Other{i}>'
+            for i in range(20000)
+        )
+        data = parse_xbrl_instance(
+            _instance(
+                DURATION_CONTEXT
+                + filler
+                + '<jppfs_cor:OperatingIncome contextRef="CurrentYearDuration" unitRef="JPY">42</jppfs_cor:OperatingIncome>'
+            )
+        )
+
+        assert data["income_statement"] == {
+            "operating_income": {
+                "value": 42.0,
+                "period": {
+                    "type": "duration",
+                    "start_date": "2023-04-01",
+                    "end_date": "2024-03-31",
+                },
+                "unit": "JPY",
+            }
+        }
+
+    def test_parser_limits_stay_enabled(self):
+        """Test nesting beyond libxml2's default depth limit is rejected."""
+        nested = "<ext:Block>" * 300 + "</ext:Block>" * 300
+
+        with pytest.raises(InvalidDataError):
+            parse_xbrl_instance(_instance(nested))
+
+    def test_invalid_xml(self):
+        """Test malformed instances raise InvalidDataError."""
+        with pytest.raises(InvalidDataError, match="Invalid XBRL XML"):
+            parse_xbrl_instance(b"<xbrl><unclosed></xbrl>")
+
+    def test_package_merges_instances(self):
+        """Test all .xbrl members of a package are parsed and merged."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr(
+                "XBRL/PublicDoc/a.xbrl",
+                _instance(
+                    DURATION_CONTEXT
+                    + '<jppfs_cor:NetSales contextRef="CurrentYearDuration" unitRef="JPY">1</jppfs_cor:NetSales>'
+                ),
+            )
+            zip_file.writestr(
+                "XBRL/PublicDoc/b.xbrl",
+                _instance(
+                    DURATION_CONTEXT
+                    + '<jppfs_cor:CashFlowsFromOperatingActivities contextRef="CurrentYearDuration" unitRef="JPY">2</jppfs_cor:CashFlowsFromOperatingActivities>'
+                ),
+            )
+            zip_file.writestr("XBRL/PublicDoc/manifest.xml", "<manifest/>")
+
+        data = parse_xbrl_package(buffer.getvalue())
+
+        assert data["income_statement"]["revenue"]["value"] == 1.0
+        assert data["cash_flow"]["operating_cash_flow"]["value"] == 2.0
+
+
+class TestFactCategorization:
+    """Test cases for element lookup and context selection."""
+
+    CONTEXTS = (
+        _context("CurrentYearDuration", "2024-03-31")
+        + _context("Prior1YearDuration", "2023-03-31")
+        + _context(
+            "CurrentYearDuration_NonConsolidatedMember",
+            "2024-03-31",
+            "jppfs_cor:NonConsolidatedMember",
+        )
+        + _context(
+            "CurrentYearDuration_SegmentMember",
+            "2024-03-31",
+            "ext:AutomotiveReportableSegmentMember",
+        )
+    )
+
+    def test_consolidated_current_and_prior(self):
+        """Test consolidated figures win and prior period figures are kept."""
+        data = parse_xbrl_instance(
+            _instance(
+                self.CONTEXTS
+                + '<jppfs_cor:NetSales contextRef="CurrentYearDuration_NonConsolidatedMember" unitRef="JPY">10</jppfs_cor:NetSales>'
+                + '<jppfs_cor:NetSales contextRef="CurrentYearDuration_SegmentMember" unitRef="JPY">20</jppfs_cor:NetSales>'
+                + '<jppfs_cor:NetSales contextRef="CurrentYearDuration" unitRef="JPY">100</jppfs_cor:NetSales>'
+                + '<jppfs_cor:NetSales contextRef="Prior1YearDuration" unitRef="JPY">90</jppfs_cor:NetSales>'
+                + '<jppfs_cor:OperatingIncome contextRef="CurrentYearDuration_NonConsolidatedMember" unitRef="JPY">5</jppfs_cor:OperatingIncome>'
+            )
+        )
+
+        assert data["income_statement"]["revenue"]["value"] == 100.0
+        assert "operating_income" not in data["income_statement"]
+        assert data["prior_period"]["income_statement"]["revenue"]["value"] == 90.0
+        assert (
+            data["prior_period"]["income_statement"]["revenue"]["period"]["end_date"]
+            == "2023-03-31"
+        )
+        assert data["metadata"] == {
+            "consolidated": True,
+            "accounting_standard": "jgaap",
+        }
+
+    def test_non_consolidated_only(self):
+        """Test non-consolidated figures are used when nothing is consolidated."""
+        data = parse_xbrl_instance(
+            _instance(
+                self.CONTEXTS
+                + '<jppfs_cor:NetSales contextRef="CurrentYearDuration_NonConsolidatedMember" unitRef="JPY">10</jppfs_cor:NetSales>'
+            )
+        )
+
+        assert data["income_statement"]["revenue"]["value"] == 10.0
+        assert data["metadata"]["consolidated"] is False
+
+    def test_ifrs_and_element_priority(self):
+        """Test IFRS elements map and statement elements beat summaries."""
+        data = parse_xbrl_instance(
+            _instance(
+                self.CONTEXTS
+                + '<jpcrp_cor:RevenueIFRSSummaryOfBusinessResults contextRef="CurrentYearDuration" unitRef="JPY">1</jpcrp_cor:RevenueIFRSSummaryOfBusinessResults>'
+                + '<jpigp_cor:RevenueIFRS contextRef="CurrentYearDuration" unitRef="JPY">2</jpigp_cor:RevenueIFRS>'
+                + '<jpigp_cor:ProfitLossIFRS contextRef="CurrentYearDuration" unitRef="JPY">3</jpigp_cor:ProfitLossIFRS>'
+                + '<jpigp_cor:ProfitLossAttributableToOwnersOfParentIFRS contextRef="CurrentYearDuration" unitRef="JPY">4</jpigp_cor:ProfitLossAttributableToOwnersOfParentIFRS>'
+                + '<ext:NetSales contextRef="CurrentYearDuration" unitRef="JPY">5</ext:NetSales>'
+            )
+        )
+
+        assert data["income_statement"]["revenue"]["value"] == 2.0
+        assert data["income_statement"]["net_income"]["value"] == 4.0
+        assert data["metadata"]["accounting_standard"] == "ifrs"
+
+    def test_quarterly_report_prefers_year_to_date(self):
+        """Test flow statements use YTD figures and the balance sheet instants."""
+        quarter = _context("CurrentQuarterDuration", "2023-12-31").replace(
+            "2022-04-01", "2023-10-01"
+        )
+        ytd = _context("CurrentYTDDuration", "2023-12-31").replace(
+            "2022-04-01", "2023-04-01"
+        )
+        instant = (
+            '<xbrli:context id="CurrentQuarterInstant"><xbrli:entity><xbrli:identifier scheme="http://disclosure.edinet-fsa.go.jp">E12345</xbrli:identifier></xbrli:entity>'
+            "<xbrli:period><xbrli:instant>2023-12-31</xbrli:instant></xbrli:period></xbrli:context>"
+        )
+        # Quarter facts come first, so document order alone would pick them
+        data = parse_xbrl_instance(
+            _instance(
+                quarter
+                + ytd
+                + instant
+                + '<jppfs_cor:NetSales contextRef="CurrentQuarterDuration" unitRef="JPY">30</jppfs_cor:NetSales>'
+                + '<jppfs_cor:NetSales contextRef="CurrentYTDDuration" unitRef="JPY">90</jppfs_cor:NetSales>'
+                + '<jppfs_cor:NetIncome contextRef="CurrentQuarterDuration" unitRef="JPY">3</jppfs_cor:NetIncome>'
+                + '<jpcrp_cor:NetIncomeLossSummaryOfBusinessResults contextRef="CurrentYTDDuration" unitRef="JPY">9</jpcrp_cor:NetIncomeLossSummaryOfBusinessResults>'
+                + '<jppfs_cor:Assets contextRef="CurrentQuarterDuration" unitRef="JPY">1</jppfs_cor:Assets>'
+                + '<jppfs_cor:Assets contextRef="CurrentQuarterInstant" unitRef="JPY">500</jppfs_cor:Assets>'
+            )
+        )
+
+        assert data["income_statement"]["revenue"]["value"] == 90.0
+        assert (
+            data["income_statement"]["revenue"]["period"]["start_date"] == "2023-04-01"
+        )
+        assert data["income_statement"]["net_income"]["value"] == 9.0
+        assert data["balance_sheet"]["total_assets"]["value"] == 500.0
+
+    def test_document_information(self):
+        """Test DEI period information is kept as metadata."""
+        data = parse_xbrl_instance(
+            _instance(
+                self.CONTEXTS
+                + '<xbrli:context id="FilingDateInstant"><xbrli:entity><xbrli:identifier scheme="http://disclosure.edinet-fsa.go.jp">E12345</xbrli:identifier></xbrli:entity><xbrli:period><xbrli:instant>2024-06-25</xbrli:instant></xbrli:period></xbrli:context>'
+                + '<jpdei_cor:TypeOfCurrentPeriodDEI contextRef="FilingDateInstant">Q3</jpdei_cor:TypeOfCurrentPeriodDEI>'
+                + '<jpdei_cor:CurrentFiscalYearEndDateDEI contextRef="FilingDateInstant">2024-03-31</jpdei_cor:CurrentFiscalYearEndDateDEI>'
+            )
+        )
+
+        assert data["metadata"] == {
+            "period_type": "Q3",
+            "fiscal_year_end": "2024-03-31",
+        }
+
+    def test_fact_mapping_is_frozen(self):
+        """Test the element lookup cannot be modified at runtime."""
+        assert FACT_MAPPING["jppfs_cor:NetSales"][:2] == ("income_statement", "revenue")
+        with pytest.raises(TypeError):
+            FACT_MAPPING["jppfs_cor:NetSales"] = ("balance_sheet", "total_assets", 0)
+
+
+class TestXBRLParsePool:
+    """Test cases for XBRLParsePool."""
+
+    SALES = DURATION_CONTEXT + (
+        '<jppfs_cor:NetSales contextRef="CurrentYearDuration" unitRef="JPY">100</jppfs_cor:NetSales>'
+    )
+
+    @pytest.mark.asyncio
+    async def test_parse_in_worker_process(self):
+        """Test documents are parsed in the process pool."""
+        pool = XBRLParsePool(max_workers=1)
+        try:
+            results = await asyncio.gather(
+                pool.parse(_package(self.SALES)), pool.parse(_package(self.SALES))
+            )
+        finally:
+            pool.shutdown()
+
+        assert all(r["income_statement"]["revenue"]["value"] == 100.0 for r in results)
+        metrics = pool.get_metrics()
+        assert metrics["completed"] == 2
+        assert metrics["queue_depth"] == 0
+        assert metrics["peak_queue_depth"] == 2
+        assert metrics["avg_parse_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_parse_errors_propagate(self):
+        """Test parse failures in workers are raised to the caller."""
+        pool = XBRLParsePool(max_workers=1)
+        try:
+            with pytest.raises(InvalidDataError):
+                await pool.parse(b"not a zip")
+        finally:
+            pool.shutdown()
+
+        assert pool.get_metrics()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_is_shut_down(self):
+        """Test a broken pool is shut down before it is replaced."""
+        broken = Future()
+        broken.set_exception(BrokenProcessPool("worker died"))
+        executor = Mock()
+        executor.submit.return_value = broken
+
+        pool = XBRLParsePool(max_workers=1)
+        pool._executor = executor
+
+        with pytest.raises(DataSourceUnavailableError, match="crashed"):
+            await pool.parse(_package(self.SALES))
+
+        executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert pool._executor is None
+        assert pool.get_metrics()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_cap_rejects(self):
+        """Test submissions beyond the queue cap are rejected."""
+        pool = XBRLParsePool(max_workers=1, max_queue=1)
+        slots = pool._get_slots()
+        await slots.acquire()  # Occupy the only worker slot
+
+        waiting = asyncio.create_task(pool.parse(_package(self.SALES)))
+        await asyncio.sleep(0)
+
+        with pytest.raises(DataSourceUnavailableError, match="queue full"):
+            await pool.parse(_package(self.SALES))
+
+        assert pool.get_metrics()["queued"] == 1
+        assert pool.get_metrics()["rejected"] == 1
+
+        slots.release()
+        try:
+            result = await waiting
+        finally:
+            pool.shutdown()
+        assert result["income_statement"]["revenue"]["value"] == 100.0
+
+    @pytest.mark.asyncio
+    async def test_inline_mode(self):
+        """Test max_workers=0 parses without a process pool."""
+        pool = XBRLParsePool(max_workers=0)
+
+        result = await pool.parse(_package(self.SALES))
+
+        assert result["income_statement"]["revenue"]["value"] == 100.0
+        assert pool._executor is None
+        assert pool.get_metrics()["completed"] == 1
@@ -2,12 +2,13 @@
 
 import pytest
 import asyncio
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch
 import aiohttp
 import json
 
 from app.adapters.yahoo_finance_adapter import YahooFinanceJapanAdapter
+from app.adapters.price_frame import PRICE_FRAME_COLUMNS
 from app.adapters.base import (
     HealthStatus,
     RateLimitExceededError,
@@ -694,4 +695,128 @@ class TestYahooFinanceJapanAdapter:
         second_record = result[1]  # Sorted newest first
         assert second_record["open"] == 0.0  # None converted to 0
         assert second_record["volume"] == 0  # None converted to 0
-        assert second_record["high"] == 2500.0  # Valid value preserved
\ No newline at end of file
+        assert second_record["high"] == 2500.0  # Valid value preserved    
+    @pytest.mark.asyncio
+    async def test_get_current_prices_bulk_endpoint(self, adapter):
+        """Test bulk price lookup uses one multi-quote request."""
+        quote_response = {
+            "quoteResponse": {
+                "result": [
+                    {
+                        "symbol": "7203.T",
+                        "regularMarketPrice": 2500.0,
+                        "regularMarketPreviousClose": 2480.0,
+                        "currency": "JPY",
+                        "marketState": "REGULAR"
+                    },
+                    {
+                        "symbol": "6758.T",
+                        "regularMarketPrice": 13000.0,
+                        "regularMarketPreviousClose": 13100.0,
+                        "currency": "JPY"
+                    }
+                ],
+                "error": None
+            }
+        }
+        
+        with patch.object(adapter, '_make_request', return_value=quote_response) as mock_request:
+            result = await adapter.get_current_prices(["7203", "6758.T", "9999"])
+            
+            mock_request.assert_called_once()
+            assert mock_request.call_args[0][1] == {"symbols": "7203.T,6758.T,9999.T"}
+            assert result.quotes["7203"]["price"] == 2500.0
+            assert result.quotes["7203"]["change"] == 20.0
+            assert result.quotes["7203"]["market_status"] == "open"
+            assert result.quotes["6758.T"]["symbol"] == "6758.T"
+            assert result.errors == {"9999": "Symbol not found"}
+    
+    @pytest.mark.asyncio
+    async def test_get_current_prices_falls_back_to_chart(self, adapter, mock_chart_response):
+        """Test bulk price lookup falls back to per-symbol requests."""
+        async def fake_request(url, params=None):
+            if url == adapter.QUOTE_URL:
+                raise DataSourceUnavailableError("Yahoo Finance server error: 503")
+            return mock_chart_response
+        
+        with patch.object(adapter, '_make_request', side_effect=fake_request):
+            result = await adapter.get_current_prices(["7203.T", "6758.T"])
+            
+            assert set(result.quotes) == {"7203.T", "6758.T"}
+            assert result.is_complete
+    
+    @pytest.mark.asyncio
+    async def test_get_current_prices_chunking(self, adapter):
+        """Test bulk price lookup splits large symbol lists into chunks."""
+        adapter.bulk_quote_chunk_size = 2
+        empty_response = {"quoteResponse": {"result": [], "error": None}}
+        
+        with patch.object(adapter, '_make_request', return_value=empty_response) as mock_request:
+            result = await adapter.get_current_prices(["1301", "1332", "1333"])
+            
+            assert mock_request.call_count == 2
+            assert len(result.errors) == 3
+    
+    def test_parse_historical_frame(self, adapter, mock_historical_response):
+        """Test columnar parsing produces a date-sorted frame in exchange time."""
+        frame = adapter._parse_historical_frame(mock_historical_response)
+        
+        assert list(frame.columns) == list(PRICE_FRAME_COLUMNS)
+        assert [d.date() for d in frame["date"]] == [
+            date(2022, 1, 13), date(2022, 1, 14), date(2022, 1, 15)
+        ]
+        assert frame["close"].tolist() == [2460.0, 2480.0, 2500.0]
+        assert frame["volume"].tolist() == [13000000, 14000000, 15000000]
+    
+    def test_parse_historical_frame_masks_nulls(self, adapter):
+        """Test null bars are dropped and null fields fall back to the close."""
+        response = {
+            "chart": {
+                "result": [
+                    {
+                        "meta": {"gmtoffset": 32400},
+                        "timestamp": [1642032000, 1642118400, 1642204800],
+                        "indicators": {
+                            "quote": [
+                                {
+                                    "open": [2450.0, None, 2490.0],
+                                    "high": [2480.0, None, 2520.0],
+                                    "low": [2430.0, None],
+                                    "close": [2460.0, None, 2500.0],
+                                    "volume": [13000000, None, None]
+                                }
+                            ]
+                        }
+                    }
+                ]
+            }
+        }
+        
+        frame = adapter._parse_historical_frame(response)
+        
+        assert len(frame) == 2
+        assert frame["low"].tolist() == [2430.0, 2500.0]  # Missing entry uses close
+        assert frame["volume"].tolist() == [13000000, 0]
+        assert frame["adjusted_close"].tolist() == [2460.0, 2500.0]
+    
+    def test_parse_historical_data_filters_range(self, adapter, mock_historical_response):
+        """Test the dict path filters by date range on timestamps."""
+        start_date = datetime.fromtimestamp(1642118400)
+        end_date = datetime.fromtimestamp(1642204800)
+        
+        result = adapter._parse_historical_data(
+            mock_historical_response, "7203.T", start_date, end_date
+        )
+        
+        assert [record["close"] for record in result] == [2500.0, 2480.0]
+    
+    @pytest.mark.asyncio
+    async def test_get_historical_price_frame(self, adapter, mock_historical_response):
+        """Test getting historical prices as a frame filters the date range."""
+        start_date = datetime.fromtimestamp(1642118400)
+        end_date = datetime.fromtimestamp(1642204800) + timedelta(hours=1)
+        
+        with patch.object(adapter, '_make_request', return_value=mock_historical_response):
+            frame = await adapter.get_historical_price_frame("7203", start_date, end_date)
+            
+            assert frame["close"].tolist() == [2480.0, 2500.0]